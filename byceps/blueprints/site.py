@@ -50,6 +50,7 @@ def register_site_blueprints(
             'services.shop.payment.stripe.blueprints.site',
             '/shop/payment/stripe',
         ),
+        ('services.shop.waiting_room.blueprints.site', '/shop/waiting_room'),
         ('services.site.blueprints.site', None),
         ('services.snippet.blueprints.site', None),
         ('services.ticketing.blueprints.site', '/tickets'),
@@ -20,6 +20,10 @@ from .commands.import_roles import import_roles
 from .commands.import_seats import import_seats
 from .commands.import_users import import_users
 from .commands.initialize_database import initialize_database
+from .commands.rebuild_ticket_checkin_search_terms import (
+    rebuild_ticket_checkin_search_terms,
+)
+from .commands.reconcile_shop_order_stats import reconcile_shop_order_stats
 from .commands.worker import worker
 
 
@@ -40,6 +44,8 @@ for func in [
     import_seats,
     import_users,
     initialize_database,
+    rebuild_ticket_checkin_search_terms,
+    reconcile_shop_order_stats,
     worker,
 ]:
     cli.add_command(func)
@@ -8,32 +8,121 @@ Import user accounts from JSON lines.
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from collections.abc import Iterable, Iterator
 from pathlib import Path
+import time
 
 import click
 from flask.cli import with_appcontext
 
 from byceps.services.user import user_import_service
+from byceps.services.user.user_import_service import UserToImport
 
 
 @click.command()
+@click.option(
+    '--batched',
+    is_flag=True,
+    help='Import in batches (for large amounts of users).',
+)
+@click.option(
+    '--batch-size',
+    type=click.IntRange(min=1),
+    default=user_import_service.DEFAULT_BATCH_SIZE,
+    show_default=True,
+    help='Number of users to import per transaction (in batched mode).',
+)
+@click.option(
+    '--hashing-workers',
+    type=click.IntRange(min=1),
+    help='Number of processes to hash passwords with (in batched mode). '
+    'Defaults to the number of CPUs.',
+)
 @click.argument(
     'data_file', type=click.Path(exists=True, dir_okay=False, path_type=Path)
 )
 @with_appcontext
-def import_users(data_file: Path) -> None:
+def import_users(
+    batched: bool,
+    batch_size: int,
+    hashing_workers: int | None,
+    data_file: Path,
+) -> None:
     """Import user accounts."""
     with data_file.open() as f:
         lines = user_import_service.parse_lines(f)
-        for line_number, line in enumerate(lines, start=1):
-            try:
-                user_to_import = user_import_service.parse_user_json(line)
-                user = user_import_service.import_user(user_to_import)
-                click.secho(
-                    f'[line {line_number}] Imported user {user.screen_name}.',
-                    fg='green',
-                )
-            except Exception as e:
-                click.secho(
-                    f'[line {line_number}] Could not import user: {e}', fg='red'
-                )
+
+        if batched:
+            _import_users_in_batches(lines, batch_size, hashing_workers)
+        else:
+            _import_users(lines)
+
+
+def _import_users(lines: Iterable[str]) -> None:
+    for line_number, line in enumerate(lines, start=1):
+        try:
+            user_to_import = user_import_service.parse_user_json(line)
+            user = user_import_service.import_user(user_to_import)
+            click.secho(
+                f'[line {line_number}] Imported user {user.screen_name}.',
+                fg='green',
+            )
+        except Exception as e:
+            click.secho(
+                f'[line {line_number}] Could not import user: {e}', fg='red'
+            )
+
+
+def _import_users_in_batches(
+    lines: Iterable[str], batch_size: int, hashing_workers: int | None
+) -> None:
+    line_numbers_and_users_to_import = _parse_users(lines)
+
+    batch_results = user_import_service.import_users_in_batches(
+        line_numbers_and_users_to_import,
+        batch_size=batch_size,
+        max_hashing_workers=hashing_workers,
+    )
+
+    imported_total = 0
+    started_at = time.monotonic()
+
+    for batch_result in batch_results:
+        for line_number, reason in batch_result.failed:
+            click.secho(
+                f'[line {line_number}] Could not import user: {reason}',
+                fg='red',
+            )
+
+        imported_total += len(batch_result.imported)
+
+        click.secho(
+            f'Imported batch of {len(batch_result.imported)} users. '
+            + _format_progress(imported_total, started_at),
+            fg='green',
+        )
+
+    click.secho('Done. ' + _format_progress(imported_total, started_at))
+
+
+def _parse_users(lines: Iterable[str]) -> Iterator[tuple[int, UserToImport]]:
+    """Yield parsed users, reporting lines that could not be parsed."""
+    for line_number, line in enumerate(lines, start=1):
+        try:
+            user_to_import = user_import_service.parse_user_json(line)
+        except Exception as e:
+            click.secho(
+                f'[line {line_number}] Could not import user: {e}', fg='red'
+            )
+            continue
+
+        yield line_number, user_to_import
+
+
+def _format_progress(imported_total: int, started_at: float) -> str:
+    elapsed = time.monotonic() - started_at
+    users_per_second = imported_total / elapsed if elapsed > 0 else 0.0
+    return (
+        f'Total: {imported_total} users in {elapsed:.1f} s '
+        f'({users_per_second:.1f} users/s).'
+    )
@@ -0,0 +1,33 @@
+"""
+byceps.cli.command.rebuild_ticket_checkin_search_terms
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Rebuild parties' ticket check-in search terms from their tickets.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import click
+from flask.cli import with_appcontext
+
+from byceps.services.party import party_service
+from byceps.services.party.models import PartyID
+from byceps.services.ticketing import ticket_checkin_search_service
+
+
+@click.command()
+@click.argument('party_ids', metavar='[PARTY_ID]...', nargs=-1)
+@with_appcontext
+def rebuild_ticket_checkin_search_terms(party_ids: tuple[PartyID, ...]) -> None:
+    """Rebuild ticket check-in search terms of the given parties
+    (default: all active parties).
+    """
+    if not party_ids:
+        party_ids = tuple(
+            party.id for party in party_service.get_active_parties()
+        )
+
+    for party_id in party_ids:
+        ticket_checkin_search_service.rebuild_terms_for_party(party_id)
+        click.echo(f'Rebuilt check-in search terms of party "{party_id}".')
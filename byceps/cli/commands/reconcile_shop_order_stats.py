@@ -0,0 +1,31 @@
+"""
+byceps.cli.command.reconcile_shop_order_stats
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Recompute shops' precomputed order statistics from their orders.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import click
+from flask.cli import with_appcontext
+
+from byceps.services.shop.order import order_stats_service
+from byceps.services.shop.shop import shop_service
+from byceps.services.shop.shop.models import ShopID
+
+
+@click.command()
+@click.argument('shop_ids', metavar='[SHOP_ID]...', nargs=-1)
+@with_appcontext
+def reconcile_shop_order_stats(shop_ids: tuple[ShopID, ...]) -> None:
+    """Recompute order statistics of the given shops (default: all
+    active shops).
+    """
+    if not shop_ids:
+        shop_ids = tuple(shop.id for shop in shop_service.get_active_shops())
+
+    for shop_id in shop_ids:
+        order_stats_service.reconcile_stats(shop_id)
+        click.echo(f'Reconciled order statistics of shop "{shop_id}".')
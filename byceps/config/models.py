@@ -57,9 +57,11 @@ class BycepsConfig:
     invoiceninja: InvoiceNinjaConfig | None
     jobs: JobsConfig
     metrics: MetricsConfig
+    password_verification: PasswordVerificationConfig
     payment_gateways: PaymentGatewaysConfig | None
     redis: RedisConfig
     smtp: SmtpConfig
+    user_log: UserLogConfig
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
@@ -143,6 +145,12 @@ class MetricsConfig:
     enabled: bool
 
 
+@dataclass(frozen=True, kw_only=True, slots=True)
+class PasswordVerificationConfig:
+    max_concurrency: int
+    queue_timeout_in_ms: int
+
+
 @dataclass(frozen=True, kw_only=True, slots=True)
 class PaymentGatewaysConfig:
     paypal: PaypalConfig | None
@@ -179,3 +187,15 @@ class StripeConfig:
     secret_key: str
     publishable_key: str
     webhook_secret: str
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class UserLogConfig:
+    retention_policies: list[UserLogRetentionPolicyConfig]
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class UserLogRetentionPolicyConfig:
+    event_type: str
+    max_age_in_days: int
+    archive: bool
@@ -29,12 +29,15 @@ from .models import (
     InvoiceNinjaConfig,
     JobsConfig,
     MetricsConfig,
+    PasswordVerificationConfig,
     PaymentGatewaysConfig,
     PaypalConfig,
     RedisConfig,
     SiteWebAppConfig,
     SmtpConfig,
     StripeConfig,
+    UserLogConfig,
+    UserLogRetentionPolicyConfig,
     WebAppsConfig,
 )
 from .util import find_duplicate_server_names, iterate_app_configs
@@ -94,6 +97,15 @@ def _validate_apps_config(
     return Ok(None)
 
 
+def _validate_password_verification_config(
+    password_verification_config: PasswordVerificationConfig,
+) -> ParsingResult[None]:
+    if password_verification_config.max_concurrency < 1:
+        return Err(['Password verification concurrency must be at least 1'])
+
+    return Ok(None)
+
+
 _TOPLEVEL_FIELDS = [
     Field('locale', required=True),
     Field('propagate_exceptions', required=False, default=None),
@@ -226,6 +238,30 @@ _SECTION_DEFINITIONS = [
             enabled=False,
         ),
     ),
+    Section(
+        name='password_verification',
+        fields=[
+            Field(
+                'max_concurrency',
+                type_=ValueType.Integer,
+                required=False,
+                default=4,
+            ),
+            Field(
+                'queue_timeout_in_ms',
+                type_=ValueType.Integer,
+                required=False,
+                default=2000,
+            ),
+        ],
+        config_class=PasswordVerificationConfig,
+        required=False,
+        default=PasswordVerificationConfig(
+            max_concurrency=4,
+            queue_timeout_in_ms=2000,
+        ),
+        validator=_validate_password_verification_config,
+    ),
     Section(
         name='payment_gateways',
         subsections=[
@@ -306,6 +342,40 @@ _SECTION_DEFINITIONS = [
         config_class=SmtpConfig,
         required=True,
     ),
+    Section(
+        name='user_log',
+        subsections=[
+            Subsection(
+                Section(
+                    name='retention_policies',
+                    fields=[
+                        Field('event_type', required=True),
+                        Field(
+                            'max_age_in_days',
+                            type_=ValueType.Integer,
+                            required=True,
+                        ),
+                        Field(
+                            'archive',
+                            type_=ValueType.Boolean,
+                            required=False,
+                            default=False,
+                        ),
+                    ],
+                    config_class=UserLogRetentionPolicyConfig,
+                    collection_type=CollectionType.List,
+                    required=False,
+                ),
+                collection_type=CollectionType.List,
+            ),
+        ],
+        fields=[],
+        config_class=UserLogConfig,
+        required=False,
+        default=UserLogConfig(
+            retention_policies=[],
+        ),
+    ),
 ]
 
 
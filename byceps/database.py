@@ -8,13 +8,21 @@ Database utilities.
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from collections.abc import Callable, Iterable
-from typing import Any
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any, cast
 
 from flask_sqlalchemy import SQLAlchemy
 from flask_sqlalchemy.pagination import Pagination
+from sqlalchemy import (
+    ColumnElement,
+    CursorResult,
+    DDL,
+    delete,
+    event,
+    select,
+)
 from sqlalchemy.dialects.postgresql import insert, JSONB
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, InstrumentedAttribute
 from sqlalchemy.sql import Select
 from sqlalchemy.sql.dml import Insert
 from sqlalchemy.sql.schema import Table
@@ -33,6 +41,15 @@ db = SQLAlchemy(model_class=Base)
 db.JSONB = JSONB
 
 
+# Trigram indexes (for substring searches) depend on this extension,
+# which has to be available before any tables are created.
+event.listen(
+    db.metadata,
+    'before_create',
+    DDL('CREATE EXTENSION IF NOT EXISTS pg_trgm'),
+)
+
+
 def paginate(
     stmt: Select,
     page: int,
@@ -51,6 +68,32 @@ def paginate(
     return pagination
 
 
+class _PrefetchedPagination(Pagination):
+    """Pagination over a page of items that has already been fetched."""
+
+    def _query_items(self) -> list[Any]:
+        return self._query_args['items']
+
+    def _query_count(self) -> int:
+        return self._query_args['total']
+
+
+def to_pagination(
+    items: list[Any], total: int, page: int, per_page: int
+) -> Pagination:
+    """Wrap an already fetched page of items, e.g. one that has been
+    assembled from multiple sources.
+    """
+    return _PrefetchedPagination(
+        page=page,
+        per_page=per_page,
+        max_per_page=None,
+        error_out=False,
+        items=items,
+        total=total,
+    )
+
+
 def insert_ignore_on_conflict(table: Table, values: dict[str, Any]) -> None:
     """Insert the record identified by the primary key (specified as
     part of the values), or do nothing on conflict.
@@ -65,6 +108,49 @@ def insert_ignore_on_conflict(table: Table, values: dict[str, Any]) -> None:
     db.session.commit()
 
 
+def insert_many(table: Table, rows: Sequence[dict[str, Any]]) -> None:
+    """Execute, but do not commit, a multi-row INSERT of the records."""
+    if not rows:
+        return
+
+    query = insert(table).values(list(rows))
+
+    db.session.execute(query)
+
+
+def delete_in_chunks(
+    id_column: InstrumentedAttribute,
+    *criteria: ColumnElement[bool],
+    chunk_size: int,
+) -> int:
+    """Delete the records matching the criteria in chunks of (at most)
+    `chunk_size` records, committing after each chunk.
+
+    This avoids a single huge `DELETE` that holds locks for a long time.
+
+    Return the total number of deleted records.
+    """
+    model = id_column.class_
+    num_deleted_total = 0
+
+    while True:
+        ids_stmt = select(id_column).filter(*criteria).limit(chunk_size)
+        result = cast(
+            CursorResult,
+            db.session.execute(
+                delete(model)
+                .where(id_column.in_(ids_stmt))
+                .execution_options(synchronize_session=False)
+            ),
+        )
+        db.session.commit()
+
+        num_deleted_total += result.rowcount
+
+        if result.rowcount < chunk_size:
+            return num_deleted_total
+
+
 def upsert(
     table: Table, identifier: dict[str, Any], replacement: dict[str, Any]
 ) -> None:
@@ -6,13 +6,13 @@ byceps.services.api.blueprints.admin.views
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from flask import g, request
+from flask import g, request, session
 from flask_babel import gettext
 
 from byceps.services.authn.api import authn_api_service
 from byceps.services.user import user_service
 from byceps.util.framework.blueprint import create_blueprint
-from byceps.util.framework.flash import flash_success
+from byceps.util.framework.flash import flash_error, flash_success
 from byceps.util.framework.templating import templated
 from byceps.util.views import (
     permission_required,
@@ -26,6 +26,9 @@ from .forms import CreateForm
 blueprint = create_blueprint('api_admin', __name__)
 
 
+SESSION_KEY_CREATION_REFERENCE = 'api_admin_creation_reference'
+
+
 @blueprint.get('')
 @permission_required('api.administrate')
 @templated
@@ -69,13 +72,46 @@ def create_api_token():
     permissions = set(form.permissions.data)
     description = form.description.data.strip()
 
-    authn_api_service.create_api_token(
+    api_token = authn_api_service.create_api_token(
         creator_id, permissions, description=description
     )
 
     flash_success(gettext('API token has been created.'))
 
-    return redirect_to('.index')
+    # Pass the token on to be shown once, so that reloading the page
+    # does not create another API token. The token itself is kept on
+    # the server, the session only carries a reference to it.
+    reference = authn_api_service.stash_created_token(api_token.token)
+    session[SESSION_KEY_CREATION_REFERENCE] = {
+        'api_token_id': str(api_token.id),
+        'reference': reference,
+    }
+
+    return redirect_to('.view_created_api_token', api_token_id=api_token.id)
+
+
+@blueprint.get('/api_tokens/<uuid:api_token_id>/created')
+@permission_required('api.administrate')
+@templated
+def view_created_api_token(api_token_id):
+    """Show the token of a just created API token (once)."""
+    creation_reference = session.pop(SESSION_KEY_CREATION_REFERENCE, None)
+
+    token = None
+    if (creation_reference is not None) and (
+        creation_reference['api_token_id'] == str(api_token_id)
+    ):
+        token = authn_api_service.pop_created_token(
+            creation_reference['reference']
+        )
+
+    if token is None:
+        flash_error(gettext('The token cannot be displayed again.'))
+        return redirect_to('.index')
+
+    return {
+        'token': token,
+    }
 
 
 @blueprint.post('/api_tokens/<uuid:api_token_id>/suspend')
@@ -6,7 +6,10 @@ byceps.services.attendance.blueprints.api.views
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from flask import abort, request
+from itertools import batched
+from typing import Any
+
+from flask import abort, jsonify, request
 from pydantic import ValidationError
 
 from byceps.services.party import party_service
@@ -15,7 +18,11 @@ from byceps.services.ticketing import ticket_attendance_service
 from byceps.services.user import user_service
 from byceps.services.user.models import UserID
 from byceps.util.framework.blueprint import create_blueprint
-from byceps.util.views import api_token_required, respond_no_content
+from byceps.util.views import (
+    api_token_required,
+    get_request_items,
+    respond_no_content,
+)
 
 from .models import CreateArchivedAttendanceRequest
 
@@ -23,6 +30,11 @@ from .models import CreateArchivedAttendanceRequest
 blueprint = create_blueprint('attendance_api', __name__)
 
 
+# Number of items of a batch request to process at once
+BATCH_CHUNK_SIZE = 1_000
+BATCH_MAX_ITEMS = 10_000
+
+
 @blueprint.post('/archived_attendances')
 @api_token_required
 @respond_no_content
@@ -47,3 +59,72 @@ def create_archived_attendance():
         abort(400, 'Party ID unknown')
 
     ticket_attendance_service.create_archived_attendance(user.id, party.id)
+
+
+@blueprint.post('/archived_attendances/batch')
+@api_token_required
+def create_archived_attendances():
+    """Create archived attendances of users at parties.
+
+    Accept a JSON array or newline-delimited JSON of attendances, and
+    return a result for each.
+    """
+    reqs = get_request_items(
+        CreateArchivedAttendanceRequest, max_items=BATCH_MAX_ITEMS
+    )
+
+    results = []
+    for chunk in batched(reqs, BATCH_CHUNK_SIZE):
+        results.extend(_create_archived_attendances(chunk))
+
+    return jsonify({'results': results})
+
+
+def _create_archived_attendances(
+    reqs: tuple[CreateArchivedAttendanceRequest, ...],
+) -> list[dict[str, Any]]:
+    user_ids = {UserID(req.user_id) for req in reqs}
+    known_user_ids = {user.id for user in user_service.get_users(user_ids)}
+
+    party_ids = {PartyID(req.party_id) for req in reqs}
+    known_party_ids = {
+        party.id for party in party_service.get_parties(party_ids)
+    }
+
+    valid_user_and_party_ids = [
+        (UserID(req.user_id), PartyID(req.party_id))
+        for req in reqs
+        if req.user_id in known_user_ids and req.party_id in known_party_ids
+    ]
+
+    created_user_and_party_ids = (
+        ticket_attendance_service.create_archived_attendances(
+            valid_user_and_party_ids
+        )
+    )
+
+    results = []
+    for req in reqs:
+        result: dict[str, Any] = {
+            'user_id': str(req.user_id),
+            'party_id': req.party_id,
+        }
+
+        user_and_party_id = (UserID(req.user_id), PartyID(req.party_id))
+
+        if req.user_id not in known_user_ids:
+            result['status'] = 'rejected'
+            result['error'] = 'User ID unknown'
+        elif req.party_id not in known_party_ids:
+            result['status'] = 'rejected'
+            result['error'] = 'Party ID unknown'
+        elif user_and_party_id in created_user_and_party_ids:
+            result['status'] = 'created'
+            # Report duplicates within the request as existing.
+            created_user_and_party_ids.remove(user_and_party_id)
+        else:
+            result['status'] = 'exists'
+
+        results.append(result)
+
+    return results
@@ -7,6 +7,7 @@ byceps.services.authn.api.authn_api_domain_service
 """
 
 from datetime import datetime
+from hashlib import sha256
 from secrets import token_urlsafe
 
 from byceps.services.authz.models import PermissionID
@@ -37,3 +38,12 @@ def create_api_token(
         description=description,
         suspended=False,
     )
+
+
+def digest_token(token: str) -> str:
+    """Return the digest of the token, which is stored instead of the
+    token itself.
+
+    As tokens are long and random, a plain (unsalted) hash suffices.
+    """
+    return sha256(token.encode()).hexdigest()
@@ -2,14 +2,35 @@
 byceps.services.authn.api.authn_api_service
 ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
+Only a digest of each token is stored.
+
+As every API request needs its token to be verified, API tokens are
+looked up by digest in a short-lived per-process cache first, then in
+Redis, and only then in the database.
+
+Suspending, unsuspending, or deleting an API token bumps its
+generation in Redis. Entries cached in Redis carry the generation that
+was current before the token was read from the database, and are
+ignored if it has changed since. This prevents a lookup that has read
+the token just before the change from caching the outdated state after
+it. Other processes may keep accepting the token for up to
+`LOCAL_CACHE_TTL`, though.
+
 :Copyright: 2014-2026 Jochen Kupperschmidt
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+import hmac
+import json
+import secrets
 from uuid import UUID
 
+from redis import Redis
 from sqlalchemy import delete, select
 
+from byceps.byceps_app import get_current_byceps_app
 from byceps.database import db
 from byceps.services.authz.models import PermissionID
 from byceps.services.user.models import UserID
@@ -19,6 +40,31 @@ from .dbmodels import DbApiToken
 from .models import ApiToken
 
 
+LOCAL_CACHE_TTL = timedelta(seconds=5)
+REDIS_CACHE_TTL = timedelta(seconds=60)
+CREATED_TOKEN_TTL = timedelta(minutes=5)
+
+_REDIS_KEY_PREFIX = 'authn-api-token:'
+_REDIS_GENERATION_KEY_PREFIX = 'authn-api-token-generation:'
+_REDIS_STASH_KEY_PREFIX = 'authn-api-created-token:'
+
+# Generations must outlive the cache entries that refer to them.
+_REDIS_GENERATION_TTL = REDIS_CACHE_TTL * 10
+
+
+# API tokens (and when they were cached) by token digest
+_cached_api_tokens_by_digest: dict[str, tuple[ApiToken, datetime]] = {}
+
+
+@dataclass
+class _ChangeCounter:
+    value: int = 0
+
+
+# Number of API token changes made by this process
+_local_changes = _ChangeCounter()
+
+
 def create_api_token(
     creator_id: UserID,
     permissions: set[PermissionID],
@@ -36,11 +82,14 @@ def create_api_token(
 
 
 def _persist_api_token(api_token: ApiToken) -> None:
+    if api_token.token is None:
+        raise ValueError('Token is only available for new API tokens')
+
     db_api_token = DbApiToken(
         api_token.id,
         api_token.created_at,
         api_token.creator_id,
-        api_token.token,
+        authn_api_domain_service.digest_token(api_token.token),
         api_token.permissions,
         api_token.description,
         api_token.suspended,
@@ -51,13 +100,46 @@ def _persist_api_token(api_token: ApiToken) -> None:
 
 def find_api_token_by_token(token: str) -> ApiToken | None:
     """Return the API token for that token, or nothing if not found."""
+    token_digest = authn_api_domain_service.digest_token(token)
+
+    api_token = _get_locally_cached_api_token(token_digest)
+    if api_token is not None:
+        return api_token
+
+    local_change_count = _local_changes.value
+
+    api_token, generation = _get_redis_cached_api_token(token_digest)
+    if api_token is None:
+        api_token = _find_db_api_token_by_digest(token_digest)
+        if api_token is None:
+            return None
+
+        _cache_api_token_in_redis(token_digest, api_token, generation)
+
+    # Do not cache locally if the API token might have been changed
+    # by this process while it was being looked up.
+    if _local_changes.value == local_change_count:
+        _cached_api_tokens_by_digest[token_digest] = (
+            api_token,
+            datetime.utcnow(),
+        )
+
+    return api_token
+
+
+def _find_db_api_token_by_digest(token_digest: str) -> ApiToken | None:
     db_api_token = db.session.execute(
-        select(DbApiToken).filter_by(token=token)
+        select(DbApiToken).filter_by(token_digest=token_digest)
     ).scalar_one_or_none()
 
     if db_api_token is None:
         return None
 
+    # Compare in constant time instead of relying on the database's
+    # comparison alone.
+    if not hmac.compare_digest(db_api_token.token_digest, token_digest):
+        return None
+
     return _db_entity_to_api_token(db_api_token)
 
 
@@ -76,6 +158,8 @@ def suspend_api_token(api_token_id: UUID) -> None:
     db_api_token.suspended = True
     db.session.commit()
 
+    _uncache_api_token(db_api_token.token_digest)
+
 
 def unsuspend_api_token(api_token_id: UUID) -> None:
     """Unsuspend the API token."""
@@ -83,6 +167,8 @@ def unsuspend_api_token(api_token_id: UUID) -> None:
     db_api_token.suspended = False
     db.session.commit()
 
+    _uncache_api_token(db_api_token.token_digest)
+
 
 def _get_db_api_token(api_token_id: UUID) -> DbApiToken:
     db_api_token = db.session.get(DbApiToken, api_token_id)
@@ -95,6 +181,10 @@ def _get_db_api_token(api_token_id: UUID) -> DbApiToken:
 
 def delete_api_token(api_token_id: UUID) -> None:
     """Delete the API token."""
+    token_digest = db.session.scalar(
+        select(DbApiToken.token_digest).filter_by(id=api_token_id)
+    )
+
     db.session.execute(
         delete(DbApiToken)
         .where(DbApiToken.id == api_token_id)
@@ -102,14 +192,153 @@ def delete_api_token(api_token_id: UUID) -> None:
     )
     db.session.commit()
 
+    if token_digest is not None:
+        _uncache_api_token(token_digest)
+
+
+def stash_created_token(token: str) -> str:
+    """Keep the token of a just created API token on the server for a
+    short time, to be displayed once.
+
+    Return a reference to retrieve the token with.
+    """
+    reference = secrets.token_urlsafe(24)
+
+    _get_redis_client().set(
+        _REDIS_STASH_KEY_PREFIX + reference,
+        token,
+        ex=CREATED_TOKEN_TTL,
+    )
+
+    return reference
+
+
+def pop_created_token(reference: str) -> str | None:
+    """Return the stashed token and remove it, or nothing if it has
+    already been retrieved or has expired.
+    """
+    value = _get_redis_client().getdel(_REDIS_STASH_KEY_PREFIX + reference)
+
+    if value is None:
+        return None
+
+    return value.decode()
+
 
 def _db_entity_to_api_token(db_api_token: DbApiToken) -> ApiToken:
     return ApiToken(
         id=db_api_token.id,
         created_at=db_api_token.created_at,
         creator_id=db_api_token.creator_id,
-        token=db_api_token.token,
+        token=None,
         permissions=frozenset(db_api_token.permissions),
         description=db_api_token.description,
         suspended=db_api_token.suspended,
     )
+
+
+# -------------------------------------------------------------------- #
+# caching
+
+
+def _get_locally_cached_api_token(token_digest: str) -> ApiToken | None:
+    cached = _cached_api_tokens_by_digest.get(token_digest)
+    if cached is None:
+        return None
+
+    api_token, cached_at = cached
+    if datetime.utcnow() - cached_at > LOCAL_CACHE_TTL:
+        del _cached_api_tokens_by_digest[token_digest]
+        return None
+
+    return api_token
+
+
+def _get_redis_cached_api_token(
+    token_digest: str,
+) -> tuple[ApiToken | None, int]:
+    """Return the API token cached in Redis (if any, and if it is still
+    current) and the current generation of the API token.
+    """
+    value, generation_value = _get_redis_client().mget(
+        [_get_redis_key(token_digest), _get_redis_generation_key(token_digest)]
+    )
+
+    generation = int(generation_value) if generation_value is not None else 0
+
+    if value is None:
+        return None, generation
+
+    data = json.loads(value)
+
+    if data.get('generation') != generation:
+        # The API token has been changed since it was cached.
+        return None, generation
+
+    api_token = ApiToken(
+        id=UUID(data['id']),
+        created_at=datetime.fromisoformat(data['created_at']),
+        creator_id=UserID(UUID(data['creator_id'])),
+        token=None,
+        permissions=frozenset(
+            PermissionID(permission) for permission in data['permissions']
+        ),
+        description=data['description'],
+        suspended=data['suspended'],
+    )
+
+    return api_token, generation
+
+
+def _cache_api_token_in_redis(
+    token_digest: str, api_token: ApiToken, generation: int
+) -> None:
+    """Cache the API token in Redis.
+
+    The generation has to be the one that was current before the API
+    token was read from the database.
+    """
+    data = {
+        'id': str(api_token.id),
+        'created_at': api_token.created_at.isoformat(),
+        'creator_id': str(api_token.creator_id),
+        'permissions': sorted(api_token.permissions),
+        'description': api_token.description,
+        'suspended': api_token.suspended,
+        'generation': generation,
+    }
+
+    _get_redis_client().set(
+        _get_redis_key(token_digest), json.dumps(data), ex=REDIS_CACHE_TTL
+    )
+
+
+def _uncache_api_token(token_digest: str) -> None:
+    """Invalidate cached entries of the API token.
+
+    Has to be called after the change to the API token has been
+    committed.
+    """
+    _local_changes.value += 1
+
+    generation_key = _get_redis_generation_key(token_digest)
+
+    pipeline = _get_redis_client().pipeline()
+    pipeline.incr(generation_key)
+    pipeline.expire(generation_key, _REDIS_GENERATION_TTL)
+    pipeline.delete(_get_redis_key(token_digest))
+    pipeline.execute()
+
+    _cached_api_tokens_by_digest.pop(token_digest, None)
+
+
+def _get_redis_key(token_digest: str) -> str:
+    return _REDIS_KEY_PREFIX + token_digest
+
+
+def _get_redis_generation_key(token_digest: str) -> str:
+    return _REDIS_GENERATION_KEY_PREFIX + token_digest
+
+
+def _get_redis_client() -> Redis:
+    return get_current_byceps_app().redis_client
@@ -6,6 +6,8 @@ byceps.services.authn.api.blueprints.api.views
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+import ipaddress
+
 from flask import abort, jsonify, request
 
 from byceps.services.authn.session import authn_session_service
@@ -20,14 +22,36 @@ blueprint = create_blueprint('authn_api', __name__)
 @blueprint.get('/logins')
 @api_token_required
 def get_logins_for_ip_address():
-    """Return logins for an IP address."""
+    """Return logins for an IP address or from within a network (given
+    in CIDR notation, e.g. `192.168.0.0/16`).
+    """
     ip_address = request.args.get('ip_address')
-    if not ip_address:
-        abort(400, "No value given for query parameter 'ip_address'.")
+    network = request.args.get('network')
+
+    if ip_address:
+        try:
+            ipaddress.ip_address(ip_address)
+        except ValueError:
+            abort(400, "Invalid value for query parameter 'ip_address'.")
+
+        occurred_at_and_user_ids = (
+            authn_session_service.find_logins_for_ip_address(ip_address)
+        )
+    elif network:
+        try:
+            ip_network = ipaddress.ip_network(network, strict=False)
+        except ValueError:
+            abort(400, "Invalid value for query parameter 'network'.")
+
+        occurred_at_and_user_ids = (
+            authn_session_service.find_logins_for_network(ip_network)
+        )
+    else:
+        abort(
+            400,
+            "No value given for query parameter 'ip_address' or 'network'.",
+        )
 
-    occurred_at_and_user_ids = authn_session_service.find_logins_for_ip_address(
-        ip_address
-    )
     occurred_at_and_user_ids.sort()
 
     user_ids = {user_id for _, user_id in occurred_at_and_user_ids}
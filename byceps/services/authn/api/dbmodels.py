@@ -27,7 +27,7 @@ class DbApiToken(db.Model):
     creator_id: Mapped[UserID] = mapped_column(
         db.Uuid, db.ForeignKey('users.id')
     )
-    token: Mapped[str] = mapped_column(db.UnicodeText)
+    token_digest: Mapped[str] = mapped_column(db.UnicodeText, unique=True)
     permissions: Mapped[list[PermissionID]] = mapped_column(
         MutableList.as_mutable(db.JSONB)
     )
@@ -39,7 +39,7 @@ class DbApiToken(db.Model):
         api_token_id: UUID,
         created_at: datetime,
         creator_id: UserID,
-        token: str,
+        token_digest: str,
         permissions: frozenset[PermissionID],
         description: str | None,
         suspended: bool,
@@ -47,7 +47,7 @@ class DbApiToken(db.Model):
         self.id = api_token_id
         self.created_at = created_at
         self.creator_id = creator_id
-        self.token = token
+        self.token_digest = token_digest
         self.permissions = list(permissions)
         self.description = description
         self.suspended = suspended
@@ -19,7 +19,9 @@ class ApiToken:
     id: UUID
     created_at: datetime
     creator_id: UserID
-    token: str
+    # Only the token's digest is stored, so the token itself is only
+    # available right after the API token has been created.
+    token: str | None
     permissions: frozenset[PermissionID]
     description: str | None
     suspended: bool
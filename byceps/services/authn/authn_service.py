@@ -70,8 +70,12 @@ def _check_account(user: User) -> Result[User, UserAuthenticationFailedError]:
 def _check_password(
     user: User, password: Password
 ) -> Result[User, UserAuthenticationFailedError]:
-    if not authn_password_service.is_password_valid_for_user(user.id, password):
-        return Err(WrongPasswordError())
+    match authn_password_service.check_password_for_user(user.id, password):
+        case Ok(is_password_valid):
+            if not is_password_valid:
+                return Err(WrongPasswordError())
+        case Err(e):
+            return Err(e)
 
     authn_password_service.migrate_password_hash_if_outdated(user.id, password)
 
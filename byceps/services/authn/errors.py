@@ -34,10 +34,18 @@ class WrongPasswordError:
     pass
 
 
+@dataclass(frozen=True)
+class PasswordVerificationUnavailableError:
+    """The password could not be verified because too many password
+    verifications are already in progress.
+    """
+
+
 UserAuthenticationFailedError = (
     UsernameUnknownError
     | UserAccountNotInitializedError
     | UserAccountSuspendedError
     | UserAccountDeletedError
     | WrongPasswordError
+    | PasswordVerificationUnavailableError
 )
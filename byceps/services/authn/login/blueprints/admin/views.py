@@ -11,6 +11,7 @@ from flask_babel import gettext
 from secret_type import secret
 
 from byceps.services.authn import signals as authn_signals
+from byceps.services.authn.errors import PasswordVerificationUnavailableError
 from byceps.services.user import user_service
 from byceps.util.framework.blueprint import create_blueprint
 from byceps.util.framework.flash import flash_notice
@@ -67,6 +68,11 @@ def log_in():
     ):
         case Ok((_, logged_in_event)):
             pass
+        case Err(PasswordVerificationUnavailableError()):
+            form.form_errors.append(
+                gettext('Too many logins at the moment. Please retry shortly.')
+            )
+            return log_in_form(form), 503
         case Err(_):
             form.form_errors.append(gettext('Login failed.'))
             return log_in_form(form)
@@ -11,6 +11,7 @@ from flask_babel import gettext
 from secret_type import secret
 
 from byceps.services.authn import signals as authn_signals
+from byceps.services.authn.errors import PasswordVerificationUnavailableError
 from byceps.util.framework.blueprint import create_blueprint
 from byceps.util.framework.flash import flash_notice
 from byceps.util.framework.templating import templated
@@ -84,6 +85,8 @@ def log_in():
                 'consent.consent_form', token=err.verification_token
             )
             return [('Location', consent_form_url)]
+        case Err(PasswordVerificationUnavailableError()):
+            abort(503, 'Too many logins at the moment, please retry shortly')
         case Err(_):
             abort(401, 'Authentication failed')
 
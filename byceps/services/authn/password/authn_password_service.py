@@ -10,13 +10,18 @@ from secret_type import secret
 from sqlalchemy import delete
 
 from byceps.database import db
+from byceps.services.authn.errors import PasswordVerificationUnavailableError
 from byceps.services.authn.events import PasswordUpdatedEvent
 from byceps.services.authn.session import authn_session_service
 from byceps.services.user.log import user_log_service
 from byceps.services.user.log.models import UserLogEntry
 from byceps.services.user.models import Password, User, UserID
+from byceps.util.result import Err, Ok, Result
 
-from . import authn_password_domain_service
+from . import (
+    authn_password_domain_service,
+    authn_password_verification_service,
+)
 from .dbmodels import DbCredential
 from .models import Credential
 
@@ -86,19 +91,49 @@ def is_password_valid_for_user(user_id: UserID, password: Password) -> bool:
     )
 
 
+def check_password_for_user(
+    user_id: UserID, password: Password
+) -> Result[bool, PasswordVerificationUnavailableError]:
+    """Return `True` if the password is valid for the user, or `False`
+    otherwise.
+
+    Only a limited number of passwords are verified at the same time.
+    Return an error if it was not this password's turn in time.
+    """
+    db_credential = _find_credential_for_user(user_id)
+
+    if db_credential is None:
+        # no password stored for user
+        return Ok(False)
+
+    password_hash = secret(db_credential.password_hash)
+    return authn_password_verification_service.check_password_hash(
+        password_hash, password
+    )
+
+
 def migrate_password_hash_if_outdated(
     user_id: UserID, password: Password
 ) -> None:
-    """Recreate the password hash with the current algorithm and parameters."""
+    """Recreate the password hash with the current algorithm and parameters.
+
+    If the new hash cannot be created because too many password
+    verifications are in progress, keep the outdated hash for now. It
+    will be migrated on a later login.
+    """
     db_credential = _get_credential_for_user(user_id)
 
     password_hash = secret(db_credential.password_hash)
     if authn_password_domain_service.is_password_hash_current(password_hash):
         return
 
-    credential = authn_password_domain_service.create_password_hash(
+    match authn_password_verification_service.create_password_hash(
         user_id, password
-    )
+    ):
+        case Ok(credential):
+            pass
+        case Err(_):
+            return
 
     with credential.password_hash.dangerous_reveal() as password_hash:
         db_credential.password_hash = password_hash
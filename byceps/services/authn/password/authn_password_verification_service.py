@@ -0,0 +1,211 @@
+"""
+byceps.services.authn.password.authn_password_verification_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Limit the number of password verifications (and password hash
+creations) that run at the same time, across all processes.
+
+The limit is enforced by a semaphore in Redis. If no slot becomes
+available within the configured queue timeout, the attempt is rejected
+right away instead of holding up the request any longer.
+
+Metrics are recorded by the same Redis scripts that acquire and
+release slots, so they do not cost extra round trips.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+import secrets
+import time
+
+from redis import Redis
+import structlog
+
+from byceps.byceps_app import get_current_byceps_app
+from byceps.config.models import PasswordVerificationConfig
+from byceps.services.authn.errors import PasswordVerificationUnavailableError
+from byceps.services.user.models import Password, PasswordHash, UserID
+from byceps.util.result import Err, Ok, Result
+
+from . import authn_password_domain_service
+from .models import Credential
+
+
+log = structlog.get_logger()
+
+
+# Slots of processes that died while holding them are freed after this.
+SLOT_LEASE = timedelta(seconds=30)
+
+POLL_INTERVAL = timedelta(milliseconds=20)
+
+_REDIS_KEY_PREFIX = 'authn-password-verification:'
+_REDIS_KEY_HOLDERS = _REDIS_KEY_PREFIX + 'holders'
+_REDIS_KEY_WAITERS = _REDIS_KEY_PREFIX + 'waiters'
+_REDIS_KEY_HASH_COUNT = _REDIS_KEY_PREFIX + 'hash-count'
+_REDIS_KEY_HASH_SECONDS_SUM = _REDIS_KEY_PREFIX + 'hash-seconds-sum'
+_REDIS_KEY_REJECTED_COUNT = _REDIS_KEY_PREFIX + 'rejected-count'
+
+
+# Holders and waiters are kept in sorted sets, scored by the time
+# (in seconds since the epoch) at which they expire.
+
+_ACQUIRE_SCRIPT = """
+local holders, waiters = KEYS[1], KEYS[2]
+local id, limit, now = ARGV[1], tonumber(ARGV[2]), ARGV[3]
+local holder_expires_at, waiter_expires_at = ARGV[4], ARGV[5]
+
+redis.call('ZREMRANGEBYSCORE', holders, '-inf', now)
+redis.call('ZREMRANGEBYSCORE', waiters, '-inf', now)
+
+if redis.call('ZCARD', holders) < limit then
+    redis.call('ZADD', holders, holder_expires_at, id)
+    redis.call('ZREM', waiters, id)
+    return 1
+end
+
+redis.call('ZADD', waiters, waiter_expires_at, id)
+return 0
+"""
+
+_RELEASE_SCRIPT = """
+redis.call('ZREM', KEYS[1], ARGV[1])
+redis.call('INCR', KEYS[2])
+redis.call('INCRBYFLOAT', KEYS[3], ARGV[2])
+"""
+
+_REJECT_SCRIPT = """
+redis.call('ZREM', KEYS[1], ARGV[1])
+redis.call('INCR', KEYS[2])
+"""
+
+
+@dataclass(frozen=True, kw_only=True)
+class PasswordVerificationMetrics:
+    queue_depth: int
+    hash_count: int
+    hash_seconds_sum: float
+    rejected_count: int
+
+
+def check_password_hash(
+    password_hash: PasswordHash, password: Password
+) -> Result[bool, PasswordVerificationUnavailableError]:
+    """Check the password against the hash once a slot is available."""
+    return _run_bounded(
+        lambda: authn_password_domain_service.check_password_hash(
+            password_hash, password
+        )
+    )
+
+
+def create_password_hash(
+    user_id: UserID, password: Password
+) -> Result[Credential, PasswordVerificationUnavailableError]:
+    """Create a password-based credential once a slot is available."""
+    return _run_bounded(
+        lambda: authn_password_domain_service.create_password_hash(
+            user_id, password
+        )
+    )
+
+
+def _run_bounded[T](
+    func: Callable[[], T],
+) -> Result[T, PasswordVerificationUnavailableError]:
+    byceps_app = get_current_byceps_app()
+    config = byceps_app.byceps_config.password_verification
+    redis_client = byceps_app.redis_client
+
+    slot_id = secrets.token_hex(16)
+
+    if not _acquire_slot(redis_client, config, slot_id):
+        redis_client.register_script(_REJECT_SCRIPT)(
+            keys=[_REDIS_KEY_WAITERS, _REDIS_KEY_REJECTED_COUNT],
+            args=[slot_id],
+        )
+
+        log.warning(
+            'Password verification rejected: '
+            'no slot available within queue timeout'
+        )
+
+        return Err(PasswordVerificationUnavailableError())
+
+    started_at = time.monotonic()
+    try:
+        return Ok(func())
+    finally:
+        elapsed_seconds = time.monotonic() - started_at
+
+        redis_client.register_script(_RELEASE_SCRIPT)(
+            keys=[
+                _REDIS_KEY_HOLDERS,
+                _REDIS_KEY_HASH_COUNT,
+                _REDIS_KEY_HASH_SECONDS_SUM,
+            ],
+            args=[slot_id, elapsed_seconds],
+        )
+
+
+def _acquire_slot(
+    redis_client: Redis, config: PasswordVerificationConfig, slot_id: str
+) -> bool:
+    """Wait for a slot until the queue timeout has passed.
+
+    Return `True` if a slot has been acquired.
+    """
+    acquire = redis_client.register_script(_ACQUIRE_SCRIPT)
+
+    queue_timeout = timedelta(milliseconds=config.queue_timeout_in_ms)
+    deadline = time.monotonic() + queue_timeout.total_seconds()
+
+    while True:
+        now = time.time()
+        acquired = acquire(
+            keys=[_REDIS_KEY_HOLDERS, _REDIS_KEY_WAITERS],
+            args=[
+                slot_id,
+                config.max_concurrency,
+                now,
+                now + SLOT_LEASE.total_seconds(),
+                now + (queue_timeout + SLOT_LEASE).total_seconds(),
+            ],
+        )
+        if acquired:
+            return True
+
+        remaining_seconds = deadline - time.monotonic()
+        if remaining_seconds <= 0:
+            return False
+
+        time.sleep(min(POLL_INTERVAL.total_seconds(), remaining_seconds))
+
+
+def get_metrics() -> PasswordVerificationMetrics:
+    """Return metrics on password verifications of all processes."""
+    redis_client = get_current_byceps_app().redis_client
+
+    pipeline = redis_client.pipeline()
+    pipeline.zcount(_REDIS_KEY_WAITERS, time.time(), '+inf')
+    pipeline.mget(
+        [
+            _REDIS_KEY_HASH_COUNT,
+            _REDIS_KEY_HASH_SECONDS_SUM,
+            _REDIS_KEY_REJECTED_COUNT,
+        ]
+    )
+    queue_depth, (hash_count, hash_seconds_sum, rejected_count) = (
+        pipeline.execute()
+    )
+
+    return PasswordVerificationMetrics(
+        queue_depth=queue_depth,
+        hash_count=int(hash_count or 0),
+        hash_seconds_sum=float(hash_seconds_sum or 0.0),
+        rejected_count=int(rejected_count or 0),
+    )
@@ -8,15 +8,25 @@ byceps.services.authn.session.authn_session_repository
 
 from collections.abc import Sequence
 from datetime import datetime
+import ipaddress
+from ipaddress import IPv4Network, IPv6Network
 from uuid import uuid4
 
-from sqlalchemy import delete, select
+from sqlalchemy import cast, delete, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import insert
 
-from byceps.database import db, insert_ignore_on_conflict, upsert
+from byceps.database import (
+    db,
+    delete_in_chunks,
+    insert_ignore_on_conflict,
+    upsert,
+)
+from byceps.services.site.models import SiteID
 from byceps.services.user.log.dbmodels import DbUserLogEntry
 from byceps.services.user.models import UserID
 
-from .dbmodels import DbRecentLogin, DbSessionToken
+from .dbmodels import DbLogin, DbRecentLogin, DbSessionToken
 
 
 LOGIN_EVENT_TYPES = frozenset(
@@ -126,6 +136,24 @@ def find_recent_logins_for_users(
     }
 
 
+def persist_login(
+    db_log_entry: DbUserLogEntry, ip_address: str | None, site_id: SiteID | None
+) -> None:
+    """Store the login's log entry and login record."""
+    db.session.add(db_log_entry)
+
+    db_login = DbLogin(
+        db_log_entry.id,
+        db_log_entry.occurred_at,
+        db_log_entry.user_id,
+        ip_address,
+        site_id,
+    )
+    db.session.add(db_login)
+
+    db.session.commit()
+
+
 def find_logins_for_ip_address(
     ip_address: str,
 ) -> Sequence[tuple[datetime, UserID]]:
@@ -135,29 +163,131 @@ def find_logins_for_ip_address(
     return (
         db.session.execute(
             select(
-                DbUserLogEntry.occurred_at,
-                DbUserLogEntry.user_id,
+                DbLogin.occurred_at,
+                DbLogin.user_id,
             )
-            .filter(DbUserLogEntry.event_type.in_(LOGIN_EVENT_TYPES))
-            .filter(DbUserLogEntry.data['ip_address'].astext == ip_address)
-            .order_by(DbUserLogEntry.occurred_at)
+            .filter(DbLogin.ip_address == cast(ip_address, postgresql.INET))
+            .order_by(DbLogin.occurred_at)
+        )
+        .tuples()
+        .all()
+    )
+
+
+def find_logins_for_network(
+    network: IPv4Network | IPv6Network,
+) -> Sequence[tuple[datetime, UserID]]:
+    """Return login timestamp and user ID for logins from IP addresses
+    within the given network.
+    """
+    return (
+        db.session.execute(
+            select(
+                DbLogin.occurred_at,
+                DbLogin.user_id,
+            )
+            .filter(
+                DbLogin.ip_address.op('<<=')(
+                    cast(str(network), postgresql.CIDR)
+                )
+            )
+            .order_by(DbLogin.occurred_at)
         )
         .tuples()
         .all()
     )
 
 
-def delete_login_entries(occurred_before: datetime) -> int:
-    """Delete login log entries which occurred before the given date.
+def backfill_logins_from_log_entries(
+    *, chunk_size: int = 10_000
+) -> tuple[int, int]:
+    """Create login records for login log entries that lack one.
+
+    Log entries are processed in chunks, committing after each chunk.
+    Entries with an IP address that is empty or malformed are skipped.
+
+    Return the number of login records created and the number of log
+    entries skipped.
+    """
+    num_created = 0
+    num_skipped = 0
+    last_entry_id = None
+
+    while True:
+        stmt = (
+            select(
+                DbUserLogEntry.id,
+                DbUserLogEntry.occurred_at,
+                DbUserLogEntry.user_id,
+                DbUserLogEntry.data,
+            )
+            .filter(DbUserLogEntry.event_type.in_(LOGIN_EVENT_TYPES))
+            .order_by(DbUserLogEntry.id)
+            .limit(chunk_size)
+        )
+
+        if last_entry_id is not None:
+            stmt = stmt.filter(DbUserLogEntry.id > last_entry_id)
+
+        rows = db.session.execute(stmt).all()
+        if not rows:
+            break
+
+        last_entry_id = rows[-1].id
+
+        values = []
+        for entry_id, occurred_at, user_id, data in rows:
+            ip_address = data.get('ip_address')
+            if ip_address is not None:
+                try:
+                    ip_address = str(ipaddress.ip_address(ip_address))
+                except ValueError:
+                    num_skipped += 1
+                    continue
+
+            values.append(
+                {
+                    'id': entry_id,
+                    'occurred_at': occurred_at,
+                    'user_id': user_id,
+                    'ip_address': ip_address,
+                    'site_id': data.get('site_id'),
+                }
+            )
+
+        if values:
+            created_ids = db.session.scalars(
+                insert(DbLogin)
+                .values(values)
+                .on_conflict_do_nothing(index_elements=['id'])
+                .returning(DbLogin.id)
+            ).all()
+            num_created += len(created_ids)
+
+        db.session.commit()
+
+    return num_created, num_skipped
+
+
+def delete_login_entries(
+    occurred_before: datetime, *, chunk_size: int = 10_000
+) -> int:
+    """Delete login log entries (and login records) which occurred
+    before the given date.
+
+    Deletion is done in chunks, committing after each chunk.
 
     Return the number of deleted log entries.
     """
-    result = db.session.execute(
-        delete(DbUserLogEntry)
-        .filter(DbUserLogEntry.event_type.in_(LOGIN_EVENT_TYPES))
-        .filter(DbUserLogEntry.occurred_at < occurred_before)
+    delete_in_chunks(
+        DbLogin.id,
+        DbLogin.occurred_at < occurred_before,
+        chunk_size=chunk_size,
     )
-    db.session.commit()
 
-    num_deleted = result.rowcount
-    return num_deleted
+    return delete_in_chunks(
+        DbUserLogEntry.id,
+        DbUserLogEntry.event_type.in_(LOGIN_EVENT_TYPES),
+        DbUserLogEntry.occurred_at < occurred_before,
+        chunk_size=chunk_size,
+    )
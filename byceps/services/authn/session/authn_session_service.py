@@ -7,6 +7,10 @@ byceps.services.authn.session.authn_session_service
 """
 
 from datetime import datetime
+import ipaddress
+from ipaddress import IPv4Network, IPv6Network
+
+import structlog
 
 from byceps.services.authn.events import (
     UserLoggedInToAdminEvent,
@@ -21,6 +25,9 @@ from byceps.services.user.models import User, UserID
 from . import authn_session_repository
 
 
+log = structlog.get_logger()
+
+
 def delete_session_tokens_for_user(user_id: UserID) -> None:
     """Delete all session tokens that belong to the user."""
     authn_session_repository.delete_session_tokens_for_user(user_id)
@@ -63,7 +70,10 @@ def log_in_user_to_admin(
     )
 
     log_entry = _build_admin_login_log_entry(event)
-    user_log_service.persist_entry(log_entry)
+    db_log_entry = user_log_service.to_db_entry(log_entry)
+    authn_session_repository.persist_login(
+        db_log_entry, _to_valid_ip_address(ip_address), None
+    )
 
     authn_session_repository.record_recent_login(user.id, occurred_at)
 
@@ -104,7 +114,10 @@ def log_in_user_to_site(
     )
 
     log_entry = _build_site_login_log_entry(event)
-    user_log_service.persist_entry(log_entry)
+    db_log_entry = user_log_service.to_db_entry(log_entry)
+    authn_session_repository.persist_login(
+        db_log_entry, _to_valid_ip_address(ip_address), site.id
+    )
 
     authn_session_repository.record_recent_login(user.id, occurred_at)
 
@@ -128,6 +141,17 @@ def _build_site_login_log_entry(event: UserLoggedInToSiteEvent) -> UserLogEntry:
     )
 
 
+def _to_valid_ip_address(ip_address: str | None) -> str | None:
+    """Return the IP address if it is valid, `None` otherwise."""
+    if not ip_address:
+        return None
+
+    try:
+        return str(ipaddress.ip_address(ip_address))
+    except ValueError:
+        return None
+
+
 def find_recent_login(user_id: UserID) -> datetime | None:
     """Return the time of the user's most recent login, if found."""
     return authn_session_repository.find_recent_login(user_id)
@@ -149,8 +173,39 @@ def find_logins_for_ip_address(
     return list(authn_session_repository.find_logins_for_ip_address(ip_address))
 
 
+def find_logins_for_network(
+    network: IPv4Network | IPv6Network,
+) -> list[tuple[datetime, UserID]]:
+    """Return login timestamp and user ID for logins from IP addresses
+    within the given network (e.g. `192.168.0.0/16`).
+    """
+    return list(authn_session_repository.find_logins_for_network(network))
+
+
+def backfill_logins_from_log_entries() -> tuple[int, int]:
+    """Create login records for login log entries that lack one.
+
+    Log entries with an empty or malformed IP address are skipped.
+
+    Return the number of login records created and the number of log
+    entries skipped.
+    """
+    num_created, num_skipped = (
+        authn_session_repository.backfill_logins_from_log_entries()
+    )
+
+    if num_skipped:
+        log.warning(
+            'Skipped login log entries with invalid IP address',
+            num_skipped=num_skipped,
+        )
+
+    return num_created, num_skipped
+
+
 def delete_login_entries(occurred_before: datetime) -> int:
-    """Delete login log entries which occurred before the given date.
+    """Delete login log entries (and login records) which occurred
+    before the given date.
 
     Return the number of deleted log entries.
     """
@@ -7,13 +7,48 @@ byceps.services.authn.session.dbmodels
 """
 
 from datetime import datetime
+from uuid import UUID
 
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Mapped, mapped_column
 
 from byceps.database import db
+from byceps.services.site.models import SiteID
 from byceps.services.user.models import UserID
 
 
+class DbLogin(db.Model):
+    """A user's successful login.
+
+    Kept separately from the user log to be able to look up logins by IP
+    address (or network) with an index.
+    """
+
+    __tablename__ = 'authn_logins'
+
+    id: Mapped[UUID] = mapped_column(db.Uuid, primary_key=True)
+    occurred_at: Mapped[datetime] = mapped_column(index=True)
+    user_id: Mapped[UserID] = mapped_column(
+        db.Uuid, db.ForeignKey('users.id'), index=True
+    )
+    ip_address: Mapped[str | None] = mapped_column(postgresql.INET, index=True)
+    site_id: Mapped[SiteID | None] = mapped_column(db.UnicodeText)
+
+    def __init__(
+        self,
+        login_id: UUID,
+        occurred_at: datetime,
+        user_id: UserID,
+        ip_address: str | None,
+        site_id: SiteID | None,
+    ) -> None:
+        self.id = login_id
+        self.occurred_at = occurred_at
+        self.user_id = user_id
+        self.ip_address = ip_address
+        self.site_id = site_id
+
+
 class DbRecentLogin(db.Model):
     """A user's most recent successful login."""
 
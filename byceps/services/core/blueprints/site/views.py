@@ -8,7 +8,7 @@ byceps.services.core.blueprints.site.views
 
 from typing import Any
 
-from flask import g, request, Response, url_for
+from flask import current_app, g, request, Response, url_for
 from flask_babel import get_locale
 import sentry_sdk
 
@@ -41,6 +41,9 @@ def url_for_site_file(filename, **kwargs) -> str | None:
 
 @blueprint.before_app_request
 def prepare_request_globals() -> Response | None:
+    if _is_view_without_request_globals():
+        return None
+
     site = _get_site()
     if not site.enabled:
         return Response(status=404)
@@ -65,6 +68,14 @@ def prepare_request_globals() -> Response | None:
     return None
 
 
+def _is_view_without_request_globals() -> bool:
+    if request.endpoint is None:
+        return False
+
+    view_function = current_app.view_functions.get(request.endpoint)
+    return getattr(view_function, 'without_request_globals', False)
+
+
 def _get_site() -> Site:
     return site_service.get_site(get_current_byceps_app().site_id)
 
@@ -51,10 +51,15 @@ def view_global():
     current_parties_with_brand = _add_brands_to_parties(
         current_parties, active_brands
     )
+    ticket_sale_stats_by_party_id = (
+        ticket_service.get_ticket_sale_stats_for_parties(
+            current_parties_with_brand, cached=True
+        )
+    )
     current_parties_with_stats = [
         (
             party,
-            ticket_service.get_ticket_sale_stats(party),
+            ticket_sale_stats_by_party_id[party.id],
             seat_service.get_seat_utilization(party.id),
         )
         for party in current_parties_with_brand
@@ -145,7 +150,7 @@ def view_brand(brand_id):
         )
         current_party_with_stats = (
             current_party_with_brand,
-            ticket_service.get_ticket_sale_stats(current_party),
+            ticket_service.get_ticket_sale_stats(current_party, cached=True),
             seat_service.get_seat_utilization(current_party.id),
         )
     else:
@@ -203,10 +208,12 @@ def view_party(party_id):
     seating_area_count = seating_area_service.count_areas_for_party(party.id)
     seat_count = seat_service.count_seats_for_party(party.id)
 
-    ticket_sale_stats = ticket_service.get_ticket_sale_stats(party)
-    tickets_checked_in = ticket_service.count_tickets_checked_in_for_party(
-        party.id
+    # Both are served by the same (cached) ticket counters.
+    ticket_sale_stats = ticket_service.get_ticket_sale_stats(party, cached=True)
+    ticket_counters = ticket_service.get_ticket_counters(
+        [party.id], cached=True
     )
+    tickets_checked_in = ticket_counters[party.id].checked_in
 
     seat_utilization = seat_service.get_seat_utilization(party.id)
 
@@ -7,6 +7,7 @@ byceps.services.guest_server.blueprints.common.views
 """
 
 from collections.abc import Iterable
+from functools import lru_cache
 
 from flask import abort, g
 import qrcode
@@ -104,8 +105,12 @@ def _get_site_server_name(party_id: PartyID) -> str:
     return site.server_name
 
 
+@lru_cache(maxsize=1_024)
 def _generate_qrcode_svg(data: str) -> str:
-    """Generate QR code as SVG."""
+    """Generate QR code as SVG.
+
+    Cached, as the same cards tend to be viewed and printed repeatedly.
+    """
     image = qrcode.make(data, border=0, box_size=10, image_factory=SvgPathImage)
     return image.to_string().decode('utf-8')
 
@@ -8,6 +8,9 @@ byceps.metrics.metrics_service
 
 from collections.abc import Iterator
 
+from byceps.services.authn.password import (
+    authn_password_verification_service,
+)
 from byceps.services.board import (
     board_posting_query_service,
     board_service,
@@ -41,6 +44,7 @@ def collect_metrics() -> Iterator[Metric]:
 
     yield from _collect_board_metrics(brand_ids)
     yield from _collect_consent_metrics()
+    yield from _collect_password_verification_metrics()
     yield from _collect_shop_ordered_product_metrics(active_shops)
     yield from _collect_shop_order_metrics(active_shops)
     # Copy and uncomment the following line to add all orders with the
@@ -80,6 +84,24 @@ def _collect_consent_metrics() -> Iterator[Metric]:
         )
 
 
+def _collect_password_verification_metrics() -> Iterator[Metric]:
+    """Provide password verification queue depth, hashing duration, and
+    rejections.
+    """
+    metrics = authn_password_verification_service.get_metrics()
+
+    yield Metric('password_verification_queue_depth', metrics.queue_depth)
+    yield Metric(
+        'password_verification_hash_duration_seconds_sum',
+        metrics.hash_seconds_sum,
+    )
+    yield Metric(
+        'password_verification_hash_duration_seconds_count',
+        metrics.hash_count,
+    )
+    yield Metric('password_verification_rejected_count', metrics.rejected_count)
+
+
 def _collect_shop_ordered_product_metrics(
     shops: list[Shop],
 ) -> Iterator[Metric]:
@@ -161,6 +183,10 @@ def _collect_seating_metrics(active_parties: list[Party]) -> Iterator[Metric]:
 
 def _collect_ticket_metrics(active_parties: list[Party]) -> Iterator[Metric]:
     """Provide ticket counts for active parties."""
+    ticket_counters_by_party_id = ticket_service.get_ticket_counters(
+        party.id for party in active_parties
+    )
+
     for party in active_parties:
         party_id = party.id
         labels = [Label('party', party_id)]
@@ -169,23 +195,18 @@ def _collect_ticket_metrics(active_parties: list[Party]) -> Iterator[Metric]:
         if max_ticket_quantity is not None:
             yield Metric('tickets_max', max_ticket_quantity, labels=labels)
 
-        tickets_revoked_count = ticket_service.count_revoked_tickets_for_party(
-            party_id
-        )
+        ticket_counters = ticket_counters_by_party_id[party_id]
+
         yield Metric(
-            'tickets_revoked_count', tickets_revoked_count, labels=labels
+            'tickets_revoked_count', ticket_counters.revoked, labels=labels
         )
 
-        tickets_sold_count = ticket_service.count_sold_tickets_for_party(
-            party_id
-        )
-        yield Metric('tickets_sold_count', tickets_sold_count, labels=labels)
+        yield Metric('tickets_sold_count', ticket_counters.sold, labels=labels)
 
-        tickets_checked_in_count = (
-            ticket_service.count_tickets_checked_in_for_party(party_id)
-        )
         yield Metric(
-            'tickets_checked_in_count', tickets_checked_in_count, labels=labels
+            'tickets_checked_in_count',
+            ticket_counters.checked_in,
+            labels=labels,
         )
 
 
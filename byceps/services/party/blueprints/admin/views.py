@@ -91,10 +91,9 @@ def _get_days_by_party_id(parties) -> dict[PartyID, list[date]]:
 def _get_ticket_sale_stats_by_party_id(
     parties,
 ) -> dict[PartyID, TicketSaleStats]:
-    return {
-        party.id: ticket_service.get_ticket_sale_stats(party)
-        for party in parties
-    }
+    return ticket_service.get_ticket_sale_stats_for_parties(
+        parties, cached=True
+    )
 
 
 @blueprint.get('/parties/<party_id>')
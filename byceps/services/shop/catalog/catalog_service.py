@@ -21,7 +21,11 @@ from byceps.services.shop.shop.models import ShopID
 from byceps.util.result import Err, Ok, Result
 from byceps.util.uuid import generate_uuid7
 
-from . import catalog_domain_service, catalog_repository
+from . import (
+    catalog_domain_service,
+    catalog_repository,
+    catalog_version_service,
+)
 from .dbmodels import DbCatalog, DbCatalogProduct, DbCollection
 from .errors import CollectionNotEmptyError
 from .models import (
@@ -101,6 +105,8 @@ def create_collection(catalog_id: CatalogID, title: str) -> Collection:
 
     position = catalog_repository.create_collection(collection)
 
+    catalog_version_service.increment_version()
+
     return dataclasses.replace(collection, position=position)
 
 
@@ -112,6 +118,8 @@ def update_collection(collection: Collection, title: str) -> Collection:
 
     catalog_repository.update_collection(updated_collection)
 
+    catalog_version_service.increment_version()
+
     return updated_collection
 
 
@@ -122,6 +130,7 @@ def delete_collection(
     match catalog_domain_service.delete_collection(collection):
         case Ok(_):
             catalog_repository.delete_collection(collection.id)
+            catalog_version_service.increment_version()
             return Ok(None)
         case Err(e):
             return Err(e)
@@ -278,6 +287,8 @@ def add_product_to_collection(
         product_id, collection_id, assignment_id
     )
 
+    catalog_version_service.increment_version()
+
     return assignment_id
 
 
@@ -287,6 +298,8 @@ def remove_product_from_collection(
     """Remove product from collection."""
     catalog_repository.remove_product_from_collection(product_id, collection_id)
 
+    catalog_version_service.increment_version()
+
 
 def _get_catalog_products(catalog_id: CatalogID) -> list[CatalogProduct]:
     """Return the catalog's catalog products."""
@@ -0,0 +1,40 @@
+"""
+byceps.services.shop.catalog.catalog_version_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+A version number for the offered products and how they are arranged
+in catalogs, shared by all application processes via Redis.
+
+It is incremented whenever products, their attachments, or catalog
+collections change, so that data derived from them can be cached until
+the version changes.
+
+Changes to product quantities do not increment the version.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from redis import Redis
+
+from byceps.byceps_app import get_current_byceps_app
+
+
+_REDIS_KEY = 'shop-catalog-version'
+
+
+def get_version() -> int:
+    """Return the current catalog version."""
+    value = _get_redis_client().get(_REDIS_KEY)
+    return int(value) if value is not None else 0
+
+
+def increment_version() -> None:
+    """Increment the catalog version, invalidating data cached for the
+    previous version.
+    """
+    _get_redis_client().incr(_REDIS_KEY)
+
+
+def _get_redis_client() -> Redis:
+    return get_current_byceps_app().redis_client
@@ -6,7 +6,7 @@ byceps.services.shop.order.actions.ticket
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from typing import Any
 from uuid import UUID
 
@@ -19,9 +19,11 @@ from byceps.services.shop.order.log import (
     order_log_domain_service,
     order_log_service,
 )
+from byceps.services.shop.order.log.models import OrderLogEntry
 from byceps.services.shop.order.models.action import (
     ActionParameters,
     ActionProcedure,
+    PaymentActionItem,
 )
 from byceps.services.shop.order.models.order import (
     LineItem,
@@ -49,6 +51,7 @@ from byceps.util.result import Ok, Result
 def get_action_procedure() -> ActionProcedure:
     return ActionProcedure(
         on_payment=on_payment,
+        on_payment_batch=on_payment_batch,
         on_cancellation_after_payment=on_cancellation_after_payment,
     )
 
@@ -60,19 +63,72 @@ def on_payment(
     parameters: ActionParameters,
 ) -> Result[None, OrderActionFailedError]:
     """Create tickets."""
-    if parameters:
-        ticket_category_id = parameters['ticket_category_id']
-    else:
-        product = product_service.get_product(line_item.product_id)
-        ticket_category_id = product.type_params['ticket_category_id']
-
-    ticket_category = ticket_category_service.get_category(ticket_category_id)
+    ticket_category = _get_ticket_category(line_item, parameters)
 
     _create_tickets(order, line_item, ticket_category, initiator)
 
     return Ok(None)
 
 
+def on_payment_batch(
+    items: Sequence[PaymentActionItem], initiator: User
+) -> Result[None, OrderActionFailedError]:
+    """Create tickets for line items of multiple orders at once."""
+    ticket_categories = [
+        _get_ticket_category(item.line_item, item.parameters) for item in items
+    ]
+
+    db_tickets_per_item = ticket_creation_service.create_tickets_for_owners(
+        [
+            (
+                ticket_category,
+                item.order.placed_by,
+                item.line_item.quantity,
+                item.order.order_number,
+            )
+            for item, ticket_category in zip(
+                items, ticket_categories, strict=True
+            )
+        ]
+    )
+
+    log_entries = []
+    processing_results = {}
+    tickets_sold_events = []
+
+    for item, ticket_category, db_tickets in zip(
+        items, ticket_categories, db_tickets_per_item, strict=True
+    ):
+        log_entries.extend(
+            _build_creation_order_log_entries(item.order.id, db_tickets)
+        )
+
+        processing_results[item.line_item.id] = _build_processing_result(
+            db_tickets
+        )
+
+        tickets_sold_events.append(
+            order_event_service.create_tickets_sold_event(
+                item.order,
+                initiator,
+                ticket_category,
+                item.order.placed_by,
+                item.line_item.quantity,
+            )
+        )
+
+    order_log_service.persist_entries(log_entries)
+
+    order_command_service.update_line_item_processing_results(
+        processing_results
+    )
+
+    for tickets_sold_event in tickets_sold_events:
+        order_event_service.send_tickets_sold_event(tickets_sold_event)
+
+    return Ok(None)
+
+
 def on_cancellation_after_payment(
     order: Order,
     line_item: LineItem,
@@ -85,6 +141,18 @@ def on_cancellation_after_payment(
     return Ok(None)
 
 
+def _get_ticket_category(
+    line_item: LineItem, parameters: ActionParameters
+) -> TicketCategory:
+    if parameters:
+        ticket_category_id = parameters['ticket_category_id']
+    else:
+        product = product_service.get_product(line_item.product_id)
+        ticket_category_id = product.type_params['ticket_category_id']
+
+    return ticket_category_service.get_category(ticket_category_id)
+
+
 def _create_tickets(
     order: PaidOrder,
     line_item: LineItem,
@@ -106,9 +174,7 @@ def _create_tickets(
 
     _create_creation_order_log_entries(order.id, tickets)
 
-    data: dict[str, Any] = {
-        'ticket_ids': list(sorted(str(ticket.id) for ticket in tickets))
-    }
+    data = _build_processing_result(tickets)
     order_command_service.update_line_item_processing_result(line_item.id, data)
 
     tickets_sold_event = order_event_service.create_tickets_sold_event(
@@ -117,10 +183,22 @@ def _create_tickets(
     order_event_service.send_tickets_sold_event(tickets_sold_event)
 
 
+def _build_processing_result(tickets: Iterable[DbTicket]) -> dict[str, Any]:
+    return {'ticket_ids': list(sorted(str(ticket.id) for ticket in tickets))}
+
+
 def _create_creation_order_log_entries(
     order_id: OrderID, tickets: Iterable[DbTicket]
 ) -> None:
-    log_entries = [
+    log_entries = _build_creation_order_log_entries(order_id, tickets)
+
+    order_log_service.persist_entries(log_entries)
+
+
+def _build_creation_order_log_entries(
+    order_id: OrderID, tickets: Iterable[DbTicket]
+) -> list[OrderLogEntry]:
+    return [
         order_log_domain_service.build_ticket_created_entry(
             order_id,
             ticket.id,
@@ -131,8 +209,6 @@ def _create_creation_order_log_entries(
         for ticket in tickets
     ]
 
-    order_log_service.persist_entries(log_entries)
-
 
 def _revoke_tickets(order: Order, line_item: LineItem, initiator: User) -> None:
     """Revoke all tickets related to the line item."""
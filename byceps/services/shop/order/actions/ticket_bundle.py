@@ -6,6 +6,7 @@ byceps.services.shop.order.actions.ticket_bundle
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from collections.abc import Iterable, Sequence
 from typing import Any
 from uuid import UUID
 
@@ -19,9 +20,11 @@ from byceps.services.shop.order.log import (
     order_log_domain_service,
     order_log_service,
 )
+from byceps.services.shop.order.log.models import OrderLogEntry
 from byceps.services.shop.order.models.action import (
     ActionParameters,
     ActionProcedure,
+    PaymentActionItem,
 )
 from byceps.services.shop.order.models.order import (
     LineItem,
@@ -46,6 +49,7 @@ from byceps.util.result import Err, Ok, Result
 def get_action_procedure() -> ActionProcedure:
     return ActionProcedure(
         on_payment=on_payment,
+        on_payment_batch=on_payment_batch,
         on_cancellation_after_payment=on_cancellation_after_payment,
     )
 
@@ -57,15 +61,9 @@ def on_payment(
     parameters: ActionParameters,
 ) -> Result[None, OrderActionFailedError]:
     """Create ticket bundles."""
-    if parameters:
-        ticket_category_id = parameters['ticket_category_id']
-        ticket_quantity_per_bundle = int(parameters['ticket_quantity'])
-    else:
-        product = product_service.get_product(line_item.product_id)
-        ticket_category_id = product.type_params['ticket_category_id']
-        ticket_quantity_per_bundle = int(product.type_params['ticket_quantity'])
-
-    ticket_category = ticket_category_service.get_category(ticket_category_id)
+    ticket_category, ticket_quantity_per_bundle = _get_bundle_parameters(
+        line_item, parameters
+    )
 
     _create_ticket_bundles(
         order, line_item, ticket_category, ticket_quantity_per_bundle, initiator
@@ -74,6 +72,69 @@ def on_payment(
     return Ok(None)
 
 
+def on_payment_batch(
+    items: Sequence[PaymentActionItem], initiator: User
+) -> Result[None, OrderActionFailedError]:
+    """Create ticket bundles for line items of multiple orders at once."""
+    bundle_parameters = [
+        _get_bundle_parameters(item.line_item, item.parameters)
+        for item in items
+    ]
+
+    bundles_per_item = ticket_bundle_service.create_bundles_for_owners(
+        [
+            (
+                ticket_category,
+                ticket_quantity_per_bundle,
+                item.order.placed_by,
+                item.line_item.quantity,
+                item.order.order_number,
+            )
+            for item, (ticket_category, ticket_quantity_per_bundle) in zip(
+                items, bundle_parameters, strict=True
+            )
+        ]
+    )
+
+    log_entries: list[OrderLogEntry] = []
+    processing_results = {}
+    tickets_sold_events = []
+
+    for item, (ticket_category, ticket_quantity_per_bundle), bundles in zip(
+        items, bundle_parameters, bundles_per_item, strict=True
+    ):
+        log_entries.extend(
+            _build_creation_order_log_entry(item.order.id, bundle)
+            for bundle in bundles
+        )
+
+        processing_results[item.line_item.id] = _build_processing_result(
+            bundle.id for bundle in bundles
+        )
+
+        total_quantity = ticket_quantity_per_bundle * item.line_item.quantity
+        tickets_sold_events.append(
+            order_event_service.create_tickets_sold_event(
+                item.order,
+                initiator,
+                ticket_category,
+                item.order.placed_by,
+                total_quantity,
+            )
+        )
+
+    order_log_service.persist_entries(log_entries)
+
+    order_command_service.update_line_item_processing_results(
+        processing_results
+    )
+
+    for tickets_sold_event in tickets_sold_events:
+        order_event_service.send_tickets_sold_event(tickets_sold_event)
+
+    return Ok(None)
+
+
 def on_cancellation_after_payment(
     order: Order,
     line_item: LineItem,
@@ -88,6 +149,23 @@ def on_cancellation_after_payment(
             return Err(OrderActionFailedError(e))
 
 
+def _get_bundle_parameters(
+    line_item: LineItem, parameters: ActionParameters
+) -> tuple[TicketCategory, int]:
+    """Return ticket category and ticket quantity per bundle."""
+    if parameters:
+        ticket_category_id = parameters['ticket_category_id']
+        ticket_quantity_per_bundle = int(parameters['ticket_quantity'])
+    else:
+        product = product_service.get_product(line_item.product_id)
+        ticket_category_id = product.type_params['ticket_category_id']
+        ticket_quantity_per_bundle = int(product.type_params['ticket_quantity'])
+
+    ticket_category = ticket_category_service.get_category(ticket_category_id)
+
+    return ticket_category, ticket_quantity_per_bundle
+
+
 def _create_ticket_bundles(
     order: PaidOrder,
     line_item: LineItem,
@@ -114,11 +192,7 @@ def _create_ticket_bundles(
 
         _create_creation_order_log_entry(order.id, bundle)
 
-    data: dict[str, Any] = {
-        'ticket_bundle_ids': list(
-            sorted(str(bundle_id) for bundle_id in bundle_ids)
-        )
-    }
+    data = _build_processing_result(bundle_ids)
     order_command_service.update_line_item_processing_result(line_item.id, data)
 
     total_quantity = ticket_quantity_per_bundle * bundle_quantity
@@ -128,10 +202,28 @@ def _create_ticket_bundles(
     order_event_service.send_tickets_sold_event(tickets_sold_event)
 
 
+def _build_processing_result(
+    bundle_ids: Iterable[TicketBundleID],
+) -> dict[str, Any]:
+    return {
+        'ticket_bundle_ids': list(
+            sorted(str(bundle_id) for bundle_id in bundle_ids)
+        )
+    }
+
+
 def _create_creation_order_log_entry(
     order_id: OrderID, ticket_bundle: TicketBundle
 ) -> None:
-    log_entry = order_log_domain_service.build_ticket_bundle_created_entry(
+    log_entry = _build_creation_order_log_entry(order_id, ticket_bundle)
+
+    order_log_service.persist_entry(log_entry)
+
+
+def _build_creation_order_log_entry(
+    order_id: OrderID, ticket_bundle: TicketBundle
+) -> OrderLogEntry:
+    return order_log_domain_service.build_ticket_bundle_created_entry(
         order_id,
         ticket_bundle.id,
         ticket_bundle.ticket_category.id,
@@ -139,8 +231,6 @@ def _create_creation_order_log_entry(
         ticket_bundle.owned_by.id,
     )
 
-    order_log_service.persist_entry(log_entry)
-
 
 def _revoke_ticket_bundles(
     order: Order, line_item: LineItem, initiator: User
@@ -6,6 +6,9 @@ byceps.services.shop.order.actions.award_badge
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from collections.abc import Sequence
+from uuid import UUID
+
 from byceps.services.shop.order.errors import OrderActionFailedError
 from byceps.services.shop.order.log import (
     order_log_domain_service,
@@ -14,6 +17,7 @@ from byceps.services.shop.order.log import (
 from byceps.services.shop.order.models.action import (
     ActionParameters,
     ActionProcedure,
+    PaymentActionItem,
 )
 from byceps.services.shop.order.models.order import LineItem, OrderID, PaidOrder
 from byceps.services.user.models import User
@@ -21,13 +25,14 @@ from byceps.services.user_badge import (
     user_badge_awarding_service,
     user_badge_service,
 )
-from byceps.services.user_badge.models import BadgeAwarding
+from byceps.services.user_badge.models import BadgeAwarding, BadgeID
 from byceps.util.result import Err, Ok, Result
 
 
 def get_action_procedure() -> ActionProcedure:
     return ActionProcedure(
         on_payment=on_payment,
+        on_payment_batch=on_payment_batch,
     )
 
 
@@ -51,6 +56,50 @@ def on_payment(
     return Ok(None)
 
 
+def on_payment_batch(
+    items: Sequence[PaymentActionItem], initiator: User
+) -> Result[None, OrderActionFailedError]:
+    """Award badges to users of multiple orders at once."""
+    badge_ids = {_get_badge_id(item.parameters) for item in items}
+    badges_by_id = {
+        badge.id: badge for badge in user_badge_service.get_badges(badge_ids)
+    }
+
+    order_ids = []
+    badges_and_awardees = []
+    for item in items:
+        badge = badges_by_id[_get_badge_id(item.parameters)]
+        awardee = item.order.placed_by
+        for _ in range(item.line_item.quantity):
+            order_ids.append(item.order.id)
+            badges_and_awardees.append((badge, awardee))
+
+    match user_badge_awarding_service.award_badges_to_users(
+        badges_and_awardees
+    ):
+        case Ok(awardings_and_events):
+            pass
+        case Err(e):
+            return Err(OrderActionFailedError(details=e))
+
+    log_entries = [
+        order_log_domain_service.build_user_badge_awarded_entry(
+            order_id, awarding
+        )
+        for order_id, (awarding, _) in zip(
+            order_ids, awardings_and_events, strict=True
+        )
+    ]
+
+    order_log_service.persist_entries(log_entries)
+
+    return Ok(None)
+
+
+def _get_badge_id(parameters: ActionParameters) -> BadgeID:
+    return BadgeID(UUID(str(parameters['badge_id'])))
+
+
 def _create_order_log_entry(order_id: OrderID, awarding: BadgeAwarding) -> None:
     log_entry = order_log_domain_service.build_user_badge_awarded_entry(
         order_id, awarding
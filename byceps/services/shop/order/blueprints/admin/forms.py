@@ -7,8 +7,20 @@ byceps.services.shop.order.blueprints.admin.forms
 """
 
 from flask_babel import lazy_gettext
-from wtforms import BooleanField, RadioField, StringField, TextAreaField
-from wtforms.validators import InputRequired, Length
+from wtforms import (
+    BooleanField,
+    DateField,
+    IntegerField,
+    RadioField,
+    StringField,
+    TextAreaField,
+)
+from wtforms.validators import (
+    InputRequired,
+    Length,
+    NumberRange,
+    ValidationError,
+)
 
 from byceps.services.shop.order import order_service
 from byceps.services.shop.order.models.payment import DEFAULT_PAYMENT_METHODS
@@ -30,6 +42,19 @@ class CancelForm(LocalizedForm):
     )
 
 
+class BulkExportForm(LocalizedForm):
+    first_day = DateField(lazy_gettext('From'), validators=[InputRequired()])
+    last_day = DateField(lazy_gettext('Until'), validators=[InputRequired()])
+
+    @staticmethod
+    def validate_last_day(form, field):
+        first_day = form.first_day.data
+        if (first_day is not None) and (field.data < first_day):
+            raise ValidationError(
+                lazy_gettext('The last day must not be before the first one.')
+            )
+
+
 class MarkAsPaidForm(LocalizedForm):
     payment_method = RadioField(
         lazy_gettext('Payment type'),
@@ -52,7 +77,24 @@ class MarkAsPaidForm(LocalizedForm):
         self.payment_method.choices = choices
 
 
+class MarkOrdersAsPaidForm(MarkAsPaidForm):
+    order_numbers = TextAreaField(
+        lazy_gettext('Order numbers'),
+        validators=[InputRequired()],
+    )
+
+    def get_order_numbers(self) -> list[str]:
+        lines = self.order_numbers.data.splitlines()
+        stripped_lines = (line.strip() for line in lines)
+        return list(dict.fromkeys(line for line in stripped_lines if line))
+
+
 class OrderNumberSequenceCreateForm(LocalizedForm):
     prefix = StringField(
         lazy_gettext('Static prefix'), validators=[InputRequired()]
     )
+    block_size = IntegerField(
+        lazy_gettext('Numbers to reserve at once'),
+        default=1,
+        validators=[InputRequired(), NumberRange(min=1)],
+    )
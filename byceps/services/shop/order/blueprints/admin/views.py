@@ -6,7 +6,16 @@ byceps.services.shop.order.blueprints.admin.views
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from flask import abort, g, request, Response
+from uuid import UUID
+
+from flask import (
+    abort,
+    g,
+    request,
+    Response,
+    send_from_directory,
+    stream_with_context,
+)
 from flask_babel import gettext
 
 from byceps.byceps_app import get_current_byceps_app
@@ -42,6 +51,7 @@ from byceps.services.ticketing import ticket_service
 from byceps.util.framework.blueprint import create_blueprint
 from byceps.util.framework.flash import flash_error, flash_notice, flash_success
 from byceps.util.framework.templating import templated
+from byceps.util.jobqueue import enqueue
 from byceps.util.result import Err, Ok
 from byceps.util.views import (
     permission_required,
@@ -52,8 +62,10 @@ from byceps.util.views import (
 from . import service
 from .forms import (
     AddNoteForm,
+    BulkExportForm,
     CancelForm,
     MarkAsPaidForm,
+    MarkOrdersAsPaidForm,
     OrderNumberSequenceCreateForm,
 )
 from .models import OrderStateFilter
@@ -62,11 +74,15 @@ from .models import OrderStateFilter
 blueprint = create_blueprint('shop_order_admin', __name__)
 
 
-@blueprint.get('/for_shop/<shop_id>', defaults={'page': 1})
-@blueprint.get('/for_shop/<shop_id>/pages/<int:page>')
+# Larger bulk exports are created in the background instead of being
+# streamed in the request.
+BULK_EXPORT_MAX_ORDERS_TO_STREAM = 1000
+
+
+@blueprint.get('/for_shop/<shop_id>')
 @permission_required('shop_order.view')
 @templated
-def index_for_shop(shop_id, page):
+def index_for_shop(shop_id):
     """List orders for that shop."""
     shop = _get_shop_or_404(shop_id)
 
@@ -74,6 +90,8 @@ def index_for_shop(shop_id, page):
 
     per_page = request.args.get('per_page', type=int, default=15)
 
+    after = request.args.get('after', type=UUID)
+
     search_term = request.args.get('search_term', default='').strip()
 
     only_payment_state = request.args.get(
@@ -94,20 +112,25 @@ def index_for_shop(shop_id, page):
         only_payment_state, only_overdue, only_processed
     )
 
-    orders = order_service.get_orders_for_shop_paginated(
+    search_result = order_service.search_orders(
         shop.id,
-        page,
-        per_page,
         search_term=search_term,
         only_payment_state=only_payment_state,
         only_overdue=only_overdue,
         only_processed=only_processed,
+        after=after,
+        limit=per_page,
+    )
+
+    facets = order_service.get_order_search_facets(
+        shop.id, search_term=search_term
     )
 
     return {
         'shop': shop,
         'brand': brand,
         'per_page': per_page,
+        'after': after,
         'search_term': search_term,
         'PaymentState': PaymentState,
         'only_payment_state': only_payment_state,
@@ -115,7 +138,9 @@ def index_for_shop(shop_id, page):
         'only_processed': only_processed,
         'OrderStateFilter': OrderStateFilter,
         'order_state_filter': order_state_filter,
-        'orders': orders,
+        'orders': search_result.orders,
+        'next_after': search_result.next_after,
+        'facets': facets,
     }
 
 
@@ -165,6 +190,93 @@ def export(order_id):
     )
 
 
+@blueprint.get('/for_shop/<shop_id>/export')
+@permission_required('shop_order.view')
+@templated
+def bulk_export_form(shop_id, erroneous_form=None):
+    """Show form to export the paid orders of a date range."""
+    shop = _get_shop_or_404(shop_id)
+
+    brand = brand_service.get_brand(shop.brand_id)
+
+    form = erroneous_form if erroneous_form else BulkExportForm()
+
+    export_filenames = order_export_service.get_bulk_export_filenames(shop.id)
+
+    return {
+        'shop': shop,
+        'brand': brand,
+        'form': form,
+        'export_filenames': export_filenames,
+    }
+
+
+@blueprint.post('/for_shop/<shop_id>/export')
+@permission_required('shop_order.view')
+def bulk_export(shop_id):
+    """Export the paid orders of a date range as a ZIP archive of XML
+    documents.
+
+    Small exports are streamed right away, large ones are created in
+    the background.
+    """
+    shop = _get_shop_or_404(shop_id)
+
+    form = BulkExportForm(request.form)
+    if not form.validate():
+        return bulk_export_form(shop.id, form)
+
+    created_range = order_export_service.get_created_range_for_days(
+        form.first_day.data, form.last_day.data
+    )
+
+    order_count = order_export_service.count_orders_to_export(
+        shop.id, created_range
+    )
+
+    if order_count > BULK_EXPORT_MAX_ORDERS_TO_STREAM:
+        enqueue(
+            order_export_service.create_orders_xml_zip_file,
+            shop.id,
+            created_range,
+        )
+        flash_notice(
+            gettext(
+                'The export of %(order_count)s orders is being created. '
+                'It will be listed here when complete.',
+                order_count=order_count,
+            )
+        )
+        return redirect_to('.bulk_export_form', shop_id=shop.id)
+
+    chunks = order_export_service.export_orders_as_xml_zip(
+        shop.id, created_range
+    )
+    filename = (
+        f'orders_{form.first_day.data.isoformat()}'
+        f'_{form.last_day.data.isoformat()}.zip'
+    )
+
+    return Response(
+        stream_with_context(chunks),
+        mimetype='application/zip',
+        headers={'Content-Disposition': f'attachment; filename="{filename}"'},
+    )
+
+
+@blueprint.get('/for_shop/<shop_id>/export/files/<filename>')
+@permission_required('shop_order.view')
+def bulk_export_download(shop_id, filename):
+    """Download a bulk export that has been created in the background."""
+    shop = _get_shop_or_404(shop_id)
+
+    exports_path = order_export_service.get_bulk_exports_path(shop.id)
+
+    return send_from_directory(
+        exports_path, filename, mimetype='application/zip', as_attachment=True
+    )
+
+
 # -------------------------------------------------------------------- #
 # invoice
 
@@ -475,6 +587,100 @@ def mark_as_paid(order_id):
     return redirect_to('.view', order_id=paid_order.id)
 
 
+@blueprint.get('/for_shop/<shop_id>/mark_as_paid')
+@permission_required('shop_order.mark_as_paid')
+@templated
+def mark_orders_as_paid_form(shop_id, erroneous_form=None):
+    """Show form to mark multiple orders as paid."""
+    shop = _get_shop_or_404(shop_id)
+
+    brand = brand_service.get_brand(shop.brand_id)
+
+    form = erroneous_form if erroneous_form else MarkOrdersAsPaidForm()
+    form.set_payment_method_choices()
+
+    return {
+        'shop': shop,
+        'brand': brand,
+        'form': form,
+    }
+
+
+@blueprint.post('/for_shop/<shop_id>/mark_as_paid')
+@permission_required('shop_order.mark_as_paid')
+def mark_orders_as_paid(shop_id):
+    """Set the payment state of multiple orders to 'paid'."""
+    shop = _get_shop_or_404(shop_id)
+
+    form = MarkOrdersAsPaidForm(request.form)
+    form.set_payment_method_choices()
+    if not form.validate():
+        return mark_orders_as_paid_form(shop.id, form)
+
+    order_numbers = form.get_order_numbers()
+    payment_method = form.payment_method.data
+    initiator = g.user.as_user()
+
+    order_ids_by_order_number = order_service.get_order_ids_for_order_numbers(
+        set(order_numbers), shop_id=shop.id
+    )
+
+    unknown_order_numbers = [
+        order_number
+        for order_number in order_numbers
+        if order_number not in order_ids_by_order_number
+    ]
+    if unknown_order_numbers:
+        flash_error(
+            gettext(
+                'Unknown order numbers: %(order_numbers)s',
+                order_numbers=', '.join(unknown_order_numbers),
+            )
+        )
+        return mark_orders_as_paid_form(shop.id, form)
+
+    order_ids = list(order_ids_by_order_number.values())
+
+    paid_orders_and_events, action_errors = (
+        order_command_service.mark_orders_as_paid(
+            order_ids, payment_method, initiator
+        )
+    )
+
+    # The orders have been marked as paid even if executing some of
+    # their actions failed.
+    for paid_order, event in paid_orders_and_events:
+        order_email_service.send_email_for_paid_order_to_orderer(paid_order)
+
+        shop_order_signals.order_paid.send(None, event=event)
+
+    paid_count = len(paid_orders_and_events)
+    flash_success(
+        gettext(
+            '%(paid_count)s of %(order_count)s orders have been marked as paid.',
+            paid_count=paid_count,
+            order_count=len(order_ids),
+        )
+    )
+
+    skipped_count = len(order_ids) - paid_count
+    if skipped_count:
+        flash_notice(
+            gettext(
+                '%(skipped_count)s orders have been skipped because they are '
+                'not open (anymore) or are currently being processed.',
+                skipped_count=skipped_count,
+            )
+        )
+
+    for action_error in action_errors:
+        flash_error(
+            gettext('An unexpected error occurred.') + f'\n{action_error}'
+        )
+
+    return redirect_to('.index_for_shop', shop_id=shop.id)
+
+
 # -------------------------------------------------------------------- #
 # email
 
@@ -533,8 +739,11 @@ def create_number_sequence(shop_id):
         return create_number_sequence_form(shop_id, form)
 
     prefix = form.prefix.data.strip()
+    block_size = form.block_size.data
 
-    match order_sequence_service.create_order_number_sequence(shop.id, prefix):
+    match order_sequence_service.create_order_number_sequence(
+        shop.id, prefix, block_size=block_size
+    ):
         case Err(_):
             flash_error(
                 gettext(
@@ -7,70 +7,181 @@ byceps.services.shop.order.blueprints.site.service
 """
 
 from collections.abc import Iterable
+import dataclasses
+from dataclasses import dataclass
 
 from flask_babel import gettext
 from moneyed import Currency
 
 from byceps.services.shop.cart.models import Cart
-from byceps.services.shop.catalog import catalog_service
+from byceps.services.shop.catalog import (
+    catalog_service,
+    catalog_version_service,
+)
 from byceps.services.shop.catalog.models import CatalogID
 from byceps.services.shop.order import (
     order_checkout_service,
     signals as shop_order_signals,
 )
 from byceps.services.shop.order.email import order_email_service
+from byceps.services.shop.order.errors import ProductsSoldOutError
 from byceps.services.shop.order.models.order import Order
-from byceps.services.shop.product import product_service
-from byceps.services.shop.product.errors import NoProductsAvailableError
+from byceps.services.shop.product import (
+    product_domain_service,
+    product_service,
+)
 from byceps.services.shop.product.models import (
     Product,
+    ProductAttachment,
     ProductCollection,
     ProductCompilation,
     ProductCompilationBuilder,
+    ProductID,
 )
 from byceps.services.shop.shop.models import ShopID
-from byceps.services.shop.storefront.models import Storefront
+from byceps.services.shop.storefront.models import Storefront, StorefrontID
 from byceps.util.result import Err, Ok, Result
 
 
+@dataclass(frozen=True, kw_only=True)
+class _Collection:
+    title: str
+    products_with_attachments: list[tuple[Product, list[ProductAttachment]]]
+
+
+@dataclass(frozen=True, kw_only=True)
+class _CachedCollections:
+    catalog_id: CatalogID | None
+    catalog_version: int
+    collections: list[_Collection]
+
+
+# Collections per storefront, built from the storefront's catalog (or
+# from all orderable products of the shop) regardless of availability,
+# and kept until the catalog version changes.
+_cached_collections_by_storefront_id: dict[
+    StorefrontID, _CachedCollections
+] = {}
+
+
 def get_collections(
     storefront: Storefront,
 ) -> Result[list[ProductCollection], str]:
-    if storefront.catalog:
-        return Ok(_get_collections_from_catalog(storefront.catalog.id))
-    else:
-        return _get_collections_from_shop(storefront.shop_id)
-
-
-def _get_collections_from_catalog(
-    catalog_id: CatalogID,
-) -> list[ProductCollection]:
-    return catalog_service.get_product_collections_for_catalog(
-        catalog_id,
-        only_currently_available=True,
-        only_directly_orderable=True,
-        only_not_requiring_separate_order=True,
-    )
+    """Return the product collections to offer in the storefront.
 
+    Only currently available products are included, with their current
+    quantities.
+    """
+    cached_collections = _get_cached_collections(storefront)
 
-def _get_collections_from_shop(
-    shop_id: ShopID,
-) -> Result[list[ProductCollection], str]:
-    match product_service.get_product_compilation_for_orderable_products(
-        shop_id
+    product_ids = _get_product_ids(cached_collections.collections)
+    quantities_by_product_id = product_service.get_quantities(product_ids)
+
+    collections = [
+        _to_product_collection(collection, quantities_by_product_id)
+        for collection in cached_collections.collections
+    ]
+
+    if not storefront.catalog and not collections[0].items:
+        return Err(gettext('No products are available.'))
+
+    return Ok(collections)
+
+
+def _get_cached_collections(storefront: Storefront) -> _CachedCollections:
+    catalog_id = storefront.catalog.id if storefront.catalog else None
+    catalog_version = catalog_version_service.get_version()
+
+    cached_collections = _cached_collections_by_storefront_id.get(storefront.id)
+
+    if (
+        cached_collections is None
+        or cached_collections.catalog_id != catalog_id
+        or cached_collections.catalog_version != catalog_version
     ):
-        case Ok(compilation):
-            collection = (
-                product_service.get_product_collection_for_product_compilation(
-                    '', compilation
-                )
+        if catalog_id is not None:
+            collections = _build_collections_from_catalog(catalog_id)
+        else:
+            collections = [_build_collection_from_shop(storefront.shop_id)]
+
+        cached_collections = _CachedCollections(
+            catalog_id=catalog_id,
+            catalog_version=catalog_version,
+            collections=collections,
+        )
+        _cached_collections_by_storefront_id[storefront.id] = cached_collections
+
+    return cached_collections
+
+
+def _build_collections_from_catalog(catalog_id: CatalogID) -> list[_Collection]:
+    collections_and_products = (
+        catalog_service.get_collections_and_products_for_catalog(
+            catalog_id,
+            only_currently_available=False,
+            only_directly_orderable=True,
+            only_not_requiring_separate_order=True,
+        )
+    )
+
+    return [
+        _Collection(
+            title=collection.title,
+            products_with_attachments=[(product, []) for product in products],
+        )
+        for collection, products in collections_and_products
+    ]
+
+
+def _build_collection_from_shop(shop_id: ShopID) -> _Collection:
+    return _Collection(
+        title='',
+        products_with_attachments=(
+            product_service.get_orderable_products_with_attachments(shop_id)
+        ),
+    )
+
+
+def _get_product_ids(collections: list[_Collection]) -> set[ProductID]:
+    product_ids = set()
+
+    for collection in collections:
+        for product, attachments in collection.products_with_attachments:
+            product_ids.add(product.id)
+            for attachment in attachments:
+                product_ids.add(attachment.attached_product.id)
+
+    return product_ids
+
+
+def _to_product_collection(
+    collection: _Collection, quantities_by_product_id: dict[ProductID, int]
+) -> ProductCollection:
+    """Build a product collection of only the currently available
+    products, with their current quantities.
+    """
+
+    def with_current_quantity(product: Product) -> Product:
+        quantity = quantities_by_product_id.get(product.id, product.quantity)
+        return dataclasses.replace(product, quantity=quantity)
+
+    builder = ProductCompilationBuilder()
+
+    for product, attachments in collection.products_with_attachments:
+        if not product_domain_service.is_product_available_now(product):
+            continue
+
+        builder.append_product(with_current_quantity(product))
+
+        for attachment in attachments:
+            builder.append_product(
+                with_current_quantity(attachment.attached_product),
+                fixed_quantity=attachment.attached_quantity,
             )
-            return Ok([collection])
-        case Err(e):
-            if isinstance(e, NoProductsAvailableError):
-                return Err(gettext('No products are available.'))
-            else:
-                return Err(gettext('An unknown error has occurred.'))
+
+    return product_service.get_product_collection_for_product_compilation(
+        collection.title, builder.build()
+    )
 
 
 def get_products_from_collections(
@@ -103,12 +214,14 @@ def create_cart_from_product_compilation(
     return cart
 
 
-def place_order(storefront, orderer, cart) -> Result[Order, None]:
+def place_order(
+    storefront, orderer, cart
+) -> Result[Order, ProductsSoldOutError | None]:
     match order_checkout_service.place_order(storefront, orderer, cart):
         case Ok((order, event)):
             pass
-        case Err(_):
-            return Err(None)
+        case Err(e):
+            return Err(e)
 
     order_email_service.send_email_for_incoming_order_to_orderer(order)
 
@@ -11,10 +11,14 @@ from flask_babel import gettext, format_percent
 
 from byceps.services.country import country_service
 from byceps.services.shop.order import order_service
+from byceps.services.shop.order.errors import ProductsSoldOutError
 from byceps.services.shop.product import product_domain_service, product_service
 from byceps.services.shop.product.models import ProductCollection
 from byceps.services.shop.shop import shop_service
 from byceps.services.shop.storefront import storefront_service
+from byceps.services.shop.waiting_room.blueprints.site import (
+    admission as waiting_room_admission,
+)
 from byceps.services.site.blueprints.site.navigation import (
     subnavigation_for_view,
 )
@@ -44,6 +48,9 @@ def tax_rate_as_percentage(tax_rate) -> str:
 @subnavigation_for_view('shop')
 def order_form(erroneous_form=None):
     """Show a form to order products."""
+    if not _is_admitted_through_waiting_room():
+        return redirect_to('shop_waiting_room.index')
+
     storefront = _get_storefront_or_404()
 
     if storefront.closed:
@@ -103,6 +110,9 @@ def list_products(collections: list[ProductCollection]):
 @login_required
 def order():
     """Order products."""
+    if not _is_admitted_through_waiting_room():
+        return redirect_to('shop_waiting_room.index')
+
     storefront = _get_storefront_or_404()
 
     if storefront.closed:
@@ -142,7 +152,7 @@ def order():
 
     placement_result = service.place_order(storefront, orderer, cart)
     if placement_result.is_err():
-        flash_error(gettext('Placing the order has failed.'))
+        _flash_order_placement_error(placement_result.unwrap_err())
         return order_form(form)
 
     order = placement_result.unwrap()
@@ -158,6 +168,9 @@ def order():
 @subnavigation_for_view('shop')
 def order_single_form(product_id, erroneous_form=None):
     """Show a form to order a single product."""
+    if not _is_admitted_through_waiting_room():
+        return redirect_to('shop_waiting_room.index')
+
     product = _get_product_or_404(product_id)
 
     storefront = _get_storefront_or_404()
@@ -224,6 +237,9 @@ def order_single_form(product_id, erroneous_form=None):
 @login_required
 def order_single(product_id):
     """Order a single product."""
+    if not _is_admitted_through_waiting_room():
+        return redirect_to('shop_waiting_room.index')
+
     product = _get_product_or_404(product_id)
 
     storefront = _get_storefront_or_404()
@@ -266,7 +282,7 @@ def order_single(product_id):
 
     placement_result = service.place_order(storefront, orderer, cart)
     if placement_result.is_err():
-        flash_error(gettext('Placing the order has failed.'))
+        _flash_order_placement_error(placement_result.unwrap_err())
         return order_form(form)
 
     order = placement_result.unwrap()
@@ -276,6 +292,30 @@ def order_single(product_id):
     return redirect_to('shop_orders.view', order_id=order.id)
 
 
+def _flash_order_placement_error(error: ProductsSoldOutError | None) -> None:
+    match error:
+        case ProductsSoldOutError():
+            flash_error(
+                gettext(
+                    'Placing the order has failed because some products '
+                    'are sold out.'
+                )
+            )
+        case _:
+            flash_error(gettext('Placing the order has failed.'))
+
+
+def _is_admitted_through_waiting_room() -> bool:
+    """Return `False` if a waiting room is open in front of the
+    storefront and the current user has not been admitted through it.
+    """
+    storefront_id = g.site.storefront_id
+    if (storefront_id is None) or not g.user.authenticated:
+        return True
+
+    return waiting_room_admission.is_user_admitted(storefront_id, g.user.id)
+
+
 def _get_storefront_or_404():
     storefront_id = g.site.storefront_id
     if storefront_id is None:
@@ -25,6 +25,7 @@ class DbOrderNumberSequence(db.Model):
     )
     prefix: Mapped[str] = mapped_column(db.UnicodeText, unique=True)
     value: Mapped[int]
+    block_size: Mapped[int]
     archived: Mapped[bool]
 
     def __init__(
@@ -34,12 +35,14 @@ class DbOrderNumberSequence(db.Model):
         prefix: str,
         value: int,
         *,
+        block_size: int = 1,
         archived: bool = False,
     ) -> None:
         self.id = sequence_id
         self.shop_id = shop_id
         self.prefix = prefix
         self.value = value
+        self.block_size = block_size
         self.archived = archived
 
     def __repr__(self) -> str:
@@ -49,5 +52,6 @@ class DbOrderNumberSequence(db.Model):
             .add('shop', self.shop_id)
             .add_with_lookup('prefix')
             .add_with_lookup('value')
+            .add_with_lookup('block_size')
             .build()
         )
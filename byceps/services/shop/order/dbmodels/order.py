@@ -44,6 +44,14 @@ class DbOrder(db.Model):
     """An order for products, placed by a user."""
 
     __tablename__ = 'shop_orders'
+    __table_args__ = (
+        db.Index(
+            'ix_shop_orders_shop_id_created_at_id',
+            'shop_id',
+            'created_at',
+            'id',
+        ),
+    )
 
     id: Mapped[OrderID] = mapped_column(db.Uuid, primary_key=True)
     created_at: Mapped[datetime]
@@ -157,6 +165,26 @@ class DbOrder(db.Model):
         )
 
 
+# The text that orders are searched in. The expression has to match
+# the one of the index exactly for the index to be used.
+order_search_text = (
+    DbOrder.order_number
+    + ' '
+    + DbOrder.first_name
+    + ' '
+    + DbOrder.last_name
+    + ' '
+    + db.func.coalesce(DbOrder.company, '')
+)
+
+db.Index(
+    'ix_shop_orders_search_text_trgm',
+    order_search_text.label('search_text'),
+    postgresql_using='gin',
+    postgresql_ops={'search_text': 'gin_trgm_ops'},
+)
+
+
 class DbLineItem(db.Model):
     """A line item that belongs to an order."""
 
@@ -0,0 +1,39 @@
+"""
+byceps.services.shop.order.dbmodels.stats
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Precomputed order statistics, maintained along with the orders.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from sqlalchemy.orm import Mapped, mapped_column
+
+from byceps.database import db
+from byceps.services.shop.product.models import ProductID
+from byceps.services.shop.shop.models import ShopID
+
+
+class DbOrderStats(db.Model):
+    """The number of a shop's orders in a payment state."""
+
+    __tablename__ = 'shop_order_stats'
+
+    shop_id: Mapped[ShopID] = mapped_column(
+        db.UnicodeText, db.ForeignKey('shops.id'), primary_key=True
+    )
+    payment_state: Mapped[str] = mapped_column(db.UnicodeText, primary_key=True)
+    order_count: Mapped[int]
+
+
+class DbOrderedProductStats(db.Model):
+    """The quantity of a product ordered by orders in a payment state."""
+
+    __tablename__ = 'shop_ordered_product_stats'
+
+    product_id: Mapped[ProductID] = mapped_column(
+        db.Uuid, db.ForeignKey('shop_products.id'), primary_key=True
+    )
+    payment_state: Mapped[str] = mapped_column(db.UnicodeText, primary_key=True)
+    quantity: Mapped[int]
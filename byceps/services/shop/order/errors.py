@@ -9,6 +9,8 @@ byceps.services.shop.order.errors
 from dataclasses import dataclass
 from typing import Any
 
+from byceps.services.shop.product.models import ProductID
+
 
 @dataclass(frozen=True)
 class CartEmptyError:
@@ -32,3 +34,10 @@ class OrderAlreadyMarkedAsPaidError:
 
 class OrderNotPaidError:
     pass
+
+
+@dataclass(frozen=True)
+class ProductsSoldOutError:
+    """Not enough of these products is available to place the order."""
+
+    product_ids: set[ProductID]
@@ -6,20 +6,35 @@ byceps.services.shop.order.export.order_export_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from datetime import datetime, UTC
+from collections.abc import Buffer, Iterator
+from datetime import date, datetime, time, timedelta, UTC
 from decimal import Decimal
+from functools import cache
+from io import RawIOBase
+from itertools import batched
+from pathlib import Path
 from typing import Any
+from zipfile import ZIP_DEFLATED, ZipFile
 from zoneinfo import ZoneInfo
 
 from flask import current_app
+from jinja2 import Template
 
+from byceps.byceps_app import get_current_byceps_app
 from byceps.services.shop.order import order_service
 from byceps.services.shop.order.models.detailed_order import DetailedOrder
-from byceps.services.shop.order.models.order import OrderID
+from byceps.services.shop.order.models.order import OrderID, PaymentState
+from byceps.services.shop.shop.models import ShopID
 from byceps.services.user import user_service
+from byceps.util.datetime.range import DateTimeRange
 from byceps.util.templating import load_template
 
 
+# Number of orders to look up the orderers' email addresses for at once
+# during bulk exports.
+_BULK_EXPORT_BATCH_SIZE = 100
+
+
 def export_order_as_xml(order_id: OrderID) -> dict[str, str] | None:
     """Export the order as an XML document."""
     order = order_service.find_order_with_details(order_id)
@@ -27,8 +42,9 @@ def export_order_as_xml(order_id: OrderID) -> dict[str, str] | None:
     if order is None:
         return None
 
-    context = _assemble_context(order)
-    xml = _render_template(context)
+    email_address = user_service.get_email_address(order.placed_by.id)
+
+    xml = _render_order(order, email_address)
 
     return {
         'content': xml,
@@ -36,10 +52,178 @@ def export_order_as_xml(order_id: OrderID) -> dict[str, str] | None:
     }
 
 
-def _assemble_context(order: DetailedOrder) -> dict[str, Any]:
-    """Assemble template context."""
-    email_address = user_service.get_email_address(order.placed_by.id)
+# -------------------------------------------------------------------- #
+# bulk export
+
+
+def get_created_range_for_days(
+    first_day: date, last_day: date
+) -> DateTimeRange:
+    """Return the range of (naive UTC) creation times that covers the
+    days (both inclusive) in the export time zone.
+    """
+    start = datetime.combine(first_day, time.min)
+    end = datetime.combine(last_day + timedelta(days=1), time.min)
+    return DateTimeRange(
+        start=_from_export_timezone(start),
+        end=_from_export_timezone(end),
+    )
+
+
+def count_orders_to_export(
+    shop_id: ShopID, created_range: DateTimeRange
+) -> int:
+    """Return the number of paid orders that a bulk export of that shop
+    and range would include.
+    """
+    return order_service.count_orders_for_shop_created_in_range(
+        shop_id, created_range, only_payment_state=PaymentState.paid
+    )
+
+
+def export_orders_as_xml_zip(
+    shop_id: ShopID, created_range: DateTimeRange
+) -> Iterator[bytes]:
+    """Export the shop's paid orders created in that range as a ZIP
+    archive of XML documents, one per order.
+
+    The archive is yielded in chunks as the orders are loaded and
+    rendered, so that it is never held in memory as a whole.
+    """
+    buffer = _ChunkBuffer()
+
+    with ZipFile(buffer, 'w', compression=ZIP_DEFLATED) as zip_file:
+        for order, email_address in _get_orders_to_export(
+            shop_id, created_range
+        ):
+            xml = _render_order(order, email_address)
+            zip_file.writestr(f'{order.order_number}.xml', xml)
+            yield buffer.drain()
+
+    yield buffer.drain()
+
+
+def _get_orders_to_export(
+    shop_id: ShopID, created_range: DateTimeRange
+) -> Iterator[tuple[DetailedOrder, str | None]]:
+    orders = order_service.get_orders_with_details_for_shop_created_in_range(
+        shop_id,
+        created_range,
+        only_payment_state=PaymentState.paid,
+        batch_size=_BULK_EXPORT_BATCH_SIZE,
+    )
+
+    for orders_batch in batched(orders, _BULK_EXPORT_BATCH_SIZE):
+        orderer_ids = {order.placed_by.id for order in orders_batch}
+        email_addresses_by_user_id = dict(
+            user_service.get_email_addresses(orderer_ids)
+        )
+
+        for order in orders_batch:
+            yield order, email_addresses_by_user_id.get(order.placed_by.id)
+
+
+class _ChunkBuffer(RawIOBase):
+    """A write-only, non-seekable stream that collects written data
+    until it is drained.
+
+    `ZipFile` supports writing to non-seekable streams (by using data
+    descriptors), which allows for streaming an archive.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Buffer, /) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        return len(chunk)
+
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
 
+def create_orders_xml_zip_file(
+    shop_id: ShopID, created_range: DateTimeRange
+) -> Path:
+    """Write a bulk export of the shop's paid orders created in that
+    range to a file in the shop's export directory.
+
+    Intended to be run as a background job for very large ranges.
+
+    The file only gets its final name once it is complete.
+    """
+    exports_path = get_bulk_exports_path(shop_id)
+    exports_path.mkdir(parents=True, exist_ok=True)
+
+    filename = _build_bulk_export_filename(created_range)
+    path = exports_path / filename
+    partial_path = path.with_name(filename + '.part')
+
+    with partial_path.open('wb') as f:
+        for chunk in export_orders_as_xml_zip(shop_id, created_range):
+            f.write(chunk)
+
+    partial_path.rename(path)
+
+    return path
+
+
+def _build_bulk_export_filename(created_range: DateTimeRange) -> str:
+    # The end of the range is exclusive, so the last exported day is
+    # the one before.
+    first_day = _to_export_timezone(created_range.start).date()
+    last_day = (
+        _to_export_timezone(created_range.end) - timedelta(days=1)
+    ).date()
+    now = datetime.utcnow()
+    return f'orders_{first_day}_{last_day}_{now:%Y%m%d-%H%M%S}.zip'
+
+
+def get_bulk_exports_path(shop_id: ShopID) -> Path:
+    """Return the path of the directory bulk exports of that shop's
+    orders are stored in.
+    """
+    data_path = get_current_byceps_app().byceps_config.data_path
+    return data_path / 'shops' / shop_id / 'order_exports'
+
+
+def get_bulk_export_filenames(shop_id: ShopID) -> list[str]:
+    """Return the names of the completed bulk export files of that
+    shop's orders, newest first.
+    """
+    exports_path = get_bulk_exports_path(shop_id)
+    if not exports_path.is_dir():
+        return []
+
+    paths = sorted(
+        exports_path.glob('*.zip'),
+        key=lambda path: path.stat().st_mtime,
+        reverse=True,
+    )
+
+    return [path.name for path in paths]
+
+
+# -------------------------------------------------------------------- #
+# rendering
+
+
+def _render_order(order: DetailedOrder, email_address: str | None) -> str:
+    context = _assemble_context(order, email_address)
+    return _get_template().render(**context)
+
+
+def _assemble_context(
+    order: DetailedOrder, email_address: str | None
+) -> dict[str, Any]:
+    """Assemble template context."""
     now = datetime.utcnow()
 
     return {
@@ -64,17 +248,28 @@ def _format_export_amount(amount: Decimal) -> str:
 
 def _format_export_datetime(dt: datetime) -> str:
     """Format date and time as required by the export format specification."""
+    return _to_export_timezone(dt).isoformat()
+
+
+def _to_export_timezone(dt: datetime) -> datetime:
+    """Convert naive UTC date and time to the export time zone."""
     export_tz = ZoneInfo(current_app.config['SHOP_ORDER_EXPORT_TIMEZONE'])
     dt_utc = dt.replace(tzinfo=UTC)
-    dt_local = dt_utc.astimezone(export_tz)
-    return dt_local.isoformat()
+    return dt_utc.astimezone(export_tz)
+
+
+def _from_export_timezone(dt: datetime) -> datetime:
+    """Convert naive date and time in the export time zone to naive UTC."""
+    export_tz = ZoneInfo(current_app.config['SHOP_ORDER_EXPORT_TIMEZONE'])
+    dt_local = dt.replace(tzinfo=export_tz)
+    return dt_local.astimezone(UTC).replace(tzinfo=None)
 
 
-def _render_template(context: dict[str, Any]) -> str:
-    """Load and render export template."""
+@cache
+def _get_template() -> Template:
+    """Load and compile the export template (once per process)."""
     path = 'services/shop/order/export/templates/export.xml'
     with current_app.open_resource(path, 'r') as f:
         source = f.read()
 
-    template = load_template(source)
-    return template.render(**context)
+    return load_template(source)
@@ -6,7 +6,7 @@ byceps.services.shop.order.models.action
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
 from typing import Any
 from uuid import UUID
@@ -30,12 +30,32 @@ class Action:
     parameters: ActionParameters
 
 
+@dataclass(frozen=True, kw_only=True)
+class PaymentActionItem:
+    """A line item of a paid order for which an action is to be
+    executed, with the action's parameters.
+    """
+
+    order: PaidOrder
+    line_item: LineItem
+    parameters: ActionParameters
+
+
 @dataclass(frozen=True, kw_only=True)
 class ActionProcedure:
     on_payment: Callable[
         [PaidOrder, LineItem, User, ActionParameters],
         Result[None, OrderActionFailedError],
     ] = field(default_factory=lambda: on_payment_default)
+    # Optional; if set, used instead of `on_payment` to execute the
+    # action for line items of multiple orders at once.
+    on_payment_batch: (
+        Callable[
+            [Sequence[PaymentActionItem], User],
+            Result[None, OrderActionFailedError],
+        ]
+        | None
+    ) = None
     on_cancellation_before_payment: Callable[
         [Order, LineItem, User, ActionParameters],
         Result[None, OrderActionFailedError],
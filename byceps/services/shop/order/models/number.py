@@ -22,6 +22,7 @@ class OrderNumberSequence:
     shop_id: ShopID
     prefix: str
     value: int
+    block_size: int
     archived: bool
 
 
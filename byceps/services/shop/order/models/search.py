@@ -0,0 +1,32 @@
+"""
+byceps.services.shop.order.models.search
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from dataclasses import dataclass
+
+from .order import AdminOrderListItem, OrderID, PaymentState
+
+
+@dataclass(frozen=True, kw_only=True)
+class OrderSearchResult:
+    """A page of orders, newest first.
+
+    If there are more (older) orders, the next page starts after the
+    order referenced by `next_after`.
+    """
+
+    orders: list[AdminOrderListItem]
+    next_after: OrderID | None
+
+
+@dataclass(frozen=True, kw_only=True)
+class OrderSearchFacets:
+    """Number of orders matching a search, in total and per state."""
+
+    total: int
+    per_payment_state: dict[PaymentState, int]
+    overdue: int
@@ -7,7 +7,7 @@ byceps.services.shop.order.order_action_service
 """
 
 from collections import defaultdict
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 from uuid import UUID
 
 import structlog
@@ -24,7 +24,12 @@ from .actions import ticket_bundle as ticket_bundle_actions
 from .actions import user_badge as user_badge_actions
 from .dbmodels.order_action import DbOrderAction
 from .errors import OrderActionFailedError
-from .models.action import Action, ActionParameters, ActionProcedure
+from .models.action import (
+    Action,
+    ActionParameters,
+    ActionProcedure,
+    PaymentActionItem,
+)
 from .models.order import LineItem, Order, PaidOrder, PaymentState
 
 
@@ -117,6 +122,76 @@ def execute_actions_on_payment(
     return Ok(None)
 
 
+def execute_actions_on_payment_for_orders(
+    orders: Sequence[PaidOrder], initiator: User
+) -> list[OrderActionFailedError]:
+    """Execute item creation actions for these orders, both those based
+    on product type and those registered for products.
+
+    Actions are grouped by procedure across all orders. Procedures that
+    support it are executed once for all of their line items.
+
+    A failing procedure (or line item) does not keep the remaining ones
+    from being executed.
+
+    Return the errors of the executions that failed.
+    """
+    errors: list[OrderActionFailedError] = []
+
+    items_by_procedure: dict[ActionProcedure, list[PaymentActionItem]] = (
+        defaultdict(list)
+    )
+
+    orders_and_line_items = [
+        (order, line_item) for order in orders for line_item in order.line_items
+    ]
+
+    # based on product type
+    for order, line_item in orders_and_line_items:
+        procedure = find_procedure_for_product_type(line_item.product_type)
+        if procedure:
+            items_by_procedure[procedure].append(
+                PaymentActionItem(
+                    order=order, line_item=line_item, parameters={}
+                )
+            )
+
+    # based on order action registered for product number
+    product_ids = {
+        line_item.product_id for _, line_item in orders_and_line_items
+    }
+    actions_by_product_id = _get_actions_by_product_id(product_ids)
+
+    for order, line_item in orders_and_line_items:
+        for action in actions_by_product_id.get(line_item.product_id, []):
+            match _get_procedure(action.procedure_name, action.product_id):
+                case Ok(procedure):
+                    items_by_procedure[procedure].append(
+                        PaymentActionItem(
+                            order=order,
+                            line_item=line_item,
+                            parameters=action.parameters,
+                        )
+                    )
+                case Err(e):
+                    log.error(
+                        'Unknown order action configured',
+                        order_id=str(order.id),
+                        order_number=order.order_number,
+                        payment_state=PaymentState.paid.name,
+                        initiator=initiator.screen_name,
+                        error_details=e.details,
+                    )
+                    errors.append(e)
+
+    for procedure, items in items_by_procedure.items():
+        errors.extend(
+            _execute_procedure_on_payment_for_items(procedure, items, initiator)
+        )
+
+    return errors
+
+
 def execute_actions_on_cancellation_before_payment(
     order: Order, initiator: User
 ) -> Result[None, OrderActionFailedError]:
@@ -160,9 +235,7 @@ def _get_line_items_with_actions(
 ) -> Iterator[tuple[LineItem, list[Action]]]:
     product_ids = {line_item.product_id for line_item in order.line_items}
 
-    actions_by_product_id: dict[ProductID, list[Action]] = defaultdict(list)
-    for action in _get_actions(product_ids):
-        actions_by_product_id[action.product_id].append(action)
+    actions_by_product_id = _get_actions_by_product_id(product_ids)
 
     for line_item in order.line_items:
         actions = actions_by_product_id.get(line_item.product_id)
@@ -170,6 +243,16 @@ def _get_line_items_with_actions(
             yield line_item, actions
 
 
+def _get_actions_by_product_id(
+    product_ids: set[ProductID],
+) -> dict[ProductID, list[Action]]:
+    actions_by_product_id: dict[ProductID, list[Action]] = defaultdict(list)
+    for action in _get_actions(product_ids):
+        actions_by_product_id[action.product_id].append(action)
+
+    return actions_by_product_id
+
+
 def _get_actions(product_ids: set[ProductID]) -> list[Action]:
     """Return the order actions for those product IDs."""
     db_actions = order_action_repository.get_actions_for_products(product_ids)
@@ -213,6 +296,48 @@ def _execute_action_on_payment(
             return Err(e)
 
 
+def _execute_procedure_on_payment_for_items(
+    procedure: ActionProcedure,
+    items: Sequence[PaymentActionItem],
+    initiator: User,
+) -> list[OrderActionFailedError]:
+    if procedure.on_payment_batch is None:
+        errors = []
+
+        for item in items:
+            match procedure.on_payment(
+                item.order, item.line_item, initiator, item.parameters
+            ):
+                case Err(e):
+                    _log_batch_execution_failure([item], initiator, e)
+                    errors.append(e)
+
+        return errors
+
+    match procedure.on_payment_batch(items, initiator):
+        case Ok(_):
+            return []
+        case Err(e):
+            _log_batch_execution_failure(items, initiator, e)
+            return [e]
+
+
+def _log_batch_execution_failure(
+    items: Sequence[PaymentActionItem],
+    initiator: User,
+    error: OrderActionFailedError,
+) -> None:
+    order_numbers = sorted({item.order.order_number for item in items})
+
+    log.error(
+        'Order action execution failed',
+        order_numbers=order_numbers,
+        payment_state=PaymentState.paid.name,
+        initiator=initiator.screen_name,
+        error_details=error.details,
+    )
+
+
 def _execute_action_on_cancellation_before_payment(
     action: Action,
     order: Order,
@@ -6,26 +6,32 @@ byceps.services.shop.order.order_checkout_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from collections.abc import Iterator
+from collections import Counter
 from datetime import datetime
 
 from sqlalchemy.exc import IntegrityError
 import structlog
 
-from byceps.database import db
+from byceps.database import db, insert_many
 from byceps.services.shop.cart.models import Cart
-from byceps.services.shop.order.log import order_log_service
+from byceps.services.shop.order.log.dbmodels import DbOrderLogEntry
+from byceps.services.shop.order.log.models import OrderLogEntry
 from byceps.services.shop.product import product_service
-from byceps.services.shop.shop import shop_service
+from byceps.services.shop.product.models import ProductID
 from byceps.services.shop.storefront.models import Storefront
 from byceps.util.result import Err, Ok, Result
 
-from . import order_domain_service, order_helper_service, order_sequence_service
+from . import (
+    order_domain_service,
+    order_sequence_service,
+    order_stats_service,
+)
 from .dbmodels.order import DbLineItem, DbOrder
+from .errors import ProductsSoldOutError
 from .events import ShopOrderPlacedEvent
-from .models.checkout import IncomingLineItem, IncomingOrder
+from .models.checkout import IncomingOrder
 from .models.number import OrderNumber
-from .models.order import Order, Orderer
+from .models.order import Order, Orderer, PaymentState
 
 
 log = structlog.get_logger()
@@ -37,15 +43,15 @@ def place_order(
     cart: Cart,
     *,
     created_at: datetime | None = None,
-) -> Result[tuple[Order, ShopOrderPlacedEvent], None]:
-    """Place an order for one or more products."""
-    shop = shop_service.get_shop(storefront.shop_id)
+) -> Result[tuple[Order, ShopOrderPlacedEvent], ProductsSoldOutError | None]:
+    """Place an order for one or more products.
 
-    order_number_sequence = order_sequence_service.get_order_number_sequence(
-        storefront.order_number_sequence_id
-    )
+    Return an error if not enough of the products is available.
+    """
     order_number_generation_result = (
-        order_sequence_service.generate_order_number(order_number_sequence.id)
+        order_sequence_service.generate_order_number(
+            storefront.order_number_sequence_id
+        )
     )
     if order_number_generation_result.is_err():
         error_message = order_number_generation_result.unwrap_err()
@@ -58,7 +64,7 @@ def place_order(
         created_at = datetime.utcnow()
 
     place_order_result = order_domain_service.place_order(
-        created_at, shop.id, storefront.id, orderer, cart
+        created_at, storefront.shop_id, storefront.id, orderer, cart
     )
     if place_order_result.is_err():
         error_message = 'Cart must not be empty'
@@ -67,28 +73,39 @@ def place_order(
 
     incoming_order, log_entry = place_order_result.unwrap()
 
-    db_order = _build_db_order(incoming_order, order_number)
-
-    db_line_items = list(
-        _build_db_line_items(incoming_order.line_items, db_order)
-    )
-
-    db.session.add(db_order)
-    db.session.add_all(db_line_items)
-
-    _reduce_product_stock(incoming_order)
-
-    db_log_entry = order_log_service.to_db_entry(log_entry)
-    db.session.add(db_log_entry)
-
+    match _reduce_product_stock(incoming_order):
+        case Err(sold_out_error):
+            db.session.rollback()
+            log.info(
+                'Order placement failed: products sold out',
+                product_ids=[
+                    str(product_id) for product_id in sold_out_error.product_ids
+                ],
+            )
+            return Err(sold_out_error)
+
+    # Statements are executed right away, so constraint violations
+    # (e.g. a duplicate order number) are raised by the inserts already.
     try:
+        _insert_order(incoming_order, order_number, log_entry)
+
+        order_stats_service.record_order_placed(
+            incoming_order.shop_id,
+            [
+                (line_item.product_id, line_item.quantity)
+                for line_item in incoming_order.line_items
+            ],
+        )
+
         db.session.commit()
     except IntegrityError as e:
         log.error('Order placement failed', order_number=order_number, exc=e)
         db.session.rollback()
         return Err(None)
 
-    order = order_helper_service.to_order(db_order, orderer.user)
+    order = order_domain_service.build_placed_order(
+        incoming_order, order_number
+    )
 
     occurred_at = order.created_at
 
@@ -105,6 +122,77 @@ def place_order(
     return Ok((order, event))
 
 
+def _insert_order(
+    incoming_order: IncomingOrder,
+    order_number: OrderNumber,
+    log_entry: OrderLogEntry,
+) -> None:
+    """Insert the order, its line items, and the log entry with one
+    (multi-row) statement each.
+
+    Does not commit.
+    """
+    orderer = incoming_order.orderer
+
+    insert_many(
+        DbOrder.__table__,
+        [
+            {
+                'id': incoming_order.id,
+                'created_at': incoming_order.created_at,
+                'shop_id': incoming_order.shop_id,
+                'storefront_id': incoming_order.storefront_id,
+                'order_number': order_number,
+                'placed_by_id': orderer.user.id,
+                'company': orderer.company,
+                'first_name': orderer.first_name,
+                'last_name': orderer.last_name,
+                'country': orderer.country,
+                'postal_code': orderer.postal_code,
+                'city': orderer.city,
+                'street': orderer.street,
+                'currency': incoming_order.total_amount.currency.code,
+                'total_amount': incoming_order.total_amount.amount,
+                'payment_state': PaymentState.open.name,
+                'processing_required': incoming_order.processing_required,
+            }
+        ],
+    )
+
+    insert_many(
+        DbLineItem.__table__,
+        [
+            {
+                'id': line_item.id,
+                'order_number': order_number,
+                'product_id': line_item.product_id,
+                'product_number': line_item.product_number,
+                'product_type': line_item.product_type.name,
+                'name': line_item.name,
+                'unit_price': line_item.unit_price.amount,
+                'tax_rate': line_item.tax_rate,
+                'quantity': line_item.quantity,
+                'line_amount': line_item.line_amount.amount,
+                'processing_required': line_item.processing_required,
+            }
+            for line_item in incoming_order.line_items
+        ],
+    )
+
+    insert_many(
+        DbOrderLogEntry.__table__,
+        [
+            {
+                'id': log_entry.id,
+                'occurred_at': log_entry.occurred_at,
+                'event_type': log_entry.event_type,
+                'order_id': log_entry.order_id,
+                'data': log_entry.data,
+            }
+        ],
+    )
+
+
 def _build_db_order(
     incoming_order: IncomingOrder, order_number: OrderNumber
 ) -> DbOrder:
@@ -130,29 +218,22 @@ def _build_db_order(
     )
 
 
-def _build_db_line_items(
-    incoming_line_items: list[IncomingLineItem], db_order: DbOrder
-) -> Iterator[DbLineItem]:
-    """Build line items from the cart's content."""
-    for incoming_line_item in incoming_line_items:
-        yield DbLineItem(
-            line_item_id=incoming_line_item.id,
-            order=db_order,
-            product_id=incoming_line_item.product_id,
-            product_number=incoming_line_item.product_number,
-            product_type=incoming_line_item.product_type,
-            name=incoming_line_item.name,
-            unit_price=incoming_line_item.unit_price.amount,
-            tax_rate=incoming_line_item.tax_rate,
-            quantity=incoming_line_item.quantity,
-            line_amount=incoming_line_item.line_amount.amount,
-            processing_required=incoming_line_item.processing_required,
-        )
-
+def _reduce_product_stock(
+    incoming_order: IncomingOrder,
+) -> Result[None, ProductsSoldOutError]:
+    """Reduce product stock according to what is in the cart, but only
+    if enough of every product is available.
 
-def _reduce_product_stock(incoming_order: IncomingOrder) -> None:
-    """Reduce product stock according to what is in the cart."""
+    On error, the transaction has to be rolled back.
+    """
+    quantities_by_product_id: Counter[ProductID] = Counter()
     for line_item in incoming_order.line_items:
-        product_service.decrease_quantity(
-            line_item.product_id, line_item.quantity, commit=False
-        )
+        quantities_by_product_id[line_item.product_id] += line_item.quantity
+
+    match product_service.decrease_quantities_if_available(
+        quantities_by_product_id
+    ):
+        case Ok(_):
+            return Ok(None)
+        case Err(sold_out_product_ids):
+            return Err(ProductsSoldOutError(sold_out_product_ids))
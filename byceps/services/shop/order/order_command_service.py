@@ -6,20 +6,29 @@ byceps.services.shop.order.order_command_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator, Sequence
 from datetime import datetime
 from typing import Any
 
+from sqlalchemy import select
 import structlog
 
 from byceps.database import db
 from byceps.services.shop.order.log import order_log_service
 from byceps.services.shop.order.log.models import OrderLogEntry
 from byceps.services.shop.product import product_service
+from byceps.services.shop.product.models import ProductID
 from byceps.services.user import user_service
 from byceps.services.user.models import User
 from byceps.util.result import Err, Ok, Result
 
-from . import order_action_service, order_domain_service, order_payment_service
+from . import (
+    order_action_service,
+    order_domain_service,
+    order_payment_service,
+    order_stats_service,
+)
 from .dbmodels.order import DbLineItem, DbOrder
 from .errors import (
     OrderActionFailedError,
@@ -206,6 +215,115 @@ def cancel_order(
     return Ok((canceled_order, event))
 
 
+def cancel_open_orders(
+    order_ids: Sequence[OrderID], initiator: User, reason: str
+) -> list[tuple[Order, ShopOrderCanceledEvent, OrderActionFailedError | None]]:
+    """Cancel those of the orders that are still open (i.e. neither
+    paid nor canceled), in a single transaction.
+
+    Orders currently locked by another transaction (e.g. because they
+    are being marked as paid) are skipped.
+
+    Reserved quantities of products from those orders are made
+    available again, summed up per product.
+
+    Return the canceled orders with their events and, if executing
+    the cancellation actions of an order failed, the error.
+    """
+    db_orders = db.session.scalars(
+        select(DbOrder)
+        .options(db.selectinload(DbOrder.line_items))
+        .filter(DbOrder.id.in_(order_ids))
+        .filter_by(_payment_state=PaymentState.open.name)
+        .order_by(DbOrder.id)
+        .with_for_update(of=DbOrder, skip_locked=True)
+    ).all()
+
+    if not db_orders:
+        return []
+
+    orderer_ids = {db_order.placed_by_id for db_order in db_orders}
+    orderers_by_id = user_service.get_users_indexed_by_id(orderer_ids)
+
+    occurred_at = datetime.utcnow()
+
+    canceled_orders_and_events = []
+    canceled_db_orders_by_shop_id = defaultdict(list)
+
+    for db_order in db_orders:
+        orderer_user = orderers_by_id[db_order.placed_by_id]
+        order = to_order(db_order, orderer_user)
+
+        cancel_order_result = order_domain_service.cancel_order(
+            order, orderer_user, occurred_at, reason, initiator
+        )
+        if cancel_order_result.is_err():
+            continue
+
+        event, log_entry = cancel_order_result.unwrap()
+
+        db_order.payment_state = PaymentState.canceled_before_paid
+        db_order.payment_state_updated_at = occurred_at
+        db_order.payment_state_updated_by_id = initiator.id
+        db_order.cancellation_reason = reason
+
+        db_log_entry = order_log_service.to_db_entry(log_entry)
+        db.session.add(db_log_entry)
+
+        canceled_order = to_order(db_order, orderer_user)
+        canceled_orders_and_events.append((canceled_order, event))
+        canceled_db_orders_by_shop_id[db_order.shop_id].append(db_order)
+
+    for shop_id, canceled_db_orders in canceled_db_orders_by_shop_id.items():
+        order_stats_service.record_payment_state_change(
+            shop_id,
+            _get_product_quantities(canceled_db_orders),
+            PaymentState.open,
+            PaymentState.canceled_before_paid,
+            order_count=len(canceled_db_orders),
+        )
+
+    # Make the reserved quantities of products available again, with
+    # one update per product.
+    quantities_by_product_id: Counter[ProductID] = Counter()
+    for canceled_db_orders in canceled_db_orders_by_shop_id.values():
+        for product_id, quantity in _get_product_quantities(canceled_db_orders):
+            quantities_by_product_id[product_id] += quantity
+
+    for product_id, quantity in sorted(quantities_by_product_id.items()):
+        product_service.increase_quantity(product_id, quantity, commit=False)
+
+    db.session.commit()
+
+    results: list[
+        tuple[Order, ShopOrderCanceledEvent, OrderActionFailedError | None]
+    ] = []
+
+    for canceled_order, event in canceled_orders_and_events:
+        action_error: OrderActionFailedError | None
+        match _execute_actions_on_cancellation_before_payment(
+            canceled_order, initiator
+        ):
+            case Ok(_):
+                action_error = None
+            case Err(error):
+                action_error = error
+
+        log.info('Order canceled', shop_order_canceled_event=event)
+
+        results.append((canceled_order, event, action_error))
+
+    return results
+
+
+def _get_product_quantities(
+    db_orders: Iterable[DbOrder],
+) -> Iterator[tuple[ProductID, int]]:
+    for db_order in db_orders:
+        for db_line_item in db_order.line_items:
+            yield db_line_item.product_id, db_line_item.quantity
+
+
 def mark_order_as_paid(
     order_id: OrderID,
     payment_method: str,
@@ -276,12 +394,136 @@ def mark_order_as_paid(
     return Ok((paid_order, event))
 
 
+def mark_orders_as_paid(
+    order_ids: Sequence[OrderID], payment_method: str, initiator: User
+) -> tuple[
+    list[tuple[PaidOrder, ShopOrderPaidEvent]], list[OrderActionFailedError]
+]:
+    """Mark those of the orders as paid that are still open, in a single
+    transaction.
+
+    Orders currently locked by another transaction (e.g. because they
+    are being canceled) are skipped.
+
+    The orders' actions are then executed grouped by procedure, across
+    all orders. If some of them fail, the orders remain marked as paid.
+
+    Return the paid orders with their events, and the errors of the
+    actions that failed.
+    """
+    db_orders = db.session.scalars(
+        select(DbOrder)
+        .options(db.selectinload(DbOrder.line_items))
+        .filter(DbOrder.id.in_(order_ids))
+        .filter_by(_payment_state=PaymentState.open.name)
+        .order_by(DbOrder.id)
+        .with_for_update(of=DbOrder, skip_locked=True)
+    ).all()
+
+    if not db_orders:
+        return [], []
+
+    orderer_ids = {db_order.placed_by_id for db_order in db_orders}
+    orderers_by_id = user_service.get_users_indexed_by_id(orderer_ids)
+
+    paid_db_orders_and_events = []
+    paid_db_orders_by_shop_id = defaultdict(list)
+
+    for db_order in db_orders:
+        orderer_user = orderers_by_id[db_order.placed_by_id]
+        order = to_order(db_order, orderer_user)
+
+        payment_added_at = datetime.utcnow()
+
+        create_payment_result = order_domain_service.create_payment(
+            order,
+            payment_added_at,
+            payment_method,
+            order.total_amount,
+            initiator,
+            {},
+        )
+        if create_payment_result.is_err():
+            continue
+
+        payment, payment_log_entry = create_payment_result.unwrap()
+
+        # Use separate timestamp so that log events are properly ordered.
+        marked_as_paid_at = datetime.utcnow()
+
+        mark_order_as_paid_result = order_domain_service.mark_order_as_paid(
+            order,
+            orderer_user,
+            marked_as_paid_at,
+            payment.method,
+            payment.additional_data,
+            initiator,
+        )
+        if mark_order_as_paid_result.is_err():
+            continue
+
+        event, log_entry = mark_order_as_paid_result.unwrap()
+
+        db_payment = order_payment_service.to_db_payment(payment)
+        db.session.add(db_payment)
+
+        db_payment_log_entry = order_log_service.to_db_entry(payment_log_entry)
+        db.session.add(db_payment_log_entry)
+
+        db_order.payment_method = payment_method
+        db_order.payment_state = PaymentState.paid
+        db_order.payment_state_updated_at = marked_as_paid_at
+        db_order.payment_state_updated_by_id = initiator.id
+
+        db_log_entry = order_log_service.to_db_entry(log_entry)
+        db.session.add(db_log_entry)
+
+        paid_db_orders_and_events.append((db_order, orderer_user, event))
+        paid_db_orders_by_shop_id[db_order.shop_id].append(db_order)
+
+    for shop_id, paid_db_orders in paid_db_orders_by_shop_id.items():
+        order_stats_service.record_payment_state_change(
+            shop_id,
+            _get_product_quantities(paid_db_orders),
+            PaymentState.open,
+            PaymentState.paid,
+            order_count=len(paid_db_orders),
+        )
+
+    db.session.commit()
+
+    paid_orders_and_events = [
+        (to_paid_order(db_order, orderer_user), event)
+        for db_order, orderer_user, event in paid_db_orders_and_events
+    ]
+
+    for _, event in paid_orders_and_events:
+        log.info('Order paid', shop_order_paid_event=event)
+
+    paid_orders = [paid_order for paid_order, _ in paid_orders_and_events]
+    action_errors = order_action_service.execute_actions_on_payment_for_orders(
+        paid_orders, initiator
+    )
+
+    return paid_orders_and_events, action_errors
+
+
 def _update_payment_state(
     db_order: DbOrder,
     state: PaymentState,
     updated_at: datetime,
     initiator: User,
 ) -> None:
+    order_stats_service.record_payment_state_change(
+        db_order.shop_id,
+        [
+            (db_line_item.product_id, db_line_item.quantity)
+            for db_line_item in db_order.line_items
+        ],
+        db_order.payment_state,
+        state,
+    )
+
     db_order.payment_state = state
     db_order.payment_state_updated_at = updated_at
     db_order.payment_state_updated_by_id = initiator.id
@@ -358,3 +600,32 @@ def update_line_item_processing_result(
     db_line_item.processing_result = data
     db_line_item.processed_at = datetime.utcnow()
     db.session.commit()
+
+
+def update_line_item_processing_results(
+    data_by_line_item_id: dict[LineItemID, dict[str, Any]],
+) -> None:
+    """Update multiple line items' processing result data at once."""
+    if not data_by_line_item_id:
+        return
+
+    db_line_items = db.session.scalars(
+        select(DbLineItem).filter(DbLineItem.id.in_(data_by_line_item_id))
+    ).all()
+
+    unknown_line_item_ids = set(data_by_line_item_id) - {
+        db_line_item.id for db_line_item in db_line_items
+    }
+    if unknown_line_item_ids:
+        raise ValueError(
+            'Unknown line item IDs: '
+            + ', '.join(map(str, sorted(unknown_line_item_ids)))
+        )
+
+    processed_at = datetime.utcnow()
+
+    for db_line_item in db_line_items:
+        db_line_item.processing_result = data_by_line_item_id[db_line_item.id]
+        db_line_item.processed_at = processed_at
+
+    db.session.commit()
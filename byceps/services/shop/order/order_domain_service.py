@@ -30,12 +30,16 @@ from .events import ShopOrderCanceledEvent, ShopOrderPaidEvent
 from .log import order_log_domain_service
 from .log.models import OrderLogEntry
 from .models.checkout import IncomingLineItem, IncomingOrder
+from .models.number import OrderNumber
 from .models.order import (
     Address,
+    LineItem,
     LineItemID,
+    LineItemProcessingState,
     Order,
     Orderer,
     OrderID,
+    OrderState,
     PaymentState,
 )
 from .models.payment import AdditionalPaymentData, Payment
@@ -107,6 +111,80 @@ def _build_incoming_line_items(
         )
 
 
+def build_placed_order(
+    incoming_order: IncomingOrder, order_number: OrderNumber
+) -> Order:
+    """Build the order as it is right after it has been placed.
+
+    This avoids having to load the order from the database again after
+    persisting it.
+    """
+    orderer = incoming_order.orderer
+
+    line_items = [
+        _build_placed_line_item(incoming_line_item, order_number)
+        for incoming_line_item in incoming_order.line_items
+    ]
+    line_items.sort(key=lambda li: li.product_id)
+
+    return Order(
+        id=incoming_order.id,
+        created_at=incoming_order.created_at,
+        shop_id=incoming_order.shop_id,
+        storefront_id=incoming_order.storefront_id,
+        order_number=order_number,
+        placed_by=orderer.user,
+        company=orderer.company,
+        first_name=orderer.first_name,
+        last_name=orderer.last_name,
+        address=Address(
+            country=orderer.country,
+            postal_code=orderer.postal_code,
+            city=orderer.city,
+            street=orderer.street,
+        ),
+        total_amount=incoming_order.total_amount,
+        line_items=line_items,
+        payment_method=None,
+        payment_state=PaymentState.open,
+        state=OrderState.open,
+        is_open=True,
+        is_canceled=False,
+        is_paid=False,
+        is_invoiced=False,
+        is_overdue=False,
+        is_processing_required=incoming_order.processing_required,
+        is_processed=False,
+        cancellation_reason=None,
+    )
+
+
+def _build_placed_line_item(
+    incoming_line_item: IncomingLineItem, order_number: OrderNumber
+) -> LineItem:
+    if incoming_line_item.processing_required:
+        processing_state = LineItemProcessingState.pending
+    else:
+        processing_state = LineItemProcessingState.not_applicable
+
+    return LineItem(
+        id=incoming_line_item.id,
+        order_number=order_number,
+        product_id=incoming_line_item.product_id,
+        product_number=incoming_line_item.product_number,
+        product_type=incoming_line_item.product_type,
+        name=incoming_line_item.name,
+        unit_price=incoming_line_item.unit_price,
+        tax_rate=incoming_line_item.tax_rate,
+        quantity=incoming_line_item.quantity,
+        line_amount=incoming_line_item.line_amount,
+        processing_required=incoming_line_item.processing_required,
+        processing_result={},
+        processed_at=None,
+        processing_state=processing_state,
+    )
+
+
 def update_orderer(
     original_order: Order,
     new_orderer: Orderer,
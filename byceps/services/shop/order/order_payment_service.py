@@ -55,7 +55,18 @@ def add_payment(
 
 
 def _persist_payment(payment: Payment, log_entry: OrderLogEntry) -> None:
-    db_payment = DbPayment(
+    db_payment = to_db_payment(payment)
+    db.session.add(db_payment)
+
+    db_log_entry = order_log_service.to_db_entry(log_entry)
+    db.session.add(db_log_entry)
+
+    db.session.commit()
+
+
+def to_db_payment(payment: Payment) -> DbPayment:
+    """Convert payment to database entity."""
+    return DbPayment(
         payment.id,
         payment.order_id,
         payment.created_at,
@@ -63,12 +74,6 @@ def _persist_payment(payment: Payment, log_entry: OrderLogEntry) -> None:
         payment.amount,
         payment.additional_data,
     )
-    db.session.add(db_payment)
-
-    db_log_entry = order_log_service.to_db_entry(log_entry)
-    db.session.add(db_log_entry)
-
-    db.session.commit()
 
 
 def get_payments_for_order(order_id: OrderID) -> list[Payment]:
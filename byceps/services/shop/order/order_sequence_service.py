@@ -6,6 +6,9 @@ byceps.services.shop.order.order_sequence_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from dataclasses import dataclass, field
+from threading import Lock
+
 from sqlalchemy import delete, select, update
 from sqlalchemy.exc import IntegrityError
 
@@ -22,13 +25,69 @@ from .models.number import (
 )
 
 
+@dataclass(kw_only=True)
+class _ReservedBlock:
+    """A block of order numbers reserved by this process."""
+
+    prefix: str
+    size: int
+    next_value: int
+    last_value: int
+
+    def is_exhausted(self) -> bool:
+        return self.next_value > self.last_value
+
+    def take_number(self) -> OrderNumber:
+        value = self.next_value
+        self.next_value += 1
+        return OrderNumber(f'{self.prefix}{value:05d}')
+
+
+@dataclass(kw_only=True)
+class _ReservedBlocks:
+    """The blocks of order numbers reserved by this process for a
+    sequence.
+    """
+
+    lock: Lock = field(default_factory=Lock)
+    blocks: list[_ReservedBlock] = field(default_factory=list)
+    block_size: int | None = None
+
+    def take_number(self) -> OrderNumber | None:
+        """Take the next number from a reserved block, if available."""
+        with self.lock:
+            while self.blocks:
+                block = self.blocks[0]
+                if not block.is_exhausted():
+                    return block.take_number()
+                self.blocks.pop(0)
+
+        return None
+
+    def add_block(self, block: _ReservedBlock) -> None:
+        with self.lock:
+            self.blocks.append(block)
+
+
+_reserved_blocks_by_sequence_id: dict[
+    OrderNumberSequenceID, _ReservedBlocks
+] = {}
+_reserved_blocks_by_sequence_id_lock = Lock()
+
+
 def create_order_number_sequence(
-    shop_id: ShopID, prefix: str, *, value: int = 0
+    shop_id: ShopID, prefix: str, *, value: int = 0, block_size: int = 1
 ) -> Result[OrderNumberSequence, None]:
-    """Create an order number sequence."""
+    """Create an order number sequence.
+
+    With a block size greater than one, order numbers are reserved in
+    blocks of that size (see `generate_order_number`).
+    """
     sequence_id = OrderNumberSequenceID(generate_uuid7())
 
-    db_sequence = DbOrderNumberSequence(sequence_id, shop_id, prefix, value)
+    db_sequence = DbOrderNumberSequence(
+        sequence_id, shop_id, prefix, value, block_size=block_size
+    )
 
     db.session.add(db_sequence)
 
@@ -48,6 +107,9 @@ def delete_order_number_sequence(sequence_id: OrderNumberSequenceID) -> None:
     db.session.execute(delete(DbOrderNumberSequence).filter_by(id=sequence_id))
     db.session.commit()
 
+    with _reserved_blocks_by_sequence_id_lock:
+        _reserved_blocks_by_sequence_id.pop(sequence_id, None)
+
 
 def get_order_number_sequence(
     sequence_id: OrderNumberSequenceID,
@@ -80,22 +142,87 @@ def generate_order_number(
 ) -> Result[OrderNumber, str]:
     """Generate and reserve an unused, unique order number from this
     sequence.
+
+    Numbers are reserved in the database in blocks of the sequence's
+    block size, and handed out from the block by this process until it
+    is exhausted. A block size of one reserves each number separately.
+
+    Generated order numbers are unique. With a block size greater than
+    one, however, numbers do not reflect the order in which they were
+    generated, and numbers left in a block when the process ends are
+    never handed out (leaving gaps).
+
+    Locks are only held to take a number from an already reserved
+    block, never while reserving a block in the database. A sequence
+    with a block size of one bypasses the reserved blocks altogether.
     """
+    reserved_blocks = _get_reserved_blocks(sequence_id)
+
+    if reserved_blocks.block_size != 1:
+        order_number = reserved_blocks.take_number()
+        if order_number is not None:
+            return Ok(order_number)
+
+    block_result = _reserve_block(sequence_id)
+    if block_result.is_err():
+        return Err(block_result.unwrap_err())
+
+    block = block_result.unwrap()
+
+    reserved_blocks.block_size = block.size
+
+    order_number = block.take_number()
+
+    if not block.is_exhausted():
+        reserved_blocks.add_block(block)
+
+    return Ok(order_number)
+
+
+def _get_reserved_blocks(
+    sequence_id: OrderNumberSequenceID,
+) -> _ReservedBlocks:
+    with _reserved_blocks_by_sequence_id_lock:
+        reserved_blocks = _reserved_blocks_by_sequence_id.get(sequence_id)
+
+        if reserved_blocks is None:
+            reserved_blocks = _ReservedBlocks()
+            _reserved_blocks_by_sequence_id[sequence_id] = reserved_blocks
+
+        return reserved_blocks
+
+
+def _reserve_block(
+    sequence_id: OrderNumberSequenceID,
+) -> Result[_ReservedBlock, str]:
+    """Reserve the next block of numbers from the sequence."""
     row = db.session.execute(
         update(DbOrderNumberSequence)
         .filter_by(id=sequence_id)
-        .values(value=DbOrderNumberSequence.value + 1)
-        .returning(DbOrderNumberSequence.prefix, DbOrderNumberSequence.value)
+        .values(
+            value=DbOrderNumberSequence.value + DbOrderNumberSequence.block_size
+        )
+        .returning(
+            DbOrderNumberSequence.prefix,
+            DbOrderNumberSequence.value,
+            DbOrderNumberSequence.block_size,
+        )
     ).one_or_none()
     db.session.commit()
 
     if row is None:
         return Err(f'No order number sequence found for ID "{sequence_id}".')
 
-    prefix, value = row
-    order_number = OrderNumber(f'{prefix}{value:05d}')
+    prefix, last_value, block_size = row
 
-    return Ok(order_number)
+    return Ok(
+        _ReservedBlock(
+            prefix=prefix,
+            size=block_size,
+            next_value=last_value - block_size + 1,
+            last_value=last_value,
+        )
+    )
 
 
 def _db_entity_to_order_number_sequence(
@@ -106,5 +233,6 @@ def _db_entity_to_order_number_sequence(
         shop_id=db_sequence.shop_id,
         prefix=db_sequence.prefix,
         value=db_sequence.value,
+        block_size=db_sequence.block_size,
         archived=db_sequence.archived,
     )
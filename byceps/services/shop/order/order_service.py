@@ -6,26 +6,29 @@ byceps.services.shop.order.order_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 import dataclasses
-from datetime import datetime, timedelta
+from datetime import datetime
 
 from flask_babel import lazy_gettext
-from sqlalchemy import select
+from sqlalchemy import CompoundSelect, literal, Select, select, tuple_, union
 
-from byceps.database import db, paginate, Pagination
+from byceps.database import db
 from byceps.services.shop.invoice import order_invoice_service
 from byceps.services.shop.product.models import ProductID
 from byceps.services.shop.shop.dbmodels import DbShop
 from byceps.services.shop.shop.models import ShopID
 from byceps.services.shop.storefront.models import StorefrontID
 from byceps.services.user import user_service
+from byceps.services.user.dbmodels import DbUser
 from byceps.services.user.models import User, UserID
+from byceps.util.datetime.range import DateTimeRange
 
 from . import (
     order_payment_service,
 )
-from .dbmodels.order import DbLineItem, DbOrder
+from .dbmodels.order import DbLineItem, DbOrder, order_search_text
+from .dbmodels.stats import DbOrderStats
 from .models.detailed_order import AdminDetailedOrder, DetailedOrder
 from .models.number import OrderNumber
 from .models.order import (
@@ -36,6 +39,7 @@ from .models.order import (
     PaymentState,
     SiteOrderListItem,
 )
+from .models.search import OrderSearchFacets, OrderSearchResult
 from .order_domain_service import OVERDUE_THRESHOLD
 from .order_helper_service import (
     to_admin_order_list_item,
@@ -47,25 +51,31 @@ from .order_helper_service import (
 
 
 def count_open_orders(shop_id: ShopID) -> int:
-    """Return the number of open orders for the shop."""
+    """Return the number of open orders for the shop.
+
+    Read from the precomputed statistics.
+    """
     return (
         db.session.scalar(
-            select(db.func.count(DbOrder.id))
+            select(DbOrderStats.order_count)
             .filter_by(shop_id=shop_id)
-            .filter_by(_payment_state=PaymentState.open.name)
+            .filter_by(payment_state=PaymentState.open.name)
         )
         or 0
     )
 
 
 def count_orders_per_payment_state(shop_id: ShopID) -> dict[PaymentState, int]:
-    """Count orders for the shop, grouped by payment state."""
+    """Count orders for the shop, grouped by payment state.
+
+    Read from the precomputed statistics.
+    """
     counts_by_payment_state = dict.fromkeys(PaymentState, 0)
 
     rows = db.session.execute(
-        select(DbOrder._payment_state, db.func.count(DbOrder.id))
-        .filter(DbOrder.shop_id == shop_id)
-        .group_by(DbOrder._payment_state)
+        select(DbOrderStats.payment_state, DbOrderStats.order_count).filter(
+            DbOrderStats.shop_id == shop_id
+        )
     ).all()
 
     for payment_state_str, count in rows:
@@ -165,6 +175,88 @@ def find_order_with_details(order_id: OrderID) -> DetailedOrder | None:
     return to_detailed_order(db_order, placed_by)
 
 
+def count_orders_for_shop_created_in_range(
+    shop_id: ShopID,
+    created_range: DateTimeRange,
+    *,
+    only_payment_state: PaymentState | None = None,
+) -> int:
+    """Return the number of orders for that shop created in that range."""
+    stmt = _select_orders_for_shop_created_in_range(
+        select(db.func.count(DbOrder.id)),
+        shop_id,
+        created_range,
+        only_payment_state,
+    )
+
+    return db.session.scalar(stmt) or 0
+
+
+def get_orders_with_details_for_shop_created_in_range(
+    shop_id: ShopID,
+    created_range: DateTimeRange,
+    *,
+    only_payment_state: PaymentState | None = None,
+    batch_size: int = 100,
+) -> Iterator[DetailedOrder]:
+    """Yield the orders for that shop created in that range, oldest
+    first.
+
+    Orders (with line items and orderers) are loaded in batches so that
+    even a large number of orders is never held in memory at once.
+    """
+    after: tuple[datetime, OrderID] | None = None
+
+    while True:
+        stmt = _select_orders_for_shop_created_in_range(
+            select(DbOrder).options(db.selectinload(DbOrder.line_items)),
+            shop_id,
+            created_range,
+            only_payment_state,
+        )
+
+        if after is not None:
+            stmt = stmt.filter(tuple_(DbOrder.created_at, DbOrder.id) > after)
+
+        db_orders = db.session.scalars(
+            stmt.order_by(DbOrder.created_at, DbOrder.id).limit(batch_size)
+        ).all()
+
+        if not db_orders:
+            return
+
+        orderers_by_id = _get_orderers_by_id(db_orders)
+
+        for db_order in db_orders:
+            yield to_detailed_order(
+                db_order, orderers_by_id[db_order.placed_by_id]
+            )
+
+        if len(db_orders) < batch_size:
+            return
+
+        last_db_order = db_orders[-1]
+        after = (last_db_order.created_at, last_db_order.id)
+
+
+def _select_orders_for_shop_created_in_range(
+    stmt: Select,
+    shop_id: ShopID,
+    created_range: DateTimeRange,
+    only_payment_state: PaymentState | None,
+) -> Select:
+    stmt = (
+        stmt.filter(DbOrder.shop_id == shop_id)
+        .filter(DbOrder.created_at >= created_range.start)
+        .filter(DbOrder.created_at < created_range.end)
+    )
+
+    if only_payment_state is not None:
+        stmt = stmt.filter(DbOrder._payment_state == only_payment_state.name)
+
+    return stmt
+
+
 def find_order_with_details_for_admin(
     order_id: OrderID,
 ) -> AdminDetailedOrder | None:
@@ -224,17 +316,23 @@ def get_orders_for_order_numbers(
 
 
 def get_order_ids_for_order_numbers(
-    order_numbers: set[OrderNumber],
+    order_numbers: set[OrderNumber], *, shop_id: ShopID | None = None
 ) -> dict[OrderNumber, OrderID]:
-    """Return the order IDs for those order numbers."""
+    """Return the order IDs for those order numbers.
+
+    If a shop is given, only orders of that shop are considered.
+    """
     if not order_numbers:
         return {}
 
-    order_ids_and_numbers = db.session.execute(
-        select(DbOrder.id, DbOrder.order_number).filter(
-            DbOrder.order_number.in_(order_numbers)
-        )
-    ).all()
+    stmt = select(DbOrder.id, DbOrder.order_number).filter(
+        DbOrder.order_number.in_(order_numbers)
+    )
+
+    if shop_id is not None:
+        stmt = stmt.filter_by(shop_id=shop_id)
+
+    order_ids_and_numbers = db.session.execute(stmt).all()
 
     return {
         order_number: order_id
@@ -276,31 +374,116 @@ def get_orders(order_ids: frozenset[OrderID]) -> list[Order]:
     return _db_orders_to_transfer_objects_with_orderer_users(db_orders)
 
 
-def get_orders_for_shop_paginated(
+def search_orders(
     shop_id: ShopID,
-    page: int,
-    per_page: int,
     *,
-    search_term=None,
+    search_term: str | None = None,
     only_payment_state: PaymentState | None = None,
     only_overdue: bool | None = None,
     only_processed: bool | None = None,
-) -> Pagination:
-    """Return all orders for that shop, ordered by creation date.
+    after: OrderID | None = None,
+    limit: int,
+) -> OrderSearchResult:
+    """Return up to `limit` orders for that shop, newest first.
+
+    If a search term is given, only orders whose number, orderer name,
+    company, or orderer email address contains it are returned.
 
     If a payment state is specified, only orders in that state are
     returned.
+
+    If an order ID is given as `after`, only orders older than that one
+    are returned (keyset pagination).
     """
     stmt = (
         select(DbOrder)
-        .options(db.joinedload(DbOrder.line_items))
         .filter_by(shop_id=shop_id)
-        .order_by(DbOrder.created_at.desc())
+        .order_by(DbOrder.created_at.desc(), DbOrder.id.desc())
+        .limit(limit + 1)
+    )
+
+    stmt = _filter_orders(
+        stmt,
+        search_term=search_term,
+        only_payment_state=only_payment_state,
+        only_overdue=only_overdue,
+        only_processed=only_processed,
+    )
+
+    if after is not None:
+        after_created_at = db.session.scalar(
+            select(DbOrder.created_at).filter_by(id=after)
+        )
+        if after_created_at is not None:
+            stmt = stmt.filter(
+                tuple_(DbOrder.created_at, DbOrder.id)
+                < tuple_(literal(after_created_at), literal(after))
+            )
+
+    db_orders = list(db.session.scalars(stmt).all())
+
+    has_more = len(db_orders) > limit
+    db_orders = db_orders[:limit]
+
+    next_after = db_orders[-1].id if has_more else None
+
+    return OrderSearchResult(
+        orders=_to_admin_order_list_items(db_orders),
+        next_after=next_after,
+    )
+
+
+def get_order_search_facets(
+    shop_id: ShopID, *, search_term: str | None = None
+) -> OrderSearchFacets:
+    """Return the number of orders for that shop (optionally matching
+    the search term), in total, per payment state, and overdue.
+    """
+    overdue_created_before = datetime.utcnow() - OVERDUE_THRESHOLD
+
+    stmt = (
+        select(
+            DbOrder._payment_state,
+            db.func.count(DbOrder.id),
+            db.func.count(DbOrder.id).filter(
+                DbOrder.created_at < overdue_created_before
+            ),
+        )
+        .filter_by(shop_id=shop_id)
+        .group_by(DbOrder._payment_state)
     )
 
+    stmt = _filter_orders(stmt, search_term=search_term)
+
+    rows = db.session.execute(stmt).tuples().all()
+
+    per_payment_state = dict.fromkeys(PaymentState, 0)
+    overdue = 0
+    for payment_state_name, count, created_before_overdue_count in rows:
+        payment_state = PaymentState[payment_state_name]
+        per_payment_state[payment_state] = count
+        if payment_state == PaymentState.open:
+            overdue = created_before_overdue_count
+
+    return OrderSearchFacets(
+        total=sum(per_payment_state.values()),
+        per_payment_state=per_payment_state,
+        overdue=overdue,
+    )
+
+
+def _filter_orders(
+    stmt: Select,
+    *,
+    search_term: str | None = None,
+    only_payment_state: PaymentState | None = None,
+    only_overdue: bool | None = None,
+    only_processed: bool | None = None,
+) -> Select:
     if search_term:
-        ilike_pattern = f'%{search_term}%'
-        stmt = stmt.filter(DbOrder.order_number.ilike(ilike_pattern))
+        stmt = stmt.filter(
+            DbOrder.id.in_(_select_order_ids_matching(search_term))
+        )
 
     if only_payment_state is not None:
         stmt = stmt.filter_by(_payment_state=only_payment_state.name)
@@ -308,14 +491,12 @@ def get_orders_for_shop_paginated(
         if (only_payment_state == PaymentState.open) and (
             only_overdue is not None
         ):
-            now = datetime.utcnow()
+            overdue_created_before = datetime.utcnow() - OVERDUE_THRESHOLD
 
             if only_overdue:
-                stmt = stmt.filter(DbOrder.created_at + OVERDUE_THRESHOLD < now)
+                stmt = stmt.filter(DbOrder.created_at < overdue_created_before)
             else:
-                stmt = stmt.filter(
-                    DbOrder.created_at + OVERDUE_THRESHOLD >= now
-                )
+                stmt = stmt.filter(DbOrder.created_at >= overdue_created_before)
 
     if only_processed is not None:
         stmt = stmt.filter(DbOrder.processing_required == True)  # noqa: E712
@@ -325,11 +506,25 @@ def get_orders_for_shop_paginated(
         else:
             stmt = stmt.filter(DbOrder.processed_at.is_(None))
 
-    paginated_orders = paginate(stmt, page, per_page)
+    return stmt
+
+
+def _select_order_ids_matching(search_term: str) -> CompoundSelect:
+    """Select the IDs of orders whose number, orderer name, company, or
+    orderer email address contains the search term.
 
-    paginated_orders.items = _to_admin_order_list_items(paginated_orders.items)
+    Both parts of the union can be answered by a trigram index each,
+    which would not be the case for a single condition spanning orders
+    and users.
+    """
+    ilike_pattern = f'%{search_term}%'
 
-    return paginated_orders
+    return union(
+        select(DbOrder.id).filter(order_search_text.ilike(ilike_pattern)),
+        select(DbOrder.id)
+        .join(DbUser, DbUser.id == DbOrder.placed_by_id)
+        .filter(DbUser.email_address.ilike(ilike_pattern)),
+    )
 
 
 def _to_admin_order_list_items(
@@ -368,32 +563,39 @@ def get_open_orders(
     ]
 
 
-def get_overdue_orders(
-    shop_id: ShopID, older_than: timedelta, *, limit: int | None = None
-) -> list[Order]:
-    """Return all overdue orders for that shop, ordered by creation date."""
-    now = datetime.utcnow()
-
-    db_orders = (
-        db.session.scalars(
-            select(DbOrder)
-            .options(db.joinedload(DbOrder.line_items))
-            .filter_by(shop_id=shop_id)
-            .filter_by(_payment_state=PaymentState.open.name)
-            .filter(DbOrder.created_at + older_than < now)
-            .order_by(DbOrder.created_at)
-            .limit(limit)
-        )
-        .unique()
-        .all()
+def get_overdue_order_ids(
+    shop_id: ShopID,
+    created_before: datetime,
+    *,
+    after: OrderID | None = None,
+    limit: int,
+) -> list[OrderID]:
+    """Return the IDs of up to `limit` open orders for that shop that
+    were created before that point in time, oldest first.
+
+    If an order ID is given as `after`, only orders created after that
+    one are returned (keyset pagination).
+    """
+    stmt = (
+        select(DbOrder.id)
+        .filter_by(shop_id=shop_id)
+        .filter_by(_payment_state=PaymentState.open.name)
+        .filter(DbOrder.created_at < created_before)
+        .order_by(DbOrder.created_at, DbOrder.id)
+        .limit(limit)
     )
 
-    orderers_by_id = _get_orderers_by_id(db_orders)
+    if after is not None:
+        after_created_at = db.session.scalar(
+            select(DbOrder.created_at).filter_by(id=after)
+        )
+        if after_created_at is not None:
+            stmt = stmt.filter(
+                tuple_(DbOrder.created_at, DbOrder.id)
+                > tuple_(literal(after_created_at), literal(after))
+            )
 
-    return [
-        to_order(db_order, orderers_by_id[db_order.placed_by_id])
-        for db_order in db_orders
-    ]
+    return list(db.session.scalars(stmt).all())
 
 
 def get_orders_placed_by_user(user_id: UserID) -> list[Order]:
@@ -0,0 +1,187 @@
+"""
+byceps.services.shop.order.order_stats_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Maintain precomputed numbers of orders and ordered products per shop and
+payment state.
+
+The statistics are updated in the same transaction as the orders they
+reflect. Should they ever drift (e.g. after orders were changed in the
+database directly), they can be recomputed from the orders.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections import Counter
+from collections.abc import Iterable
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+
+from byceps.database import db
+from byceps.services.shop.product.dbmodels.product import DbProduct
+from byceps.services.shop.product.models import ProductID
+from byceps.services.shop.shop.models import ShopID
+
+from .dbmodels.order import DbLineItem, DbOrder
+from .dbmodels.stats import DbOrderedProductStats, DbOrderStats
+from .models.order import PaymentState
+
+
+def record_order_placed(
+    shop_id: ShopID, product_quantities: Iterable[tuple[ProductID, int]]
+) -> None:
+    """Count a newly placed (and thus open) order.
+
+    Does not commit.
+    """
+    _update_stats(shop_id, product_quantities, {PaymentState.open: 1})
+
+
+def record_payment_state_change(
+    shop_id: ShopID,
+    product_quantities: Iterable[tuple[ProductID, int]],
+    payment_state_from: PaymentState,
+    payment_state_to: PaymentState,
+    *,
+    order_count: int = 1,
+) -> None:
+    """Move orders from one payment state to another.
+
+    The product quantities are those of all moved orders.
+
+    Does not commit.
+    """
+    if payment_state_from == payment_state_to:
+        return
+
+    _update_stats(
+        shop_id,
+        product_quantities,
+        {payment_state_from: -order_count, payment_state_to: order_count},
+    )
+
+
+def _update_stats(
+    shop_id: ShopID,
+    product_quantities: Iterable[tuple[ProductID, int]],
+    deltas_by_payment_state: dict[PaymentState, int],
+) -> None:
+    # Sort rows to always lock them in the same order, avoiding
+    # deadlocks between concurrent transactions.
+    payment_states_and_deltas = sorted(
+        deltas_by_payment_state.items(), key=lambda item: item[0].name
+    )
+
+    _add_to_order_counts(shop_id, payment_states_and_deltas)
+
+    quantities_by_product_id: Counter[ProductID] = Counter()
+    for product_id, quantity in product_quantities:
+        quantities_by_product_id[product_id] += quantity
+
+    _add_to_ordered_product_quantities(
+        [
+            (product_id, payment_state, quantity if delta > 0 else -quantity)
+            for product_id, quantity in sorted(quantities_by_product_id.items())
+            for payment_state, delta in payment_states_and_deltas
+        ]
+    )
+
+
+def _add_to_order_counts(
+    shop_id: ShopID, payment_states_and_deltas: list[tuple[PaymentState, int]]
+) -> None:
+    table = DbOrderStats.__table__
+
+    stmt = insert(table).values(
+        [
+            {
+                'shop_id': shop_id,
+                'payment_state': payment_state.name,
+                'order_count': delta,
+            }
+            for payment_state, delta in payment_states_and_deltas
+        ]
+    )
+    stmt = stmt.on_conflict_do_update(
+        constraint=table.primary_key,
+        set_={'order_count': table.c.order_count + stmt.excluded.order_count},
+    )
+
+    db.session.execute(stmt)
+
+
+def _add_to_ordered_product_quantities(
+    rows: list[tuple[ProductID, PaymentState, int]],
+) -> None:
+    if not rows:
+        return
+
+    table = DbOrderedProductStats.__table__
+
+    stmt = insert(table).values(
+        [
+            {
+                'product_id': product_id,
+                'payment_state': payment_state.name,
+                'quantity': quantity,
+            }
+            for product_id, payment_state, quantity in rows
+        ]
+    )
+    stmt = stmt.on_conflict_do_update(
+        constraint=table.primary_key,
+        set_={'quantity': table.c.quantity + stmt.excluded.quantity},
+    )
+
+    db.session.execute(stmt)
+
+
+def reconcile_stats(shop_id: ShopID) -> None:
+    """Recompute the shop's statistics from its orders."""
+    _reconcile_order_counts(shop_id)
+    _reconcile_ordered_product_quantities(shop_id)
+
+    db.session.commit()
+
+
+def _reconcile_order_counts(shop_id: ShopID) -> None:
+    db.session.execute(delete(DbOrderStats).filter_by(shop_id=shop_id))
+
+    db.session.execute(
+        insert(DbOrderStats).from_select(
+            ['shop_id', 'payment_state', 'order_count'],
+            select(
+                DbOrder.shop_id,
+                DbOrder._payment_state,
+                db.func.count(DbOrder.id),
+            )
+            .filter(DbOrder.shop_id == shop_id)
+            .group_by(DbOrder.shop_id, DbOrder._payment_state),
+        )
+    )
+
+
+def _reconcile_ordered_product_quantities(shop_id: ShopID) -> None:
+    db.session.execute(
+        delete(DbOrderedProductStats).filter(
+            DbOrderedProductStats.product_id.in_(
+                select(DbProduct.id).filter_by(shop_id=shop_id)
+            )
+        )
+    )
+
+    db.session.execute(
+        insert(DbOrderedProductStats).from_select(
+            ['product_id', 'payment_state', 'quantity'],
+            select(
+                DbLineItem.product_id,
+                DbOrder._payment_state,
+                db.func.sum(DbLineItem.quantity),
+            )
+            .join(DbOrder)
+            .filter(DbOrder.shop_id == shop_id)
+            .group_by(DbLineItem.product_id, DbOrder._payment_state),
+        )
+    )
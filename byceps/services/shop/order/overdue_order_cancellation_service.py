@@ -0,0 +1,229 @@
+"""
+byceps.services.shop.order.overdue_order_cancellation_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Cancel a shop's overdue orders in the background, in chunks.
+
+Each chunk is canceled by a job of its own, in a single transaction,
+which then enqueues the job for the next chunk. Only orders that are
+still open are canceled, so a failed job can simply be requeued (or
+the whole cancellation started over) without affecting orders that
+have been canceled or paid in the meantime.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime, timedelta
+from itertools import batched
+
+import structlog
+
+from byceps.services.shop.shop.models import ShopID
+from byceps.services.user.models import User
+from byceps.util.jobqueue import enqueue
+
+from . import order_command_service, order_service
+from . import signals as shop_order_signals
+from .email import order_email_service
+from .models.order import OrderID
+
+
+log = structlog.get_logger()
+
+
+CHUNK_SIZE = 100
+
+
+def start_cancellation(
+    shop_id: ShopID,
+    older_than: timedelta,
+    initiator: User,
+    reason: str,
+    *,
+    notify_orderers: bool,
+) -> None:
+    """Start canceling the shop's open orders that are older than the
+    given age.
+
+    Orders that only become overdue while the cancellation is under way
+    are not included.
+    """
+    created_before = datetime.utcnow() - older_than
+
+    log.info(
+        'Overdue order cancellation started',
+        shop_id=shop_id,
+        created_before=created_before,
+    )
+
+    enqueue(
+        cancel_overdue_orders_chunk,
+        shop_id,
+        created_before,
+        initiator,
+        reason,
+        notify_orderers=notify_orderers,
+    )
+
+
+def cancel_overdue_orders_chunk(
+    shop_id: ShopID,
+    created_before: datetime,
+    initiator: User,
+    reason: str,
+    *,
+    notify_orderers: bool,
+    after: OrderID | None = None,
+    canceled_total: int = 0,
+    failed_total: int = 0,
+    skipped_order_ids: list[OrderID] | None = None,
+) -> None:
+    """Cancel the next chunk of overdue orders, then enqueue the job
+    for the chunk after that.
+
+    Orders that have been skipped (because they were locked by another
+    transaction at the time) are behind the keyset cursor, so they are
+    collected and retried once after the last chunk.
+    """
+    if skipped_order_ids is None:
+        skipped_order_ids = []
+
+    order_ids = order_service.get_overdue_order_ids(
+        shop_id, created_before, after=after, limit=CHUNK_SIZE
+    )
+
+    if not order_ids:
+        _retry_skipped_orders(
+            shop_id,
+            initiator,
+            reason,
+            skipped_order_ids,
+            notify_orderers=notify_orderers,
+            canceled_total=canceled_total,
+            failed_total=failed_total,
+        )
+        return
+
+    canceled_order_ids, failed_count = _cancel_orders(
+        order_ids, initiator, reason, notify_orderers=notify_orderers
+    )
+
+    skipped_order_ids += _get_skipped_order_ids(order_ids, canceled_order_ids)
+
+    canceled_total += len(canceled_order_ids)
+    failed_total += failed_count
+
+    log.info(
+        'Overdue orders canceled',
+        shop_id=shop_id,
+        canceled=len(canceled_order_ids),
+        skipped=len(order_ids) - len(canceled_order_ids),
+        canceled_total=canceled_total,
+        failed_total=failed_total,
+    )
+
+    enqueue(
+        cancel_overdue_orders_chunk,
+        shop_id,
+        created_before,
+        initiator,
+        reason,
+        notify_orderers=notify_orderers,
+        after=order_ids[-1],
+        canceled_total=canceled_total,
+        failed_total=failed_total,
+        skipped_order_ids=skipped_order_ids,
+    )
+
+
+def _retry_skipped_orders(
+    shop_id: ShopID,
+    initiator: User,
+    reason: str,
+    skipped_order_ids: list[OrderID],
+    *,
+    notify_orderers: bool,
+    canceled_total: int,
+    failed_total: int,
+) -> None:
+    """Retry canceling the skipped orders once, then finish.
+
+    Skipped orders that have been paid or canceled in the meantime are
+    left alone. Those still skipped are reported, to be picked up by a
+    later run.
+    """
+    still_skipped_total = 0
+
+    for order_ids in batched(skipped_order_ids, CHUNK_SIZE):
+        canceled_order_ids, failed_count = _cancel_orders(
+            list(order_ids), initiator, reason, notify_orderers=notify_orderers
+        )
+
+        canceled_total += len(canceled_order_ids)
+        failed_total += failed_count
+        still_skipped_total += len(order_ids) - len(canceled_order_ids)
+
+    log.info(
+        'Overdue order cancellation finished',
+        shop_id=shop_id,
+        canceled_total=canceled_total,
+        failed_total=failed_total,
+        skipped_total=still_skipped_total,
+    )
+
+
+def _cancel_orders(
+    order_ids: list[OrderID],
+    initiator: User,
+    reason: str,
+    *,
+    notify_orderers: bool,
+) -> tuple[list[OrderID], int]:
+    """Cancel those of the orders that are still open (and not locked).
+
+    Return the IDs of the canceled orders and the number of orders for
+    which executing the cancellation actions failed.
+    """
+    results = order_command_service.cancel_open_orders(
+        order_ids, initiator, reason
+    )
+
+    for canceled_order, event, action_error in results:
+        shop_order_signals.order_canceled.send(None, event=event)
+
+        if action_error is not None:
+            log.error(
+                'Executing actions on cancellation of overdue order failed',
+                order_number=canceled_order.order_number,
+                details=action_error.details,
+            )
+
+    canceled_order_ids = [canceled_order.id for canceled_order, _, _ in results]
+    failed_count = sum(
+        1 for _, _, action_error in results if action_error is not None
+    )
+
+    if notify_orderers and canceled_order_ids:
+        enqueue(notify_orderers_of_canceled_orders, canceled_order_ids)
+
+    return canceled_order_ids, failed_count
+
+
+def _get_skipped_order_ids(
+    order_ids: list[OrderID], canceled_order_ids: list[OrderID]
+) -> list[OrderID]:
+    canceled_order_id_set = set(canceled_order_ids)
+    return [
+        order_id
+        for order_id in order_ids
+        if order_id not in canceled_order_id_set
+    ]
+
+
+def notify_orderers_of_canceled_orders(order_ids: list[OrderID]) -> None:
+    """Send an email to the orderer of each of the canceled orders."""
+    orders = order_service.get_orders(frozenset(order_ids))
+
+    for order in orders:
+        order_email_service.send_email_for_canceled_order_to_orderer(order)
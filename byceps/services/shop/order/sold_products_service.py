@@ -10,18 +10,24 @@ from __future__ import annotations
 
 from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
+from itertools import batched, groupby
 
 from flask_babel import lazy_gettext
+from sqlalchemy import select
 
-from byceps.services.party.models import Party, PartyID
-from byceps.services.shop.order import ordered_products_service
+from byceps.database import db
+from byceps.services.party.models import Party
+from byceps.services.shop.order.dbmodels.order import DbLineItem, DbOrder
 from byceps.services.shop.order.models.number import OrderNumber
-from byceps.services.shop.order.models.order import Order, OrderID, PaymentState
-from byceps.services.shop.product.models import Product, ProductNumber
+from byceps.services.shop.order.models.order import OrderID, PaymentState
+from byceps.services.shop.product.models import (
+    Product,
+    ProductID,
+    ProductNumber,
+)
 from byceps.services.user import user_service
 from byceps.services.user.models import UserForAdmin, UserID
 from byceps.util.export import serialize_tuples_to_csv
-from byceps.util.iterables import find
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
@@ -47,19 +53,23 @@ class SoldProductsReport:
 CsvRow = tuple[str, ...]
 
 
-def get_sold_products_report(
-    party: Party, products: list[Product]
-) -> SoldProductsReport:
-    orders = list(_select_unique_orders(_collect_product_orders(products)))
+# Number of rows to fetch from the database at once, and number of
+# orders to look up the orderers for at once, when streaming.
+_STREAM_BATCH_SIZE = 500
 
-    orderers_by_id = _get_orderers_by_id(orders)
 
-    order_summaries = [
-        _assemble_order_summary(party.id, order, orderers_by_id, products)
-        for order in orders
-    ]
+@dataclass(frozen=True, kw_only=True, slots=True)
+class _OrderProductQuantities:
+    order_id: OrderID
+    order_number: OrderNumber
+    orderer_id: UserID
+    quantities_by_product_id: dict[ProductID, int]
 
-    order_summaries.sort(key=lambda summary: summary.order_number)
+
+def get_sold_products_report(
+    party: Party, products: list[Product]
+) -> SoldProductsReport:
+    order_summaries = list(_generate_order_summaries(products))
 
     return SoldProductsReport(
         products=products,
@@ -67,92 +77,131 @@ def get_sold_products_report(
     )
 
 
-def _collect_product_orders(products: list[Product]) -> Iterator[Order]:
-    for product in products:
-        yield from ordered_products_service.get_orders_including_product(
-            product.id, only_payment_state=PaymentState.paid
-        )
+def _generate_order_summaries(
+    products: list[Product],
+) -> Iterator[OrderSummary]:
+    """Yield summaries of paid orders that include any of the products,
+    ordered by order number.
 
+    Orders are fetched from the database, and their orderers are looked
+    up, in batches.
+    """
+    orders = _get_order_product_quantities(products)
 
-def _select_unique_orders(orders: Iterable[Order]) -> Iterator[Order]:
-    unique_order_ids = set()
+    for orders_batch in batched(orders, _STREAM_BATCH_SIZE):
+        orderers_by_id = _get_orderers_by_id(orders_batch)
 
-    for order in orders:
-        if order.id in unique_order_ids:
-            continue
+        for order in orders_batch:
+            yield _assemble_order_summary(order, orderers_by_id, products)
 
-        unique_order_ids.add(order.id)
-        yield order
 
+def _get_order_product_quantities(
+    products: list[Product],
+) -> Iterator[_OrderProductQuantities]:
+    """Yield the quantities of the products per paid order, ordered by
+    order number.
+
+    All orders are aggregated by a single query, and the results are
+    streamed from a server-side cursor.
+    """
+    product_ids = {product.id for product in products}
+    if not product_ids:
+        return
+
+    rows = db.session.execute(
+        select(
+            DbOrder.id,
+            DbOrder.order_number,
+            DbOrder.placed_by_id,
+            DbLineItem.product_id,
+            db.func.sum(DbLineItem.quantity),
+        )
+        .join(DbLineItem)
+        .filter(DbLineItem.product_id.in_(product_ids))
+        .filter(DbOrder._payment_state == PaymentState.paid.name)
+        .group_by(
+            DbOrder.id,
+            DbOrder.order_number,
+            DbOrder.placed_by_id,
+            DbLineItem.product_id,
+        )
+        .order_by(DbOrder.order_number)
+        .execution_options(yield_per=_STREAM_BATCH_SIZE)
+    ).tuples()
+
+    for (order_id, order_number, orderer_id), order_rows in groupby(
+        rows, key=lambda row: row[:3]
+    ):
+        yield _OrderProductQuantities(
+            order_id=order_id,
+            order_number=order_number,
+            orderer_id=orderer_id,
+            quantities_by_product_id={
+                product_id: quantity for *_, product_id, quantity in order_rows
+            },
+        )
 
-def _get_orderers_by_id(orders: Iterable[Order]) -> dict[UserID, UserForAdmin]:
-    orderer_ids = {order.placed_by.id for order in orders}
-    orderers = user_service.get_users_for_admin(orderer_ids)
-    return {orderer.id: orderer for orderer in orderers}
+
+def _get_orderers_by_id(
+    orders: Iterable[_OrderProductQuantities],
+) -> dict[UserID, UserForAdmin]:
+    orderer_ids = {order.orderer_id for order in orders}
+    return user_service.get_users_for_admin_indexed_by_id(orderer_ids)
 
 
 def _assemble_order_summary(
-    party_id: PartyID,
-    order: Order,
+    order: _OrderProductQuantities,
     orderers_by_id: dict[UserID, UserForAdmin],
     products: list[Product],
 ) -> OrderSummary:
-    orderer = orderers_by_id[order.placed_by.id]
+    orderer = orderers_by_id[order.orderer_id]
 
     product_quantities = [
         ProductQuantity(
             item_number=product.item_number,
-            quantity=get_product_quantity(product.item_number, order),
+            quantity=order.quantities_by_product_id.get(product.id, 0),
         )
         for product in products
     ]
 
     return OrderSummary(
-        order_id=order.id,
+        order_id=order.order_id,
         order_number=order.order_number,
         orderer=orderer,
         product_quantities=product_quantities,
     )
 
 
-def get_product_quantity(product_number: ProductNumber, order: Order) -> int:
-    product_line_item = find(
-        order.line_items,
-        lambda line_item: line_item.product_number == product_number,
-    )
-
-    if not product_line_item:
-        return 0
-
-    return product_line_item.quantity
-
+def export_sold_products_as_csv(
+    party: Party, products: list[Product]
+) -> Iterator[str]:
+    """Yield the report as CSV lines.
 
-def export_sold_products_as_csv(report: SoldProductsReport) -> str:
-    header_row = _assemble_csv_header_row(report)
-    data_rows = _assemble_csv_data_rows(report)
-    all_rows = [header_row] + data_rows
+    The lines are generated as the orders come in from the database, so
+    that the report is never held in memory as a whole.
+    """
+    header_row = _assemble_csv_header_row(products)
+    yield from serialize_tuples_to_csv([header_row])
 
-    lines = serialize_tuples_to_csv(all_rows)
-    return ''.join(lines)
+    order_summaries = _generate_order_summaries(products)
+    for order_summaries_batch in batched(order_summaries, _STREAM_BATCH_SIZE):
+        data_rows = [
+            tuple(_assemble_data_row(order_summary))
+            for order_summary in order_summaries_batch
+        ]
+        yield from serialize_tuples_to_csv(data_rows)
 
 
-def _assemble_csv_header_row(report: SoldProductsReport) -> CsvRow:
+def _assemble_csv_header_row(products: list[Product]) -> CsvRow:
     fixed_column_names = (
         str(lazy_gettext('Order number')),
         str(lazy_gettext('Username')),
         str(lazy_gettext('Name')),
     )
-    product_names = tuple(product.name for product in report.products)
+    product_names = tuple(product.name for product in products)
     return fixed_column_names + product_names
 
 
-def _assemble_csv_data_rows(report: SoldProductsReport) -> list[CsvRow]:
-    return [
-        tuple(_assemble_data_row(order_summary))
-        for order_summary in report.order_summaries
-    ]
-
-
 def _assemble_data_row(order_summary: OrderSummary) -> Iterator[str]:
     yield from (
         str(order_summary.order_number),
@@ -6,10 +6,16 @@ byceps.services.shop.payment.dbmodels
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from datetime import datetime
+from uuid import UUID
+
 from sqlalchemy.orm import Mapped, mapped_column
 
 from byceps.database import db
+from byceps.services.shop.order.models.order import OrderID
+from byceps.services.shop.order.models.payment import AdditionalPaymentData
 from byceps.services.shop.storefront.models import StorefrontID
+from byceps.services.user.models import UserID
 
 
 class DbPaymentGateway(db.Model):
@@ -56,3 +62,32 @@ class DbStorefrontPaymentGateway(db.Model):
     ) -> None:
         self.storefront_id = storefront_id
         self.payment_gateway_id = payment_gateway_id
+
+
+class DbPaymentEvent(db.Model):
+    """A verified payment notification from a payment gateway, to be
+    processed asynchronously.
+
+    The gateway's ID for the event serves as idempotency key.
+    """
+
+    __tablename__ = 'shop_payment_events'
+    __table_args__ = (
+        db.UniqueConstraint('payment_gateway_id', 'gateway_event_id'),
+    )
+
+    id: Mapped[UUID] = mapped_column(db.Uuid, primary_key=True)
+    received_at: Mapped[datetime]
+    payment_gateway_id: Mapped[str] = mapped_column(db.UnicodeText)
+    gateway_event_id: Mapped[str] = mapped_column(db.UnicodeText)
+    order_id: Mapped[OrderID] = mapped_column(
+        db.Uuid, db.ForeignKey('shop_orders.id'), index=True
+    )
+    payment_method: Mapped[str] = mapped_column(db.UnicodeText)
+    additional_payment_data: Mapped[AdditionalPaymentData] = mapped_column(
+        db.JSONB
+    )
+    initiator_id: Mapped[UserID] = mapped_column(
+        db.Uuid, db.ForeignKey('users.id')
+    )
+    processed_at: Mapped[datetime | None]
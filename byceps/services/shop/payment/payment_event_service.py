@@ -0,0 +1,155 @@
+"""
+byceps.services.shop.payment.payment_event_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+An inbox for payment notifications from payment gateways.
+
+Gateways' notifications are verified and persisted right away so that
+they can be acknowledged quickly. Marking the order as paid, executing
+its actions, and notifying the orderer happen in a background job.
+
+A notification received more than once is stored (and processed) only
+once.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime
+from uuid import UUID
+
+from rq import Retry
+from sqlalchemy.dialects.postgresql import insert
+import structlog
+
+from byceps.database import db
+from byceps.services.shop.order import (
+    order_command_service,
+    order_service,
+    signals as shop_order_signals,
+)
+from byceps.services.shop.order.email import order_email_service
+from byceps.services.shop.order.errors import OrderActionFailedError
+from byceps.services.shop.order.models.order import OrderID
+from byceps.services.shop.order.models.payment import AdditionalPaymentData
+from byceps.services.user import user_service
+from byceps.services.user.models import User
+from byceps.util.jobqueue import enqueue
+from byceps.util.result import Err, Ok
+from byceps.util.uuid import generate_uuid7
+
+from .dbmodels import DbPaymentEvent
+
+
+log = structlog.get_logger()
+
+
+# Retry failed processing jobs after 10 seconds, 1 minute, and
+# 5 minutes.
+_PROCESSING_RETRY = Retry(max=3, interval=[10, 60, 300])
+
+
+def receive_payment_event(
+    payment_gateway_id: str,
+    gateway_event_id: str,
+    order_id: OrderID,
+    payment_method: str,
+    additional_payment_data: AdditionalPaymentData,
+    initiator: User,
+) -> bool:
+    """Store the verified payment event and enqueue its processing.
+
+    Return `False` if the event has been received before, in which case
+    nothing is done.
+    """
+    event_id = db.session.scalar(
+        insert(DbPaymentEvent)
+        .values(
+            id=generate_uuid7(),
+            received_at=datetime.utcnow(),
+            payment_gateway_id=payment_gateway_id,
+            gateway_event_id=gateway_event_id,
+            order_id=order_id,
+            payment_method=payment_method,
+            additional_payment_data=additional_payment_data,
+            initiator_id=initiator.id,
+        )
+        .on_conflict_do_nothing(
+            index_elements=['payment_gateway_id', 'gateway_event_id']
+        )
+        .returning(DbPaymentEvent.id)
+    )
+    db.session.commit()
+
+    if event_id is None:
+        log.info(
+            'Duplicate payment event ignored',
+            payment_gateway_id=payment_gateway_id,
+            gateway_event_id=gateway_event_id,
+            shop_order_id=str(order_id),
+        )
+        return False
+
+    enqueue(process_payment_event, event_id, retry=_PROCESSING_RETRY)
+
+    return True
+
+
+def process_payment_event(event_id: UUID) -> None:
+    """Mark the event's order as paid, unless that has already been
+    done.
+
+    Safe to be run again for the same event.
+    """
+    db_event = db.session.get(DbPaymentEvent, event_id)
+
+    if db_event is None:
+        log.error('Unknown payment event', payment_event_id=str(event_id))
+        return
+
+    if db_event.processed_at is not None:
+        return
+
+    order = order_service.find_order(db_event.order_id)
+
+    if order is None or not order.is_open:
+        # Most likely, the event has already been processed before,
+        # but the processing job failed before recording that.
+        log.warning(
+            'Payment event for order that does not exist or is not open',
+            payment_event_id=str(event_id),
+            shop_order_id=str(db_event.order_id),
+        )
+        _mark_event_as_processed(db_event)
+        return
+
+    initiator = user_service.get_user(db_event.initiator_id)
+
+    match order_command_service.mark_order_as_paid(
+        order.id,
+        db_event.payment_method,
+        initiator,
+        additional_payment_data=db_event.additional_payment_data,
+    ):
+        case Ok((paid_order, paid_event)):
+            order_email_service.send_email_for_paid_order_to_orderer(paid_order)
+            shop_order_signals.order_paid.send(None, event=paid_event)
+        case Err(e):
+            # The order has been marked as paid but its actions have
+            # failed, or it has been paid or canceled meanwhile.
+            # Processing the event again would not help either way.
+            log.error(
+                'Processing payment event failed',
+                payment_event_id=str(event_id),
+                shop_order_id=str(order.id),
+                error=(
+                    e.details if isinstance(e, OrderActionFailedError) else e
+                ),
+            )
+
+    _mark_event_as_processed(db_event)
+
+
+def _mark_event_as_processed(db_event: DbPaymentEvent) -> None:
+    db_event.processed_at = datetime.utcnow()
+    db.session.commit()
@@ -23,13 +23,9 @@ import structlog
 
 from byceps.byceps_app import get_current_byceps_app
 from byceps.config.errors import ConfigurationError
-from byceps.services.shop.order import (
-    order_command_service,
-    order_service,
-    signals as shop_order_signals,
-)
-from byceps.services.shop.order.email import order_email_service
+from byceps.services.shop.order import order_service
 from byceps.services.shop.order.models.order import Order, OrderID
+from byceps.services.shop.payment import payment_event_service
 from byceps.util.framework.blueprint import create_blueprint
 from byceps.util.result import Err, Ok, Result
 from byceps.util.views import create_empty_json_response
@@ -190,13 +186,11 @@ def _mark_order_as_paid(
         'paypal_transaction_id': paypal_order_details.transaction_id,
     }
 
-    paid_order, event = order_command_service.mark_order_as_paid(
+    payment_event_service.receive_payment_event(
+        'paypal',
+        paypal_order_details.id,
         order.id,
         'paypal',
+        additional_payment_data,
         initiator,
-        additional_payment_data=additional_payment_data,
-    ).unwrap()
-
-    order_email_service.send_email_for_paid_order_to_orderer(paid_order)
-
-    shop_order_signals.order_paid.send(None, event=event)
+    )
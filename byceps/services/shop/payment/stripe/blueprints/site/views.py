@@ -17,13 +17,9 @@ import structlog
 from byceps.byceps_app import get_current_byceps_app
 from byceps.config.errors import ConfigurationError
 from byceps.config.models import StripeConfig
-from byceps.services.shop.order import (
-    order_command_service,
-    order_service,
-    signals as shop_order_signals,
-)
-from byceps.services.shop.order.email import order_email_service
+from byceps.services.shop.order import order_service
 from byceps.services.shop.order.models.order import OrderID
+from byceps.services.shop.payment import payment_event_service
 from byceps.services.user import user_service
 from byceps.services.user.models import UserID
 from byceps.util.framework.blueprint import create_blueprint
@@ -152,10 +148,11 @@ def _fulfill_order(session: stripe.checkout.Session):
 
     order = order_service.find_order(shop_order_id)
 
-    if not order or not order.is_open:
+    # Whether the order is still open is checked when processing the
+    # payment event, so that repeated deliveries are no errors.
+    if not order:
         log.error(
-            'Error processing checkout session: '
-            'Order does not exist or is not open.',
+            'Error processing checkout session: Order does not exist.',
             session_id=session_id,
             shop_order_id=shop_order_id,
         )
@@ -169,19 +166,17 @@ def _fulfill_order(session: stripe.checkout.Session):
         )
         return
 
-    paid_order, event = order_command_service.mark_order_as_paid(
+    payment_event_service.receive_payment_event(
+        'stripe',
+        session_id,
         order.id,
         'stripe',
-        order.placed_by,
-        additional_payment_data={
+        {
             'stripe_session_id': session_id,
             'stripe_payment_id': session.payment_intent,
         },
-    ).unwrap()
-
-    order_email_service.send_email_for_paid_order_to_orderer(paid_order)
-
-    shop_order_signals.order_paid.send(None, event=event)
+        order.placed_by,
+    )
 
 
 def _check_transaction_against_order(session, order):
@@ -7,14 +7,14 @@ byceps.services.shop.product.product_repository
 """
 
 from collections import defaultdict
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from datetime import datetime
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import case, delete, select, update
 from sqlalchemy.sql import Select
 
 from byceps.database import db, paginate, Pagination
-from byceps.services.shop.order.dbmodels.order import DbLineItem, DbOrder
+from byceps.services.shop.order.dbmodels.stats import DbOrderedProductStats
 from byceps.services.shop.order.models.order import PaymentState
 from byceps.services.shop.shop.models import ShopID
 from byceps.util.uuid import generate_uuid7
@@ -149,6 +149,49 @@ def decrease_quantity(
         db.session.commit()
 
 
+def decrease_quantities_if_available(
+    quantities_to_decrease_by: Mapping[ProductID, int],
+) -> set[ProductID]:
+    """Decrease the quantities of the products by the given values, but
+    only for products of which enough is available.
+
+    Return the IDs of the products of which not enough is available (or
+    which do not exist). If there are any, the transaction has to be
+    rolled back to undo the decrease of the other products' quantities.
+
+    Does not commit.
+    """
+    product_ids = set(quantities_to_decrease_by.keys())
+    if not product_ids:
+        return set()
+
+    # Lock the products' rows in a consistent order to avoid deadlocks
+    # between concurrent orders of the same products. Doing so in a
+    # subquery keeps locking and updating in a single statement.
+    locked_product_ids = (
+        select(DbProduct.id)
+        .where(DbProduct.id.in_(product_ids))
+        .order_by(DbProduct.id)
+        .with_for_update()
+        .subquery()
+    )
+
+    quantity_to_decrease_by = case(
+        quantities_to_decrease_by, value=DbProduct.id
+    )
+
+    decreased_product_ids = db.session.scalars(
+        update(DbProduct)
+        .where(DbProduct.id == locked_product_ids.c.id)
+        .where(DbProduct.quantity >= quantity_to_decrease_by)
+        .values(quantity=DbProduct.quantity - quantity_to_decrease_by)
+        .returning(DbProduct.id)
+        .execution_options(synchronize_session=False)
+    ).all()
+
+    return product_ids.difference(decreased_product_ids)
+
+
 def delete_product(product_id: ProductID) -> None:
     """Delete a product."""
     db.session.execute(delete(DbProduct).filter_by(id=product_id))
@@ -307,6 +350,20 @@ def get_products(
     return db.session.scalars(stmt).all()
 
 
+def get_quantities(product_ids: set[ProductID]) -> dict[ProductID, int]:
+    """Return the currently available quantities of those products."""
+    if not product_ids:
+        return {}
+
+    rows = db.session.execute(
+        select(DbProduct.id, DbProduct.quantity).filter(
+            DbProduct.id.in_(product_ids)
+        )
+    ).all()
+
+    return {product_id: quantity for product_id, quantity in rows}
+
+
 def get_products_for_shop(shop_id: ShopID) -> Sequence[DbProduct]:
     """Return all products for that shop, ordered by product number."""
     return db.session.scalars(
@@ -361,28 +418,14 @@ def _generate_search_clauses_for_term(search_term: str) -> Select:
 def get_orderable_products(shop_id: ShopID) -> Sequence[DbProduct]:
     """Return the products which can be ordered from that shop, less the
     ones that are only orderable in a dedicated order.
-    """
-    now = datetime.utcnow()
 
+    Temporal availability is not taken into account.
+    """
     return db.session.scalars(
         select(DbProduct)
         .filter_by(shop_id=shop_id)
         .filter_by(not_directly_orderable=False)
         .filter_by(separate_order_required=False)
-        # Select only products that are available in between the
-        # temporal boundaries for this product, if specified.
-        .filter(
-            db.or_(
-                DbProduct.available_from.is_(None),
-                now >= DbProduct.available_from,
-            )
-        )
-        .filter(
-            db.or_(
-                DbProduct.available_until.is_(None),
-                now < DbProduct.available_until,
-            )
-        )
         .order_by(DbProduct.name)
     ).all()
 
@@ -412,32 +455,24 @@ def get_attachable_products(product_id: ProductID) -> Sequence[DbProduct]:
 def sum_ordered_products_by_payment_state(
     shop_ids: set[ShopID],
 ) -> list[tuple[ShopID, ProductNumber, str, PaymentState, int]]:
-    """Sum ordered products for those shops, grouped by order payment state."""
-    subquery = (
-        select(
-            DbLineItem.product_id,
-            DbOrder._payment_state.label('payment_state'),
-            db.func.sum(DbLineItem.quantity).label('quantity'),
-        )
-        .join(DbOrder)
-        .group_by(DbLineItem.product_id, DbOrder._payment_state)
-        .subquery()
-    )
+    """Sum ordered products for those shops, grouped by order payment state.
 
+    Read from the precomputed statistics.
+    """
     rows = db.session.execute(
         select(
             DbProduct.shop_id,
             DbProduct.item_number,
             DbProduct.name,
-            subquery.c.payment_state,
-            subquery.c.quantity,
+            DbOrderedProductStats.payment_state,
+            DbOrderedProductStats.quantity,
         )
         .outerjoin(
-            subquery,
-            db.and_(DbProduct.id == subquery.c.product_id),
+            DbOrderedProductStats,
+            DbProduct.id == DbOrderedProductStats.product_id,
         )
         .filter(DbProduct.shop_id.in_(shop_ids))
-        .order_by(DbProduct.item_number, subquery.c.payment_state)
+        .order_by(DbProduct.item_number, DbOrderedProductStats.payment_state)
     ).all()
 
     shop_ids_and_product_numbers_and_names = {
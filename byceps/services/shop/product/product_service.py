@@ -7,12 +7,14 @@ byceps.services.shop.product.product_service
 """
 
 from collections import defaultdict
+from collections.abc import Mapping
 from datetime import datetime
 from decimal import Decimal
 
 from moneyed import Money
 
 from byceps.database import Pagination
+from byceps.services.shop.catalog import catalog_version_service
 from byceps.services.shop.order.models.order import PaymentState
 from byceps.services.shop.shop.models import ShopID
 from byceps.services.ticketing.models.ticket import TicketCategoryID
@@ -21,7 +23,6 @@ from byceps.util.result import Err, Ok, Result
 from . import product_domain_service, product_repository
 from .dbmodels.product import DbProduct, DbProductImage
 from .dbmodels.attached_product import DbAttachedProduct
-from .errors import NoProductsAvailableError
 from .models import (
     Product,
     ProductAttachment,
@@ -79,6 +80,8 @@ def create_product(
 
     product_repository.create_product(product)
 
+    catalog_version_service.increment_version()
+
     return product
 
 
@@ -194,6 +197,8 @@ def update_product(
 
     product_repository.update_product(updated_product)
 
+    catalog_version_service.increment_version()
+
     return updated_product
 
 
@@ -220,11 +225,15 @@ def attach_product(
         product_id_to_attach, quantity, product_id_to_attach_to
     )
 
+    catalog_version_service.increment_version()
+
 
 def unattach_product(attached_product_id: AttachedProductID) -> None:
     """Unattach a product from another."""
     product_repository.unattach_product(attached_product_id)
 
+    catalog_version_service.increment_version()
+
 
 def increase_quantity(
     product_id: ProductID, quantity_to_increase_by: int, *, commit: bool = True
@@ -244,10 +253,40 @@ def decrease_quantity(
     )
 
 
+def decrease_quantities_if_available(
+    quantities_to_decrease_by: Mapping[ProductID, int],
+) -> Result[None, set[ProductID]]:
+    """Decrease the quantities of the products by the given values, but
+    only if enough is available of every one of them.
+
+    Return the IDs of the products of which not enough is available as
+    an error. In that case, the transaction has to be rolled back.
+
+    Does not commit.
+    """
+    unavailable_product_ids = (
+        product_repository.decrease_quantities_if_available(
+            quantities_to_decrease_by
+        )
+    )
+
+    if unavailable_product_ids:
+        return Err(unavailable_product_ids)
+
+    return Ok(None)
+
+
 def delete_product(product_id: ProductID) -> None:
     """Delete a product."""
     product_repository.delete_product(product_id)
 
+    catalog_version_service.increment_version()
+
+
+def get_quantities(product_ids: set[ProductID]) -> dict[ProductID, int]:
+    """Return the currently available quantities of those products."""
+    return product_repository.get_quantities(product_ids)
+
 
 def find_product(product_id: ProductID) -> Product | None:
     """Return the product with that ID, or `None` if not found."""
@@ -389,35 +428,25 @@ def get_products_for_shop_paginated(
     )
 
 
-def get_product_compilation_for_orderable_products(
+def get_orderable_products_with_attachments(
     shop_id: ShopID,
-) -> Result[ProductCompilation, NoProductsAvailableError]:
-    """Return a compilation of the products which can be ordered from
-    that shop, less the ones that are only orderable in a dedicated
-    order.
+) -> list[tuple[Product, list[ProductAttachment]]]:
+    """Return the products which can be ordered from that shop (less
+    the ones that are only orderable in a dedicated order) together with
+    the products attached to them, ordered by name.
+
+    Products are included regardless of whether they are currently
+    available.
     """
     db_orderable_products = product_repository.get_orderable_products(shop_id)
-    if not db_orderable_products:
-        return Err(NoProductsAvailableError())
-
-    compilation_builder = ProductCompilationBuilder()
 
-    for db_product in db_orderable_products:
-        product = _db_entity_to_product(db_product)
-        compilation_builder.append_product(product)
-
-        product_attachments = _get_product_attachments(
-            db_product.attached_products
+    return [
+        (
+            _db_entity_to_product(db_product),
+            _get_product_attachments(db_product.attached_products),
         )
-        for product_attachment in product_attachments:
-            compilation_builder.append_product(
-                product_attachment.attached_product,
-                fixed_quantity=product_attachment.attached_quantity,
-            )
-
-    compilation = compilation_builder.build()
-
-    return Ok(compilation)
+        for db_product in db_orderable_products
+    ]
 
 
 def get_product_compilation_for_single_product(
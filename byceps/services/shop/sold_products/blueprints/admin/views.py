@@ -98,20 +98,24 @@ def export_as_csv(party_id):
         product_number4,
     ]
 
-    report = _assemble_report(party, product_numbers)
+    products = _get_products(product_numbers)
 
-    return sold_products_service.export_sold_products_as_csv(report)
+    return sold_products_service.export_sold_products_as_csv(party, products)
 
 
 def _assemble_report(party: Party, product_numbers: list[str]):
-    products = [
+    products = _get_products(product_numbers)
+
+    return sold_products_service.get_sold_products_report(party, products)
+
+
+def _get_products(product_numbers: list[str]) -> list[Product]:
+    return [
         _get_product_number(product_number)
         for product_number in product_numbers
         if product_number
     ]
 
-    return sold_products_service.get_sold_products_report(party, products)
-
 
 # -------------------------------------------------------------------- #
 # helpers
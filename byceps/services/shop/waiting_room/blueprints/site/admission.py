@@ -0,0 +1,59 @@
+"""
+byceps.services.shop.waiting_room.blueprints.site.admission
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Keep the current user's queue entry and admission ticket in the
+session.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from flask import session
+
+from byceps.services.shop.storefront.models import StorefrontID
+from byceps.services.shop.waiting_room import waiting_room_service
+from byceps.services.shop.waiting_room.models import QueueEntry
+from byceps.services.user.models import UserID
+from byceps.util.result import Err, Ok
+
+
+SESSION_KEY_QUEUE_ENTRY = 'shop_waiting_room_queue_entry'
+SESSION_KEY_ADMISSION_TICKET = 'shop_waiting_room_admission_ticket'
+
+
+def find_queue_entry() -> QueueEntry | None:
+    """Return the queue entry stored in the session, if any."""
+    token = session.get(SESSION_KEY_QUEUE_ENTRY)
+    if token is None:
+        return None
+
+    match waiting_room_service.deserialize_queue_entry(token):
+        case Ok(entry):
+            return entry
+        case Err(_):
+            return None
+
+
+def store_queue_entry(entry: QueueEntry) -> None:
+    """Store the queue entry in the session."""
+    session[SESSION_KEY_QUEUE_ENTRY] = (
+        waiting_room_service.serialize_queue_entry(entry)
+    )
+
+
+def admit(entry: QueueEntry) -> None:
+    """Replace the queue entry in the session with an admission ticket."""
+    session.pop(SESSION_KEY_QUEUE_ENTRY, None)
+    session[SESSION_KEY_ADMISSION_TICKET] = (
+        waiting_room_service.create_admission_ticket(entry)
+    )
+
+
+def is_user_admitted(storefront_id: StorefrontID, user_id: UserID) -> bool:
+    """Return `True` if the user may access the storefront's order forms."""
+    admission_ticket = session.get(SESSION_KEY_ADMISSION_TICKET)
+
+    return waiting_room_service.is_admitted(
+        storefront_id, user_id, admission_ticket
+    )
@@ -0,0 +1,91 @@
+"""
+byceps.services.shop.waiting_room.blueprints.site.views
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from flask import abort, g, jsonify
+
+from byceps.byceps_app import get_current_byceps_app
+from byceps.services.shop.waiting_room import waiting_room_service
+from byceps.services.site import site_service
+from byceps.util.framework.blueprint import create_blueprint
+from byceps.util.framework.templating import templated
+from byceps.util.views import (
+    create_empty_json_response,
+    login_required,
+    redirect_to,
+    without_request_globals,
+)
+
+from . import admission
+
+
+blueprint = create_blueprint('shop_waiting_room', __name__)
+
+
+@blueprint.get('')
+@login_required
+@templated
+def index():
+    """Queue up in the waiting room in front of the storefront."""
+    storefront_id = g.site.storefront_id
+    if storefront_id is None:
+        abort(404)
+
+    waiting_room = waiting_room_service.find_waiting_room(storefront_id)
+    if (waiting_room is None) or admission.is_user_admitted(
+        storefront_id, g.user.id
+    ):
+        return redirect_to('shop_order.order_form')
+
+    entry = admission.find_queue_entry()
+    if (
+        (entry is None)
+        or (entry.user_id != g.user.id)
+        or not waiting_room_service.is_queue_entry_current(waiting_room, entry)
+    ):
+        entry = waiting_room_service.join_queue(waiting_room, g.user.id)
+        admission.store_queue_entry(entry)
+
+    status = waiting_room_service.get_queue_status(waiting_room, entry)
+    if status.admitted:
+        admission.admit(entry)
+        return redirect_to('shop_order.order_form')
+
+    return {
+        'ahead_count': status.ahead_count,
+    }
+
+
+@blueprint.get('/status')
+@without_request_globals
+def status():
+    """Return the current user's status in the queue.
+
+    Meant to be polled from the waiting room page. Skips preparing the
+    request globals, so only the site is looked up in the database.
+    """
+    site = site_service.get_site(get_current_byceps_app().site_id)
+    if not site.enabled:
+        return create_empty_json_response(404)
+
+    entry = admission.find_queue_entry()
+    if (entry is None) or (entry.storefront_id != site.storefront_id):
+        return create_empty_json_response(404)
+
+    waiting_room = waiting_room_service.find_waiting_room(entry.storefront_id)
+    if waiting_room is None:
+        # The waiting room has been closed, so everyone is admitted.
+        return jsonify(admitted=True, ahead_count=0)
+
+    if not waiting_room_service.is_queue_entry_current(waiting_room, entry):
+        return create_empty_json_response(404)
+
+    status = waiting_room_service.get_queue_status(waiting_room, entry)
+    if status.admitted:
+        admission.admit(entry)
+
+    return jsonify(admitted=status.admitted, ahead_count=status.ahead_count)
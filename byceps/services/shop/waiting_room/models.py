@@ -0,0 +1,47 @@
+"""
+byceps.services.shop.waiting_room.models
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import NewType
+from uuid import UUID
+
+from byceps.services.shop.storefront.models import StorefrontID
+from byceps.services.user.models import UserID
+
+
+WaitingRoomID = NewType('WaitingRoomID', UUID)
+
+
+@dataclass(frozen=True, kw_only=True)
+class WaitingRoom:
+    """A queue in front of a storefront's order forms.
+
+    Queued users are admitted in the order in which they joined, at a
+    fixed rate per second counted from the admission start.
+    """
+
+    id: WaitingRoomID
+    storefront_id: StorefrontID
+    admission_rate_per_second: int
+    admission_started_at: datetime
+
+
+@dataclass(frozen=True, kw_only=True)
+class QueueEntry:
+    waiting_room_id: WaitingRoomID
+    storefront_id: StorefrontID
+    user_id: UserID
+    position: int
+
+
+@dataclass(frozen=True, kw_only=True)
+class QueueStatus:
+    entry: QueueEntry
+    admitted: bool
+    ahead_count: int
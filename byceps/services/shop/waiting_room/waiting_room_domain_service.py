@@ -0,0 +1,87 @@
+"""
+byceps.services.shop.waiting_room.waiting_room_domain_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from dataclasses import replace
+from datetime import datetime, timedelta
+import math
+
+from byceps.services.shop.storefront.models import StorefrontID
+from byceps.util.uuid import generate_uuid7
+
+from .models import QueueEntry, QueueStatus, WaitingRoom, WaitingRoomID
+
+
+def open_waiting_room(
+    storefront_id: StorefrontID, admission_rate_per_second: int, now: datetime
+) -> WaitingRoom:
+    """Open a waiting room, starting to admit users right away."""
+    _check_admission_rate(admission_rate_per_second)
+
+    return WaitingRoom(
+        id=WaitingRoomID(generate_uuid7()),
+        storefront_id=storefront_id,
+        admission_rate_per_second=admission_rate_per_second,
+        admission_started_at=now,
+    )
+
+
+def change_admission_rate(
+    waiting_room: WaitingRoom, admission_rate_per_second: int, now: datetime
+) -> WaitingRoom:
+    """Change the admission rate, keeping users admitted so far admitted.
+
+    The admission start is moved so that the number of users admitted
+    up to now stays the same under the new rate.
+    """
+    _check_admission_rate(admission_rate_per_second)
+
+    admitted_count = count_admitted(waiting_room, now)
+    admission_started_at = now - timedelta(
+        seconds=admitted_count / admission_rate_per_second
+    )
+
+    return replace(
+        waiting_room,
+        admission_rate_per_second=admission_rate_per_second,
+        admission_started_at=admission_started_at,
+    )
+
+
+def _check_admission_rate(admission_rate_per_second: int) -> None:
+    if admission_rate_per_second < 1:
+        raise ValueError('Admission rate must be at least 1 per second')
+
+
+def count_admitted(waiting_room: WaitingRoom, now: datetime) -> int:
+    """Return the number of queue positions admitted up to now."""
+    elapsed_seconds = (now - waiting_room.admission_started_at).total_seconds()
+    if elapsed_seconds <= 0:
+        return 0
+
+    return math.floor(elapsed_seconds * waiting_room.admission_rate_per_second)
+
+
+def get_queue_status(
+    waiting_room: WaitingRoom, entry: QueueEntry, now: datetime
+) -> QueueStatus:
+    """Return whether the entry has been admitted, and how many users
+    are still ahead of it in the queue.
+    """
+    admitted_count = count_admitted(waiting_room, now)
+    admitted = entry.position <= admitted_count
+    ahead_count = max(entry.position - 1 - admitted_count, 0)
+
+    return QueueStatus(entry=entry, admitted=admitted, ahead_count=ahead_count)
+
+
+def is_entry_current(waiting_room: WaitingRoom, entry: QueueEntry) -> bool:
+    """Return `True` if the entry has been created for this waiting room
+    (and not for an earlier waiting room in front of the same
+    storefront).
+    """
+    return entry.waiting_room_id == waiting_room.id
@@ -0,0 +1,253 @@
+"""
+byceps.services.shop.waiting_room.waiting_room_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Waiting rooms are kept in Redis only, so that users can check their
+position in the queue without causing any database queries.
+
+Queue entries and admission tickets are handed to users as signed
+tokens.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from flask import current_app
+from itsdangerous import BadSignature, URLSafeTimedSerializer
+from redis import Redis
+
+from byceps.byceps_app import get_current_byceps_app
+from byceps.services.shop.storefront.models import StorefrontID
+from byceps.services.user.models import UserID
+from byceps.util.result import Err, Ok, Result
+
+from . import waiting_room_domain_service
+from .models import QueueEntry, QueueStatus, WaitingRoom, WaitingRoomID
+
+
+QUEUE_ENTRY_MAX_AGE = timedelta(hours=12)
+ADMISSION_TICKET_MAX_AGE = timedelta(minutes=30)
+
+
+_REDIS_KEY_PREFIX = 'shop-waiting-room:'
+
+_QUEUE_ENTRY_SALT = 'shop-waiting-room-queue-entry'
+_ADMISSION_TICKET_SALT = 'shop-waiting-room-admission-ticket'
+
+
+# -------------------------------------------------------------------- #
+# waiting rooms
+
+
+def open_waiting_room(
+    storefront_id: StorefrontID, admission_rate_per_second: int
+) -> WaitingRoom:
+    """Open a waiting room in front of the storefront.
+
+    An already open waiting room is replaced, and its queue is reset.
+    """
+    waiting_room = waiting_room_domain_service.open_waiting_room(
+        storefront_id, admission_rate_per_second, datetime.utcnow()
+    )
+
+    redis_client = _get_redis_client()
+    pipeline = redis_client.pipeline()
+    pipeline.delete(_get_last_position_key(storefront_id))
+    _persist_waiting_room(pipeline, waiting_room)
+    pipeline.execute()
+
+    return waiting_room
+
+
+def change_admission_rate(
+    storefront_id: StorefrontID, admission_rate_per_second: int
+) -> Result[WaitingRoom, str]:
+    """Change the admission rate of the waiting room in front of the
+    storefront.
+    """
+    waiting_room = find_waiting_room(storefront_id)
+    if waiting_room is None:
+        return Err(f'No waiting room open for storefront "{storefront_id}".')
+
+    updated_waiting_room = waiting_room_domain_service.change_admission_rate(
+        waiting_room, admission_rate_per_second, datetime.utcnow()
+    )
+
+    _persist_waiting_room(_get_redis_client(), updated_waiting_room)
+
+    return Ok(updated_waiting_room)
+
+
+def close_waiting_room(storefront_id: StorefrontID) -> None:
+    """Close the waiting room in front of the storefront, admitting
+    everyone.
+    """
+    _get_redis_client().delete(
+        _get_waiting_room_key(storefront_id),
+        _get_last_position_key(storefront_id),
+    )
+
+
+def find_waiting_room(storefront_id: StorefrontID) -> WaitingRoom | None:
+    """Return the waiting room in front of the storefront, if open."""
+    data = _get_redis_client().hgetall(_get_waiting_room_key(storefront_id))
+    if not data:
+        return None
+
+    return WaitingRoom(
+        id=WaitingRoomID(UUID(data[b'id'].decode())),
+        storefront_id=storefront_id,
+        admission_rate_per_second=int(data[b'admission_rate_per_second']),
+        admission_started_at=datetime.fromisoformat(
+            data[b'admission_started_at'].decode()
+        ),
+    )
+
+
+def _persist_waiting_room(
+    redis_client: Redis, waiting_room: WaitingRoom
+) -> None:
+    redis_client.hset(
+        _get_waiting_room_key(waiting_room.storefront_id),
+        mapping={
+            'id': str(waiting_room.id),
+            'admission_rate_per_second': waiting_room.admission_rate_per_second,
+            'admission_started_at': waiting_room.admission_started_at.isoformat(),
+        },
+    )
+
+
+# -------------------------------------------------------------------- #
+# queue
+
+
+def join_queue(waiting_room: WaitingRoom, user_id: UserID) -> QueueEntry:
+    """Put the user at the end of the queue."""
+    position = _get_redis_client().incr(
+        _get_last_position_key(waiting_room.storefront_id)
+    )
+
+    return QueueEntry(
+        waiting_room_id=waiting_room.id,
+        storefront_id=waiting_room.storefront_id,
+        user_id=user_id,
+        position=position,
+    )
+
+
+def get_queue_status(
+    waiting_room: WaitingRoom, entry: QueueEntry
+) -> QueueStatus:
+    """Return the status of the queue entry."""
+    return waiting_room_domain_service.get_queue_status(
+        waiting_room, entry, datetime.utcnow()
+    )
+
+
+def is_queue_entry_current(
+    waiting_room: WaitingRoom, entry: QueueEntry
+) -> bool:
+    """Return `True` if the entry belongs to the waiting room."""
+    return waiting_room_domain_service.is_entry_current(waiting_room, entry)
+
+
+def serialize_queue_entry(entry: QueueEntry) -> str:
+    """Return the queue entry as signed token."""
+    data = {
+        'waiting_room_id': str(entry.waiting_room_id),
+        'storefront_id': entry.storefront_id,
+        'user_id': str(entry.user_id),
+        'position': entry.position,
+    }
+
+    return _get_serializer(_QUEUE_ENTRY_SALT).dumps(data)
+
+
+def deserialize_queue_entry(token: str) -> Result[QueueEntry, None]:
+    """Return the queue entry from the signed token.
+
+    Return an error if the signature is invalid or the token has
+    expired.
+    """
+    try:
+        data = _get_serializer(_QUEUE_ENTRY_SALT).loads(
+            token, max_age=int(QUEUE_ENTRY_MAX_AGE.total_seconds())
+        )
+    except BadSignature:
+        return Err(None)
+
+    return Ok(
+        QueueEntry(
+            waiting_room_id=WaitingRoomID(UUID(data['waiting_room_id'])),
+            storefront_id=StorefrontID(data['storefront_id']),
+            user_id=UserID(UUID(data['user_id'])),
+            position=data['position'],
+        )
+    )
+
+
+# -------------------------------------------------------------------- #
+# admission
+
+
+def create_admission_ticket(entry: QueueEntry) -> str:
+    """Return a signed admission ticket for the admitted queue entry."""
+    data = {
+        'waiting_room_id': str(entry.waiting_room_id),
+        'user_id': str(entry.user_id),
+    }
+
+    return _get_serializer(_ADMISSION_TICKET_SALT).dumps(data)
+
+
+def is_admitted(
+    storefront_id: StorefrontID, user_id: UserID, admission_ticket: str | None
+) -> bool:
+    """Return `True` if the user may access the storefront's order forms.
+
+    That is the case if no waiting room is open in front of the
+    storefront, or if the admission ticket has been issued to the user
+    by the open waiting room, and has not expired.
+    """
+    waiting_room = find_waiting_room(storefront_id)
+    if waiting_room is None:
+        return True
+
+    if admission_ticket is None:
+        return False
+
+    try:
+        data = _get_serializer(_ADMISSION_TICKET_SALT).loads(
+            admission_ticket,
+            max_age=int(ADMISSION_TICKET_MAX_AGE.total_seconds()),
+        )
+    except BadSignature:
+        return False
+
+    return (data['waiting_room_id'] == str(waiting_room.id)) and (
+        data['user_id'] == str(user_id)
+    )
+
+
+# -------------------------------------------------------------------- #
+# helpers
+
+
+def _get_redis_client() -> Redis:
+    return get_current_byceps_app().redis_client
+
+
+def _get_waiting_room_key(storefront_id: StorefrontID) -> str:
+    return f'{_REDIS_KEY_PREFIX}{storefront_id}'
+
+
+def _get_last_position_key(storefront_id: StorefrontID) -> str:
+    return f'{_REDIS_KEY_PREFIX}{storefront_id}:last-position'
+
+
+def _get_serializer(salt: str) -> URLSafeTimedSerializer:
+    secret_key = current_app.config['SECRET_KEY']
+    return URLSafeTimedSerializer(secret_key, salt=salt)
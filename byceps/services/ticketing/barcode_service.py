@@ -6,11 +6,14 @@ Render Code 128 (set B) barcodes as SVG images.
 
 This implementation only supports code set B.
 
+Rendered images are cached per text and thickness, as the same ticket
+codes are rendered over and over again.
+
 :Copyright: 2014-2026 Jochen Kupperschmidt
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from jinja2 import Template
+from functools import lru_cache
 
 
 # As seen on https://en.wikipedia.org/wiki/Code_128#Bar_code_widths
@@ -131,18 +134,11 @@ VALUES_TO_WIDTHS = {value: width for value, _, width in VALUES_CHARS_WIDTHS}
 CHARS_TO_VALUES = {char: value for value, char, _ in VALUES_CHARS_WIDTHS}
 
 
-SVG_TEMPLATE = Template(
-    """
-<svg xmlns="http://www.w3.org/2000/svg" width="{{ image_width }}" height="{{ image_height }}" viewBox="0 0 {{ image_width }} {{ image_height }}">
-  <rect width="{{ image_width }}" height="{{ image_height }}" fill="white"/>
-  {%- for bar_x, bar_width in bars %}
-  <rect x="{{ bar_x }}" width="{{ bar_width }}" height="{{ image_height }}"/>
-  {%- endfor %}
-</svg>
-""".strip()
-)
+# Number of rendered images to keep per process
+CACHE_SIZE = 4_096
 
 
+@lru_cache(maxsize=CACHE_SIZE)
 def render_svg(text, *, thickness=3):
     values = list(_generate_values(text))
     bar_widths = list(_generate_bars(values, thickness))
@@ -199,15 +195,20 @@ def _generate_svg(bar_widths, *, image_height=100):
 
     # Calculate where the individual bars are positioned
     # horizontally and how wide they are.
-    bar_positions_and_widths = list(
-        _calculate_bar_positions_and_widths(x, bar_widths)
+    bar_positions_and_widths = _calculate_bar_positions_and_widths(
+        x, bar_widths
+    )
+
+    bars = ''.join(
+        f'\n  <rect x="{bar_x}" width="{bar_width}" height="{image_height}"/>'
+        for bar_x, bar_width in bar_positions_and_widths
     )
 
-    # Render template.
-    return SVG_TEMPLATE.render(
-        image_width=image_width,
-        image_height=image_height,
-        bars=bar_positions_and_widths,
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{image_width}" height="{image_height}" viewBox="0 0 {image_width} {image_height}">'
+        f'\n  <rect width="{image_width}" height="{image_height}" fill="white"/>'
+        f'{bars}'
+        '\n</svg>'
     )
 
 
@@ -0,0 +1,21 @@
+"""
+byceps.services.ticketing.blueprints.api.models
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from uuid import UUID
+
+from pydantic import AwareDatetime, BaseModel, Field
+
+
+class OfflineCheckInModel(BaseModel):
+    ticket_code: str
+    occurred_at: AwareDatetime
+
+
+class UploadOfflineCheckInsRequest(BaseModel):
+    initiator_id: UUID
+    check_ins: list[OfflineCheckInModel] = Field(max_length=1_000)
@@ -6,14 +6,34 @@ byceps.services.ticketing.blueprints.api.views
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from flask import abort, jsonify
+from datetime import UTC
+
+from flask import abort, jsonify, request
+from pydantic import ValidationError
 
 from byceps.services.party import party_service
 from byceps.services.party.models import Party, PartyID
-from byceps.services.ticketing import ticket_service
+from byceps.services.ticketing import (
+    signals as ticketing_signals,
+    ticket_checkin_sync_service,
+    ticket_service,
+    ticket_user_checkin_service,
+)
+from byceps.services.ticketing.errors import UserAlreadyCheckedInError
+from byceps.services.ticketing.models.checkin import (
+    CheckInSyncSnapshot,
+    CheckInSyncTicket,
+    OfflineTicketCheckIn,
+)
+from byceps.services.ticketing.models.ticket import TicketCode
+from byceps.services.user import user_service
+from byceps.services.user.models import UserID
 from byceps.util.framework.blueprint import create_blueprint
+from byceps.util.result import Err, Ok
 from byceps.util.views import api_token_required
 
+from .models import UploadOfflineCheckInsRequest
+
 
 blueprint = create_blueprint('ticketing_api', __name__)
 
@@ -26,7 +46,7 @@ def get_sale_stats(party_id):
     """
     party = _get_party_or_404(party_id)
 
-    sale_stats = ticket_service.get_ticket_sale_stats(party)
+    sale_stats = ticket_service.get_ticket_sale_stats(party, cached=True)
 
     return jsonify(
         {
@@ -36,6 +56,126 @@ def get_sale_stats(party_id):
     )
 
 
+@blueprint.get('/checkin/<party_id>/snapshot')
+@api_token_required
+def get_checkin_snapshot(party_id):
+    """Return the party's valid tickets for scanners to check users in
+    while offline.
+    """
+    party = _get_party_or_404(party_id)
+
+    snapshot = ticket_checkin_sync_service.get_snapshot(party.id)
+
+    return jsonify(_snapshot_to_json(snapshot))
+
+
+@blueprint.get('/checkin/<party_id>/changes')
+@api_token_required
+def get_checkin_changes(party_id):
+    """Return the party's tickets that have changed since the sync
+    token has been issued.
+    """
+    party = _get_party_or_404(party_id)
+
+    sync_token = request.args.get('sync_token')
+    if not sync_token:
+        abort(400, 'Sync token missing')
+
+    match ticket_checkin_sync_service.get_changes(party.id, sync_token):
+        case Ok(snapshot):
+            return jsonify(_snapshot_to_json(snapshot))
+        case Err(e):
+            abort(400, e)
+
+
+def _snapshot_to_json(snapshot: CheckInSyncSnapshot) -> dict:
+    return {
+        'party_id': snapshot.party_id,
+        'tickets': [_ticket_to_json(ticket) for ticket in snapshot.tickets],
+        'sync_token': snapshot.sync_token,
+    }
+
+
+def _ticket_to_json(ticket: CheckInSyncTicket) -> dict:
+    if ticket.used_by_id is not None:
+        user = {
+            'id': str(ticket.used_by_id),
+            'screen_name': ticket.used_by_screen_name,
+            'suspended': ticket.used_by_suspended,
+            'deleted': ticket.used_by_deleted,
+        }
+    else:
+        user = None
+
+    return {
+        'id': str(ticket.id),
+        'code': ticket.code,
+        'category': ticket.category_title,
+        'user': user,
+        'seat': ticket.seat_label,
+        'revoked': ticket.revoked,
+        'user_checked_in': ticket.user_checked_in,
+    }
+
+
+@blueprint.post('/checkin/<party_id>/check_ins')
+@api_token_required
+def upload_offline_check_ins(party_id):
+    """Record check-ins that scanners have done while offline."""
+    party = _get_party_or_404(party_id)
+
+    if not request.is_json:
+        abort(415)
+
+    try:
+        req = UploadOfflineCheckInsRequest.model_validate(request.get_json())
+    except ValidationError as e:
+        abort(400, e.json())
+
+    initiator_id = UserID(req.initiator_id)
+    initiator = user_service.find_user(initiator_id)
+    if not initiator:
+        abort(400, 'Initiator ID unknown')
+
+    check_ins = [
+        OfflineTicketCheckIn(
+            ticket_code=TicketCode(check_in.ticket_code),
+            occurred_at=check_in.occurred_at.astimezone(UTC).replace(
+                tzinfo=None
+            ),
+        )
+        for check_in in req.check_ins
+    ]
+
+    results = ticket_user_checkin_service.check_in_users_offline(
+        party.id, check_ins, initiator
+    )
+
+    response_items = []
+    for check_in, result in zip(check_ins, results, strict=True):
+        match result:
+            case Ok(event):
+                ticketing_signals.ticket_checked_in.send(None, event=event)
+                response_items.append(
+                    {'ticket_code': check_in.ticket_code, 'status': 'ok'}
+                )
+            case Err(e):
+                status = (
+                    'conflict'
+                    if isinstance(e, UserAlreadyCheckedInError)
+                    else 'rejected'
+                )
+                response_items.append(
+                    {
+                        'ticket_code': check_in.ticket_code,
+                        'status': status,
+                        'error': e.message,
+                    }
+                )
+
+    return jsonify({'results': response_items})
+
+
 def _get_party_or_404(party_id: PartyID) -> Party:
     party = party_service.find_party(party_id)
 
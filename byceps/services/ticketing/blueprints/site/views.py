@@ -6,9 +6,10 @@ byceps.services.ticketing.blueprints.site.views
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from hashlib import sha256
 from typing import Any
 
-from flask import abort, g, request
+from flask import abort, g, request, Response
 from flask_babel import gettext
 
 from byceps.services.party import party_service
@@ -16,6 +17,8 @@ from byceps.services.shop.order import order_service
 from byceps.services.ticketing import (
     barcode_service,
     ticket_category_service,
+    ticket_checkin_search_signal_handlers,  # Load to connect to signals.  # noqa: F401
+    ticket_code_service,
     ticket_seat_management_service,
     ticket_service,
     ticket_user_management_service,
@@ -45,7 +48,9 @@ def inject_ticket_sale_stats() -> dict[str, Any]:
     if g.site.is_intranet:
         return {}
 
-    ticket_sale_stats = ticket_service.get_ticket_sale_stats(g.party)
+    ticket_sale_stats = ticket_service.get_ticket_sale_stats(
+        g.party, cached=True
+    )
 
     return {
         'ticket_sale_stats': ticket_sale_stats,
@@ -108,24 +113,6 @@ def view_printable_html(ticket_id):
     ticket_category = ticket_category_service.get_category(ticket.category_id)
     party = party_service.get_party(ticket_category.party_id)
 
-    barcode_svg = barcode_service.render_svg(ticket.code)
-
-    # Encode SVG to be used inline as part of a data URI.
-    # Replacements are not complete, but sufficient for this case.
-    #
-    # See https://codepen.io/tigt/post/optimizing-svgs-in-data-uris
-    # for details.
-    # fmt: off
-    barcode_svg_inline = (
-        barcode_svg
-        .replace('\n', '%0A')
-        .replace('#', '%23')
-        .replace('<', '%3C')
-        .replace('>', '%3E')
-        .replace('"', "'")
-    )
-    # fmt: on
-
     return {
         'party_title': party.title,
         'ticket_code': ticket.code,
@@ -133,10 +120,29 @@ def view_printable_html(ticket_id):
         'ticket_owner': ticket.owned_by,
         'ticket_user': ticket.used_by,
         'occupied_seat': ticket.occupied_seat,
-        'barcode_svg_inline': barcode_svg_inline,
     }
 
 
+@blueprint.get('/barcodes/<code>.svg')
+def view_barcode_svg(code):
+    """Render the ticket code as barcode.
+
+    The image only depends on the code, so it may be cached for good.
+    """
+    if not ticket_code_service.is_ticket_code_wellformed(code):
+        abort(404)
+
+    barcode_svg = barcode_service.render_svg(code)
+
+    response = Response(barcode_svg, mimetype='image/svg+xml')
+    response.set_etag(sha256(barcode_svg.encode()).hexdigest())
+    response.cache_control.public = True
+    response.cache_control.max_age = 365 * 24 * 60 * 60
+    response.cache_control.immutable = True
+
+    return response.make_conditional(request)
+
+
 # -------------------------------------------------------------------- #
 # user
 
@@ -6,28 +6,23 @@ byceps.services.ticketing.checkin.blueprints.admin.views
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from collections.abc import Iterator
 from datetime import date
 
 from flask import abort, g, request, url_for
 from flask_babel import gettext
 
-from byceps.services.brand.models import BrandID
 from byceps.services.party import party_service
 from byceps.services.party.models import Party, PartyID
-from byceps.services.shop.order import order_service
-from byceps.services.shop.order.models.order import AdminOrderListItem
-from byceps.services.shop.shop import shop_service
 from byceps.services.ticketing import (
     errors as ticketing_errors,
     signals as ticketing_signals,
+    ticket_checkin_search_service,
+    ticket_checkin_search_signal_handlers,  # Load to connect to signals.  # noqa: F401
     ticket_service,
     ticket_user_checkin_service,
 )
 from byceps.services.ticketing.dbmodels.ticket import DbTicket
 from byceps.services.ticketing.models.ticket import TicketID
-from byceps.services.user import user_service
-from byceps.services.user.models import User
 from byceps.util.framework.blueprint import create_blueprint
 from byceps.util.framework.flash import flash_error, flash_notice, flash_success
 from byceps.util.framework.templating import templated
@@ -54,24 +49,18 @@ def index(party_id):
 
     if search_term:
         latest_dob_for_checkin = _get_latest_date_of_birth_for_checkin()
-        tickets = _search_tickets(party.id, search_term, limit)
-        orders = _search_orders(party.brand_id, search_term, limit)
-        users = _search_users(search_term, limit)
-
-        tickets += list(_get_tickets_for_users(party.id, users))
+        tickets = ticket_checkin_search_service.search_tickets(
+            party.id, search_term, limit=limit
+        )
     else:
         latest_dob_for_checkin = None
         tickets = None
-        orders = None
-        users = None
 
     return {
         'party': party,
         'latest_dob_for_checkin': latest_dob_for_checkin,
         'search_term': search_term,
         'tickets': tickets,
-        'orders': orders,
-        'users': users,
     }
 
 
@@ -80,63 +69,6 @@ def _get_latest_date_of_birth_for_checkin() -> date:
     return today.replace(year=today.year - MINIMUM_AGE_IN_YEARS)
 
 
-def _search_tickets(
-    party_id: PartyID, search_term: str, limit: int
-) -> list[DbTicket]:
-    page = 1
-    per_page = limit
-
-    tickets_pagination = (
-        ticket_service.get_tickets_with_details_for_party_paginated(
-            party_id, page, per_page, search_term=search_term
-        )
-    )
-
-    return tickets_pagination.items
-
-
-def _search_orders(
-    brand_id: BrandID, search_term: str, limit: int
-) -> list[AdminOrderListItem]:
-    shop = shop_service.find_shop_for_brand(brand_id)
-    if shop is None:
-        return []
-
-    page = 1
-    per_page = limit
-
-    orders_pagination = order_service.get_orders_for_shop_paginated(
-        shop.id, page, per_page, search_term=search_term
-    )
-
-    return orders_pagination.items
-
-
-def _search_users(search_term: str, limit: int) -> list[User]:
-    page = 1
-    per_page = limit
-
-    users_pagination = user_service.get_users_paginated(
-        page, per_page, search_term=search_term
-    )
-
-    # Exclude deleted users.
-    users_pagination.items = [
-        user for user in users_pagination.items if not user.deleted
-    ]
-
-    return users_pagination.items
-
-
-def _get_tickets_for_users(
-    party_id: PartyID, users: list[User]
-) -> Iterator[DbTicket]:
-    for user in users:
-        yield from ticket_service.get_tickets_related_to_user_for_party(
-            user.id, party_id
-        )
-
-
 @blueprint.post('/for_party/<party_id>/tickets/<uuid:ticket_id>/check_in_user')
 @permission_required('ticketing.checkin')
 @respond_no_content
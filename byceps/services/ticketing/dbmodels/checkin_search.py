@@ -0,0 +1,39 @@
+"""
+byceps.services.ticketing.dbmodels.checkin_search
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from sqlalchemy.orm import Mapped, mapped_column
+
+from byceps.database import db
+from byceps.services.party.models import PartyID
+from byceps.services.ticketing.models.ticket import TicketID
+
+
+class DbTicketCheckInSearchTerm(db.Model):
+    """A normalized term by which a ticket can be found at check-in."""
+
+    __tablename__ = 'ticket_checkin_search_terms'
+    __table_args__ = (
+        db.Index(
+            'ix_ticket_checkin_search_terms_party_id_term', 'party_id', 'term'
+        ),
+    )
+
+    ticket_id: Mapped[TicketID] = mapped_column(
+        db.Uuid,
+        db.ForeignKey('tickets.id', ondelete='CASCADE'),
+        primary_key=True,
+    )
+    rank: Mapped[int] = mapped_column(primary_key=True)
+    # Byte-wise collation so that prefix searches can be answered as
+    # range scans on the index.
+    term: Mapped[str] = mapped_column(
+        db.UnicodeText(collation='C'), primary_key=True
+    )
+    party_id: Mapped[PartyID] = mapped_column(
+        db.UnicodeText, db.ForeignKey('parties.id')
+    )
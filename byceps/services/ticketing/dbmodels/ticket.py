@@ -30,6 +30,13 @@ from .category import DbTicketCategory
 from .ticket_bundle import DbTicketBundle
 
 
+# The ID of the current transaction, to record which transaction has
+# last changed a ticket.
+current_transaction_id = db.cast(
+    db.cast(db.func.pg_current_xact_id(), db.Text), db.BigInteger
+)
+
+
 class DbTicket(db.Model):
     """A ticket that permits to attend a party and to occupy a seat.
 
@@ -41,7 +48,10 @@ class DbTicket(db.Model):
     """
 
     __tablename__ = 'tickets'
-    __table_args__ = (db.UniqueConstraint('party_id', 'code'),)
+    __table_args__ = (
+        db.UniqueConstraint('party_id', 'code'),
+        db.Index('ix_tickets_party_id_revision', 'party_id', 'revision'),
+    )
 
     id: Mapped[TicketID] = mapped_column(db.Uuid, primary_key=True)
     created_at: Mapped[datetime]
@@ -95,6 +105,13 @@ class DbTicket(db.Model):
     used_by: Mapped[DbUser | None] = relationship(foreign_keys=[used_by_id])
     revoked: Mapped[bool]
     user_checked_in: Mapped[bool]
+    # ID of the transaction that has last changed the ticket
+    revision: Mapped[int] = mapped_column(
+        db.BigInteger,
+        default=current_transaction_id,
+        onupdate=current_transaction_id,
+        server_default=db.text('pg_current_xact_id()::text::bigint'),
+    )
 
     def __init__(
         self,
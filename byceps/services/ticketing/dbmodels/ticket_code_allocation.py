@@ -0,0 +1,27 @@
+"""
+byceps.services.ticketing.dbmodels.ticket_code_allocation
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from sqlalchemy.orm import Mapped, mapped_column
+
+from byceps.database import db
+from byceps.services.party.models import PartyID
+
+
+class DbTicketCodeAllocation(db.Model):
+    """The state of a party's ticket code allocation: the key of the
+    permutation of the code space, and the index of the next code to
+    allocate.
+    """
+
+    __tablename__ = 'ticket_code_allocations'
+
+    party_id: Mapped[PartyID] = mapped_column(
+        db.UnicodeText, db.ForeignKey('parties.id'), primary_key=True
+    )
+    key: Mapped[bytes] = mapped_column(db.LargeBinary)
+    next_index: Mapped[int]
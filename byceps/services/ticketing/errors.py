@@ -23,6 +23,11 @@ class TicketBelongsToDifferentPartyError(TicketingError):
     """
 
 
+@dataclass(frozen=True)
+class TicketCodeUnknownError(TicketingError):
+    """Indicate that a ticket code is unknown."""
+
+
 @dataclass(frozen=True)
 class TicketIsRevokedError(TicketingError):
     """Indicate an error caused by the ticket being revoked."""
@@ -42,3 +42,34 @@ class TicketCheckIn:
     occurred_at: datetime
     ticket_id: TicketID
     initiator_id: UserID
+
+
+@dataclass(frozen=True, kw_only=True)
+class OfflineTicketCheckIn:
+    """A check-in recorded by a scanner while offline."""
+
+    ticket_code: TicketCode
+    occurred_at: datetime
+
+
+@dataclass(frozen=True, kw_only=True)
+class CheckInSyncTicket:
+    """The state of a ticket as relevant for checking in its user."""
+
+    id: TicketID
+    code: TicketCode
+    category_title: str
+    used_by_id: UserID | None
+    used_by_screen_name: str | None
+    used_by_suspended: bool
+    used_by_deleted: bool
+    seat_label: str | None
+    revoked: bool
+    user_checked_in: bool
+
+
+@dataclass(frozen=True, kw_only=True)
+class CheckInSyncSnapshot:
+    party_id: PartyID
+    tickets: list[CheckInSyncTicket]
+    sync_token: str
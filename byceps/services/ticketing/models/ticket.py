@@ -61,6 +61,13 @@ class TicketBundle:
         return self.occupied_seat_group_id is not None
 
 
+@dataclass(frozen=True, kw_only=True)
+class TicketCounters:
+    revoked: int
+    sold: int
+    checked_in: int
+
+
 @dataclass(frozen=True, kw_only=True)
 class TicketSaleStats:
     tickets_max: int | None
@@ -7,11 +7,12 @@ byceps.services.ticketing.ticket_attendance_service
 """
 
 from collections import Counter
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from datetime import datetime
 from itertools import chain
 
 from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
 
 from byceps.database import db, insert_ignore_on_conflict
 from byceps.services.brand.models import BrandID
@@ -38,6 +39,39 @@ def create_archived_attendance(user_id: UserID, party_id: PartyID) -> None:
     insert_ignore_on_conflict(table, values)
 
 
+def create_archived_attendances(
+    user_and_party_ids: Iterable[tuple[UserID, PartyID]],
+) -> set[tuple[UserID, PartyID]]:
+    """Create archived attendances of users at parties, in a single
+    statement.
+
+    Attendances that already exist are skipped. Return the ones that
+    have actually been created.
+    """
+    created_at = datetime.utcnow()
+
+    rows = [
+        {'user_id': user_id, 'party_id': party_id, 'created_at': created_at}
+        for user_id, party_id in set(user_and_party_ids)
+    ]
+
+    if not rows:
+        return set()
+
+    table = DbArchivedAttendance.__table__
+
+    created_rows = db.session.execute(
+        insert(table)
+        .values(rows)
+        .on_conflict_do_nothing(constraint=table.primary_key)
+        .returning(table.c.user_id, table.c.party_id)
+    ).all()
+
+    db.session.commit()
+
+    return {(user_id, party_id) for user_id, party_id in created_rows}
+
+
 def delete_archived_attendance(user_id: UserID, party_id: PartyID) -> None:
     """Delete the archived attendance of the user at the party."""
     db.session.execute(
@@ -0,0 +1,154 @@
+"""
+byceps.services.ticketing.ticket_bundle_bulk_creation_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Create ticket bundles with large quantities of tickets (e.g. for
+sponsors or staff).
+
+Tickets are inserted as plain rows, in chunks with a multi-row insert
+and a commit each, instead of as ORM objects all at once. Bundles with
+many tickets are filled by a background job.
+
+Filling a bundle only creates the tickets it is still missing, so an
+interrupted job can simply be run again.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import select
+import structlog
+
+from byceps.database import db, insert_many
+from byceps.services.user.models import User, UserID
+from byceps.util.jobqueue import enqueue
+from byceps.util.uuid import generate_uuid7
+
+from . import ticket_checkin_search_service
+from .dbmodels.ticket import DbTicket
+from .dbmodels.ticket_bundle import DbTicketBundle
+from .models.ticket import TicketBundleID, TicketCategory, TicketCode
+from .ticket_creation_service import allocate_ticket_codes
+
+
+log = structlog.get_logger()
+
+
+CHUNK_SIZE = 1_000
+
+# Bundles with more tickets than this are filled in the background.
+BACKGROUND_THRESHOLD = 5_000
+
+
+def create_bundle(
+    category: TicketCategory,
+    ticket_quantity: int,
+    owner: User,
+    *,
+    user: User | None = None,
+    label: str | None = None,
+) -> TicketBundleID:
+    """Create a ticket bundle and fill it with the given quantity of
+    tickets.
+
+    If the quantity exceeds the background threshold, the bundle is
+    filled by a background job, and only the bundle itself exists once
+    this function returns.
+    """
+    if ticket_quantity < 1:
+        raise ValueError('Ticket quantity must be positive.')
+
+    bundle_id = TicketBundleID(generate_uuid7())
+    created_at = datetime.utcnow()
+
+    db_bundle = DbTicketBundle(
+        bundle_id,
+        created_at,
+        category,
+        ticket_quantity,
+        owner.id,
+        label=label,
+    )
+    db.session.add(db_bundle)
+    db.session.commit()
+
+    user_id = user.id if user else None
+
+    if ticket_quantity > BACKGROUND_THRESHOLD:
+        enqueue(fill_bundle, bundle_id, user_id)
+    else:
+        fill_bundle(bundle_id, user_id)
+
+    return bundle_id
+
+
+def fill_bundle(bundle_id: TicketBundleID, user_id: UserID | None) -> None:
+    """Create the tickets the bundle is still missing, in chunks."""
+    while True:
+        # Lock the bundle so that concurrent runs cannot overfill it.
+        db_bundle = db.session.scalars(
+            select(DbTicketBundle)
+            .filter_by(id=bundle_id)
+            .with_for_update(of=DbTicketBundle)
+        ).one()
+
+        existing_quantity = _count_tickets(bundle_id)
+        missing_quantity = db_bundle.ticket_quantity - existing_quantity
+
+        if missing_quantity <= 0:
+            db.session.rollback()
+            break
+
+        chunk_quantity = min(missing_quantity, CHUNK_SIZE)
+
+        codes = allocate_ticket_codes(db_bundle.party_id, chunk_quantity)
+        rows = _build_ticket_rows(db_bundle, codes, user_id)
+        insert_many(DbTicket.__table__, rows)
+
+        ticket_checkin_search_service.update_terms_for_tickets(
+            [row['id'] for row in rows]
+        )
+
+        db.session.commit()
+
+        log.info(
+            'Ticket bundle chunk created',
+            ticket_bundle_id=str(bundle_id),
+            created=existing_quantity + chunk_quantity,
+            total=db_bundle.ticket_quantity,
+        )
+
+
+def _count_tickets(bundle_id: TicketBundleID) -> int:
+    return (
+        db.session.scalar(
+            select(db.func.count(DbTicket.id)).filter_by(bundle_id=bundle_id)
+        )
+        or 0
+    )
+
+
+def _build_ticket_rows(
+    db_bundle: DbTicketBundle, codes: list[TicketCode], user_id: UserID | None
+) -> list[dict[str, Any]]:
+    created_at = datetime.utcnow()
+
+    return [
+        {
+            'id': generate_uuid7(),
+            'created_at': created_at,
+            'party_id': db_bundle.party_id,
+            'code': code,
+            'bundle_id': db_bundle.id,
+            'category_id': db_bundle.ticket_category_id,
+            'owned_by_id': db_bundle.owned_by_id,
+            'order_number': db_bundle.order_number,
+            'used_by_id': user_id,
+            'revoked': False,
+            'user_checked_in': False,
+        }
+        for code in codes
+    ]
@@ -10,7 +10,7 @@ from collections.abc import Sequence
 from datetime import datetime
 
 from sqlalchemy import delete, select, Select
-from tenacity import retry, retry_if_exception_type, stop_after_attempt
+from sqlalchemy.exc import IntegrityError
 
 from byceps.database import db, paginate, Pagination
 from byceps.services.party.models import PartyID
@@ -23,7 +23,7 @@ from byceps.services.user.models import User
 from byceps.util.result import Err, Ok, Result
 from byceps.util.uuid import generate_uuid7
 
-from . import ticket_category_service
+from . import ticket_category_service, ticket_checkin_search_service
 from .dbmodels.category import DbTicketCategory
 from .dbmodels.ticket import DbTicket
 from .dbmodels.ticket_bundle import DbTicketBundle
@@ -34,14 +34,14 @@ from .models.ticket import (
     TicketCategory,
     TicketID,
 )
-from .ticket_creation_service import build_tickets, TicketCreationFailedError
+from .ticket_creation_service import (
+    allocate_ticket_codes_for_parties,
+    build_tickets,
+    build_tickets_with_codes,
+    TicketCreationFailedWithConflictError,
+)
 
 
-@retry(
-    reraise=True,
-    retry=retry_if_exception_type(TicketCreationFailedError),
-    stop=stop_after_attempt(5),
-)
 def create_bundle(
     category: TicketCategory,
     ticket_quantity: int,
@@ -81,6 +81,10 @@ def create_bundle(
     )
     db.session.add_all(db_tickets)
 
+    ticket_checkin_search_service.update_terms_for_tickets(
+        [db_ticket.id for db_ticket in db_tickets]
+    )
+
     db.session.commit()
 
     ticket_ids = _get_ticket_ids_sorted_by_creation_time(db_tickets)
@@ -104,6 +108,107 @@ def create_bundle(
     return bundle
 
 
+def create_bundles_for_owners(
+    requests: Sequence[
+        tuple[TicketCategory, int, User, int, OrderNumber | None]
+    ],
+) -> list[list[TicketBundle]]:
+    """Create ticket bundles for multiple owners at once, in a single
+    transaction.
+
+    Each request consists of the tickets' category, the quantity of
+    tickets per bundle, the owner (who also becomes the tickets' user),
+    the quantity of bundles, and the order number.
+
+    Return the created bundles per request, in the requests' order.
+    """
+    codes_by_party_id = allocate_ticket_codes_for_parties(
+        (category.party_id, ticket_quantity * bundle_quantity)
+        for category, ticket_quantity, _, bundle_quantity, _ in requests
+    )
+
+    db_bundles = []
+    db_tickets = []
+    bundles_per_request = []
+
+    for (
+        category,
+        ticket_quantity,
+        owner,
+        bundle_quantity,
+        order_number,
+    ) in requests:
+        if ticket_quantity < 1:
+            raise ValueError('Ticket quantity must be positive.')
+
+        codes = codes_by_party_id[category.party_id]
+
+        bundles = []
+
+        for _ in range(bundle_quantity):
+            bundle_id = TicketBundleID(generate_uuid7())
+            created_at = datetime.utcnow()
+
+            db_bundles.append(
+                DbTicketBundle(
+                    bundle_id,
+                    created_at,
+                    category,
+                    ticket_quantity,
+                    owner.id,
+                    order_number=order_number,
+                )
+            )
+
+            db_bundle_tickets = list(
+                build_tickets_with_codes(
+                    category,
+                    owner,
+                    [next(codes) for _ in range(ticket_quantity)],
+                    bundle_id=bundle_id,
+                    order_number=order_number,
+                    user=owner,
+                )
+            )
+            db_tickets.extend(db_bundle_tickets)
+
+            bundles.append(
+                TicketBundle(
+                    id=bundle_id,
+                    created_at=created_at,
+                    party_id=category.party_id,
+                    ticket_category=category,
+                    ticket_quantity=ticket_quantity,
+                    owned_by=owner,
+                    order_number=order_number,
+                    seats_managed_by=None,
+                    users_managed_by=None,
+                    label=None,
+                    revoked=False,
+                    ticket_ids=[
+                        db_ticket.id for db_ticket in db_bundle_tickets
+                    ],
+                    occupied_seat_group_id=None,
+                )
+            )
+
+        bundles_per_request.append(bundles)
+
+    db.session.add_all(db_bundles)
+    db.session.add_all(db_tickets)
+
+    try:
+        ticket_checkin_search_service.update_terms_for_tickets(
+            [db_ticket.id for db_ticket in db_tickets]
+        )
+        db.session.commit()
+    except IntegrityError as exc:
+        db.session.rollback()
+        raise TicketCreationFailedWithConflictError(exc) from exc
+
+    return bundles_per_request
+
+
 def revoke_bundle(
     bundle_id: TicketBundleID,
     initiator: User,
@@ -0,0 +1,222 @@
+"""
+byceps.services.ticketing.ticket_checkin_search_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Find tickets at the check-in desk by ticket code, order number, or
+screen name, first name, last name, or email address of their owner or
+user.
+
+The searchable terms of each ticket are kept in a dedicated table, so
+that a search is a single indexed lookup. They have to be updated
+whenever a ticket or one of the users related to it changes.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections.abc import Sequence
+
+from sqlalchemy import (
+    case,
+    ColumnElement,
+    delete,
+    insert,
+    literal,
+    select,
+    union,
+)
+from sqlalchemy.orm import InstrumentedAttribute
+
+from byceps.database import db
+from byceps.services.party.models import PartyID
+from byceps.services.seating.dbmodels.seat import DbSeat
+from byceps.services.user.dbmodels import DbUser, DbUserDetail
+from byceps.services.user.models import UserID
+
+from .dbmodels.checkin_search import DbTicketCheckInSearchTerm
+from .dbmodels.ticket import DbTicket
+from .models.ticket import TicketID
+
+
+# Lower ranks are listed first.
+_RANK_TICKET_CODE = 0
+_RANK_ORDER_NUMBER = 1
+_RANK_SCREEN_NAME = 2
+_RANK_LAST_NAME = 3
+_RANK_FIRST_NAME = 4
+_RANK_EMAIL_ADDRESS = 5
+
+# Terms that match exactly are listed before terms that only start
+# with the search term.
+_RANK_OFFSET_PREFIX_MATCH = 10
+
+# Upper bound for terms starting with a given prefix.
+_MAX_CHAR = '\U0010ffff'
+
+
+# -------------------------------------------------------------------- #
+# index maintenance
+
+
+def update_terms_for_tickets(ticket_ids: Sequence[TicketID]) -> None:
+    """Replace the search terms of the tickets.
+
+    Changes are not committed.
+    """
+    if not ticket_ids:
+        return
+
+    _replace_terms(
+        DbTicketCheckInSearchTerm.ticket_id.in_(ticket_ids),
+        DbTicket.id.in_(ticket_ids),
+    )
+
+
+def update_terms_for_user(user_id: UserID) -> None:
+    """Replace the search terms of the tickets the user owns or uses."""
+    ticket_ids = db.session.scalars(
+        select(DbTicket.id).filter(
+            (DbTicket.owned_by_id == user_id) | (DbTicket.used_by_id == user_id)
+        )
+    ).all()
+
+    update_terms_for_tickets(ticket_ids)
+
+    db.session.commit()
+
+
+def rebuild_terms_for_party(party_id: PartyID) -> None:
+    """Replace the search terms of all of the party's tickets."""
+    _replace_terms(
+        DbTicketCheckInSearchTerm.party_id == party_id,
+        DbTicket.party_id == party_id,
+    )
+
+    db.session.commit()
+
+
+def _replace_terms(
+    terms_criterion: ColumnElement[bool], tickets_criterion: ColumnElement[bool]
+) -> None:
+    # Changes to tickets might not have been written yet.
+    db.session.flush()
+
+    db.session.execute(delete(DbTicketCheckInSearchTerm).where(terms_criterion))
+
+    terms_select = union(
+        _select_ticket_terms(
+            tickets_criterion, DbTicket.code, _RANK_TICKET_CODE
+        ),
+        _select_ticket_terms(
+            tickets_criterion, DbTicket.order_number, _RANK_ORDER_NUMBER
+        ),
+        _select_user_terms(
+            tickets_criterion, DbUser.screen_name, _RANK_SCREEN_NAME
+        ),
+        _select_user_terms(
+            tickets_criterion, DbUserDetail.last_name, _RANK_LAST_NAME
+        ),
+        _select_user_terms(
+            tickets_criterion, DbUserDetail.first_name, _RANK_FIRST_NAME
+        ),
+        _select_user_terms(
+            tickets_criterion, DbUser.email_address, _RANK_EMAIL_ADDRESS
+        ),
+    )
+
+    db.session.execute(
+        insert(DbTicketCheckInSearchTerm).from_select(
+            ['ticket_id', 'party_id', 'term', 'rank'], terms_select
+        )
+    )
+
+
+def _select_ticket_terms(
+    tickets_criterion: ColumnElement[bool],
+    column: InstrumentedAttribute,
+    rank: int,
+):
+    return (
+        select(
+            DbTicket.id,
+            DbTicket.party_id,
+            db.func.lower(column),
+            literal(rank),
+        )
+        .filter(tickets_criterion)
+        .filter(column.is_not(None))
+    )
+
+
+def _select_user_terms(
+    tickets_criterion: ColumnElement[bool],
+    column: InstrumentedAttribute,
+    rank: int,
+):
+    """Select terms from both the tickets' owners and users."""
+    return (
+        select(
+            DbTicket.id,
+            DbTicket.party_id,
+            db.func.lower(column),
+            literal(rank),
+        )
+        .join(
+            DbUser, DbUser.id.in_([DbTicket.owned_by_id, DbTicket.used_by_id])
+        )
+        .outerjoin(DbUserDetail, DbUserDetail.user_id == DbUser.id)
+        .filter(tickets_criterion)
+        .filter(DbUser.deleted == False)  # noqa: E712
+        .filter(column.is_not(None))
+    )
+
+
+# -------------------------------------------------------------------- #
+# search
+
+
+def search_tickets(
+    party_id: PartyID, search_term: str, *, limit: int
+) -> Sequence[DbTicket]:
+    """Return the party's tickets matching the search term, best
+    matches first.
+    """
+    term = search_term.strip().lower()
+    if not term:
+        return []
+
+    rank = db.func.min(
+        case(
+            (
+                DbTicketCheckInSearchTerm.term == term,
+                DbTicketCheckInSearchTerm.rank,
+            ),
+            else_=DbTicketCheckInSearchTerm.rank + _RANK_OFFSET_PREFIX_MATCH,
+        )
+    ).label('rank')
+
+    matches = (
+        select(DbTicketCheckInSearchTerm.ticket_id, rank)
+        .filter(DbTicketCheckInSearchTerm.party_id == party_id)
+        .filter(DbTicketCheckInSearchTerm.term >= term)
+        .filter(DbTicketCheckInSearchTerm.term < term + _MAX_CHAR)
+        .group_by(DbTicketCheckInSearchTerm.ticket_id)
+        .order_by(rank, DbTicketCheckInSearchTerm.ticket_id)
+        .limit(limit)
+        .subquery()
+    )
+
+    return (
+        db.session.scalars(
+            select(DbTicket)
+            .join(matches, DbTicket.id == matches.c.ticket_id)
+            .options(
+                db.joinedload(DbTicket.owned_by),
+                db.joinedload(DbTicket.used_by),
+                db.joinedload(DbTicket.occupied_seat).joinedload(DbSeat.area),
+            )
+            .order_by(matches.c.rank, DbTicket.id)
+        )
+        .unique()
+        .all()
+    )
@@ -0,0 +1,24 @@
+"""
+byceps.services.ticketing.ticket_checkin_search_signal_handlers
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Update the check-in search terms of tickets when their owner or user
+changes.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.user import signals as user_signals
+from byceps.services.user.events import UserEvent
+from byceps.util.jobqueue import enqueue
+
+from . import ticket_checkin_search_service
+
+
+@user_signals.account_deleted.connect
+@user_signals.details_updated.connect
+@user_signals.email_address_changed.connect
+@user_signals.screen_name_changed.connect
+def _on_user_changed(sender, *, event: UserEvent) -> None:
+    enqueue(ticket_checkin_search_service.update_terms_for_user, event.user.id)
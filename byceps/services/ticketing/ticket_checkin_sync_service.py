@@ -0,0 +1,189 @@
+"""
+byceps.services.ticketing.ticket_checkin_sync_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Snapshots of a party's tickets for scanners that check users in while
+offline, and the changes to them since a snapshot.
+
+Every change to a ticket records the ID of the changing transaction
+as the ticket's revision. Snapshots and changes come with a signed sync
+token that records a watermark: the lowest ID of the transactions that
+were still in progress when the snapshot or changes were fetched (i.e.
+the `xmin` of the database snapshot, taken before fetching). All
+changes made by transactions with lower IDs had been committed (or
+rolled back) at that point, and thus were included.
+
+The next changes are fetched starting at the watermark, so a change
+that is committed later than changes with higher revisions cannot be
+missed. Changes might be included again, though. As each entry carries
+the complete state of a ticket, receiving one again is harmless.
+
+Changes to users (e.g. suspension) do not change ticket revisions.
+Check-ins uploaded by scanners are validated again, though.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from typing import Any
+
+from flask import current_app
+from itsdangerous import BadSignature, URLSafeSerializer
+from sqlalchemy import ColumnElement, select
+
+from byceps.database import db
+from byceps.services.party.models import PartyID
+from byceps.services.seating.dbmodels.seat import DbSeat
+from byceps.services.user.dbmodels import DbUser
+from byceps.util.result import Err, Ok, Result
+
+from .dbmodels.category import DbTicketCategory
+from .dbmodels.ticket import DbTicket
+from .models.checkin import CheckInSyncSnapshot, CheckInSyncTicket
+from .models.ticket import TicketCode
+
+
+_SERIALIZER_SALT = 'ticketing-checkin-sync'
+
+
+def get_snapshot(party_id: PartyID) -> CheckInSyncSnapshot:
+    """Return the party's tickets that have not been revoked."""
+    criterion = DbTicket.revoked == False  # noqa: E712
+    return _get_tickets(party_id, criterion)
+
+
+def get_changes(
+    party_id: PartyID, sync_token: str
+) -> Result[CheckInSyncSnapshot, str]:
+    """Return the party's tickets that have changed since the sync token
+    has been issued, including revoked ones.
+    """
+    token_result = _deserialize_sync_token(sync_token)
+    if token_result.is_err():
+        return Err(token_result.unwrap_err())
+
+    token_party_id, watermark = token_result.unwrap()
+
+    if token_party_id != party_id:
+        return Err('Sync token has been issued for another party.')
+
+    return Ok(_get_tickets(party_id, DbTicket.revision >= watermark))
+
+
+def _get_tickets(
+    party_id: PartyID, criterion: ColumnElement[bool]
+) -> CheckInSyncSnapshot:
+    # Take the watermark before fetching the tickets. Transactions that
+    # are not visible to the fetch have IDs at or above it.
+    watermark = _get_transaction_id_watermark()
+
+    rows = db.session.execute(
+        select(
+            DbTicket.id,
+            DbTicket.code,
+            DbTicketCategory.title,
+            DbTicket.used_by_id,
+            DbUser.screen_name,
+            DbUser.suspended,
+            DbUser.deleted,
+            DbSeat.label,
+            DbTicket.revoked,
+            DbTicket.user_checked_in,
+        )
+        .select_from(DbTicket)
+        .join(DbTicketCategory, DbTicketCategory.id == DbTicket.category_id)
+        .outerjoin(DbUser, DbUser.id == DbTicket.used_by_id)
+        .outerjoin(DbSeat, DbSeat.id == DbTicket.occupied_seat_id)
+        .filter(DbTicket.party_id == party_id)
+        .filter(criterion)
+        .order_by(DbTicket.revision, DbTicket.id)
+    ).all()
+
+    tickets = [
+        CheckInSyncTicket(
+            id=ticket_id,
+            code=TicketCode(code),
+            category_title=category_title,
+            used_by_id=used_by_id,
+            used_by_screen_name=used_by_screen_name,
+            used_by_suspended=bool(used_by_suspended),
+            used_by_deleted=bool(used_by_deleted),
+            seat_label=seat_label,
+            revoked=revoked,
+            user_checked_in=user_checked_in,
+        )
+        for (
+            ticket_id,
+            code,
+            category_title,
+            used_by_id,
+            used_by_screen_name,
+            used_by_suspended,
+            used_by_deleted,
+            seat_label,
+            revoked,
+            user_checked_in,
+        ) in rows
+    ]
+
+    return CheckInSyncSnapshot(
+        party_id=party_id,
+        tickets=tickets,
+        sync_token=_serialize_sync_token(party_id, watermark),
+    )
+
+
+def _get_transaction_id_watermark() -> int:
+    """Return the lowest ID of the transactions still in progress (or
+    the next one to be assigned, if none is).
+    """
+    watermark = db.session.scalar(
+        select(
+            db.cast(
+                db.cast(
+                    db.func.pg_snapshot_xmin(db.func.pg_current_snapshot()),
+                    db.Text,
+                ),
+                db.BigInteger,
+            )
+        )
+    )
+
+    if watermark is None:
+        raise RuntimeError('Could not determine transaction ID watermark.')
+
+    return watermark
+
+
+# -------------------------------------------------------------------- #
+# sync token
+
+
+def _serialize_sync_token(party_id: PartyID, watermark: int) -> str:
+    data = {'party_id': party_id, 'watermark': watermark}
+    return _get_serializer().dumps(data)
+
+
+def _deserialize_sync_token(
+    sync_token: str,
+) -> Result[tuple[PartyID, int], str]:
+    try:
+        data: dict[str, Any] = _get_serializer().loads(sync_token)
+    except BadSignature:
+        return Err('Sync token is invalid.')
+
+    if 'watermark' not in data:
+        # Issued before watermarks were introduced
+        return Err('Sync token is outdated, fetch a new snapshot.')
+
+    party_id = data.get('party_id')
+    watermark = data['watermark']
+    if not isinstance(party_id, str) or not isinstance(watermark, int):
+        return Err('Sync token is invalid.')
+
+    return Ok((PartyID(party_id), watermark))
+
+
+def _get_serializer() -> URLSafeSerializer:
+    secret_key = current_app.config['SECRET_KEY']
+    return URLSafeSerializer(secret_key, salt=_SERIALIZER_SALT)
@@ -0,0 +1,96 @@
+"""
+byceps.services.ticketing.ticket_code_allocation_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Allocate ticket codes that are unique within a party.
+
+Each party has its own secret permutation of the code space and a
+counter of allocated codes. Allocating codes advances the counter and
+maps the claimed range of indexes to codes, so codes allocated this way
+never collide with each other. Codes already taken otherwise (e.g. set
+manually, or generated before allocation was introduced) are skipped.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from secrets import token_bytes
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+
+from byceps.database import db
+from byceps.services.party.models import PartyID
+from byceps.util.result import Err, Ok, Result
+
+from . import ticket_code_service
+from .dbmodels.ticket import DbTicket
+from .dbmodels.ticket_code_allocation import DbTicketCodeAllocation
+from .models.ticket import TicketCode
+
+
+_KEY_LENGTH = 16
+
+
+def allocate_ticket_codes(
+    party_id: PartyID, quantity: int
+) -> Result[list[TicketCode], str]:
+    """Allocate that many ticket codes for the party.
+
+    The allocation is not committed, but becomes part of the current
+    transaction. Concurrent allocations for the same party wait until
+    it ends.
+    """
+    codes: list[TicketCode] = []
+
+    while len(codes) < quantity:
+        match _claim_codes(party_id, quantity - len(codes)):
+            case Ok(claimed_codes):
+                pass
+            case Err(e):
+                return Err(e)
+
+        taken_codes = _get_taken_codes(party_id, claimed_codes)
+        codes.extend(code for code in claimed_codes if code not in taken_codes)
+
+    return Ok(codes)
+
+
+def _claim_codes(
+    party_id: PartyID, quantity: int
+) -> Result[list[TicketCode], str]:
+    """Advance the party's allocation counter, then build the codes for
+    the claimed range of indexes.
+    """
+    table = DbTicketCodeAllocation.__table__
+
+    key, next_index = db.session.execute(
+        insert(table)
+        .values(
+            party_id=party_id, key=token_bytes(_KEY_LENGTH), next_index=quantity
+        )
+        .on_conflict_do_update(
+            index_elements=[table.c.party_id],
+            set_={'next_index': table.c.next_index + quantity},
+        )
+        .returning(table.c.key, table.c.next_index)
+    ).one()
+
+    start_index = next_index - quantity
+
+    return ticket_code_service.build_ticket_codes(key, start_index, quantity)
+
+
+def _get_taken_codes(
+    party_id: PartyID, codes: list[TicketCode]
+) -> set[TicketCode]:
+    """Return those of the codes that are already used by the party's
+    tickets.
+    """
+    taken_codes = db.session.scalars(
+        select(DbTicket.code)
+        .filter_by(party_id=party_id)
+        .filter(DbTicket.code.in_(codes))
+    ).all()
+
+    return {TicketCode(code) for code in taken_codes}
@@ -6,7 +6,7 @@ byceps.services.ticketing.ticket_code_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from random import sample
+from hashlib import blake2b
 from string import ascii_uppercase, digits
 
 from byceps.util.result import Err, Ok, Result
@@ -14,54 +14,72 @@ from byceps.util.result import Err, Ok, Result
 from .models.ticket import TicketCode
 
 
-def generate_ticket_codes(
-    requested_quantity: int,
-) -> Result[set[TicketCode], str]:
-    """Generate a number of ticket codes."""
-    codes: set[TicketCode] = set()
+_CODE_ALPHABET = 'BCDFGHJKLMNPQRSTVWXYZ'
+_CODE_LENGTH = 5
+
+_CODE_SPACE_SIZE = len(_CODE_ALPHABET) ** _CODE_LENGTH
+
+# The permutation operates on 22-bit values (2^22 >= 21^5) and walks
+# the cycle until it ends up inside the code space.
+_HALF_BITS = 11
+_HALF_MASK = (1 << _HALF_BITS) - 1
+_ROUNDS = 4
 
-    for _ in range(requested_quantity):
-        match _generate_ticket_code_not_in(codes):
-            case Ok(code):
-                codes.add(code)
-            case Err(e):
-                return Err(e)
 
-    # Check if the requested quantity of codes has been generated.
-    actual_quantity = len(codes)
-    if actual_quantity != requested_quantity:
+def build_ticket_codes(
+    key: bytes, start_index: int, quantity: int
+) -> Result[list[TicketCode], str]:
+    """Build the ticket codes for a consecutive range of indexes.
+
+    Each index of the code space maps to a distinct code. The key
+    determines the mapping, which makes consecutive codes look random.
+    """
+    end_index = start_index + quantity
+    if end_index > _CODE_SPACE_SIZE:
         return Err(
-            f'Number of generated ticket codes ({actual_quantity}) '
-            f'does not match requested quantity ({requested_quantity}).'
+            f'Ticket code space ({_CODE_SPACE_SIZE} codes) is exhausted.'
         )
 
-    return Ok(codes)
+    return Ok(
+        [
+            _index_to_code(_permute_index(key, index))
+            for index in range(start_index, end_index)
+        ]
+    )
 
 
-def _generate_ticket_code_not_in(
-    codes: set[TicketCode], *, max_attempts: int = 4
-) -> Result[TicketCode, str]:
-    """Generate ticket codes and return the first one not in the set."""
-    for _ in range(max_attempts):
-        code = _generate_ticket_code()
-        if code not in codes:
-            return Ok(code)
+def _permute_index(key: bytes, index: int) -> int:
+    value = _feistel(key, index)
 
-    return Err(
-        f'Could not generate unique ticket code after {max_attempts} attempts.'
-    )
+    while value >= _CODE_SPACE_SIZE:
+        value = _feistel(key, value)
 
+    return value
 
-_CODE_ALPHABET = 'BCDFGHJKLMNPQRSTVWXYZ'
-_CODE_LENGTH = 5
 
+def _feistel(key: bytes, value: int) -> int:
+    left = value >> _HALF_BITS
+    right = value & _HALF_MASK
 
-def _generate_ticket_code() -> TicketCode:
-    """Generate a ticket code.
+    for round_number in range(_ROUNDS):
+        left, right = right, left ^ _round_function(key, round_number, right)
 
-    Generated codes are not necessarily unique!
-    """
-    return TicketCode(''.join(sample(_CODE_ALPHABET, _CODE_LENGTH)))
+    return (left << _HALF_BITS) | right
+
+
+def _round_function(key: bytes, round_number: int, value: int) -> int:
+    data = bytes([round_number]) + value.to_bytes(2, 'big')
+    digest = blake2b(data, key=key, digest_size=2).digest()
+    return int.from_bytes(digest, 'big') & _HALF_MASK
+
+
+def _index_to_code(index: int) -> TicketCode:
+    symbols = []
+    for _ in range(_CODE_LENGTH):
+        index, remainder = divmod(index, len(_CODE_ALPHABET))
+        symbols.append(_CODE_ALPHABET[remainder])
+
+    return TicketCode(''.join(symbols))
 
 
 _ALLOWED_CODE_SYMBOLS = frozenset(_CODE_ALPHABET + ascii_uppercase + digits)
@@ -6,22 +6,23 @@ byceps.services.ticketing.ticket_creation_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from collections.abc import Iterator
+from collections import Counter
+from collections.abc import Iterable, Iterator, Sequence
 from datetime import datetime
 
 from sqlalchemy.exc import IntegrityError
-from tenacity import retry, retry_if_exception_type, stop_after_attempt
 
 from byceps.database import db
+from byceps.services.party.models import PartyID
 from byceps.services.shop.order.models.number import OrderNumber
 from byceps.services.ticketing.models.ticket import TicketID
 from byceps.services.user.models import User
 from byceps.util.result import Err, Ok
 from byceps.util.uuid import generate_uuid7
 
-from . import ticket_code_service
+from . import ticket_checkin_search_service, ticket_code_allocation_service
 from .dbmodels.ticket import DbTicket
-from .models.ticket import TicketBundleID, TicketCategory
+from .models.ticket import TicketBundleID, TicketCategory, TicketCode
 
 
 class TicketCreationFailedError(Exception):
@@ -51,11 +52,6 @@ def create_ticket(
     return db_tickets[0]
 
 
-@retry(
-    reraise=True,
-    retry=retry_if_exception_type(TicketCreationFailedError),
-    stop=stop_after_attempt(5),
-)
 def create_tickets(
     category: TicketCategory,
     owner: User,
@@ -74,6 +70,9 @@ def create_tickets(
     db.session.add_all(db_tickets)
 
     try:
+        ticket_checkin_search_service.update_terms_for_tickets(
+            [db_ticket.id for db_ticket in db_tickets]
+        )
         db.session.commit()
     except IntegrityError as exc:
         db.session.rollback()
@@ -82,6 +81,58 @@ def create_tickets(
     return db_tickets
 
 
+def create_tickets_for_owners(
+    requests: Sequence[tuple[TicketCategory, User, int, OrderNumber | None]],
+) -> list[list[DbTicket]]:
+    """Create tickets for multiple owners at once, in a single
+    transaction.
+
+    Each request consists of the tickets' category, owner (who also
+    becomes their user), quantity, and order number.
+
+    Return the created tickets per request, in the requests' order.
+    """
+    codes_by_party_id = allocate_ticket_codes_for_parties(
+        (category.party_id, quantity) for category, _, quantity, _ in requests
+    )
+
+    db_tickets_per_request = []
+    for category, owner, quantity, order_number in requests:
+        if quantity < 1:
+            raise ValueError('Ticket quantity must be positive.')
+
+        codes = codes_by_party_id[category.party_id]
+
+        db_tickets = list(
+            build_tickets_with_codes(
+                category,
+                owner,
+                [next(codes) for _ in range(quantity)],
+                order_number=order_number,
+                user=owner,
+            )
+        )
+        db_tickets_per_request.append(db_tickets)
+
+    db_tickets = [
+        db_ticket
+        for db_tickets in db_tickets_per_request
+        for db_ticket in db_tickets
+    ]
+    db.session.add_all(db_tickets)
+
+    try:
+        ticket_checkin_search_service.update_terms_for_tickets(
+            [db_ticket.id for db_ticket in db_tickets]
+        )
+        db.session.commit()
+    except IntegrityError as exc:
+        db.session.rollback()
+        raise TicketCreationFailedWithConflictError(exc) from exc
+
+    return db_tickets_per_request
+
+
 def build_tickets(
     category: TicketCategory,
     owner: User,
@@ -94,21 +145,68 @@ def build_tickets(
     if quantity < 1:
         raise ValueError('Ticket quantity must be positive.')
 
-    match ticket_code_service.generate_ticket_codes(quantity):
+    codes = allocate_ticket_codes(category.party_id, quantity)
+
+    yield from build_tickets_with_codes(
+        category,
+        owner,
+        codes,
+        bundle_id=bundle_id,
+        order_number=order_number,
+        user=user,
+    )
+
+
+def build_tickets_with_codes(
+    category: TicketCategory,
+    owner: User,
+    codes: Iterable[TicketCode],
+    *,
+    bundle_id: TicketBundleID | None = None,
+    order_number: OrderNumber | None = None,
+    user: User | None = None,
+) -> Iterator[DbTicket]:
+    for code in codes:
+        ticket_id = TicketID(generate_uuid7())
+        created_at = datetime.utcnow()
+
+        yield DbTicket(
+            ticket_id,
+            created_at,
+            category,
+            code,
+            owner.id,
+            bundle_id=bundle_id,
+            order_number=order_number,
+            used_by_id=user.id if user else None,
+        )
+
+
+def allocate_ticket_codes_for_parties(
+    quantities: Iterable[tuple[PartyID, int]],
+) -> dict[PartyID, Iterator[TicketCode]]:
+    """Allocate ticket codes with a single allocation per party."""
+    total_quantities_by_party_id: Counter[PartyID] = Counter()
+    for party_id, quantity in quantities:
+        total_quantities_by_party_id[party_id] += quantity
+
+    # Allocate in a consistent order to avoid deadlocks.
+    return {
+        party_id: iter(allocate_ticket_codes(party_id, total_quantity))
+        for party_id, total_quantity in sorted(
+            total_quantities_by_party_id.items()
+        )
+    }
+
+
+def allocate_ticket_codes(party_id: PartyID, quantity: int) -> list[TicketCode]:
+    """Allocate that many unused ticket codes for the party, or raise
+    an exception.
+    """
+    match ticket_code_allocation_service.allocate_ticket_codes(
+        party_id, quantity
+    ):
         case Ok(codes):
-            for code in codes:
-                ticket_id = TicketID(generate_uuid7())
-                created_at = datetime.utcnow()
-
-                yield DbTicket(
-                    ticket_id,
-                    created_at,
-                    category,
-                    code,
-                    owner.id,
-                    bundle_id=bundle_id,
-                    order_number=order_number,
-                    used_by_id=user.id if user else None,
-                )
+            return codes
         case Err(e):
             raise TicketCreationFailedError(e)
@@ -34,14 +34,18 @@ from .models.checkin import (
 
 
 def check_in_user(
-    party_id: PartyID, ticket: PotentialTicketForCheckIn, initiator: User
+    party_id: PartyID,
+    ticket: PotentialTicketForCheckIn,
+    initiator: User,
+    *,
+    occurred_at: datetime | None = None,
 ) -> Result[
     tuple[TicketCheckIn, TicketCheckedInEvent, TicketLogEntry], TicketingError
 ]:
     validation_result = _validate_ticket(ticket, party_id)
     match validation_result:
         case Ok(valid_ticket):
-            return Ok(_check_in_user(valid_ticket, initiator))
+            return Ok(_check_in_user(valid_ticket, initiator, occurred_at))
         case Err(e):
             return Err(e)
         case _:
@@ -102,9 +106,12 @@ def _validate_ticket(
 
 
 def _check_in_user(
-    ticket: ValidTicketForCheckIn, initiator: User
+    ticket: ValidTicketForCheckIn,
+    initiator: User,
+    occurred_at: datetime | None,
 ) -> tuple[TicketCheckIn, TicketCheckedInEvent, TicketLogEntry]:
-    occurred_at = datetime.utcnow()
+    if occurred_at is None:
+        occurred_at = datetime.utcnow()
 
     check_in = _build_check_in(occurred_at, ticket, initiator)
     event = _build_check_in_event(occurred_at, ticket, initiator)
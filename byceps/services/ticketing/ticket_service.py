@@ -6,8 +6,10 @@ byceps.services.ticketing.ticket_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
+from datetime import timedelta
 from enum import Enum
+from time import monotonic
 
 from sqlalchemy import delete, select
 
@@ -19,7 +21,7 @@ from byceps.services.shop.order.models.number import OrderNumber
 from byceps.services.user.dbmodels import DbUser
 from byceps.services.user.models import User, UserID
 
-from . import ticket_code_service
+from . import ticket_checkin_search_service, ticket_code_service
 from .dbmodels.category import DbTicketCategory
 from .dbmodels.ticket import DbTicket
 from .log import ticket_log_domain_service, ticket_log_service
@@ -27,11 +29,22 @@ from .log.dbmodels import DbTicketLogEntry
 from .models.ticket import (
     TicketCategoryID,
     TicketCode,
+    TicketCounters,
     TicketID,
     TicketSaleStats,
 )
 
 
+# How long ticket counters are cached per process
+TICKET_COUNTERS_CACHE_TTL = timedelta(seconds=10)
+
+
+# party ID -> (expiry as monotonic time, counters)
+_cached_ticket_counters_by_party_id: dict[
+    PartyID, tuple[float, TicketCounters]
+] = {}
+
+
 def update_ticket_code(ticket_id: TicketID, code: str, initiator: User) -> None:
     """Set a custom code for the ticket."""
     db_ticket = get_ticket(ticket_id)
@@ -43,6 +56,8 @@ def update_ticket_code(ticket_id: TicketID, code: str, initiator: User) -> None:
 
     db_ticket.code = code
 
+    ticket_checkin_search_service.update_terms_for_tickets([db_ticket.id])
+
     log_entry = ticket_log_domain_service.build_ticket_code_changed_entry(
         db_ticket.id, old_code, code, initiator
     )
@@ -360,15 +375,93 @@ def count_tickets_checked_in_for_party(party_id: PartyID) -> int:
     )
 
 
-def get_ticket_sale_stats(party: Party) -> TicketSaleStats:
+def get_ticket_counters(
+    party_ids: Iterable[PartyID], *, cached: bool = False
+) -> dict[PartyID, TicketCounters]:
+    """Return the numbers of revoked, sold, and checked in tickets for
+    those parties, counted in a single query.
+
+    If requested, counters are taken from a short-lived, per-process
+    cache, and might thus be slightly out of date.
+    """
+    party_ids = set(party_ids)
+
+    counters_by_party_id = {}
+
+    if cached:
+        now = monotonic()
+        for party_id in party_ids:
+            cache_entry = _cached_ticket_counters_by_party_id.get(party_id)
+            if cache_entry is not None:
+                expires_at, counters = cache_entry
+                if expires_at > now:
+                    counters_by_party_id[party_id] = counters
+
+    missing_party_ids = party_ids - counters_by_party_id.keys()
+    if not missing_party_ids:
+        return counters_by_party_id
+
+    counted_counters_by_party_id = _count_tickets(missing_party_ids)
+
+    expires_at = monotonic() + TICKET_COUNTERS_CACHE_TTL.total_seconds()
+    for party_id, counters in counted_counters_by_party_id.items():
+        _cached_ticket_counters_by_party_id[party_id] = (expires_at, counters)
+
+    counters_by_party_id.update(counted_counters_by_party_id)
+
+    return counters_by_party_id
+
+
+def _count_tickets(party_ids: set[PartyID]) -> dict[PartyID, TicketCounters]:
+    rows = db.session.execute(
+        select(
+            DbTicket.party_id,
+            db.func.count(DbTicket.id).filter(DbTicket.revoked),
+            db.func.count(DbTicket.id).filter(db.not_(DbTicket.revoked)),
+            db.func.count(DbTicket.id).filter(DbTicket.user_checked_in),
+        )
+        .filter(DbTicket.party_id.in_(party_ids))
+        .group_by(DbTicket.party_id)
+    ).all()
+
+    counters_by_party_id = {
+        party_id: TicketCounters(revoked=0, sold=0, checked_in=0)
+        for party_id in party_ids
+    }
+
+    for party_id, revoked, sold, checked_in in rows:
+        counters_by_party_id[party_id] = TicketCounters(
+            revoked=revoked, sold=sold, checked_in=checked_in
+        )
+
+    return counters_by_party_id
+
+
+def get_ticket_sale_stats(
+    party: Party, *, cached: bool = False
+) -> TicketSaleStats:
     """Return the number of maximum and sold tickets, respectively."""
-    sold = count_sold_tickets_for_party(party.id)
+    return get_ticket_sale_stats_for_parties([party], cached=cached)[party.id]
+
 
-    return TicketSaleStats(
-        tickets_max=party.max_ticket_quantity,
-        tickets_sold=sold,
+def get_ticket_sale_stats_for_parties(
+    parties: Sequence[Party], *, cached: bool = False
+) -> dict[PartyID, TicketSaleStats]:
+    """Return the number of maximum and sold tickets, respectively, for
+    each of those parties.
+    """
+    counters_by_party_id = get_ticket_counters(
+        [party.id for party in parties], cached=cached
     )
 
+    return {
+        party.id: TicketSaleStats(
+            tickets_max=party.max_ticket_quantity,
+            tickets_sold=counters_by_party_id[party.id].sold,
+        )
+        for party in parties
+    }
+
 
 def find_ticket_occupying_seat(seat_id: SeatID) -> DbTicket | None:
     """Return the ticket that occupies that seat, or `None` if not found."""
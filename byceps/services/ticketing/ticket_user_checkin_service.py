@@ -6,13 +6,15 @@ byceps.services.ticketing.ticket_user_checkin_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from collections.abc import Sequence
+
 from sqlalchemy import select
 
 from byceps.database import db
 from byceps.services.party.models import PartyID
 from byceps.services.ticketing.dbmodels.checkin import DbTicketCheckIn
 from byceps.services.user import user_service
-from byceps.services.user.models import User
+from byceps.services.user.models import User, UserID
 from byceps.util.result import Err, Ok, Result
 from byceps.util.uuid import generate_uuid7
 
@@ -20,13 +22,18 @@ from . import ticket_domain_service, ticket_service
 from .dbmodels.ticket import DbTicket
 from .errors import (
     InitiatorNotSpecifiedError,
+    TicketCodeUnknownError,
     TicketingError,
     UserIdUnknownError,
 )
 from .events import TicketCheckedInEvent
 from .log import ticket_log_domain_service, ticket_log_service
 from .log.models import TicketLogEntry
-from .models.checkin import PotentialTicketForCheckIn, TicketCheckIn
+from .models.checkin import (
+    OfflineTicketCheckIn,
+    PotentialTicketForCheckIn,
+    TicketCheckIn,
+)
 from .models.ticket import TicketCode, TicketID
 
 
@@ -44,14 +51,8 @@ def check_in_user(
         if used_by is None:
             return Err(UserIdUnknownError(f"Unknown user ID '{used_by_id}'"))
 
-    potential_ticket_for_check_in = PotentialTicketForCheckIn(
-        id=db_ticket.id,
-        party_id=db_ticket.party_id,
-        code=TicketCode(db_ticket.code),
-        occupied_seat_id=db_ticket.occupied_seat_id,
-        used_by=used_by,
-        revoked=db_ticket.revoked,
-        user_checked_in=db_ticket.user_checked_in,
+    potential_ticket_for_check_in = _to_potential_ticket_for_check_in(
+        db_ticket, used_by
     )
 
     check_in_result = ticket_domain_service.check_in_user(
@@ -70,16 +71,132 @@ def check_in_user(
             return Err(e)
 
 
+def check_in_users_offline(
+    party_id: PartyID,
+    check_ins: Sequence[OfflineTicketCheckIn],
+    initiator: User,
+) -> list[Result[TicketCheckedInEvent, TicketingError]]:
+    """Record check-ins that scanners have done while offline.
+
+    Each check-in is validated against the current state of its ticket
+    (as well as the check-ins before it), and is recorded with the time
+    it occurred on the scanner. Check-ins with tickets that have been
+    used to check in a user in the meantime result in a
+    `UserAlreadyCheckedInError`.
+
+    Return a result for each check-in, in the same order.
+    """
+    ticket_codes = {check_in.ticket_code for check_in in check_ins}
+
+    db_tickets_by_code = {
+        db_ticket.code: db_ticket
+        for db_ticket in db.session.scalars(
+            select(DbTicket)
+            .filter_by(party_id=party_id)
+            .filter(DbTicket.code.in_(ticket_codes))
+            .with_for_update()
+        ).all()
+    }
+
+    users_by_id = user_service.get_users_indexed_by_id(
+        {
+            db_ticket.used_by_id
+            for db_ticket in db_tickets_by_code.values()
+            if db_ticket.used_by_id is not None
+        }
+    )
+
+    results: list[Result[TicketCheckedInEvent, TicketingError]] = [
+        _check_in_user_offline(
+            party_id, db_tickets_by_code, users_by_id, check_in, initiator
+        )
+        for check_in in check_ins
+    ]
+
+    db.session.commit()
+
+    return results
+
+
+def _check_in_user_offline(
+    party_id: PartyID,
+    db_tickets_by_code: dict[str, DbTicket],
+    users_by_id: dict[UserID, User],
+    check_in: OfflineTicketCheckIn,
+    initiator: User,
+) -> Result[TicketCheckedInEvent, TicketingError]:
+    db_ticket = db_tickets_by_code.get(check_in.ticket_code)
+    if db_ticket is None:
+        return Err(
+            TicketCodeUnknownError(
+                f"Unknown ticket code '{check_in.ticket_code}'"
+            )
+        )
+
+    used_by_id = db_ticket.used_by_id
+    if used_by_id is None:
+        used_by = None
+    else:
+        used_by = users_by_id.get(used_by_id)
+        if used_by is None:
+            return Err(UserIdUnknownError(f"Unknown user ID '{used_by_id}'"))
+
+    potential_ticket_for_check_in = _to_potential_ticket_for_check_in(
+        db_ticket, used_by
+    )
+
+    check_in_result = ticket_domain_service.check_in_user(
+        party_id,
+        potential_ticket_for_check_in,
+        initiator,
+        occurred_at=check_in.occurred_at,
+    )
+
+    if check_in_result.is_err():
+        return Err(check_in_result.unwrap_err())
+
+    _, event, log_entry = check_in_result.unwrap()
+
+    match _add_check_in(db_ticket, event, log_entry):
+        case Ok(_):
+            return Ok(event)
+        case Err(e):
+            return Err(e)
+
+
+def _to_potential_ticket_for_check_in(
+    db_ticket: DbTicket, used_by: User | None
+) -> PotentialTicketForCheckIn:
+    return PotentialTicketForCheckIn(
+        id=db_ticket.id,
+        party_id=db_ticket.party_id,
+        code=TicketCode(db_ticket.code),
+        occupied_seat_id=db_ticket.occupied_seat_id,
+        used_by=used_by,
+        revoked=db_ticket.revoked,
+        user_checked_in=db_ticket.user_checked_in,
+    )
+
+
 def _persist_check_in(
     db_ticket: DbTicket,
     check_in: TicketCheckIn,
     event: TicketCheckedInEvent,
     log_entry: TicketLogEntry,
 ) -> Result[None, InitiatorNotSpecifiedError]:
-    db_ticket.user_checked_in = True
+    result = _add_check_in(db_ticket, event, log_entry)
 
-    check_in_id = generate_uuid7()
+    if result.is_ok():
+        db.session.commit()
+
+    return result
 
+
+def _add_check_in(
+    db_ticket: DbTicket,
+    event: TicketCheckedInEvent,
+    log_entry: TicketLogEntry,
+) -> Result[None, InitiatorNotSpecifiedError]:
     if not event.initiator:
         return Err(
             InitiatorNotSpecifiedError(
@@ -87,6 +204,9 @@ def _persist_check_in(
             )
         )
 
+    db_ticket.user_checked_in = True
+
+    check_in_id = generate_uuid7()
     initiator_id = event.initiator.id
 
     db_check_in = DbTicketCheckIn(
@@ -97,8 +217,6 @@ def _persist_check_in(
     db_log_entry = ticket_log_service.to_db_entry(log_entry)
     db.session.add(db_log_entry)
 
-    db.session.commit()
-
     return Ok(None)
 
 
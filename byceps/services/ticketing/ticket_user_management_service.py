@@ -10,7 +10,7 @@ from byceps.database import db
 from byceps.services.user.models import User
 from byceps.util.result import Err, Ok, Result
 
-from . import ticket_service
+from . import ticket_checkin_search_service, ticket_service
 from .errors import (
     TicketingError,
     TicketIsRevokedError,
@@ -96,6 +96,8 @@ def appoint_user(
 
     db_ticket.used_by_id = user.id
 
+    ticket_checkin_search_service.update_terms_for_tickets([db_ticket.id])
+
     log_entry = ticket_log_domain_service.build_user_appointed_entry(
         db_ticket.id, user, initiator
     )
@@ -127,6 +129,8 @@ def withdraw_user(
 
     db_ticket.used_by_id = None
 
+    ticket_checkin_search_service.update_terms_for_tickets([db_ticket.id])
+
     log_entry = ticket_log_domain_service.build_user_withdrawn_entry(
         db_ticket.id, initiator
     )
@@ -8,12 +8,14 @@ byceps.services.user.blueprints.admin.service
 
 from collections import defaultdict
 from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 from operator import attrgetter
 from typing import Any
 from uuid import UUID
 
 from flask_babel import gettext
 
+from byceps.database import Pagination, to_pagination
 from byceps.services.consent import consent_service, consent_subject_service
 from byceps.services.newsletter import newsletter_service
 from byceps.services.newsletter.models import List as NewsletterList
@@ -22,6 +24,7 @@ from byceps.services.party.models import Party, PartyID
 from byceps.services.shop.order import order_service
 from byceps.services.shop.order.log import order_log_service
 from byceps.services.site import site_service
+from byceps.services.site.models import Site, SiteID
 from byceps.services.ticketing import ticket_attendance_service, ticket_service
 from byceps.services.ticketing.dbmodels.ticket import DbTicket
 from byceps.services.user import user_service
@@ -30,6 +33,7 @@ from byceps.services.user.log import user_log_service
 from byceps.services.user.log.models import UserLogEntry, UserLogEntryData
 from byceps.services.user.models import User, UserDetailDifference, UserID
 from byceps.services.user_badge import user_badge_service
+from byceps.services.user_badge.models import Badge, BadgeID
 
 
 def get_parties_and_tickets(
@@ -87,10 +91,50 @@ def get_newsletter_subscription_states(
         yield list_, is_subscribed
 
 
-def get_log_entries(user: User) -> Iterator[UserLogEntryData]:
-    log_entries = _collect_log_entries(user)
+LOGIN_EVENT_TYPES = frozenset(
+    ['user-logged-in', 'user-logged-in-to-admin', 'user-logged-in-to-site']
+)
 
-    users_by_id = _get_users_indexed_by_id(log_entries)
+
+def get_log_entries_paginated(
+    user: User, page: int, per_page: int, *, include_logins: bool = True
+) -> Pagination:
+    """Return one page of the user's log entries, newest first."""
+    excluded_event_types = frozenset() if include_logins else LOGIN_EVENT_TYPES
+
+    # The newest entries of the combined sources are among the newest
+    # entries of each source, so only that many entries have to be
+    # fetched from the (potentially large) user log.
+    db_log_entries = user_log_service.get_latest_entries_for_user(
+        user.id, page * per_page, excluded_event_types=excluded_event_types
+    )
+    db_log_entry_total = user_log_service.count_entries_for_user(
+        user.id, excluded_event_types=excluded_event_types
+    )
+
+    volatile_log_entries = list(_collect_volatile_log_entries(user))
+
+    log_entries = db_log_entries + volatile_log_entries
+    log_entries.sort(key=attrgetter('occurred_at'), reverse=True)
+
+    offset = (page - 1) * per_page
+    log_entries_on_page = log_entries[offset : offset + per_page]
+
+    items = list(_enrich_log_entries(log_entries_on_page))
+    total = db_log_entry_total + len(volatile_log_entries)
+
+    return to_pagination(items, total, page, per_page)
+
+
+def _enrich_log_entries(
+    log_entries: list[UserLogEntry],
+) -> Iterator[UserLogEntryData]:
+    """Add data from referenced objects to the log entries.
+
+    Referenced objects are collected from all entries first so that
+    each kind of object can be loaded with a single query.
+    """
+    references = _load_references(log_entries)
 
     for entry in log_entries:
         data = {
@@ -99,19 +143,17 @@ def get_log_entries(user: User) -> Iterator[UserLogEntryData]:
             'data': entry.data,
         }
 
-        additional_data = _get_additional_data(entry, users_by_id)
+        additional_data = _get_additional_data(entry, references)
         data.update(additional_data)
 
         yield data
 
 
-def _collect_log_entries(user: User) -> list[UserLogEntry]:
-    log_entries = user_log_service.get_entries_for_user(user.id)
-    log_entries.extend(_fake_consent_log_entries(user))
-    log_entries.extend(_fake_newsletter_subscription_update_log_entries(user))
-    log_entries.extend(_get_order_log_entries(user))
-
-    return log_entries
+def _collect_volatile_log_entries(user: User) -> Iterator[UserLogEntry]:
+    """Yield log entries that are assembled from other data."""
+    yield from _fake_consent_log_entries(user)
+    yield from _fake_newsletter_subscription_update_log_entries(user)
+    yield from _get_order_log_entries(user)
 
 
 def _fake_consent_log_entries(user: User) -> Iterator[UserLogEntry]:
@@ -203,22 +245,45 @@ def _get_order_log_entries(initiator: User) -> Iterator[UserLogEntry]:
         )
 
 
-def _get_users_indexed_by_id(
-    log_entries: Iterable[UserLogEntry],
-) -> dict[UserID, User]:
-    initiator_ids = {
-        _to_user_id(entry.data['initiator_id'])
-        for entry in log_entries
-        if 'initiator_id' in entry.data
-    }
+@dataclass(frozen=True, kw_only=True)
+class _References:
+    badges_by_id: dict[str, Badge]
+    sites_by_id: dict[SiteID, Site]
+    users_by_id: dict[UserID, User]
+
+
+def _load_references(log_entries: Iterable[UserLogEntry]) -> _References:
+    badge_ids: set[BadgeID] = set()
+    site_ids: set[SiteID] = set()
+    user_ids: set[UserID] = set()
+
+    for entry in log_entries:
+        if entry.event_type == 'user-badge-awarded':
+            badge_ids.add(BadgeID(UUID(entry.data['badge_id'])))
+
+        if entry.event_type in {'user-logged-in', 'user-logged-in-to-site'}:
+            site_id = entry.data.get('site_id')
+            if site_id:
+                site_ids.add(site_id)
+
+        if 'initiator_id' in entry.data:
+            user_ids.add(_to_user_id(entry.data['initiator_id']))
+
+    badges = user_badge_service.get_badges(badge_ids)
+    sites = site_service.get_sites(site_ids)
+    users_by_id = user_service.get_users_indexed_by_id(
+        user_ids, include_avatars=True
+    )
 
-    return user_service.get_users_indexed_by_id(
-        initiator_ids, include_avatars=True
+    return _References(
+        badges_by_id={str(badge.id): badge for badge in badges},
+        sites_by_id={site.id: site for site in sites},
+        users_by_id=users_by_id,
     )
 
 
 def _get_additional_data(
-    log_entry: UserLogEntry, users_by_id: dict[UserID, User]
+    log_entry: UserLogEntry, references: _References
 ) -> Iterator[tuple[str, Any]]:
     if log_entry.event_type in {
         'user-avatar-removed',
@@ -248,7 +313,7 @@ def _get_additional_data(
         'user-badge-awarded',
     }:
         yield from _get_additional_data_for_user_initiated_log_entry(
-            log_entry, users_by_id
+            log_entry, references.users_by_id
         )
 
     if log_entry.event_type in {'user-avatar-removed', 'user-avatar-updated'}:
@@ -256,7 +321,7 @@ def _get_additional_data(
         yield 'url_path', url_path
 
     if log_entry.event_type == 'user-badge-awarded':
-        badge = user_badge_service.find_badge(log_entry.data['badge_id'])
+        badge = references.badges_by_id.get(log_entry.data['badge_id'])
         yield 'badge', badge
 
     if log_entry.event_type == 'user-details-updated':
@@ -294,19 +359,13 @@ def _get_additional_data(
         }
         yield 'details', details
 
-    if log_entry.event_type == 'user-logged-in':
+    if log_entry.event_type in {'user-logged-in', 'user-logged-in-to-site'}:
         site_id = log_entry.data.get('site_id')
         if site_id:
-            site = site_service.find_site(site_id)
+            site = references.sites_by_id.get(site_id)
             if site is not None:
                 yield 'site', site
 
-    if log_entry.event_type == 'user-logged-in-to-site':
-        site_id = log_entry.data.get('site_id')
-        site = site_service.find_site(site_id)
-        if site is not None:
-            yield 'site', site
-
 
 def _get_additional_data_for_user_initiated_log_entry(
     log_entry: UserLogEntry, users_by_id: dict[UserID, User]
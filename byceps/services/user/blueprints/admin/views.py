@@ -844,32 +844,30 @@ def role_deassign(user_id, role_id):
 # events
 
 
-LOGIN_EVENT_TYPES = frozenset(
-    ['user-logged-in', 'user-logged-in-to-admin', 'user-logged-in-to-site']
-)
+EVENTS_MAX_PER_PAGE = 100
 
 
-@blueprint.get('/<uuid:user_id>/events')
+@blueprint.get('/<uuid:user_id>/events', defaults={'page': 1})
+@blueprint.get('/<uuid:user_id>/events/pages/<int:page>')
 @permission_required('user.view')
 @templated
-def view_events(user_id):
+def view_events(user_id, page):
     """Show user's events."""
     user = _get_user_for_admin_or_404(user_id)
 
-    log_entries = list(service.get_log_entries(user))
-
+    per_page = request.args.get('per_page', type=int, default=100)
+    per_page = max(1, min(per_page, EVENTS_MAX_PER_PAGE))
     include_logins = request.args.get('include_logins', default='yes') == 'yes'
-    if not include_logins:
-        log_entries = [
-            entry
-            for entry in log_entries
-            if entry['event_type'] not in LOGIN_EVENT_TYPES
-        ]
+
+    log_entries = service.get_log_entries_paginated(
+        user, page, per_page, include_logins=include_logins
+    )
 
     return {
         'profile_user': user,
         'user': user,
         'log_entries': log_entries,
+        'per_page': per_page,
         'logins_included': include_logins,
     }
 
@@ -22,6 +22,13 @@ class DbUserLogEntry(db.Model):
     """A log entry regarding a user."""
 
     __tablename__ = 'user_log_entries'
+    __table_args__ = (
+        db.Index(
+            'ix_user_log_entries_event_type_occurred_at',
+            'event_type',
+            'occurred_at',
+        ),
+    )
 
     id: Mapped[UUID] = mapped_column(db.Uuid, primary_key=True)
     occurred_at: Mapped[datetime]
@@ -51,3 +58,20 @@ class DbUserLogEntry(db.Model):
         self.user_id = user_id
         self.initiator_id = initiator_id
         self.data = data
+
+
+class DbArchivedUserLogEntry(db.Model):
+    """A log entry regarding a user that has been moved out of the
+    main user log according to a retention policy.
+
+    Without foreign key constraints to keep archiving cheap.
+    """
+
+    __tablename__ = 'user_log_entries_archive'
+
+    id: Mapped[UUID] = mapped_column(db.Uuid, primary_key=True)
+    occurred_at: Mapped[datetime] = mapped_column(index=True)
+    event_type: Mapped[str] = mapped_column(db.UnicodeText)
+    user_id: Mapped[UserID] = mapped_column(db.Uuid, index=True)
+    initiator_id: Mapped[UserID | None] = mapped_column(db.Uuid)
+    data: Mapped[UserLogEntryData] = mapped_column(db.JSONB)
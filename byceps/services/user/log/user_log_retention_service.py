@@ -0,0 +1,177 @@
+"""
+byceps.services.user.log.user_log_retention_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Apply retention policies to the user log: move old log entries of
+specific event types to an archive table, or delete them.
+
+Login records (which share their ID with the login's log entry) are
+deleted together with the log entries they belong to, so a policy for
+login events also removes the IP addresses stored with them.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime, timedelta
+from typing import cast
+from uuid import UUID
+
+from sqlalchemy import CursorResult, delete, select
+from sqlalchemy.dialects.postgresql import insert
+
+from byceps.config.models import UserLogRetentionPolicyConfig
+from byceps.database import db
+from byceps.services.authn.session.authn_session_repository import (
+    LOGIN_EVENT_TYPES,
+)
+from byceps.services.authn.session.dbmodels import DbLogin
+
+from .dbmodels import DbArchivedUserLogEntry, DbUserLogEntry
+
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+_COLUMN_NAMES = [
+    'id',
+    'occurred_at',
+    'event_type',
+    'user_id',
+    'initiator_id',
+    'data',
+]
+
+
+def apply_retention_policies(
+    policies: Iterable[UserLogRetentionPolicyConfig],
+    *,
+    now: datetime | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[tuple[UserLogRetentionPolicyConfig, int]]:
+    """Archive or delete log entries according to the policies.
+
+    Yield each policy with the number of log entries it affected.
+    """
+    if now is None:
+        now = datetime.utcnow()
+
+    for policy in policies:
+        occurred_before = now - timedelta(days=policy.max_age_in_days)
+
+        if policy.archive:
+            num_affected = archive_entries(
+                policy.event_type, occurred_before, chunk_size=chunk_size
+            )
+        else:
+            num_affected = delete_entries(
+                policy.event_type, occurred_before, chunk_size=chunk_size
+            )
+
+        yield policy, num_affected
+
+
+def archive_entries(
+    event_type: str,
+    occurred_before: datetime,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """Move log entries of that type which occurred before the given
+    date to the archive, in chunks.
+
+    Each chunk is deleted from the user log and inserted into the
+    archive with a single statement, and committed separately.
+
+    Return the number of archived log entries.
+    """
+    num_archived_total = 0
+
+    while True:
+        entry_ids = _get_entry_ids(event_type, occurred_before, chunk_size)
+        if not entry_ids:
+            return num_archived_total
+
+        _delete_logins(event_type, entry_ids)
+
+        moved_entries = (
+            delete(DbUserLogEntry.__table__)
+            .where(DbUserLogEntry.id.in_(entry_ids))
+            .returning(
+                *[DbUserLogEntry.__table__.c[name] for name in _COLUMN_NAMES]
+            )
+            .cte('moved_entries')
+        )
+
+        stmt = (
+            insert(DbArchivedUserLogEntry)
+            .from_select(_COLUMN_NAMES, select(moved_entries))
+            .returning(DbArchivedUserLogEntry.id)
+        )
+
+        archived_ids = db.session.scalars(stmt).all()
+        db.session.commit()
+
+        num_archived_total += len(archived_ids)
+
+        if len(entry_ids) < chunk_size:
+            return num_archived_total
+
+
+def delete_entries(
+    event_type: str,
+    occurred_before: datetime,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """Delete log entries of that type which occurred before the given
+    date, in chunks.
+
+    Each chunk is committed separately.
+
+    Return the number of deleted log entries.
+    """
+    num_deleted_total = 0
+
+    while True:
+        entry_ids = _get_entry_ids(event_type, occurred_before, chunk_size)
+        if not entry_ids:
+            return num_deleted_total
+
+        _delete_logins(event_type, entry_ids)
+
+        result = cast(
+            CursorResult,
+            db.session.execute(
+                delete(DbUserLogEntry).where(DbUserLogEntry.id.in_(entry_ids))
+            ),
+        )
+        db.session.commit()
+
+        num_deleted_total += result.rowcount
+
+        if len(entry_ids) < chunk_size:
+            return num_deleted_total
+
+
+def _get_entry_ids(
+    event_type: str, occurred_before: datetime, limit: int
+) -> Sequence[UUID]:
+    return db.session.scalars(
+        select(DbUserLogEntry.id)
+        .filter_by(event_type=event_type)
+        .filter(DbUserLogEntry.occurred_at < occurred_before)
+        .limit(limit)
+    ).all()
+
+
+def _delete_logins(event_type: str, entry_ids: Sequence[UUID]) -> None:
+    """Delete the login records that belong to the log entries.
+
+    Does not commit.
+    """
+    if event_type not in LOGIN_EVENT_TYPES:
+        return
+
+    db.session.execute(delete(DbLogin).where(DbLogin.id.in_(entry_ids)))
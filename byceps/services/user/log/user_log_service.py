@@ -68,6 +68,48 @@ def get_entries_of_type_for_user(
     return [_db_entity_to_entry(db_entry) for db_entry in db_entries]
 
 
+def get_latest_entries_for_user(
+    user_id: UserID,
+    limit: int,
+    *,
+    excluded_event_types: frozenset[str] = frozenset(),
+) -> list[UserLogEntry]:
+    """Return the latest log entries for that user, newest first."""
+    stmt = (
+        select(DbUserLogEntry)
+        .options(
+            db.joinedload(DbUserLogEntry.user),
+            db.joinedload(DbUserLogEntry.initiator),
+        )
+        .filter_by(user_id=user_id)
+    )
+
+    if excluded_event_types:
+        stmt = stmt.filter(
+            DbUserLogEntry.event_type.not_in(excluded_event_types)
+        )
+
+    db_entries = db.session.scalars(
+        stmt.order_by(DbUserLogEntry.occurred_at.desc()).limit(limit)
+    ).all()
+
+    return [_db_entity_to_entry(db_entry) for db_entry in db_entries]
+
+
+def count_entries_for_user(
+    user_id: UserID, *, excluded_event_types: frozenset[str] = frozenset()
+) -> int:
+    """Return the number of log entries for that user."""
+    stmt = select(db.func.count(DbUserLogEntry.id)).filter_by(user_id=user_id)
+
+    if excluded_event_types:
+        stmt = stmt.filter(
+            DbUserLogEntry.event_type.not_in(excluded_event_types)
+        )
+
+    return db.session.scalar(stmt) or 0
+
+
 def _db_entity_to_entry(db_entry: DbUserLogEntry) -> UserLogEntry:
     return UserLogEntry(
         id=db_entry.id,
@@ -6,17 +6,40 @@ byceps.services.user.user_import_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from collections.abc import Iterator
-from datetime import date
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime
 from io import TextIOBase
+from itertools import batched
 import json
 import secrets
+from typing import Self
 
 from pydantic import BaseModel, ValidationError
 from secret_type import secret
+import structlog
 
-from . import user_creation_service
-from .models import User
+from byceps.database import db, insert_many
+from byceps.services.authn.password import authn_password_domain_service
+from byceps.services.authn.password.dbmodels import DbCredential
+from byceps.services.user.log.dbmodels import DbUserLogEntry
+from byceps.services.user.log.models import UserLogEntry
+from byceps.util.result import Err, Ok, Result
+
+from . import (
+    user_creation_domain_service,
+    user_creation_service,
+    user_repository,
+)
+from .dbmodels import DbUser, DbUserDetail
+from .models import User, UserID
+
+
+log = structlog.get_logger()
+
+
+DEFAULT_BATCH_SIZE = 500
 
 
 class UserToImport(BaseModel):
@@ -34,6 +57,21 @@ class UserToImport(BaseModel):
     internal_comment: str | None = None
 
 
+@dataclass(frozen=True, kw_only=True)
+class UserImportBatchResult:
+    imported: list[tuple[int, User]]
+    failed: list[tuple[int, str]]
+
+
+@dataclass(frozen=True, kw_only=True)
+class _PreparedAccount:
+    line_number: int
+    user: User
+    email_address: str | None
+    log_entry: UserLogEntry
+    user_to_import: UserToImport
+
+
 def parse_lines(lines: TextIOBase) -> Iterator[str]:
     for line in lines:
         yield line.strip()
@@ -69,3 +107,239 @@ def import_user(user_to_import: UserToImport) -> User:
     ).unwrap()
 
     return user
+
+
+def import_users_in_batches(
+    line_numbers_and_users_to_import: Iterable[tuple[int, UserToImport]],
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_hashing_workers: int | None = None,
+) -> Iterator[UserImportBatchResult]:
+    """Import users in batches, one transaction per batch.
+
+    Screen names and email addresses are checked against an in-memory
+    index of the ones already assigned, which is loaded once upfront
+    and also catches duplicates within the imported data. Users that
+    are already assigned are skipped, so an interrupted import can be
+    run again with the same data.
+
+    Password hashes are generated in parallel by a pool of worker
+    processes.
+    """
+    index = _AssignedIdentifierIndex.load()
+
+    with ProcessPoolExecutor(max_workers=max_hashing_workers) as executor:
+        for batch in batched(line_numbers_and_users_to_import, batch_size):
+            yield _import_batch(batch, index, executor)
+
+
+class _AssignedIdentifierIndex:
+    """Lowercased screen names and email addresses that are assigned."""
+
+    def __init__(
+        self, screen_names: set[str], email_addresses: set[str]
+    ) -> None:
+        self._screen_names = screen_names
+        self._email_addresses = email_addresses
+
+    @classmethod
+    def load(cls) -> Self:
+        screen_names, email_addresses = (
+            user_repository.get_assigned_screen_names_and_email_addresses()
+        )
+        return cls(screen_names, email_addresses)
+
+    def reserve(
+        self, screen_name: str | None, email_address: str | None
+    ) -> Result[None, str]:
+        if screen_name is not None:
+            if screen_name.lower() in self._screen_names:
+                return Err(f'Screen name "{screen_name}" is already assigned.')
+
+        if email_address is not None:
+            if email_address.lower() in self._email_addresses:
+                return Err(
+                    f'Email address "{email_address}" is already assigned.'
+                )
+
+        if screen_name is not None:
+            self._screen_names.add(screen_name.lower())
+
+        if email_address is not None:
+            self._email_addresses.add(email_address.lower())
+
+        return Ok(None)
+
+    def release(
+        self, screen_name: str | None, email_address: str | None
+    ) -> None:
+        if screen_name is not None:
+            self._screen_names.discard(screen_name.lower())
+
+        if email_address is not None:
+            self._email_addresses.discard(email_address.lower())
+
+
+def _import_batch(
+    batch: tuple[tuple[int, UserToImport], ...],
+    index: _AssignedIdentifierIndex,
+    executor: Executor,
+) -> UserImportBatchResult:
+    accounts = []
+    failed = []
+
+    for line_number, user_to_import in batch:
+        match _prepare_account(line_number, user_to_import, index):
+            case Ok(account):
+                accounts.append(account)
+            case Err(reason):
+                failed.append((line_number, reason))
+
+    if not accounts:
+        return UserImportBatchResult(imported=[], failed=failed)
+
+    password_hash_futures = [
+        executor.submit(_generate_random_password_hash, account.user.id)
+        for account in accounts
+    ]
+    password_hashes = [future.result() for future in password_hash_futures]
+
+    try:
+        _insert_accounts(accounts, password_hashes)
+        db.session.commit()
+    except Exception as exc:
+        log.error('User import batch failed', exc_info=exc)
+        db.session.rollback()
+
+        for account in accounts:
+            index.release(account.user.screen_name, account.email_address)
+            failed.append((account.line_number, f'Batch failed: {exc}'))
+
+        return UserImportBatchResult(imported=[], failed=failed)
+
+    imported = [(account.line_number, account.user) for account in accounts]
+
+    return UserImportBatchResult(imported=imported, failed=failed)
+
+
+def _prepare_account(
+    line_number: int,
+    user_to_import: UserToImport,
+    index: _AssignedIdentifierIndex,
+) -> Result[_PreparedAccount, str]:
+    creation_result = user_creation_domain_service.create_account(
+        user_to_import.screen_name,
+        user_to_import.email_address,
+        creation_method='import',
+    )
+    if creation_result.is_err():
+        error = creation_result.unwrap_err()
+        return Err(f'Invalid value "{error.value}".')
+
+    user, email_address, _, log_entry = creation_result.unwrap()
+
+    reservation_result = index.reserve(user.screen_name, email_address)
+    if reservation_result.is_err():
+        return Err(reservation_result.unwrap_err())
+
+    return Ok(
+        _PreparedAccount(
+            line_number=line_number,
+            user=user,
+            email_address=email_address,
+            log_entry=log_entry,
+            user_to_import=user_to_import,
+        )
+    )
+
+
+def _generate_random_password_hash(user_id: UserID) -> tuple[str, datetime]:
+    """Generate the hash for a random password.
+
+    Meant to be run in a worker process. The hash is returned as a plain
+    string to be able to pass it back to the calling process.
+    """
+    password = secret(secrets.token_urlsafe(24))
+
+    credential = authn_password_domain_service.create_password_hash(
+        user_id, password
+    )
+
+    with credential.password_hash.dangerous_reveal() as password_hash:
+        return password_hash, credential.updated_at
+
+
+def _insert_accounts(
+    accounts: list[_PreparedAccount],
+    password_hashes: list[tuple[str, datetime]],
+) -> None:
+    """Insert users, details, credentials, and log entries with one
+    multi-row statement each.
+    """
+    insert_many(
+        DbUser.__table__,
+        [
+            {
+                'id': account.user.id,
+                'created_at': account.log_entry.occurred_at,
+                'screen_name': account.user.screen_name,
+                'email_address': account.email_address,
+                'email_address_verified': False,
+                'initialized': False,
+                'suspended': False,
+                'deleted': False,
+                'locale': None,
+                'legacy_id': account.user_to_import.legacy_id,
+            }
+            for account in accounts
+        ],
+    )
+
+    insert_many(
+        DbUserDetail.__table__,
+        [
+            {
+                'user_id': account.user.id,
+                'first_name': account.user_to_import.first_name,
+                'last_name': account.user_to_import.last_name,
+                'date_of_birth': account.user_to_import.date_of_birth,
+                'country': account.user_to_import.country,
+                'postal_code': account.user_to_import.postal_code,
+                'city': account.user_to_import.city,
+                'street': account.user_to_import.street,
+                'phone_number': account.user_to_import.phone_number,
+                'internal_comment': account.user_to_import.internal_comment,
+                'extras': None,
+            }
+            for account in accounts
+        ],
+    )
+
+    insert_many(
+        DbCredential.__table__,
+        [
+            {
+                'user_id': account.user.id,
+                'password_hash': password_hash,
+                'updated_at': updated_at,
+            }
+            for account, (password_hash, updated_at) in zip(
+                accounts, password_hashes, strict=True
+            )
+        ],
+    )
+
+    insert_many(
+        DbUserLogEntry.__table__,
+        [
+            {
+                'id': account.log_entry.id,
+                'occurred_at': account.log_entry.occurred_at,
+                'event_type': account.log_entry.event_type,
+                'user_id': account.user.id,
+                'initiator_id': None,
+                'data': account.log_entry.data,
+            }
+            for account in accounts
+        ],
+    )
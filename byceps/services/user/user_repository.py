@@ -535,6 +535,29 @@ def is_email_address_already_assigned(email_address: str) -> bool:
     return _do_users_matching_filter_exist(DbUser.email_address, email_address)
 
 
+def get_assigned_screen_names_and_email_addresses() -> tuple[
+    set[str], set[str]
+]:
+    """Return all assigned screen names and email addresses, lowercased."""
+    rows = db.session.execute(
+        select(
+            db.func.lower(DbUser.screen_name),
+            db.func.lower(DbUser.email_address),
+        )
+    ).tuples()
+
+    screen_names = set()
+    email_addresses = set()
+
+    for screen_name, email_address in rows:
+        if screen_name is not None:
+            screen_names.add(screen_name)
+        if email_address is not None:
+            email_addresses.add(email_address)
+
+    return screen_names, email_addresses
+
+
 def _do_users_matching_filter_exist(
     model_attribute: str, search_value: str
 ) -> bool:
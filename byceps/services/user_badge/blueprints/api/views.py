@@ -6,7 +6,10 @@ byceps.services.user_badge.blueprints.api.views
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from flask import abort, request
+from itertools import batched
+from typing import Any
+
+from flask import abort, jsonify, request
 from pydantic import ValidationError
 
 from byceps.services.user import user_service
@@ -18,7 +21,11 @@ from byceps.services.user_badge import (
 )
 from byceps.util.framework.blueprint import create_blueprint
 from byceps.util.result import Err, Ok
-from byceps.util.views import api_token_required, respond_no_content
+from byceps.util.views import (
+    api_token_required,
+    get_request_items,
+    respond_no_content,
+)
 
 from .models import AwardBadgeToUserRequest
 
@@ -26,6 +33,11 @@ from .models import AwardBadgeToUserRequest
 blueprint = create_blueprint('user_badge_api', __name__)
 
 
+# Number of items of a batch request to process at once
+BATCH_CHUNK_SIZE = 1_000
+BATCH_MAX_ITEMS = 10_000
+
+
 @blueprint.post('/awardings')
 @api_token_required
 @respond_no_content
@@ -60,3 +72,85 @@ def award_badge_to_user():
             user_badge_signals.user_badge_awarded.send(None, event=event)
         case Err(e):
             return Err(e)
+
+
+@blueprint.post('/awardings/batch')
+@api_token_required
+def award_badges_to_users():
+    """Award badges to users.
+
+    Accept a JSON array or newline-delimited JSON of awardings, and
+    return a result for each.
+    """
+    reqs = get_request_items(AwardBadgeToUserRequest, max_items=BATCH_MAX_ITEMS)
+
+    results = []
+    for chunk in batched(reqs, BATCH_CHUNK_SIZE):
+        results.extend(_award_badges_to_users(chunk))
+
+    return jsonify({'results': results})
+
+
+def _award_badges_to_users(
+    reqs: tuple[AwardBadgeToUserRequest, ...],
+) -> list[dict[str, Any]]:
+    slugs = {req.badge_slug for req in reqs}
+    badges_by_slug = {
+        badge.slug: badge
+        for badge in user_badge_service.get_badges_by_slugs(slugs)
+    }
+
+    user_ids = {UserID(req.awardee_id) for req in reqs} | {
+        UserID(req.initiator_id) for req in reqs
+    }
+    users_by_id = user_service.get_users_indexed_by_id(user_ids)
+
+    results: list[dict[str, Any]] = []
+    awardings = []
+    result_indexes = []
+
+    for req in reqs:
+        result: dict[str, Any] = {
+            'badge_slug': req.badge_slug,
+            'awardee_id': str(req.awardee_id),
+        }
+        results.append(result)
+
+        badge = badges_by_slug.get(req.badge_slug)
+        awardee = users_by_id.get(UserID(req.awardee_id))
+        initiator = users_by_id.get(UserID(req.initiator_id))
+
+        if not badge:
+            error = 'Badge slug unknown'
+        elif not awardee:
+            error = 'Awardee ID unknown'
+        elif not initiator:
+            error = 'Initiator ID unknown'
+        else:
+            awardings.append((badge, awardee, initiator))
+            result_indexes.append(len(results) - 1)
+            continue
+
+        result['status'] = 'rejected'
+        result['error'] = error
+
+    awarding_results = (
+        user_badge_awarding_service.award_badges_to_users_individually(
+            awardings
+        )
+    )
+
+    for result_index, awarding_result in zip(
+        result_indexes, awarding_results, strict=True
+    ):
+        result = results[result_index]
+        match awarding_result:
+            case Ok((awarding, event)):
+                user_badge_signals.user_badge_awarded.send(None, event=event)
+                result['status'] = 'awarded'
+                result['awarding_id'] = str(awarding.id)
+            case Err(e):
+                result['status'] = 'rejected'
+                result['error'] = e.message
+
+    return results
@@ -7,6 +7,7 @@ byceps.services.user_badge.user_badge_awarding_service
 """
 
 from collections import defaultdict
+from collections.abc import Sequence
 
 from sqlalchemy import select
 import structlog
@@ -63,10 +64,100 @@ def award_badge_to_user(
     return Ok((awarding, event))
 
 
+def award_badges_to_users(
+    badges_and_awardees: Sequence[tuple[Badge, User]],
+    *,
+    initiator: User | None = None,
+) -> Result[
+    list[tuple[BadgeAwarding, UserBadgeAwardedEvent]], BadgeAwardingFailedError
+]:
+    """Award each badge to its user, in a single transaction.
+
+    If any of the awardings fails, none of them is persisted.
+    """
+    awardings_and_events = []
+    awardings_and_log_entries = []
+
+    for badge, awardee in badges_and_awardees:
+        awarding_result = user_badge_domain_service.award_badge(
+            badge, awardee, initiator=initiator
+        )
+
+        match awarding_result:
+            case Err(e):
+                log.error(
+                    'User badge awarding failed',
+                    badge_id=str(badge.id),
+                    badge_label=badge.label,
+                    awardee_id=str(awardee.id),
+                    awardee_screen_name=awardee.screen_name,
+                    initiator=initiator.screen_name if initiator else None,
+                    error_details=e.message,
+                )
+                return Err(e)
+
+        awarding, event, log_entry = awarding_result.unwrap()
+
+        awardings_and_events.append((awarding, event))
+        awardings_and_log_entries.append((awarding, log_entry))
+
+    for awarding, log_entry in awardings_and_log_entries:
+        _add_awarding(awarding, log_entry)
+
+    db.session.commit()
+
+    return Ok(awardings_and_events)
+
+
+def award_badges_to_users_individually(
+    awardings: Sequence[tuple[Badge, User, User | None]],
+) -> list[
+    Result[
+        tuple[BadgeAwarding, UserBadgeAwardedEvent], BadgeAwardingFailedError
+    ]
+]:
+    """Award each badge to its user (on behalf of the initiator, if
+    given), in a single transaction.
+
+    Unlike with `award_badges_to_users`, awardings that fail do not
+    prevent the others.
+
+    Return a result for each awarding, in the same order.
+    """
+    results: list[
+        Result[
+            tuple[BadgeAwarding, UserBadgeAwardedEvent],
+            BadgeAwardingFailedError,
+        ]
+    ] = []
+
+    for badge, awardee, initiator in awardings:
+        awarding_result = user_badge_domain_service.award_badge(
+            badge, awardee, initiator=initiator
+        )
+
+        match awarding_result:
+            case Ok((awarding, event, log_entry)):
+                _add_awarding(awarding, log_entry)
+                results.append(Ok((awarding, event)))
+            case Err(e):
+                results.append(Err(e))
+
+    db.session.commit()
+
+    return results
+
+
 def _persist_awarding(
     awarding: BadgeAwarding,
     log_entry: UserLogEntry,
 ) -> None:
+    _add_awarding(awarding, log_entry)
+
+    db.session.commit()
+
+
+def _add_awarding(awarding: BadgeAwarding, log_entry: UserLogEntry) -> None:
     db_awarding = DbBadgeAwarding(
         awarding.id, awarding.badge_id, awarding.awardee_id, awarding.awarded_at
     )
@@ -75,8 +166,6 @@ def _persist_awarding(
     db_log_entry = user_log_service.to_db_entry(log_entry)
     db.session.add(db_log_entry)
 
-    db.session.commit()
-
 
 def count_awardings() -> dict[BadgeID, int]:
     """Return the number of times each badge has been awarded.
@@ -128,6 +128,18 @@ def get_badges(
     return {_db_entity_to_badge(db_badge) for db_badge in db_badges}
 
 
+def get_badges_by_slugs(slugs: set[str]) -> set[Badge]:
+    """Return the badges with those slugs."""
+    if not slugs:
+        return set()
+
+    db_badges = db.session.scalars(
+        select(DbBadge).filter(DbBadge.slug.in_(slugs))
+    ).all()
+
+    return {_db_entity_to_badge(db_badge) for db_badge in db_badges}
+
+
 def get_all_badges() -> set[Badge]:
     """Return all badges."""
     db_badges = db.session.scalars(select(DbBadge)).all()
@@ -21,6 +21,7 @@ from flask import (
     url_for,
 )
 from flask_babel import gettext
+from pydantic import BaseModel, ValidationError
 from werkzeug.datastructures import WWWAuthenticate
 
 from byceps.services.authn.api import authn_api_service
@@ -65,6 +66,47 @@ def _get_bearer_token() -> str | None:
     return token
 
 
+def get_request_items[M: BaseModel](
+    model: type[M], *, max_items: int
+) -> list[M]:
+    """Return the items sent in the request body, validated against the
+    model.
+
+    Items are accepted either as a JSON array or, for large imports, as
+    newline-delimited JSON (one object per line). Either way, all items
+    are read and validated before being returned, so the request body is
+    limited in size (see `MAX_CONTENT_LENGTH`), and requests with more
+    than `max_items` items are rejected.
+    """
+    try:
+        if request.mimetype == 'application/x-ndjson':
+            items: list[M] = []
+            for line in request.stream:
+                if not line.strip():
+                    continue
+
+                if len(items) == max_items:
+                    abort(413, f'At most {max_items} items are allowed.')
+
+                items.append(model.model_validate_json(line))
+
+            return items
+
+        if request.is_json:
+            data = request.get_json()
+            if not isinstance(data, list):
+                abort(400, 'A JSON array of items is expected.')
+
+            if len(data) > max_items:
+                abort(413, f'At most {max_items} items are allowed.')
+
+            return [model.model_validate(item) for item in data]
+    except ValidationError as e:
+        abort(400, e.json())
+
+    abort(415)
+
+
 def login_required(func):
     """Ensure the current user has logged in."""
 
@@ -103,6 +145,17 @@ def permission_required(permission: str):
     return decorator
 
 
+def without_request_globals(func):
+    """Skip preparing the request globals (like the current site and
+    user) for the decorated view function.
+
+    Meant for frequently requested views that must not cause database
+    queries. Such views must not depend on those globals.
+    """
+    func.without_request_globals = True
+    return func
+
+
 def create_empty_json_response(status):
     """Create a JSON response with the given status code and an empty
     object as its content.
@@ -0,0 +1,45 @@
+"""Archive or delete old user log entries according to the retention
+policies in the configuration.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import click
+
+from byceps.services.user.log import user_log_retention_service
+from byceps.byceps_app import get_current_byceps_app
+
+from _util import call_with_app_context
+
+
+@click.command()
+@click.option(
+    '--chunk-size',
+    type=click.IntRange(min=1),
+    default=user_log_retention_service.DEFAULT_CHUNK_SIZE,
+    show_default=True,
+    help='number of log entries to archive or delete per transaction',
+)
+def execute(chunk_size: int) -> None:
+    policies = (
+        get_current_byceps_app().byceps_config.user_log.retention_policies
+    )
+    if not policies:
+        click.secho('No user log retention policies configured.')
+        return
+
+    results = user_log_retention_service.apply_retention_policies(
+        policies, chunk_size=chunk_size
+    )
+
+    for policy, num_affected in results:
+        action = 'archived' if policy.archive else 'deleted'
+        click.secho(
+            f'{num_affected} "{policy.event_type}" log entries older than '
+            f'{policy.max_age_in_days} days {action}.'
+        )
+
+
+if __name__ == '__main__':
+    call_with_app_context(execute)
@@ -0,0 +1,33 @@
+"""Create login records (to look up logins by IP address) for login
+user log entries that were created before login records existed.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import click
+
+from byceps.services.authn.session import authn_session_service
+
+from _util import call_with_app_context
+
+
+@click.command()
+def execute() -> None:
+    click.secho('Creating login records from user login log entries ...')
+
+    num_created, num_skipped = (
+        authn_session_service.backfill_logins_from_log_entries()
+    )
+
+    click.secho(f'{num_created} login records created.')
+
+    if num_skipped:
+        click.secho(
+            f'{num_skipped} log entries skipped due to an invalid IP address.',
+            fg='yellow',
+        )
+
+
+if __name__ == '__main__':
+    call_with_app_context(execute)
@@ -0,0 +1,192 @@
+"""Measure how many orders per second can be placed concurrently by
+multiple processes, with order numbers reserved one at a time and in
+blocks.
+
+Each worker process has its own application and database connection,
+so contention on the order number sequence row in the database is part
+of the measurement (as are the other statements of placing an order).
+
+Temporary order number sequences are created for the storefront's shop,
+and deleted afterwards. The placed orders are kept, so only run this
+against a database with test data.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import dataclasses
+import time
+
+import click
+from dotenv import load_dotenv
+
+from byceps.application import create_cli_app
+from byceps.config.integration import (
+    read_configuration_from_file_given_in_env_var,
+)
+from byceps.services.shop.cart.models import Cart
+from byceps.services.shop.order import (
+    order_checkout_service,
+    order_sequence_service,
+)
+from byceps.services.shop.order.models.number import OrderNumberSequenceID
+from byceps.services.shop.order.models.order import Orderer
+from byceps.services.shop.product import product_service
+from byceps.services.shop.product.models import ProductID
+from byceps.services.shop.shop import shop_service
+from byceps.services.shop.storefront import storefront_service
+from byceps.services.shop.storefront.models import StorefrontID
+from byceps.services.user import user_service
+from byceps.services.user.models import UserID
+from byceps.util.uuid import generate_uuid7
+
+from _util import call_with_app_context
+
+
+@click.command()
+@click.option('--storefront-id', required=True)
+@click.option('--product-id', required=True)
+@click.option('--orderer-id', required=True, help='ID of the ordering user')
+@click.option(
+    '--workers',
+    type=click.IntRange(min=1),
+    default=8,
+    show_default=True,
+    help='Number of processes to place orders with',
+)
+@click.option(
+    '--orders',
+    type=click.IntRange(min=1),
+    default=1000,
+    show_default=True,
+    help='Number of orders to place per run',
+)
+@click.option(
+    '--block-size',
+    type=click.IntRange(min=2),
+    default=50,
+    show_default=True,
+    help='Number of order numbers to reserve at once in block mode',
+)
+def execute(
+    storefront_id,
+    product_id,
+    orderer_id,
+    workers: int,
+    orders: int,
+    block_size: int,
+):
+    storefront = storefront_service.get_storefront(storefront_id)
+    shop = shop_service.get_shop(storefront.shop_id)
+
+    for label, sequence_block_size in [
+        ('one at a time', 1),
+        (f'in blocks of {block_size}', block_size),
+    ]:
+        prefix = f'BENCH-{generate_uuid7().hex[:8]}-'
+        sequence = order_sequence_service.create_order_number_sequence(
+            shop.id, prefix, block_size=sequence_block_size
+        ).unwrap()
+
+        try:
+            elapsed = _place_orders(
+                storefront.id,
+                sequence.id,
+                product_id,
+                orderer_id,
+                workers,
+                orders,
+            )
+        finally:
+            order_sequence_service.delete_order_number_sequence(sequence.id)
+
+        click.secho(
+            f'Order numbers reserved {label}: {orders / elapsed:.1f} orders/s '
+            f'({orders} orders, {workers} processes, {elapsed:.2f} s)'
+        )
+
+
+def _place_orders(
+    storefront_id: StorefrontID,
+    sequence_id: OrderNumberSequenceID,
+    product_id: ProductID,
+    orderer_id: UserID,
+    workers: int,
+    orders: int,
+) -> float:
+    orders_per_worker = [
+        orders // workers + (1 if i < orders % workers else 0)
+        for i in range(workers)
+    ]
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker
+    ) as executor:
+        # Wait for all workers to have started (and created their
+        # application) before starting the clock.
+        list(executor.map(time.sleep, [0.5] * workers))
+
+        started_at = time.monotonic()
+        futures = [
+            executor.submit(
+                _place_orders_in_worker,
+                storefront_id,
+                sequence_id,
+                product_id,
+                orderer_id,
+                count,
+            )
+            for count in orders_per_worker
+        ]
+        for future in futures:
+            future.result()
+        return time.monotonic() - started_at
+
+
+def _init_worker() -> None:
+    load_dotenv()
+    config = read_configuration_from_file_given_in_env_var()
+    app = create_cli_app(config)
+    app.app_context().push()
+
+
+def _place_orders_in_worker(
+    storefront_id: StorefrontID,
+    sequence_id: OrderNumberSequenceID,
+    product_id: ProductID,
+    orderer_id: UserID,
+    count: int,
+) -> None:
+    storefront = dataclasses.replace(
+        storefront_service.get_storefront(storefront_id),
+        order_number_sequence_id=sequence_id,
+    )
+    product = product_service.get_product(product_id)
+    orderer = _build_orderer(orderer_id)
+
+    for _ in range(count):
+        cart = Cart(product.price.currency)
+        cart.add_item(product, 1)
+
+        order_checkout_service.place_order(storefront, orderer, cart).unwrap()
+
+
+def _build_orderer(user_id: UserID) -> Orderer:
+    user = user_service.get_user(user_id)
+    detail = user_service.get_detail(user.id)
+
+    return Orderer(
+        user=user,
+        company=None,
+        first_name=detail.first_name or 'n/a',
+        last_name=detail.last_name or 'n/a',
+        country=detail.country or 'n/a',
+        postal_code=detail.postal_code or 'n/a',
+        city=detail.city or 'n/a',
+        street=detail.street or 'n/a',
+    )
+
+
+if __name__ == '__main__':
+    call_with_app_context(execute)
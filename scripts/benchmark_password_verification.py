@@ -0,0 +1,74 @@
+"""Measure how many password verifications (and thus logins) per second
+can be done with the current password hash method, to size the
+password verification concurrency limit.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import os
+import time
+
+import click
+from secret_type import secret
+
+from byceps.services.authn.password import authn_password_domain_service
+from byceps.services.user.models import UserID
+from byceps.util.uuid import generate_uuid7
+
+
+@click.command()
+@click.option(
+    '--workers',
+    type=click.IntRange(min=1),
+    default=os.cpu_count() or 1,
+    show_default=True,
+    help='Number of threads to verify passwords with',
+)
+@click.option(
+    '--verifications',
+    type=click.IntRange(min=1),
+    default=100,
+    show_default=True,
+    help='Number of password verifications to do',
+)
+def execute(workers: int, verifications: int) -> None:
+    password = secret('benchmark-password')
+    credential = authn_password_domain_service.create_password_hash(
+        UserID(generate_uuid7()), password
+    )
+
+    def verify(_) -> bool:
+        return authn_password_domain_service.check_password_hash(
+            credential.password_hash, password
+        )
+
+    click.secho(
+        f'Doing {verifications} password verifications '
+        f'with {workers} worker(s) ...'
+    )
+
+    started_at = time.monotonic()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(verify, range(verifications)))
+    elapsed = time.monotonic() - started_at
+
+    if not all(results):
+        raise click.ClickException('Password verification failed.')
+
+    verifications_per_second = verifications / elapsed
+    cpu_count = os.cpu_count() or 1
+
+    click.secho(
+        f'{verifications_per_second:.1f} verifications/s in total, '
+        f'{verifications_per_second / min(workers, cpu_count):.1f} '
+        'verifications/s per core, '
+        f'{elapsed / verifications * 1000:.1f} ms per verification '
+        '(on average, including waiting for a worker).',
+        fg='green',
+    )
+
+
+if __name__ == '__main__':
+    execute()
@@ -1,5 +1,7 @@
 """Cancel open orders older than N days.
 
+The orders are canceled in chunks by background jobs.
+
 :Copyright: 2019-2026 Jan Korneffel, Jochen Kupperschmidt
 :License: Revised BSD (see `LICENSE` file for details)
 """
@@ -9,18 +11,7 @@ from datetime import timedelta
 import click
 from flask_babel import force_locale, gettext
 
-from byceps.services.shop.order import (
-    order_command_service,
-    order_service,
-    signals as shop_order_signals,
-)
-from byceps.services.shop.order.email import order_email_service
-from byceps.services.shop.order.errors import (
-    OrderActionFailedError,
-    OrderAlreadyCanceledError,
-)
-from byceps.services.shop.order.models.order import Order
-from byceps.util.result import Err, Ok
+from byceps.services.shop.order import overdue_order_cancellation_service
 
 from _util import call_with_app_context
 from _validators import validate_user_screen_name
@@ -33,7 +24,6 @@ from _validators import validate_user_screen_name
 @click.option('--locale', required=True, default='en')
 @click.option('--reason')
 @click.option('--notify/--no-notify', required=True)
-@click.option('--limit', default=100)
 def execute(
     shop_id,
     minimum_age_in_days: int,
@@ -41,60 +31,24 @@ def execute(
     locale: str,
     reason: str | None,
     notify: bool,
-    limit: int,
 ):
-    overdue_orders = _collect_overdue_orders(
-        shop_id, minimum_age_in_days, limit
-    )
-    for order in overdue_orders:
-        with force_locale(locale):
-            _cancel_order(order, canceler, reason, notify)
-
-
-def _collect_overdue_orders(
-    shop_id, minimum_age_in_days: int, limit: int
-) -> list[Order]:
-    older_than = timedelta(days=minimum_age_in_days)
-    overdue_orders = order_service.get_overdue_orders(
-        shop_id, older_than, limit=limit
-    )
-    click.secho(f'Found {len(overdue_orders)} overdue orders.', fg='yellow')
-    return overdue_orders
-
-
-def _cancel_order(order, canceler, reason: str | None, notify: bool) -> None:
     if not reason:
-        reason = gettext(
-            'The payment deadline has been exceed. '
-            'Place a new order if you are still interested in attending.'
-        )
-
-    match order_command_service.cancel_order(order.id, canceler, reason):
-        case Ok((canceled_order, canceled_event)):
-            shop_order_signals.order_canceled.send(None, event=canceled_event)
-            click.secho(
-                f'Order {order.order_number} was successfully canceled.',
-                fg='green',
+        with force_locale(locale):
+            reason = gettext(
+                'The payment deadline has been exceed. '
+                'Place a new order if you are still interested in attending.'
             )
 
-            if notify:
-                _notify_orderer(canceled_order)
-        case Err(e):
-            if isinstance(e, OrderAlreadyCanceledError):
-                message = (
-                    f'Order {order.order_number} has already been canceled.'
-                )
-            elif isinstance(e, OrderActionFailedError):
-                message = f'An error occurred on action execution for order {order.order_number}: {e.details}'
-            else:
-                message = f'Order {order.order_number} could not be canceled.'
-            click.secho(message, fg='red')
+    older_than = timedelta(days=minimum_age_in_days)
 
+    overdue_order_cancellation_service.start_cancellation(
+        shop_id, older_than, canceler, reason, notify_orderers=notify
+    )
 
-def _notify_orderer(order) -> None:
-    order_email_service.send_email_for_canceled_order_to_orderer(order)
     click.secho(
-        f'Notified orderer of canceled order {order.order_number}.', fg='green'
+        'Cancellation of overdue orders has been started. '
+        'Progress is logged by the job queue worker.',
+        fg='green',
     )
 
 
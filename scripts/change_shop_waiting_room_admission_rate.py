@@ -0,0 +1,39 @@
+"""Change the rate at which the waiting room in front of a storefront's
+order forms admits users.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import click
+
+from byceps.services.shop.storefront.models import StorefrontID
+from byceps.services.shop.waiting_room import waiting_room_service
+from byceps.util.result import Err, Ok
+
+from _util import call_with_app_context
+
+
+@click.command()
+@click.option('--storefront-id', required=True)
+@click.option(
+    '--admission-rate',
+    type=click.IntRange(min=1),
+    required=True,
+    help='Number of users to admit per second',
+)
+def execute(storefront_id: str, admission_rate: int) -> None:
+    match waiting_room_service.change_admission_rate(
+        StorefrontID(storefront_id), admission_rate
+    ):
+        case Ok(_):
+            click.secho(
+                f'Now admitting {admission_rate} users per second.',
+                fg='green',
+            )
+        case Err(error_message):
+            raise click.ClickException(error_message)
+
+
+if __name__ == '__main__':
+    call_with_app_context(execute)
@@ -11,7 +11,11 @@ from sqlalchemy import delete
 
 from byceps.database import db
 from byceps.services.authn.password.dbmodels import DbCredential
-from byceps.services.authn.session.dbmodels import DbRecentLogin, DbSessionToken
+from byceps.services.authn.session.dbmodels import (
+    DbLogin,
+    DbRecentLogin,
+    DbSessionToken,
+)
 from byceps.services.authz.dbmodels import DbUserRole
 from byceps.services.board.dbmodels.category import (
     DbLastCategoryView as DbBoardLastCategoryView,
@@ -25,7 +29,10 @@ from byceps.services.newsletter.dbmodels import (
     DbSubscriptionUpdate as DbNewsletterSubscriptionUpdate,
 )
 from byceps.services.user import user_service
-from byceps.services.user.log.dbmodels import DbUserLogEntry
+from byceps.services.user.log.dbmodels import (
+    DbArchivedUserLogEntry,
+    DbUserLogEntry,
+)
 from byceps.services.user.models import UserID
 from byceps.services.verification_token.dbmodels import DbVerificationToken
 
@@ -48,6 +55,7 @@ def execute(dry_run, user_ids) -> None:
         delete_records(label, delete_func, user_ids)
 
     delete('authentication credentials', delete_authn_credentials)
+    delete('logins', delete_authn_logins)
     delete('recent logins', delete_authn_recent_logins)
     delete('session tokens', delete_authn_session_tokens)
     delete('authorization role assignments', delete_authz_user_roles)
@@ -60,6 +68,7 @@ def execute(dry_run, user_ids) -> None:
         delete_newsletter_subscription_updates,
     )
     delete('user log entries', delete_user_log_entries)
+    delete('archived user log entries', delete_archived_user_log_entries)
     delete('verification tokens', delete_verification_tokens)
 
     if not dry_run:
@@ -90,6 +99,11 @@ def delete_authn_credentials(user_ids: set[UserID]) -> int:
     return _execute_delete_for_users_query(DbCredential, user_ids)
 
 
+def delete_authn_logins(user_ids: set[UserID]) -> int:
+    """Delete login records for the given users."""
+    return _execute_delete_for_users_query(DbLogin, user_ids)
+
+
 def delete_authn_recent_logins(user_ids: set[UserID]) -> int:
     """Delete recent logins for the given users."""
     return _execute_delete_for_users_query(DbRecentLogin, user_ids)
@@ -143,6 +157,11 @@ def delete_user_log_entries(user_ids: set[UserID]) -> int:
     )
 
 
+def delete_archived_user_log_entries(user_ids: set[UserID]) -> int:
+    """Delete archived user log entries for the given users."""
+    return _execute_delete_for_users_query(DbArchivedUserLogEntry, user_ids)
+
+
 def delete_verification_tokens(user_ids: set[UserID]) -> int:
     """Delete verification tokens for the given users."""
     return _execute_delete_for_users_query(DbVerificationToken, user_ids)
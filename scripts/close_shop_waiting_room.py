@@ -0,0 +1,28 @@
+"""Close the waiting room in front of a storefront's order forms,
+admitting everyone.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import click
+
+from byceps.services.shop.storefront.models import StorefrontID
+from byceps.services.shop.waiting_room import waiting_room_service
+
+from _util import call_with_app_context
+
+
+@click.command()
+@click.option('--storefront-id', required=True)
+def execute(storefront_id: str) -> None:
+    waiting_room_service.close_waiting_room(StorefrontID(storefront_id))
+
+    click.secho(
+        f'Closed waiting room in front of storefront "{storefront_id}".',
+        fg='green',
+    )
+
+
+if __name__ == '__main__':
+    call_with_app_context(execute)
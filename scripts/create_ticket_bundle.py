@@ -0,0 +1,78 @@
+"""Create a ticket bundle with a (possibly large) quantity of tickets,
+e.g. for sponsors or staff.
+
+Large bundles are filled with tickets by a background job.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from uuid import UUID
+
+import click
+
+from byceps.services.ticketing import (
+    ticket_bundle_bulk_creation_service,
+    ticket_category_service,
+)
+from byceps.services.ticketing.models.ticket import (
+    TicketCategory,
+    TicketCategoryID,
+)
+
+from _util import call_with_app_context
+from _validators import validate_user_screen_name
+
+
+def validate_ticket_category(
+    ctx, param, category_id_value: str
+) -> TicketCategory:
+    try:
+        category_id = TicketCategoryID(UUID(category_id_value))
+    except ValueError as exc:
+        raise click.BadParameter(
+            f'Invalid ticket category ID "{category_id_value}": {exc}'
+        ) from exc
+
+    category = ticket_category_service.find_category(category_id)
+
+    if not category:
+        raise click.BadParameter(
+            f'Unknown ticket category ID "{category_id_value}".'
+        )
+
+    return category
+
+
+@click.command()
+@click.option(
+    '--category-id',
+    'category',
+    required=True,
+    callback=validate_ticket_category,
+)
+@click.option('--quantity', required=True, type=click.IntRange(min=1))
+@click.option('--owner', required=True, callback=validate_user_screen_name)
+@click.option('--label')
+def execute(category, quantity: int, owner, label: str | None):
+    bundle_id = ticket_bundle_bulk_creation_service.create_bundle(
+        category, quantity, owner, label=label
+    )
+
+    if quantity > ticket_bundle_bulk_creation_service.BACKGROUND_THRESHOLD:
+        click.secho(
+            f'Ticket bundle {bundle_id} has been created. '
+            'Its tickets are being created in the background; '
+            'progress is logged by the job queue worker.',
+            fg='green',
+        )
+    else:
+        click.secho(
+            f'Ticket bundle {bundle_id} with {quantity} tickets '
+            'has been created.',
+            fg='green',
+        )
+
+
+if __name__ == '__main__':
+    call_with_app_context(execute)
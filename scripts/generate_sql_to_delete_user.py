@@ -59,8 +59,10 @@ def generate_delete_statements_for_users(
 
 def generate_delete_statements_for_user(user_id: UserID) -> Iterator[str]:
     for table, user_id_column in [
+        ('authn_logins', 'user_id'),
         ('user_details', 'user_id'),
         ('user_log_entries', 'user_id'),
+        ('user_log_entries_archive', 'user_id'),
         ('users', 'id'),
     ]:
         yield f"DELETE FROM {table} WHERE {user_id_column} = '{user_id}';"  # noqa: S608
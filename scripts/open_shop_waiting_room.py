@@ -0,0 +1,37 @@
+"""Open a waiting room in front of a storefront's order forms, to admit
+users at a limited rate when a sale starts.
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import click
+
+from byceps.services.shop.storefront import storefront_service
+from byceps.services.shop.waiting_room import waiting_room_service
+
+from _util import call_with_app_context
+
+
+@click.command()
+@click.option('--storefront-id', required=True)
+@click.option(
+    '--admission-rate',
+    type=click.IntRange(min=1),
+    required=True,
+    help='Number of users to admit per second',
+)
+def execute(storefront_id: str, admission_rate: int) -> None:
+    storefront = storefront_service.get_storefront(storefront_id)
+
+    waiting_room_service.open_waiting_room(storefront.id, admission_rate)
+
+    click.secho(
+        f'Opened waiting room in front of storefront "{storefront.id}", '
+        f'admitting {admission_rate} users per second.',
+        fg='green',
+    )
+
+
+if __name__ == '__main__':
+    call_with_app_context(execute)
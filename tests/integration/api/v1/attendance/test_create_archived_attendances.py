@@ -0,0 +1,119 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import json
+from uuid import uuid4
+
+from byceps.services.attendance.blueprints.api import (
+    views as attendance_api_views,
+)
+from byceps.services.ticketing import ticket_attendance_service
+
+
+URL = 'http://api.acmecon.test/v1/attendances/archived_attendances/batch'
+
+
+def test_create_archived_attendances(
+    api_client, api_client_authz_header, party, make_user
+):
+    user1 = make_user()
+    user2 = make_user()
+    unknown_user_id = uuid4()
+
+    ticket_attendance_service.create_archived_attendance(user2.id, party.id)
+
+    json_data = [
+        {'user_id': str(user1.id), 'party_id': party.id},
+        {'user_id': str(user1.id), 'party_id': party.id},
+        {'user_id': str(user2.id), 'party_id': party.id},
+        {'user_id': str(unknown_user_id), 'party_id': party.id},
+        {'user_id': str(user1.id), 'party_id': 'unknown-party'},
+    ]
+
+    response = api_client.post(
+        URL, headers=[api_client_authz_header], json=json_data
+    )
+
+    assert response.status_code == 200
+    assert [result['status'] for result in response.get_json()['results']] == [
+        'created',
+        'exists',
+        'exists',
+        'rejected',
+        'rejected',
+    ]
+
+    assert_attended_party_ids(user1.id, [party.id])
+    assert_attended_party_ids(user2.id, [party.id])
+
+
+def test_create_archived_attendances_from_ndjson(
+    api_client, api_client_authz_header, party, make_user
+):
+    users = [make_user() for _ in range(3)]
+
+    data = '\n'.join(
+        json.dumps({'user_id': str(user.id), 'party_id': party.id})
+        for user in users
+    )
+
+    response = api_client.post(
+        URL,
+        headers=[api_client_authz_header],
+        data=data,
+        content_type='application/x-ndjson',
+    )
+
+    assert response.status_code == 200
+    assert [result['status'] for result in response.get_json()['results']] == [
+        'created'
+    ] * 3
+
+    for user in users:
+        assert_attended_party_ids(user.id, [party.id])
+
+
+def test_create_archived_attendances_with_invalid_item(
+    api_client, api_client_authz_header, party
+):
+    json_data = [{'user_id': 'not-a-uuid', 'party_id': party.id}]
+
+    response = api_client.post(
+        URL, headers=[api_client_authz_header], json=json_data
+    )
+
+    assert response.status_code == 400
+
+
+def test_create_archived_attendances_with_too_many_items(
+    api_client, api_client_authz_header, party, make_user, monkeypatch
+):
+    monkeypatch.setattr(attendance_api_views, 'BATCH_MAX_ITEMS', 2)
+
+    user = make_user()
+
+    data = '\n'.join(
+        json.dumps({'user_id': str(user.id), 'party_id': party.id})
+        for _ in range(3)
+    )
+
+    response = api_client.post(
+        URL,
+        headers=[api_client_authz_header],
+        data=data,
+        content_type='application/x-ndjson',
+    )
+
+    assert response.status_code == 413
+    assert_attended_party_ids(user.id, [])
+
+
+# helpers
+
+
+def assert_attended_party_ids(user_id, expected):
+    parties = ticket_attendance_service.get_attended_parties(user_id)
+    actual = [party.id for party in parties]
+    assert actual == expected
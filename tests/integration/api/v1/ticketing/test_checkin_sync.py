@@ -0,0 +1,172 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+from sqlalchemy import update
+
+from byceps.database import db
+from byceps.services.ticketing import (
+    ticket_creation_service,
+    ticket_revocation_service,
+    ticket_service,
+    ticket_user_checkin_service,
+)
+from byceps.services.ticketing.dbmodels.ticket import DbTicket
+
+
+BASE_URL = 'http://api.acmecon.test/v1/ticketing/checkin'
+
+
+def test_get_snapshot_and_changes(
+    party, category, user, admin_user, api_client, api_client_authz_header
+):
+    ticket1 = ticket_creation_service.create_ticket(category, user, user=user)
+    ticket2 = ticket_creation_service.create_ticket(category, user)
+    headers = [api_client_authz_header]
+
+    response = api_client.get(
+        f'{BASE_URL}/{party.id}/snapshot', headers=headers
+    )
+
+    assert response.status_code == 200
+    snapshot = response.get_json()
+    assert snapshot['party_id'] == party.id
+    tickets_by_code = {ticket['code']: ticket for ticket in snapshot['tickets']}
+    assert tickets_by_code[ticket1.code] == {
+        'id': str(ticket1.id),
+        'code': ticket1.code,
+        'category': category.title,
+        'user': {
+            'id': str(user.id),
+            'screen_name': user.screen_name,
+            'suspended': False,
+            'deleted': False,
+        },
+        'seat': None,
+        'revoked': False,
+        'user_checked_in': False,
+    }
+    assert tickets_by_code[ticket2.code]['user'] is None
+
+    ticket_revocation_service.revoke_ticket(ticket2.id, admin_user)
+
+    response = api_client.get(
+        f'{BASE_URL}/{party.id}/changes',
+        query_string={'sync_token': snapshot['sync_token']},
+        headers=headers,
+    )
+
+    assert response.status_code == 200
+    changes = response.get_json()
+    changed_tickets_by_code = {
+        ticket['code']: ticket for ticket in changes['tickets']
+    }
+    assert changed_tickets_by_code[ticket2.code]['revoked']
+
+
+def test_get_changes_includes_change_committed_after_sync(
+    party, category, user, api_client, api_client_authz_header
+):
+    ticket1 = ticket_creation_service.create_ticket(category, user)
+    headers = [api_client_authz_header]
+
+    # Revoke the ticket in another transaction that is only committed
+    # after a snapshot has been fetched and later changes have been
+    # made (and committed) in the meantime.
+    with db.engine.connect() as connection:
+        connection.execute(
+            update(DbTicket).filter_by(id=ticket1.id).values(revoked=True)
+        )
+
+        response = api_client.get(
+            f'{BASE_URL}/{party.id}/snapshot', headers=headers
+        )
+        snapshot = response.get_json()
+        snapshot_codes = {ticket['code'] for ticket in snapshot['tickets']}
+        assert ticket1.code in snapshot_codes
+
+        ticket2 = ticket_creation_service.create_ticket(category, user)
+
+        connection.commit()
+
+    response = api_client.get(
+        f'{BASE_URL}/{party.id}/changes',
+        query_string={'sync_token': snapshot['sync_token']},
+        headers=headers,
+    )
+
+    changes = response.get_json()
+    changed_tickets_by_code = {
+        ticket['code']: ticket for ticket in changes['tickets']
+    }
+    assert changed_tickets_by_code[ticket1.code]['revoked']
+    assert ticket2.code in changed_tickets_by_code
+
+
+def test_get_changes_with_invalid_sync_token(
+    party, api_client, api_client_authz_header
+):
+    response = api_client.get(
+        f'{BASE_URL}/{party.id}/changes',
+        query_string={'sync_token': 'forged'},
+        headers=[api_client_authz_header],
+    )
+
+    assert response.status_code == 400
+
+
+def test_upload_offline_check_ins(
+    party, category, user, admin_user, api_client, api_client_authz_header
+):
+    ticket1 = ticket_creation_service.create_ticket(category, user, user=user)
+    ticket2 = ticket_creation_service.create_ticket(category, user, user=user)
+    ticket3 = ticket_creation_service.create_ticket(category, user)
+
+    # Checked in online while the scanner was offline.
+    ticket_user_checkin_service.check_in_user(
+        party.id, ticket2.id, admin_user
+    ).unwrap()
+
+    json_data = {
+        'initiator_id': str(admin_user.id),
+        'check_ins': [
+            {'ticket_code': code, 'occurred_at': '2026-08-15T16:00:00+02:00'}
+            for code in [ticket1.code, ticket2.code, ticket3.code, 'XXXXX']
+        ],
+    }
+
+    response = api_client.post(
+        f'{BASE_URL}/{party.id}/check_ins',
+        headers=[api_client_authz_header],
+        json=json_data,
+    )
+
+    assert response.status_code == 200
+    statuses = [
+        (result['ticket_code'], result['status'])
+        for result in response.get_json()['results']
+    ]
+    assert statuses == [
+        (ticket1.code, 'ok'),
+        (ticket2.code, 'conflict'),
+        (ticket3.code, 'rejected'),
+        ('XXXXX', 'rejected'),
+    ]
+
+    db.session.expire_all()
+
+    assert ticket_service.get_ticket(ticket1.id).user_checked_in
+    check_in = ticket_user_checkin_service.find_check_in_for_ticket(ticket1.id)
+    assert check_in.occurred_at.isoformat() == '2026-08-15T14:00:00'
+
+
+@pytest.fixture(scope='session')
+def party(brand, make_party):
+    return make_party(brand)
+
+
+@pytest.fixture(scope='session')
+def category(party, make_ticket_category):
+    return make_ticket_category(party.id, 'Standard')
@@ -0,0 +1,52 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.user_badge import (
+    user_badge_awarding_service,
+    user_badge_service,
+)
+
+
+def test_award_badges(
+    api_client, api_client_authz_header, make_user, admin_user
+):
+    badge = user_badge_service.create_badge(
+        'participant', 'Participant', 'participant.svg'
+    )
+    user1 = make_user()
+    user2 = make_user()
+    uninitialized_user = make_user(initialized=False)
+
+    url = 'http://api.acmecon.test/v1/user_badges/awardings/batch'
+    headers = [api_client_authz_header]
+    json_data = [
+        {
+            'badge_slug': badge_slug,
+            'awardee_id': str(awardee.id),
+            'initiator_id': str(admin_user.id),
+        }
+        for badge_slug, awardee in [
+            ('participant', user1),
+            ('participant', user2),
+            ('participant', uninitialized_user),
+            ('unknown', user1),
+        ]
+    ]
+
+    response = api_client.post(url, headers=headers, json=json_data)
+
+    assert response.status_code == 200
+    assert [result['status'] for result in response.get_json()['results']] == [
+        'awarded',
+        'awarded',
+        'rejected',
+        'rejected',
+    ]
+
+    awardings = user_badge_awarding_service.get_awardings_of_badge(badge.id)
+    assert {awarding.awardee_id for awarding in awardings} == {
+        user1.id,
+        user2.id,
+    }
@@ -0,0 +1,51 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+
+from byceps.services.authn.api import authn_api_service
+
+from tests.helpers import log_in_user
+
+
+BASE_URL = 'http://admin.acmecon.test'
+
+
+@pytest.fixture(scope='module')
+def api_admin(make_admin):
+    permission_ids = {'admin.access', 'api.administrate'}
+    admin = make_admin(permission_ids)
+    log_in_user(admin.id)
+    return admin
+
+
+@pytest.fixture(scope='module')
+def api_admin_client(make_client, admin_app, api_admin):
+    return make_client(admin_app, user_id=api_admin.id)
+
+
+def test_create_api_token_shows_token_once(api_admin_client):
+    api_token_count_before = len(authn_api_service.get_all_api_tokens())
+
+    url = f'{BASE_URL}/api/api_tokens'
+    form_data = {'permissions': ['api.administrate'], 'description': 'Test'}
+    response = api_admin_client.post(url, data=form_data)
+
+    assert response.status_code == 302
+    created_url = response.location
+    assert created_url.endswith('/created')
+
+    api_tokens = authn_api_service.get_all_api_tokens()
+    assert len(api_tokens) == api_token_count_before + 1
+
+    response = api_admin_client.get(created_url)
+    assert response.status_code == 200
+    assert b'<code>api_' in response.get_data()
+
+    # Reloading the page neither shows the token again nor creates
+    # another API token.
+    response = api_admin_client.get(created_url)
+    assert response.status_code == 302
+    assert len(authn_api_service.get_all_api_tokens()) == len(api_tokens)
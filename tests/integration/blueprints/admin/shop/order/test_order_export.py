@@ -3,8 +3,10 @@
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
+from io import BytesIO
+from zipfile import ZipFile
 
 from freezegun import freeze_time
 from moneyed import Money
@@ -12,12 +14,17 @@ import pytest
 
 from byceps.byceps_app import BycepsApp
 from byceps.services.shop.cart.models import Cart
-from byceps.services.shop.order import order_checkout_service
+from byceps.services.shop.order import (
+    order_checkout_service,
+    order_command_service,
+)
+from byceps.services.shop.order.export import order_export_service
 from byceps.services.shop.order.models.order import Order, Orderer
 from byceps.services.shop.product.models import Product, ProductNumber
 from byceps.services.shop.shop.models import Shop
 from byceps.services.shop.storefront.models import Storefront
 from byceps.services.user.models import User
+from byceps.util.datetime.range import DateTimeRange
 
 from tests.helpers import log_in_user
 
@@ -155,3 +162,89 @@ def test_serialize_unknown_order(
     response = client.get(url)
 
     assert response.status_code == 404
+
+
+@freeze_time('2015-04-15 07:54:18')  # UTC
+def test_bulk_export_paid_orders_as_zip(
+    admin_app: BycepsApp,
+    shop_order_admin: User,
+    make_client,
+    shop: Shop,
+    make_order_number_sequence,
+    make_storefront,
+    make_product,
+    make_user,
+    make_orderer,
+):
+    order_number_sequence = make_order_number_sequence(
+        shop.id, prefix='LR-08-C'
+    )
+    storefront = make_storefront(shop.id, order_number_sequence.id)
+
+    cart = Cart(shop.currency)
+    cart.add_item(make_product(shop.id), 1)
+
+    orderer = make_orderer(make_user())
+
+    created_at = datetime(2015, 2, 26, 12, 26, 24)  # UTC
+    order, _ = order_checkout_service.place_order(
+        storefront, orderer, cart, created_at=created_at
+    ).unwrap()
+
+    order_command_service.mark_order_as_paid(
+        order.id, 'bank_transfer', shop_order_admin
+    ).unwrap()
+
+    log_in_user(shop_order_admin.id)
+    client = make_client(admin_app, user_id=shop_order_admin.id)
+
+    expected = (
+        client.get(f'{BASE_URL}/shop/orders/{order.id}/export')
+        .get_data()
+        .decode('utf-8')
+    )
+
+    url = f'{BASE_URL}/shop/orders/for_shop/{shop.id}/export'
+    form_data = {
+        'first_day': '2015-02-01',
+        'last_day': '2015-02-28',
+    }
+    response = client.post(url, data=form_data)
+
+    assert response.status_code == 200
+    assert response.content_type == 'application/zip'
+
+    with ZipFile(BytesIO(response.get_data())) as zip_file:
+        assert zip_file.namelist() == [f'{order.order_number}.xml']
+        xml = zip_file.read(f'{order.order_number}.xml').decode('utf-8')
+
+    assert xml == expected
+
+
+def test_get_created_range_for_days(admin_app: BycepsApp):
+    actual = order_export_service.get_created_range_for_days(
+        date(2015, 2, 1), date(2015, 2, 28)
+    )
+
+    # February 2015 in Europe/Berlin, end exclusive
+    assert actual == DateTimeRange(
+        start=datetime(2015, 1, 31, 23, 0, 0),
+        end=datetime(2015, 2, 28, 23, 0, 0),
+    )
+
+    assert order_export_service._build_bulk_export_filename(actual).startswith(
+        'orders_2015-02-01_2015-02-28_'
+    )
+
+
+@freeze_time('2015-04-15 07:54:18')  # UTC
+def test_bulk_export_filename_names_first_and_last_day(admin_app: BycepsApp):
+    # February 2015 in Europe/Berlin, end exclusive
+    created_range = DateTimeRange(
+        start=datetime(2015, 1, 31, 23, 0, 0),
+        end=datetime(2015, 2, 28, 23, 0, 0),
+    )
+
+    actual = order_export_service._build_bulk_export_filename(created_range)
+
+    assert actual == 'orders_2015-02-01_2015-02-28_20150415-075418.zip'
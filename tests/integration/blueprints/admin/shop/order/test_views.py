@@ -9,7 +9,7 @@ import pytest
 
 from byceps.byceps_app import BycepsApp
 from byceps.database import db
-from byceps.services.shop.order import order_service
+from byceps.services.shop.order import order_action_service, order_service
 from byceps.services.shop.order.dbmodels.order import DbOrder
 from byceps.services.shop.order.events import (
     ShopOrderCanceledEvent,
@@ -96,6 +96,38 @@ def product4(make_product, shop: Shop) -> Product:
     )
 
 
+@pytest.fixture()
+def product5(make_product, shop: Shop) -> Product:
+    return make_product(
+        shop.id,
+        item_number=ProductNumber('item-005'),
+        name='Item #5',
+        total_quantity=8,
+    )
+
+
+@pytest.fixture()
+def product6(make_product, shop: Shop) -> Product:
+    return make_product(
+        shop.id,
+        item_number=ProductNumber('item-006'),
+        name='Item #6',
+        total_quantity=8,
+    )
+
+
+@pytest.fixture()
+def product7(make_product, shop: Shop) -> Product:
+    product = make_product(
+        shop.id,
+        item_number=ProductNumber('item-007'),
+        name='Item #7',
+        total_quantity=8,
+    )
+    order_action_service.create_action(product.id, 'unknown_procedure', {})
+    return product
+
+
 @pytest.fixture(scope='module')
 def orderer_user(make_user) -> User:
     return make_user()
@@ -263,6 +295,120 @@ def test_mark_order_as_paid(
     order_paid_signal_send_mock.assert_called_once_with(None, event=event)
 
 
+@patch('byceps.services.shop.order.signals.order_paid.send')
+@patch('byceps.services.shop.order.blueprints.admin.views.order_email_service')
+def test_mark_orders_as_paid(
+    order_email_service_mock,
+    order_paid_signal_send_mock,
+    shop: Shop,
+    storefront: Storefront,
+    product5: Product,
+    shop_order_admin: User,
+    orderer: Orderer,
+    shop_order_admin_client,
+):
+    products_with_quantity = [(product5, 1)]
+    placed_order1 = place_order(
+        shop, storefront, orderer, products_with_quantity
+    )
+    placed_order2 = place_order(
+        shop, storefront, orderer, products_with_quantity
+    )
+
+    url = f'{BASE_URL}/shop/orders/for_shop/{shop.id}/mark_as_paid'
+    form_data = {
+        'order_numbers': (
+            f'{placed_order1.order_number}\n {placed_order2.order_number} \n'
+        ),
+        'payment_method': 'bank_transfer',
+    }
+    response = shop_order_admin_client.post(url, data=form_data)
+
+    assert response.status_code == 302
+
+    for placed_order in [placed_order1, placed_order2]:
+        assert_payment(
+            get_db_order(placed_order.id),
+            'bank_transfer',
+            PaymentState.paid,
+            shop_order_admin.id,
+        )
+
+    assert (
+        order_email_service_mock.send_email_for_paid_order_to_orderer.call_count
+        == 2
+    )
+    assert order_paid_signal_send_mock.call_count == 2
+
+
+@patch('byceps.services.shop.order.signals.order_paid.send')
+@patch('byceps.services.shop.order.blueprints.admin.views.order_email_service')
+def test_mark_orders_as_paid_with_failing_action(
+    order_email_service_mock,
+    order_paid_signal_send_mock,
+    shop: Shop,
+    storefront: Storefront,
+    product7: Product,
+    shop_order_admin: User,
+    orderer: Orderer,
+    shop_order_admin_client,
+):
+    products_with_quantity = [(product7, 1)]
+    placed_order1 = place_order(
+        shop, storefront, orderer, products_with_quantity
+    )
+    placed_order2 = place_order(
+        shop, storefront, orderer, products_with_quantity
+    )
+
+    url = f'{BASE_URL}/shop/orders/for_shop/{shop.id}/mark_as_paid'
+    form_data = {
+        'order_numbers': (
+            f'{placed_order1.order_number}\n{placed_order2.order_number}'
+        ),
+        'payment_method': 'bank_transfer',
+    }
+    response = shop_order_admin_client.post(url, data=form_data)
+
+    assert response.status_code == 302
+
+    # Orders committed as paid are announced despite the failed actions.
+    for placed_order in [placed_order1, placed_order2]:
+        assert_payment(
+            get_db_order(placed_order.id),
+            'bank_transfer',
+            PaymentState.paid,
+            shop_order_admin.id,
+        )
+
+    assert (
+        order_email_service_mock.send_email_for_paid_order_to_orderer.call_count
+        == 2
+    )
+    assert order_paid_signal_send_mock.call_count == 2
+
+
+def test_mark_orders_as_paid_with_unknown_order_number(
+    shop: Shop,
+    storefront: Storefront,
+    product6: Product,
+    orderer: Orderer,
+    shop_order_admin_client,
+):
+    placed_order = place_order(shop, storefront, orderer, [(product6, 1)])
+
+    url = f'{BASE_URL}/shop/orders/for_shop/{shop.id}/mark_as_paid'
+    form_data = {
+        'order_numbers': f'{placed_order.order_number}\nUNKNOWN-00001',
+        'payment_method': 'bank_transfer',
+    }
+    response = shop_order_admin_client.post(url, data=form_data)
+
+    # The form is shown again, no order has been marked as paid.
+    assert response.status_code == 200
+    assert_payment_is_open(get_db_order(placed_order.id))
+
+
 @patch('byceps.services.shop.order.signals.order_canceled.send')
 @patch('byceps.services.shop.order.signals.order_paid.send')
 @patch('byceps.services.shop.order.blueprints.admin.views.order_email_service')
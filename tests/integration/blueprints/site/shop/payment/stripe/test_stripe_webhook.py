@@ -158,6 +158,36 @@ def test_stripe_webhook_payment_intent_succeeded(
     order_paid_signal_send_mock.assert_called_once_with(None, event=event)
 
 
+@patch(
+    'byceps.services.shop.payment.stripe.blueprints.site.views._check_transaction_against_order'
+)
+@patch('stripe.Webhook.construct_event')
+@patch('byceps.services.shop.order.signals.order_paid.send')
+@patch(
+    'byceps.services.shop.order.email.order_email_service.send_email_for_paid_order_to_orderer'
+)
+def test_stripe_webhook_repeated_delivery_is_processed_once(
+    order_email_service_mock,
+    order_paid_signal_send_mock,
+    stripe_webhook_construct_mock,
+    check_transaction_mock,
+    site_app,
+    order: Order,
+):
+    check_transaction_mock.return_value = True
+    webhook_event = create_event('checkout.session.completed', order.id)
+    stripe_webhook_construct_mock.return_value = webhook_event
+
+    for _ in range(3):
+        response = call_webhook(site_app)
+        assert response.status_code == 200
+
+    assert order_service.get_order(order.id).is_paid
+
+    assert order_email_service_mock.call_count == 1
+    assert order_paid_signal_send_mock.call_count == 1
+
+
 @patch('stripe.Webhook.construct_event')
 def test_stripe_webhook_unknown_event(
     stripe_webhook_construct_mock,
@@ -182,7 +212,7 @@ def create_event(event_type: str, order_id: OrderID):
         type=event_type,
         data=SimpleNamespace(
             object=SimpleNamespace(
-                id='dummy-payment-id',
+                id=f'dummy-session-id-{order_id}',
                 metadata={
                     'shop_order_id': order_id,
                 },
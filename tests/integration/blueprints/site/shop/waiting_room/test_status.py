@@ -0,0 +1,111 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+
+from byceps.byceps_app import BycepsApp
+from byceps.services.shop.storefront.models import Storefront
+from byceps.services.shop.waiting_room import waiting_room_service
+from byceps.services.shop.waiting_room.blueprints.site.admission import (
+    SESSION_KEY_QUEUE_ENTRY,
+)
+from byceps.services.site.models import SiteID
+from byceps.services.user.models import User
+
+from tests.helpers import create_site
+
+
+SERVER_NAME = 'site-with-waiting-room.acmecon.test'
+DISABLED_SERVER_NAME = 'disabled-site-with-waiting-room.acmecon.test'
+
+
+@pytest.fixture(scope='module')
+def storefront(
+    make_brand, make_shop, make_order_number_sequence, make_storefront
+) -> Storefront:
+    shop = make_shop(make_brand())
+    order_number_sequence = make_order_number_sequence(
+        shop.id, prefix='WAIT-26-'
+    )
+
+    return make_storefront(shop.id, order_number_sequence.id)
+
+
+@pytest.fixture(scope='module')
+def site_app(make_brand, make_site_app, storefront: Storefront):
+    site = create_site(
+        SiteID('acmecon-waiting-room-website'),
+        make_brand().id,
+        server_name=SERVER_NAME,
+        storefront_id=storefront.id,
+    )
+
+    app = make_site_app(SERVER_NAME, site.id)
+    with app.app_context():
+        yield app
+
+
+@pytest.fixture(scope='module')
+def disabled_site_app(make_brand, make_site_app, storefront: Storefront):
+    site = create_site(
+        SiteID('acmecon-disabled-waiting-room-website'),
+        make_brand().id,
+        server_name=DISABLED_SERVER_NAME,
+        enabled=False,
+        storefront_id=storefront.id,
+    )
+
+    app = make_site_app(DISABLED_SERVER_NAME, site.id)
+    with app.app_context():
+        yield app
+
+
+def test_status(site_app: BycepsApp, storefront: Storefront, user: User):
+    token = join_queue(storefront, user)
+
+    response = get_status(site_app, SERVER_NAME, token)
+
+    assert response.status_code == 200
+    assert response.get_json().keys() == {'admitted', 'ahead_count'}
+
+
+def test_status_without_queue_entry(site_app: BycepsApp):
+    client = site_app.test_client()
+
+    response = client.get(f'http://{SERVER_NAME}/shop/waiting_room/status')
+
+    assert response.status_code == 404
+
+
+def test_status_on_disabled_site(
+    disabled_site_app: BycepsApp, storefront: Storefront, user: User
+):
+    token = join_queue(storefront, user)
+
+    response = get_status(disabled_site_app, DISABLED_SERVER_NAME, token)
+
+    assert response.status_code == 404
+
+
+# helpers
+
+
+def join_queue(storefront: Storefront, user: User) -> str:
+    waiting_room = waiting_room_service.find_waiting_room(storefront.id)
+    if waiting_room is None:
+        waiting_room = waiting_room_service.open_waiting_room(storefront.id, 1)
+
+    entry = waiting_room_service.join_queue(waiting_room, user.id)
+
+    return waiting_room_service.serialize_queue_entry(entry)
+
+
+def get_status(app: BycepsApp, server_name: str, token: str):
+    client = app.test_client()
+
+    with client.session_transaction() as session:
+        session[SESSION_KEY_QUEUE_ENTRY] = token
+
+    return client.get(f'http://{server_name}/shop/waiting_room/status')
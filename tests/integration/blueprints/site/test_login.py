@@ -3,8 +3,13 @@
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+import time
+
 import pytest
 
+from byceps.services.authn.password import (
+    authn_password_verification_service,
+)
 from byceps.services.authn.session import authn_session_service
 from byceps.services.consent import (
     brand_requirements_service,
@@ -112,5 +117,51 @@ def test_site_login_fails_lacking_consent(client, brand, make_user):
     assert get_session_cookie(client) is None
 
 
+def test_site_login_rejected_if_password_verification_unavailable(
+    site_app, client, make_user
+):
+    password = 'wait for your turn'
+
+    user = make_user(password=password)
+
+    # Occupy all password verification slots.
+    redis_client = site_app.redis_client
+    holders_key = 'authn-password-verification:holders'
+    max_concurrency = (
+        site_app.byceps_config.password_verification.max_concurrency
+    )
+    expires_at = time.time() + 60
+    redis_client.zadd(
+        holders_key,
+        {f'occupied-{i}': expires_at for i in range(max_concurrency)},
+    )
+
+    with site_app.app_context():
+        rejected_count_before = (
+            authn_password_verification_service.get_metrics().rejected_count
+        )
+
+    form_data = {
+        'username': user.screen_name,
+        'password': password,
+    }
+
+    try:
+        response = client.post(
+            f'{BASE_URL}/authentication/log_in', data=form_data
+        )
+    finally:
+        redis_client.delete(holders_key)
+
+    assert response.status_code == 503
+
+    assert get_session_cookie(client) is None
+
+    with site_app.app_context():
+        metrics = authn_password_verification_service.get_metrics()
+    assert metrics.rejected_count == rejected_count_before + 1
+    assert metrics.queue_depth == 0
+
+
 def get_session_cookie(client):
     return client.get_cookie('session', domain='www.acmecon.test')
@@ -27,10 +27,12 @@ from byceps.config.models import (
     DevelopmentConfig,
     JobsConfig,
     MetricsConfig,
+    PasswordVerificationConfig,
     PaymentGatewaysConfig,
     RedisConfig,
     SiteWebAppConfig,
     SmtpConfig,
+    UserLogConfig,
     WebAppsConfig,
 )
 from byceps.database import db
@@ -136,6 +138,10 @@ def build_byceps_config(
         metrics=MetricsConfig(
             enabled=metrics_enabled,
         ),
+        password_verification=PasswordVerificationConfig(
+            max_concurrency=4,
+            queue_timeout_in_ms=2000,
+        ),
         payment_gateways=PaymentGatewaysConfig(
             paypal=None,
             stripe=None,
@@ -150,6 +156,9 @@ def build_byceps_config(
             password=None,
             suppress_send=True,
         ),
+        user_log=UserLogConfig(
+            retention_policies=[],
+        ),
     )
 
 
@@ -0,0 +1,76 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.authn.api import authn_api_service
+from byceps.services.authz.models import PermissionID
+
+
+def test_find_api_token_by_token(admin_app, admin_user):
+    permissions = {PermissionID('do_this')}
+    api_token = authn_api_service.create_api_token(admin_user.id, permissions)
+
+    # Looked up in the database, then in the caches.
+    for _ in range(2):
+        actual = authn_api_service.find_api_token_by_token(api_token.token)
+
+        assert actual is not None
+        assert actual.id == api_token.id
+        assert actual.token is None
+        assert actual.permissions == permissions
+        assert not actual.suspended
+
+    assert authn_api_service.find_api_token_by_token('api_unknown') is None
+
+
+def test_suspension_and_deletion_are_effective_immediately(
+    admin_app, admin_user
+):
+    api_token = authn_api_service.create_api_token(admin_user.id, set())
+    token = api_token.token
+
+    assert not authn_api_service.find_api_token_by_token(token).suspended
+
+    authn_api_service.suspend_api_token(api_token.id)
+    assert authn_api_service.find_api_token_by_token(token).suspended
+
+    authn_api_service.unsuspend_api_token(api_token.id)
+    assert not authn_api_service.find_api_token_by_token(token).suspended
+
+    authn_api_service.delete_api_token(api_token.id)
+    assert authn_api_service.find_api_token_by_token(token) is None
+
+
+def test_suspension_during_lookup_does_not_cache_outdated_state(
+    admin_app, admin_user, monkeypatch
+):
+    api_token = authn_api_service.create_api_token(admin_user.id, set())
+    token = api_token.token
+
+    # Suspend the API token right after a lookup has read it from the
+    # database, but before that lookup caches it.
+    find_db_api_token_by_digest = authn_api_service._find_db_api_token_by_digest
+
+    def find_db_api_token_by_digest_then_suspend(token_digest):
+        found_api_token = find_db_api_token_by_digest(token_digest)
+        authn_api_service.suspend_api_token(api_token.id)
+        return found_api_token
+
+    monkeypatch.setattr(
+        authn_api_service,
+        '_find_db_api_token_by_digest',
+        find_db_api_token_by_digest_then_suspend,
+    )
+
+    # The lookup that was in progress still sees the former state ...
+    assert not authn_api_service.find_api_token_by_token(token).suspended
+
+    monkeypatch.undo()
+
+    # ... but has cached it neither locally nor in Redis.
+    assert authn_api_service.find_api_token_by_token(token).suspended
+
+    # Same for another process, which does not have it cached locally.
+    authn_api_service._cached_api_tokens_by_digest.clear()
+    assert authn_api_service.find_api_token_by_token(token).suspended
@@ -0,0 +1,64 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from ipaddress import ip_network
+
+from byceps.services.authn.session import authn_session_service
+from byceps.services.user.log import user_log_domain_service, user_log_service
+
+
+def test_find_logins_for_ip_address_and_network(admin_app, make_user):
+    user1 = make_user()
+    user2 = make_user()
+    user3 = make_user()
+
+    authn_session_service.log_in_user_to_admin(user1, '10.99.1.17')
+    authn_session_service.log_in_user_to_admin(user2, '10.99.2.42')
+    authn_session_service.log_in_user_to_admin(user3, '192.0.2.99')
+
+    logins_for_ip_address = authn_session_service.find_logins_for_ip_address(
+        '10.99.1.17'
+    )
+    assert [user_id for _, user_id in logins_for_ip_address] == [user1.id]
+
+    logins_for_network = authn_session_service.find_logins_for_network(
+        ip_network('10.99.0.0/16')
+    )
+    assert {user_id for _, user_id in logins_for_network} == {
+        user1.id,
+        user2.id,
+    }
+
+
+def test_login_with_invalid_ip_address_is_recorded(admin_app, make_user):
+    user = make_user()
+
+    authn_session_service.log_in_user_to_admin(user, 'not-an-ip-address')
+
+    assert authn_session_service.find_recent_login(user.id) is not None
+
+
+def test_backfill_skips_log_entries_with_invalid_ip_address(
+    admin_app, make_user
+):
+    user = make_user()
+
+    for ip_address in ['10.99.3.1', '', 'not-an-ip-address']:
+        entry = user_log_domain_service.build_entry(
+            'user-logged-in-to-admin', user, {'ip_address': ip_address}
+        )
+        user_log_service.persist_entry(entry)
+
+    num_created, num_skipped = (
+        authn_session_service.backfill_logins_from_log_entries()
+    )
+
+    assert num_created >= 1
+    assert num_skipped >= 2
+
+    logins_for_ip_address = authn_session_service.find_logins_for_ip_address(
+        '10.99.3.1'
+    )
+    assert [user_id for _, user_id in logins_for_ip_address] == [user.id]
@@ -18,9 +18,6 @@ from byceps.services.shop.shop.models import Shop
 from byceps.services.shop.storefront.models import Storefront
 from byceps.services.ticketing.events import TicketsSoldEvent
 from byceps.services.ticketing.models.ticket import TicketCategory
-from byceps.services.ticketing.ticket_creation_service import (
-    TicketCreationFailedError,
-)
 from byceps.services.user.models import User
 
 from tests.helpers.shop import create_ticket_product, place_order
@@ -100,47 +97,3 @@ def test_create_tickets(
     tickets_sold_signal_send_mock.assert_called_once_with(
         None, event=tickets_sold_event
     )
-
-
-@patch('byceps.services.ticketing.ticket_code_service._generate_ticket_code')
-def test_create_tickets_with_same_code_fails(
-    generate_ticket_code_mock,
-    admin_app: BycepsApp,
-    product: Product,
-    ticket_category: TicketCategory,
-    ticket_quantity: int,
-    admin_user: User,
-    orderer: Orderer,
-    order: Order,
-) -> None:
-    generate_ticket_code_mock.side_effect = lambda: 'EQUAL'  # noqa: E731
-
-    with pytest.raises(TicketCreationFailedError):
-        mark_order_as_paid(order.id, admin_user)
-
-
-@patch('byceps.services.ticketing.ticket_code_service._generate_ticket_code')
-def test_create_tickets_with_temporarily_equal_code_and_retry_succeeds(
-    generate_ticket_code_mock,
-    admin_app: BycepsApp,
-    product: Product,
-    ticket_category: TicketCategory,
-    ticket_quantity: int,
-    admin_user: User,
-    orderer: Orderer,
-    order: Order,
-) -> None:
-    code_generation_retries = 4  # Depends on implemented default value.
-    necessary_outer_retries = 5  # Depends on argument to `retry` decorator.
-    codes = ['EQUAL'] * code_generation_retries * necessary_outer_retries
-    codes += ['TCKT1', 'TCKT2', 'TCKT3', 'TCKT4']
-    codes_iter = iter(codes)
-    generate_ticket_code_mock.side_effect = lambda: next(codes_iter)  # noqa: E731
-
-    tickets_before_paid = get_tickets_for_order(order)
-    assert len(tickets_before_paid) == 0
-
-    mark_order_as_paid(order.id, admin_user)
-
-    tickets_after_paid = get_tickets_for_order(order)
-    assert len(tickets_after_paid) == ticket_quantity
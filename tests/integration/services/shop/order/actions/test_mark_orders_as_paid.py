@@ -0,0 +1,174 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from byceps.byceps_app import BycepsApp
+from byceps.services.shop.order import (
+    order_action_service,
+    order_command_service,
+    order_service,
+)
+from byceps.services.shop.order.errors import OrderActionFailedError
+from byceps.services.shop.order.models.action import ActionProcedure
+from byceps.services.shop.order.models.order import Order
+from byceps.services.shop.product.models import Product, ProductType
+from byceps.util.result import Err
+from byceps.services.shop.shop.models import Shop
+from byceps.services.shop.storefront.models import Storefront
+from byceps.services.ticketing.models.ticket import TicketCategory
+from byceps.services.user.models import User
+
+from tests.helpers.shop import (
+    create_ticket_bundle_product,
+    create_ticket_product,
+    place_order,
+)
+
+from .helpers import get_tickets_for_order
+
+
+@pytest.fixture()
+def ticket_product(shop: Shop, ticket_category: TicketCategory) -> Product:
+    return create_ticket_product(shop.id, ticket_category.id)
+
+
+@pytest.fixture()
+def ticket_bundle_product(
+    shop: Shop, ticket_category: TicketCategory
+) -> Product:
+    return create_ticket_bundle_product(shop.id, ticket_category.id, 3)
+
+
+@pytest.fixture()
+def orders(
+    ticket_product: Product,
+    ticket_bundle_product: Product,
+    shop: Shop,
+    storefront: Storefront,
+    make_orderer,
+    make_user,
+) -> list[Order]:
+    return [
+        place_order(
+            shop,
+            storefront,
+            make_orderer(make_user()),
+            [(ticket_product, 2), (ticket_bundle_product, 1)],
+        ),
+        place_order(
+            shop,
+            storefront,
+            make_orderer(make_user()),
+            [(ticket_product, 1)],
+        ),
+    ]
+
+
+@patch('byceps.services.ticketing.signals.tickets_sold.send')
+def test_mark_orders_as_paid(
+    tickets_sold_signal_send_mock,
+    admin_app: BycepsApp,
+    admin_user: User,
+    orders: list[Order],
+) -> None:
+    order_ids = [order.id for order in orders]
+
+    paid_orders_and_events, action_errors = (
+        order_command_service.mark_orders_as_paid(
+            order_ids, 'bank_transfer', admin_user
+        )
+    )
+
+    assert action_errors == []
+    assert {paid_order.id for paid_order, _ in paid_orders_and_events} == set(
+        order_ids
+    )
+
+    order1, order2 = orders
+
+    tickets1 = get_tickets_for_order(order1)
+    assert len(tickets1) == 2 + 3
+    assert {ticket.owned_by_id for ticket in tickets1} == {order1.placed_by.id}
+
+    tickets2 = get_tickets_for_order(order2)
+    assert len(tickets2) == 1
+    assert tickets2[0].owned_by_id == order2.placed_by.id
+
+    for order in orders:
+        paid_order = order_service.get_order(order.id)
+        assert paid_order.is_paid
+        for line_item in paid_order.line_items:
+            assert line_item.processing_result
+
+    # One event per line item
+    assert tickets_sold_signal_send_mock.call_count == 3
+
+
+def test_mark_orders_as_paid_skips_orders_that_are_not_open(
+    admin_app: BycepsApp,
+    admin_user: User,
+    orders: list[Order],
+) -> None:
+    order1, order2 = orders
+
+    order_command_service.mark_order_as_paid(
+        order1.id, 'bank_transfer', admin_user
+    ).unwrap()
+
+    paid_orders_and_events, _ = order_command_service.mark_orders_as_paid(
+        [order1.id, order2.id], 'bank_transfer', admin_user
+    )
+
+    assert [paid_order.id for paid_order, _ in paid_orders_and_events] == [
+        order2.id
+    ]
+
+    assert len(get_tickets_for_order(order1)) == 2 + 3
+    assert len(get_tickets_for_order(order2)) == 1
+
+
+def test_mark_orders_as_paid_continues_after_failed_action(
+    admin_app: BycepsApp,
+    admin_user: User,
+    orders: list[Order],
+    monkeypatch,
+) -> None:
+    def fail_on_payment(order, line_item, initiator, parameters):
+        return Err(OrderActionFailedError('Ticket creation failed'))
+
+    monkeypatch.setitem(
+        order_action_service._PROCEDURES_BY_PRODUCT_TYPE,
+        ProductType.ticket,
+        ActionProcedure(on_payment=fail_on_payment),
+    )
+
+    order_ids = [order.id for order in orders]
+
+    paid_orders_and_events, action_errors = (
+        order_command_service.mark_orders_as_paid(
+            order_ids, 'bank_transfer', admin_user
+        )
+    )
+
+    # The orders remain paid, ...
+    assert {paid_order.id for paid_order, _ in paid_orders_and_events} == set(
+        order_ids
+    )
+    for order in orders:
+        assert order_service.get_order(order.id).is_paid
+
+    # ... each ticket line item has failed, ...
+    assert action_errors == [
+        OrderActionFailedError('Ticket creation failed'),
+        OrderActionFailedError('Ticket creation failed'),
+    ]
+
+    # ... but the ticket bundles have been created anyway.
+    order1, order2 = orders
+    assert len(get_tickets_for_order(order1)) == 3
+    assert len(get_tickets_for_order(order2)) == 0
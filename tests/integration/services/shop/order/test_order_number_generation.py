@@ -44,3 +44,46 @@ def test_generate_order_number_custom(admin_app, shop2):
     actual = order_sequence_service.generate_order_number(sequence.id).unwrap()
 
     assert actual == 'LOL-03-B00207'
+
+
+def test_generate_order_numbers_from_reserved_block(admin_app, shop2):
+    shop = shop2
+
+    sequence = order_sequence_service.create_order_number_sequence(
+        shop.id, 'BLK-01-B', value=10, block_size=3
+    ).unwrap()
+
+    actual = [
+        order_sequence_service.generate_order_number(sequence.id).unwrap()
+        for _ in range(4)
+    ]
+
+    assert actual == [
+        'BLK-01-B00011',
+        'BLK-01-B00012',
+        'BLK-01-B00013',
+        'BLK-01-B00014',
+    ]
+
+    # Two blocks of three numbers each have been reserved.
+    sequence = order_sequence_service.get_order_number_sequence(sequence.id)
+    assert sequence.value == 16
+
+
+def test_generate_order_numbers_with_block_size_one(admin_app, shop2):
+    shop = shop2
+
+    sequence = order_sequence_service.create_order_number_sequence(
+        shop.id, 'ONE-02-B', value=20, block_size=1
+    ).unwrap()
+
+    actual = [
+        order_sequence_service.generate_order_number(sequence.id).unwrap()
+        for _ in range(3)
+    ]
+
+    assert actual == ['ONE-02-B00021', 'ONE-02-B00022', 'ONE-02-B00023']
+
+    # Each number has been reserved separately.
+    sequence = order_sequence_service.get_order_number_sequence(sequence.id)
+    assert sequence.value == 23
@@ -0,0 +1,86 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.shop.order import order_service
+from byceps.services.shop.order.models.order import PaymentState
+
+from tests.helpers.shop import place_order
+
+
+def test_search_orders_pages_through_orders_newest_first(
+    admin_app, make_product, make_user, make_orderer, shop, storefront
+):
+    product = make_product(shop.id)
+    orderer = make_orderer(make_user())
+
+    placed_orders = [
+        place_order(shop, storefront, orderer, [(product, 1)]) for _ in range(5)
+    ]
+    expected_order_ids = [order.id for order in reversed(placed_orders)]
+
+    page1 = order_service.search_orders(shop.id, limit=2)
+    assert [order.id for order in page1.orders] == expected_order_ids[0:2]
+    assert page1.next_after == expected_order_ids[1]
+
+    page2 = order_service.search_orders(
+        shop.id, after=page1.next_after, limit=2
+    )
+    assert [order.id for order in page2.orders] == expected_order_ids[2:4]
+    assert page2.next_after == expected_order_ids[3]
+
+    page3 = order_service.search_orders(
+        shop.id, after=page2.next_after, limit=2
+    )
+    assert [order.id for order in page3.orders] == expected_order_ids[4:5]
+    assert page3.next_after is None
+
+
+def test_search_orders_by_number_name_and_email_address(
+    admin_app, make_product, make_user, make_orderer, shop, storefront
+):
+    product = make_product(shop.id)
+
+    user1 = make_user(
+        email_address='rick.deckard@replicants.test', last_name='Deckard'
+    )
+    user2 = make_user(
+        email_address='roy.batty@replicants.test', last_name='Batty'
+    )
+
+    order1 = place_order(shop, storefront, make_orderer(user1), [(product, 1)])
+    order2 = place_order(shop, storefront, make_orderer(user2), [(product, 1)])
+
+    def search(search_term: str) -> set:
+        result = order_service.search_orders(
+            shop.id, search_term=search_term, limit=10
+        )
+        return {order.id for order in result.orders}
+
+    assert search(order2.order_number) == {order2.id}
+    assert search('deckard') == {order1.id}
+    assert search('roy.batty@') == {order2.id}
+    assert search('@replicants.test') == {order1.id, order2.id}
+    assert search('tyrell') == set()
+
+
+def test_get_order_search_facets(
+    admin_app, make_product, make_user, make_orderer, shop, storefront
+):
+    product = make_product(shop.id)
+    orderer = make_orderer(make_user(last_name='Tyrell'))
+
+    for _ in range(3):
+        place_order(shop, storefront, orderer, [(product, 1)])
+
+    facets = order_service.get_order_search_facets(shop.id)
+    assert facets.total == 3
+    assert facets.per_payment_state[PaymentState.open] == 3
+    assert facets.per_payment_state[PaymentState.paid] == 0
+    assert facets.overdue == 0
+
+    facets = order_service.get_order_search_facets(
+        shop.id, search_term='nobody-by-that-name'
+    )
+    assert facets.total == 0
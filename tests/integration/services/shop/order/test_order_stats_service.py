@@ -0,0 +1,103 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from sqlalchemy import delete
+
+from byceps.database import db
+from byceps.services.shop.order import (
+    order_command_service,
+    order_service,
+    order_stats_service,
+)
+from byceps.services.shop.order.dbmodels.stats import (
+    DbOrderedProductStats,
+    DbOrderStats,
+)
+from byceps.services.shop.order.models.order import PaymentState
+from byceps.services.shop.product import product_service
+
+from tests.helpers.shop import place_order
+
+
+def test_stats_follow_placement_payment_and_cancellation(
+    admin_app,
+    admin_user,
+    make_product,
+    make_user,
+    make_orderer,
+    shop,
+    storefront,
+):
+    product = make_product(shop.id)
+    orderer = make_orderer(make_user())
+
+    order1 = place_order(shop, storefront, orderer, [(product, 2)])
+    order2 = place_order(shop, storefront, orderer, [(product, 3)])
+    order3 = place_order(shop, storefront, orderer, [(product, 1)])
+
+    order_command_service.mark_order_as_paid(
+        order1.id, 'cash', admin_user
+    ).unwrap()
+    order_command_service.mark_order_as_paid(
+        order2.id, 'cash', admin_user
+    ).unwrap()
+    order_command_service.cancel_order(
+        order2.id, admin_user, 'Refunded'
+    ).unwrap()
+
+    expected_order_counts = {
+        PaymentState.open: 1,
+        PaymentState.canceled_before_paid: 0,
+        PaymentState.paid: 1,
+        PaymentState.canceled_after_paid: 1,
+    }
+    expected_product_quantities = {
+        PaymentState.open: 1,
+        PaymentState.canceled_before_paid: 0,
+        PaymentState.paid: 2,
+        PaymentState.canceled_after_paid: 3,
+    }
+
+    def assert_stats():
+        assert order_service.count_open_orders(shop.id) == 1
+        assert (
+            order_service.count_orders_per_payment_state(shop.id)
+            == expected_order_counts
+        )
+        assert (
+            get_product_quantities_per_payment_state(
+                shop.id, product.item_number
+            )
+            == expected_product_quantities
+        )
+
+    assert order3.payment_state == PaymentState.open
+    assert_stats()
+
+    # Discard the statistics, then recompute them from the orders.
+    db.session.execute(delete(DbOrderStats).filter_by(shop_id=shop.id))
+    db.session.execute(
+        delete(DbOrderedProductStats).filter_by(product_id=product.id)
+    )
+    db.session.commit()
+
+    assert order_service.count_open_orders(shop.id) == 0
+
+    order_stats_service.reconcile_stats(shop.id)
+
+    assert_stats()
+
+
+# helpers
+
+
+def get_product_quantities_per_payment_state(shop_id, product_number):
+    stats = product_service.sum_ordered_products_by_payment_state({shop_id})
+
+    return {
+        payment_state: quantity
+        for _, number, _, payment_state, quantity in stats
+        if number == product_number
+    }
@@ -0,0 +1,125 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime, timedelta
+
+from byceps.services.shop.cart.models import Cart
+from byceps.services.shop.order import (
+    order_checkout_service,
+    order_command_service,
+    order_service,
+    overdue_order_cancellation_service,
+)
+from byceps.services.shop.order.models.order import PaymentState
+from byceps.services.shop.product import product_service
+
+
+def test_cancel_overdue_orders_in_chunks(
+    admin_app,
+    admin_user,
+    make_product,
+    make_user,
+    make_orderer,
+    shop,
+    storefront,
+    monkeypatch,
+):
+    monkeypatch.setattr(overdue_order_cancellation_service, 'CHUNK_SIZE', 2)
+
+    product = make_product(shop.id, total_quantity=10)
+    orderer = make_orderer(make_user())
+
+    def place_order(created_at):
+        cart = Cart(shop.currency)
+        cart.add_item(product, 2)
+        order, _ = order_checkout_service.place_order(
+            storefront, orderer, cart, created_at=created_at
+        ).unwrap()
+        return order
+
+    now = datetime.utcnow()
+    overdue_orders = [place_order(now - timedelta(days=20)) for _ in range(3)]
+    recent_order = place_order(now - timedelta(days=2))
+
+    assert product_service.get_product(product.id).quantity == 2
+
+    overdue_order_cancellation_service.start_cancellation(
+        shop.id,
+        timedelta(days=14),
+        admin_user,
+        'Not paid in time',
+        notify_orderers=False,
+    )
+
+    for order in overdue_orders:
+        canceled_order = order_service.get_order(order.id)
+        assert canceled_order.payment_state == PaymentState.canceled_before_paid
+        assert canceled_order.cancellation_reason == 'Not paid in time'
+
+    assert (
+        order_service.get_order(recent_order.id).payment_state
+        == PaymentState.open
+    )
+
+    assert product_service.get_product(product.id).quantity == 8
+
+    order_counts = order_service.count_orders_per_payment_state(shop.id)
+    assert order_counts[PaymentState.open] == 1
+    assert order_counts[PaymentState.canceled_before_paid] == 3
+
+
+def test_cancel_overdue_orders_retries_skipped_orders(
+    admin_app,
+    admin_user,
+    make_product,
+    make_user,
+    make_orderer,
+    shop,
+    storefront,
+    monkeypatch,
+):
+    monkeypatch.setattr(overdue_order_cancellation_service, 'CHUNK_SIZE', 2)
+
+    product = make_product(shop.id, total_quantity=10)
+    orderer = make_orderer(make_user())
+
+    created_at = datetime.utcnow() - timedelta(days=20)
+    cart = Cart(shop.currency)
+    cart.add_item(product, 1)
+    order, _ = order_checkout_service.place_order(
+        storefront, orderer, cart, created_at=created_at
+    ).unwrap()
+
+    # Simulate the order being locked by another transaction on the
+    # first attempt to cancel it.
+    cancel_open_orders = order_command_service.cancel_open_orders
+    attempted_order_ids = []
+
+    def cancel_open_orders_skipping_once(order_ids, initiator, reason):
+        if order.id in order_ids and order.id not in attempted_order_ids:
+            attempted_order_ids.append(order.id)
+            order_ids = [
+                order_id for order_id in order_ids if order_id != order.id
+            ]
+        return cancel_open_orders(order_ids, initiator, reason)
+
+    monkeypatch.setattr(
+        order_command_service,
+        'cancel_open_orders',
+        cancel_open_orders_skipping_once,
+    )
+
+    overdue_order_cancellation_service.start_cancellation(
+        shop.id,
+        timedelta(days=14),
+        admin_user,
+        'Not paid in time',
+        notify_orderers=False,
+    )
+
+    assert (
+        order_service.get_order(order.id).payment_state
+        == PaymentState.canceled_before_paid
+    )
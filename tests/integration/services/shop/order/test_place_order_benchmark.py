@@ -0,0 +1,55 @@
+"""
+Microbenchmark for order placement against the test database.
+
+Skipped unless the `RUN_BENCHMARKS` environment variable is set, e.g.:
+
+    RUN_BENCHMARKS=1 pytest -s tests/integration/services/shop/order/test_place_order_benchmark.py
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import os
+import time
+
+import pytest
+
+from byceps.services.shop.cart.models import Cart
+from byceps.services.shop.order import order_checkout_service
+
+
+ORDER_COUNT = 500
+
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get('RUN_BENCHMARKS'),
+    reason='benchmarks are only run if `RUN_BENCHMARKS` is set',
+)
+
+
+def test_place_order_throughput(
+    admin_app, make_product, make_user, make_orderer, shop, storefront, capsys
+):
+    orderer = make_orderer(make_user())
+
+    products = [
+        make_product(shop.id, total_quantity=ORDER_COUNT * 3) for _ in range(3)
+    ]
+
+    carts = []
+    for _ in range(ORDER_COUNT):
+        cart = Cart(shop.currency)
+        for quantity, product in enumerate(products, start=1):
+            cart.add_item(product, quantity)
+        carts.append(cart)
+
+    started_at = time.monotonic()
+    for cart in carts:
+        order_checkout_service.place_order(storefront, orderer, cart).unwrap()
+    elapsed = time.monotonic() - started_at
+
+    with capsys.disabled():
+        print(
+            f'\nPlaced {ORDER_COUNT} orders with {len(products)} line items '
+            f'each: {ORDER_COUNT / elapsed:.1f} orders/s ({elapsed:.2f} s)'
+        )
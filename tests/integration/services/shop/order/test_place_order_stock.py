@@ -0,0 +1,96 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import dataclasses
+
+import pytest
+from sqlalchemy import update
+
+from byceps.database import db
+from byceps.services.shop.cart.models import Cart
+from byceps.services.shop.order import (
+    order_checkout_service,
+    order_sequence_service,
+)
+from byceps.services.shop.order.dbmodels.number_sequence import (
+    DbOrderNumberSequence,
+)
+from byceps.services.shop.order.errors import ProductsSoldOutError
+from byceps.services.shop.product import product_service
+from byceps.util.result import Err
+
+from tests.helpers import generate_token
+
+
+@pytest.fixture(scope='module')
+def orderer(make_user, make_orderer):
+    user = make_user()
+    return make_orderer(user)
+
+
+def test_place_order_reduces_stock(
+    admin_app, make_product, shop, storefront, orderer
+):
+    product1 = make_product(shop.id, total_quantity=10)
+    product2 = make_product(shop.id, total_quantity=5)
+
+    cart = Cart(shop.currency)
+    cart.add_item(product1, 3)
+    cart.add_item(product2, 5)
+
+    order_checkout_service.place_order(storefront, orderer, cart).unwrap()
+
+    assert product_service.get_product(product1.id).quantity == 7
+    assert product_service.get_product(product2.id).quantity == 0
+
+
+def test_place_order_fails_if_product_is_sold_out(
+    admin_app, make_product, shop, storefront, orderer
+):
+    product1 = make_product(shop.id, total_quantity=10)
+    product2 = make_product(shop.id, total_quantity=2)
+
+    cart = Cart(shop.currency)
+    cart.add_item(product1, 3)
+    cart.add_item(product2, 3)
+
+    result = order_checkout_service.place_order(storefront, orderer, cart)
+
+    assert result == Err(ProductsSoldOutError({product2.id}))
+
+    # Stock of neither product must have been reduced.
+    assert product_service.get_product(product1.id).quantity == 10
+    assert product_service.get_product(product2.id).quantity == 2
+
+
+def test_place_order_fails_on_duplicate_order_number(
+    admin_app, make_product, shop, storefront, orderer
+):
+    sequence = order_sequence_service.create_order_number_sequence(
+        shop.id, f'DUP-{generate_token(6)}-'
+    ).unwrap()
+    storefront = dataclasses.replace(
+        storefront, order_number_sequence_id=sequence.id
+    )
+
+    product = make_product(shop.id, total_quantity=10)
+
+    cart = Cart(shop.currency)
+    cart.add_item(product, 1)
+
+    order_checkout_service.place_order(storefront, orderer, cart).unwrap()
+
+    # Rewind the sequence to have the same order number generated again.
+    db.session.execute(
+        update(DbOrderNumberSequence).filter_by(id=sequence.id).values(value=0)
+    )
+    db.session.commit()
+
+    result = order_checkout_service.place_order(storefront, orderer, cart)
+
+    assert result == Err(None)
+
+    # Stock must only have been reduced by the first order.
+    assert product_service.get_product(product.id).quantity == 9
@@ -0,0 +1,87 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from babel import Locale
+from sqlalchemy import select
+
+from byceps.database import db
+from byceps.services.authn.session.models import CurrentUser
+from byceps.services.shop.order import sold_products_service
+from byceps.services.shop.order.dbmodels.order import DbOrder
+from byceps.services.shop.order.models.number import OrderNumber
+from byceps.services.shop.order.models.order import PaymentState
+
+from tests.helpers import current_user_set
+from tests.helpers.shop import place_order
+
+
+def test_sold_products_report_and_csv_export(
+    admin_app, party, make_product, make_user, make_orderer, shop, storefront
+):
+    product1 = make_product(shop.id, name='Ticket')
+    product2 = make_product(shop.id, name='Breakfast')
+    product3 = make_product(shop.id, name='T-Shirt')
+
+    orderer = make_orderer(make_user())
+
+    order1 = place_order(shop, storefront, orderer, [(product1, 2)])
+    order2 = place_order(
+        shop, storefront, orderer, [(product1, 1), (product2, 3)]
+    )
+    unpaid_order = place_order(shop, storefront, orderer, [(product2, 1)])
+    other_product_order = place_order(
+        shop, storefront, orderer, [(product3, 1)]
+    )
+
+    for order in order1, order2, other_product_order:
+        set_payment_state(order.order_number, PaymentState.paid)
+    db.session.commit()
+
+    products = [product1, product2]
+
+    report = sold_products_service.get_sold_products_report(party, products)
+
+    assert [
+        (
+            summary.order_number,
+            [pq.quantity for pq in summary.product_quantities],
+        )
+        for summary in report.order_summaries
+    ] == [
+        (order1.order_number, [2, 0]),
+        (order2.order_number, [1, 3]),
+    ]
+    assert unpaid_order.order_number not in {
+        summary.order_number for summary in report.order_summaries
+    }
+
+    current_user = CurrentUser.create_anonymous(Locale('en'))
+    with (
+        current_user_set(admin_app, current_user),
+        admin_app.app_context(),
+        admin_app.test_request_context(),
+    ):
+        lines = list(
+            sold_products_service.export_sold_products_as_csv(party, products)
+        )
+
+    assert len(lines) == 3
+    assert lines[0].endswith(',Ticket,Breakfast\r\n')
+    assert lines[1].startswith(f'{order1.order_number},')
+    assert lines[1].endswith(',2,0\r\n')
+    assert lines[2].startswith(f'{order2.order_number},')
+    assert lines[2].endswith(',1,3\r\n')
+
+
+# helpers
+
+
+def set_payment_state(
+    order_number: OrderNumber, payment_state: PaymentState
+) -> None:
+    order = db.session.execute(
+        select(DbOrder).filter_by(order_number=order_number)
+    ).scalar_one()
+    order.payment_state = payment_state
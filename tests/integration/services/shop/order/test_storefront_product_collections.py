@@ -0,0 +1,40 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime, timedelta
+
+from byceps.services.shop.order.blueprints.site import service
+from byceps.services.shop.product import product_service
+
+
+def test_collections_are_cached_with_current_availability(
+    admin_app, make_product, shop, storefront
+):
+    now = datetime.utcnow()
+
+    product1 = make_product(shop.id, name='Ticket', total_quantity=100)
+    make_product(
+        shop.id, name='Upcoming', available_from=now + timedelta(days=1)
+    )
+
+    def get_product_names_and_quantities():
+        collections = service.get_collections(storefront).unwrap()
+        return [
+            (item.product.name, item.product.quantity)
+            for item in collections[0].items
+        ]
+
+    assert get_product_names_and_quantities() == [('Ticket', 100)]
+
+    # Quantity changes are reflected without invalidating the cache.
+    product_service.decrease_quantity(product1.id, 3)
+    assert get_product_names_and_quantities() == [('Ticket', 97)]
+
+    # Adding a product invalidates the cache.
+    make_product(shop.id, name='Breakfast', total_quantity=50)
+    assert get_product_names_and_quantities() == [
+        ('Breakfast', 50),
+        ('Ticket', 97),
+    ]
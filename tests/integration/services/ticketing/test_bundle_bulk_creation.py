@@ -0,0 +1,72 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.database import db
+from byceps.services.ticketing import (
+    ticket_bundle_bulk_creation_service,
+    ticket_bundle_service,
+)
+from byceps.services.ticketing.dbmodels.ticket import DbTicket
+
+
+def test_create_bundle_in_chunks(
+    admin_app, category, ticket_owner, monkeypatch
+):
+    monkeypatch.setattr(ticket_bundle_bulk_creation_service, 'CHUNK_SIZE', 4)
+
+    bundle_id = ticket_bundle_bulk_creation_service.create_bundle(
+        category, 10, ticket_owner, label='Crew'
+    )
+
+    db_bundle = ticket_bundle_service.get_bundle(bundle_id)
+    assert db_bundle.ticket_quantity == 10
+    assert db_bundle.label == 'Crew'
+
+    tickets = ticket_bundle_service.get_tickets_for_bundle(bundle_id)
+    assert len(tickets) == 10
+    assert len({ticket.code for ticket in tickets}) == 10
+    for ticket in tickets:
+        assert ticket.category_id == category.id
+        assert ticket.owned_by_id == ticket_owner.id
+        assert ticket.used_by_id is None
+        assert not ticket.revoked
+
+
+def test_create_bundle_in_background(
+    admin_app, category, ticket_owner, monkeypatch
+):
+    monkeypatch.setattr(ticket_bundle_bulk_creation_service, 'CHUNK_SIZE', 3)
+    monkeypatch.setattr(
+        ticket_bundle_bulk_creation_service, 'BACKGROUND_THRESHOLD', 5
+    )
+
+    # Jobs are executed synchronously in tests.
+    bundle_id = ticket_bundle_bulk_creation_service.create_bundle(
+        category, 7, ticket_owner, user=ticket_owner
+    )
+
+    tickets = ticket_bundle_service.get_tickets_for_bundle(bundle_id)
+    assert len(tickets) == 7
+    assert {ticket.used_by_id for ticket in tickets} == {ticket_owner.id}
+
+
+def test_fill_bundle_only_creates_missing_tickets(
+    admin_app, category, ticket_owner
+):
+    bundle_id = ticket_bundle_bulk_creation_service.create_bundle(
+        category, 5, ticket_owner
+    )
+
+    # Simulate an interrupted run.
+    tickets = ticket_bundle_service.get_tickets_for_bundle(bundle_id)
+    for ticket in tickets[:2]:
+        db.session.delete(db.session.get(DbTicket, ticket.id))
+    db.session.commit()
+
+    ticket_bundle_bulk_creation_service.fill_bundle(bundle_id, None)
+    ticket_bundle_bulk_creation_service.fill_bundle(bundle_id, None)
+
+    tickets = ticket_bundle_service.get_tickets_for_bundle(bundle_id)
+    assert len(tickets) == 5
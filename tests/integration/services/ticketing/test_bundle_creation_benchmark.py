@@ -0,0 +1,48 @@
+"""
+Microbenchmark for the creation of large ticket bundles against the
+test database.
+
+Skipped unless the `RUN_BENCHMARKS` environment variable is set, e.g.:
+
+    RUN_BENCHMARKS=1 pytest -s tests/integration/services/ticketing/test_bundle_creation_benchmark.py
+
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import os
+import time
+
+import pytest
+
+from byceps.services.ticketing import ticket_bundle_service
+
+
+BUNDLE_COUNT = 5
+TICKET_QUANTITY_PER_BUNDLE = 10_000
+
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get('RUN_BENCHMARKS'),
+    reason='benchmarks are only run if `RUN_BENCHMARKS` is set',
+)
+
+
+def test_create_large_bundles(admin_app, category, ticket_owner, capsys):
+    # Later bundles are created for an increasingly full party.
+    elapsed_per_bundle = []
+    for _ in range(BUNDLE_COUNT):
+        started_at = time.monotonic()
+        ticket_bundle_service.create_bundle(
+            category, TICKET_QUANTITY_PER_BUNDLE, ticket_owner
+        )
+        elapsed_per_bundle.append(time.monotonic() - started_at)
+
+    with capsys.disabled():
+        print()
+        for i, elapsed in enumerate(elapsed_per_bundle, start=1):
+            print(
+                f'Created bundle {i} of {TICKET_QUANTITY_PER_BUNDLE} tickets: '
+                f'{TICKET_QUANTITY_PER_BUNDLE / elapsed:.0f} tickets/s '
+                f'({elapsed:.2f} s)'
+            )
@@ -0,0 +1,70 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.ticketing import (
+    ticket_checkin_search_service,
+    ticket_creation_service,
+    ticket_user_management_service,
+)
+
+from tests.helpers import generate_token
+
+
+def search(party, search_term):
+    tickets = ticket_checkin_search_service.search_tickets(
+        party.id, search_term, limit=10
+    )
+    return [ticket.id for ticket in tickets]
+
+
+def test_search_by_ticket_code(admin_app, party, category, ticket_owner):
+    ticket = ticket_creation_service.create_ticket(category, ticket_owner)
+
+    assert search(party, ticket.code) == [ticket.id]
+    assert ticket.id in search(party, ticket.code[:3].lower())
+
+
+def test_search_by_owner_screen_name_and_email_address(
+    admin_app, party, category, make_user
+):
+    token = generate_token(6)
+    owner = make_user(f'Owner{token}', email_address=f'owner{token}@users.test')
+    ticket = ticket_creation_service.create_ticket(category, owner)
+
+    assert search(party, f'owner{token}') == [ticket.id]
+    assert search(party, f'OWNER{token}@users.test') == [ticket.id]
+    assert search(party, f'nobody{token}') == []
+
+
+def test_exact_matches_are_listed_first(admin_app, party, category, make_user):
+    token = generate_token(6)
+    owner1 = make_user(f'Match{token}Long')
+    owner2 = make_user(f'Match{token}')
+    ticket1 = ticket_creation_service.create_ticket(category, owner1)
+    ticket2 = ticket_creation_service.create_ticket(category, owner2)
+
+    assert search(party, f'match{token}') == [ticket2.id, ticket1.id]
+
+
+def test_search_terms_are_updated_on_user_appointment(
+    admin_app, party, category, ticket_owner, make_user
+):
+    token = generate_token(6)
+    user = make_user(f'Attendee{token}')
+    ticket = ticket_creation_service.create_ticket(category, ticket_owner)
+
+    assert search(party, f'attendee{token}') == []
+
+    ticket_user_management_service.appoint_user(
+        ticket.id, user, ticket_owner
+    ).unwrap()
+
+    assert search(party, f'attendee{token}') == [ticket.id]
+
+    ticket_user_management_service.withdraw_user(
+        ticket.id, ticket_owner
+    ).unwrap()
+
+    assert search(party, f'attendee{token}') == []
@@ -3,11 +3,15 @@
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from unittest.mock import patch
-
-import pytest
-
-from byceps.services.ticketing import ticket_creation_service
+from byceps.database import db
+from byceps.services.ticketing import (
+    ticket_code_service,
+    ticket_creation_service,
+    ticket_service,
+)
+from byceps.services.ticketing.dbmodels.ticket_code_allocation import (
+    DbTicketCodeAllocation,
+)
 from byceps.services.ticketing.log import ticket_log_service
 
 
@@ -17,21 +21,25 @@ def test_create_ticket(admin_app, category, ticket_owner):
     assert_created_ticket(ticket, category.id, ticket_owner.id)
 
 
-@patch('byceps.services.ticketing.ticket_code_service._generate_ticket_code')
-def test_create_ticket_with_existing_code(
-    generate_ticket_code_mock, admin_app, category, ticket_owner
+def test_create_ticket_skips_code_already_taken(
+    admin_app, category, ticket_owner
 ):
-    generate_ticket_code_mock.return_value = 'TAKEN'
-
     existing_ticket = ticket_creation_service.create_ticket(
         category, ticket_owner
     )
-    assert existing_ticket.code == 'TAKEN'
 
-    with pytest.raises(
-        ticket_creation_service.TicketCreationFailedWithConflictError
-    ):
-        ticket_creation_service.create_ticket(category, ticket_owner)
+    # Give the existing ticket the code that is up next.
+    db_allocation = db.session.get(DbTicketCodeAllocation, category.party_id)
+    next_code = ticket_code_service.build_ticket_codes(
+        db_allocation.key, db_allocation.next_index, 1
+    ).unwrap()[0]
+    ticket_service.update_ticket_code(
+        existing_ticket.id, next_code, ticket_owner
+    )
+
+    ticket = ticket_creation_service.create_ticket(category, ticket_owner)
+
+    assert ticket.code != next_code
 
 
 def test_create_tickets(admin_app, category, ticket_owner):
@@ -44,24 +52,14 @@ def test_create_tickets(admin_app, category, ticket_owner):
         assert_created_ticket(ticket, category.id, ticket_owner.id)
 
 
-@patch('byceps.services.ticketing.ticket_code_service._generate_ticket_code')
-def test_create_tickets_with_clashing_generated_codes(
-    generate_ticket_code_mock, admin_app, category, ticket_owner
-):
-    generate_ticket_code_mock.return_value = 'CLASH'
-
-    quantity = 3
-
-    with pytest.raises(
-        ticket_creation_service.TicketCreationFailedError
-    ) as excinfo:
-        ticket_creation_service.create_tickets(category, ticket_owner, quantity)
-
-    assert (
-        excinfo.value.args[0]
-        == 'Could not generate unique ticket code after 4 attempts.'
+def test_create_tickets_have_unique_codes(admin_app, category, ticket_owner):
+    quantity = 1_000
+    tickets = ticket_creation_service.create_tickets(
+        category, ticket_owner, quantity
     )
 
+    assert len({ticket.code for ticket in tickets}) == quantity
+
 
 def assert_created_ticket(ticket, expected_category_id, expected_owner_id):
     assert ticket is not None
@@ -0,0 +1,70 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.ticketing import (
+    ticket_creation_service,
+    ticket_revocation_service,
+    ticket_service,
+    ticket_user_checkin_service,
+)
+from byceps.services.ticketing.models.ticket import TicketCounters
+
+
+def test_get_ticket_counters(
+    admin_app, brand, make_party, make_ticket_category, make_user, admin_user
+):
+    party1 = make_party(brand)
+    party2 = make_party(brand)
+    party3 = make_party(brand)
+
+    owner = make_user()
+    category1 = make_ticket_category(party1.id, 'Standard')
+    category2 = make_ticket_category(party2.id, 'Standard')
+
+    tickets1 = ticket_creation_service.create_tickets(
+        category1, owner, 4, user=owner
+    )
+    ticket_creation_service.create_tickets(category2, owner, 2)
+
+    ticket_revocation_service.revoke_ticket(tickets1[0].id, admin_user)
+    ticket_user_checkin_service.check_in_user(
+        party1.id, tickets1[1].id, admin_user
+    ).unwrap()
+
+    actual = ticket_service.get_ticket_counters(
+        [party1.id, party2.id, party3.id]
+    )
+
+    assert actual == {
+        party1.id: TicketCounters(revoked=1, sold=3, checked_in=1),
+        party2.id: TicketCounters(revoked=0, sold=2, checked_in=0),
+        party3.id: TicketCounters(revoked=0, sold=0, checked_in=0),
+    }
+
+
+def test_get_ticket_counters_cached(
+    admin_app, brand, make_party, make_ticket_category, make_user
+):
+    party = make_party(brand)
+    owner = make_user()
+    category = make_ticket_category(party.id, 'Standard')
+
+    ticket_creation_service.create_ticket(category, owner)
+
+    assert ticket_service.get_ticket_counters([party.id], cached=True)[
+        party.id
+    ] == TicketCounters(revoked=0, sold=1, checked_in=0)
+
+    ticket_creation_service.create_ticket(category, owner)
+
+    # still cached
+    assert ticket_service.get_ticket_counters([party.id], cached=True)[
+        party.id
+    ] == TicketCounters(revoked=0, sold=1, checked_in=0)
+
+    # not cached
+    assert ticket_service.get_ticket_counters([party.id])[
+        party.id
+    ] == TicketCounters(revoked=0, sold=2, checked_in=0)
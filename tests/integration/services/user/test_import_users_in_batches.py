@@ -0,0 +1,77 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.user import user_import_service, user_service
+from byceps.services.user.log import user_log_service
+from byceps.services.user.user_import_service import UserToImport
+
+from tests.helpers import generate_token
+
+
+def test_import_users_in_batches(admin_app, make_user):
+    existing_user = make_user()
+
+    token = generate_token()
+    screen_name1 = f'Imported1-{token}'
+    screen_name2 = f'Imported2-{token}'
+    screen_name3 = f'Imported3-{token}'
+
+    line_numbers_and_users_to_import = [
+        (
+            1,
+            UserToImport(
+                screen_name=screen_name1,
+                email_address=f'{screen_name1}@users.test',
+                first_name='Alice',
+                last_name='Allison',
+            ),
+        ),
+        # already assigned, case-insensitively
+        (2, UserToImport(screen_name=existing_user.screen_name.upper())),
+        (3, UserToImport(screen_name=screen_name2)),
+        # duplicate within the imported data
+        (4, UserToImport(screen_name=screen_name2)),
+        (5, UserToImport(screen_name=screen_name3, legacy_id='legacy-3')),
+    ]
+
+    batch_results = list(
+        user_import_service.import_users_in_batches(
+            line_numbers_and_users_to_import,
+            batch_size=2,
+            max_hashing_workers=2,
+        )
+    )
+
+    assert len(batch_results) == 3
+
+    imported = [
+        (line_number, user.screen_name)
+        for batch_result in batch_results
+        for line_number, user in batch_result.imported
+    ]
+    assert imported == [
+        (1, screen_name1),
+        (3, screen_name2),
+        (5, screen_name3),
+    ]
+
+    failed_line_numbers = [
+        line_number
+        for batch_result in batch_results
+        for line_number, _ in batch_result.failed
+    ]
+    assert failed_line_numbers == [2, 4]
+
+    user1 = user_service.find_user_by_screen_name(screen_name1)
+    assert user1 is not None
+    assert not user1.initialized
+    assert user_service.find_email_address(user1.id) == (
+        f'{screen_name1}@users.test'
+    )
+    assert user_service.get_detail(user1.id).full_name == 'Alice Allison'
+
+    log_entries = user_log_service.get_entries_for_user(user1.id)
+    assert [entry.event_type for entry in log_entries] == ['user-created']
+    assert log_entries[0].data == {'creation_method': 'import'}
@@ -0,0 +1,119 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime, timedelta
+
+from byceps.services.user.blueprints.admin import service as admin_service
+from byceps.services.user.log import user_log_domain_service, user_log_service
+
+from tests.helpers import generate_token
+
+
+def test_count_entries_for_user(admin_app, make_user):
+    user = make_user()
+    event_type = f'test-{generate_token()}'
+    excluded_event_type = f'test-excluded-{generate_token()}'
+
+    count_before = user_log_service.count_entries_for_user(user.id)
+
+    _create_entries(user, event_type, 3)
+    _create_entries(user, excluded_event_type, 2)
+
+    assert user_log_service.count_entries_for_user(user.id) == count_before + 5
+    assert (
+        user_log_service.count_entries_for_user(
+            user.id, excluded_event_types=frozenset([excluded_event_type])
+        )
+        == count_before + 3
+    )
+
+
+def test_get_latest_entries_for_user(admin_app, make_user):
+    user = make_user()
+    event_type = f'test-{generate_token()}'
+
+    occurred_ats = _create_entries(user, event_type, 5)
+
+    entries = user_log_service.get_latest_entries_for_user(user.id, 3)
+
+    assert [entry.occurred_at for entry in entries] == [
+        occurred_ats[4],
+        occurred_ats[3],
+        occurred_ats[2],
+    ]
+
+
+def test_get_log_entries_paginated(admin_app, make_user):
+    user = make_user()
+    event_type = f'test-{generate_token()}'
+
+    occurred_ats = _create_entries(user, event_type, 5)
+    total = user_log_service.count_entries_for_user(user.id)
+
+    page1 = admin_service.get_log_entries_paginated(user, 1, 2)
+    page2 = admin_service.get_log_entries_paginated(user, 2, 2)
+    page3 = admin_service.get_log_entries_paginated(user, 3, 2)
+
+    assert page1.total == total
+    assert page1.pages == (total + 1) // 2
+
+    assert [entry['occurred_at'] for entry in page1.items] == [
+        occurred_ats[4],
+        occurred_ats[3],
+    ]
+    assert [entry['occurred_at'] for entry in page2.items] == [
+        occurred_ats[2],
+        occurred_ats[1],
+    ]
+    assert [entry['occurred_at'] for entry in page3.items][0] == occurred_ats[0]
+
+    assert page1.has_next
+    assert not page1.has_prev
+    assert page2.has_prev
+
+
+def test_get_log_entries_paginated_beyond_last_page(admin_app, make_user):
+    user = make_user()
+
+    total = user_log_service.count_entries_for_user(user.id)
+
+    pagination = admin_service.get_log_entries_paginated(user, total + 1, 1)
+
+    assert pagination.total == total
+    assert pagination.items == []
+    assert not pagination.has_next
+
+
+def test_get_log_entries_paginated_without_logins(admin_app, make_user):
+    user = make_user()
+    event_type = f'test-{generate_token()}'
+
+    _create_entries(user, event_type, 2)
+    _create_entries(user, 'user-logged-in', 3)
+
+    with_logins = admin_service.get_log_entries_paginated(user, 1, 100)
+    without_logins = admin_service.get_log_entries_paginated(
+        user, 1, 100, include_logins=False
+    )
+
+    assert without_logins.total == with_logins.total - 3
+    assert all(
+        entry['event_type'] != 'user-logged-in'
+        for entry in without_logins.items
+    )
+
+
+def _create_entries(user, event_type: str, count: int) -> list[datetime]:
+    # Place entries in the future so they are the newest of the user.
+    base = datetime.utcnow() + timedelta(days=1)
+    occurred_ats = [base + timedelta(minutes=i) for i in range(count)]
+
+    for occurred_at in occurred_ats:
+        entry = user_log_domain_service.build_entry(
+            event_type, user, {}, occurred_at=occurred_at
+        )
+        user_log_service.persist_entry(entry)
+
+    return occurred_ats
@@ -0,0 +1,119 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from byceps.config.models import UserLogRetentionPolicyConfig
+from byceps.database import db
+from byceps.services.authn.session import authn_session_service
+from byceps.services.user.log import (
+    user_log_domain_service,
+    user_log_retention_service,
+    user_log_service,
+)
+from byceps.services.user.log.dbmodels import DbArchivedUserLogEntry
+
+from tests.helpers import generate_token
+
+
+NOW = datetime(2014, 8, 31, 12, 0, 0)
+
+
+def test_apply_retention_policies(admin_app, make_user):
+    user = make_user()
+
+    event_type_to_delete = f'test-delete-{generate_token()}'
+    event_type_to_archive = f'test-archive-{generate_token()}'
+    event_type_to_keep = f'test-keep-{generate_token()}'
+
+    for event_type in [
+        event_type_to_delete,
+        event_type_to_archive,
+        event_type_to_keep,
+    ]:
+        for occurred_at in [
+            datetime(2014, 5, 1, 12, 0, 0),  # old
+            datetime(2014, 5, 2, 12, 0, 0),  # old
+            datetime(2014, 5, 3, 12, 0, 0),  # old
+            datetime(2014, 8, 30, 12, 0, 0),  # recent
+        ]:
+            entry = user_log_domain_service.build_entry(
+                event_type, user, {}, occurred_at=occurred_at
+            )
+            user_log_service.persist_entry(entry)
+
+    policies = [
+        UserLogRetentionPolicyConfig(
+            event_type=event_type_to_delete, max_age_in_days=30, archive=False
+        ),
+        UserLogRetentionPolicyConfig(
+            event_type=event_type_to_archive, max_age_in_days=30, archive=True
+        ),
+    ]
+
+    results = list(
+        user_log_retention_service.apply_retention_policies(
+            policies, now=NOW, chunk_size=2
+        )
+    )
+
+    assert [num_affected for _, num_affected in results] == [3, 3]
+
+    assert _count_entries(user, event_type_to_delete) == 1
+    assert _count_entries(user, event_type_to_archive) == 1
+    assert _count_entries(user, event_type_to_keep) == 4
+
+    archived_occurred_ats = db.session.scalars(
+        select(DbArchivedUserLogEntry.occurred_at)
+        .filter_by(event_type=event_type_to_archive)
+        .order_by(DbArchivedUserLogEntry.occurred_at)
+    ).all()
+    assert archived_occurred_ats == [
+        datetime(2014, 5, 1, 12, 0, 0),
+        datetime(2014, 5, 2, 12, 0, 0),
+        datetime(2014, 5, 3, 12, 0, 0),
+    ]
+
+
+@pytest.mark.parametrize('archive', [False, True])
+def test_apply_retention_policy_to_logins(admin_app, make_user, archive):
+    user = make_user()
+    ip_address = '10.99.4.1'
+    event_type = 'user-logged-in-to-admin'
+
+    authn_session_service.log_in_user_to_admin(user, ip_address)
+
+    assert _count_entries(user, event_type) == 1
+    assert _find_login_user_ids(ip_address) == [user.id]
+
+    policies = [
+        UserLogRetentionPolicyConfig(
+            event_type=event_type, max_age_in_days=30, archive=archive
+        ),
+    ]
+    now = datetime.utcnow() + timedelta(days=31)
+
+    list(user_log_retention_service.apply_retention_policies(policies, now=now))
+
+    assert _count_entries(user, event_type) == 0
+    assert _find_login_user_ids(ip_address) == []
+
+
+def _count_entries(user, event_type: str) -> int:
+    return len(
+        user_log_service.get_entries_of_type_for_user(user.id, event_type)
+    )
+
+
+def _find_login_user_ids(ip_address: str) -> list:
+    return [
+        user_id
+        for _, user_id in authn_session_service.find_logins_for_ip_address(
+            ip_address
+        )
+    ]
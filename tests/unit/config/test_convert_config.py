@@ -13,9 +13,11 @@ from byceps.config.models import (
     InvoiceNinjaConfig,
     JobsConfig,
     MetricsConfig,
+    PasswordVerificationConfig,
     PaymentGatewaysConfig,
     RedisConfig,
     SmtpConfig,
+    UserLogConfig,
 )
 
 
@@ -61,6 +63,10 @@ def test_convert_config():
         metrics=MetricsConfig(
             enabled=True,
         ),
+        password_verification=PasswordVerificationConfig(
+            max_concurrency=4,
+            queue_timeout_in_ms=2000,
+        ),
         payment_gateways=PaymentGatewaysConfig(
             paypal=None,
             stripe=None,
@@ -77,6 +83,9 @@ def test_convert_config():
             password='smtppass',
             suppress_send=False,
         ),
+        user_log=UserLogConfig(
+            retention_policies=[],
+        ),
     )
 
     actual = convert_config(config)
@@ -16,11 +16,14 @@ from byceps.config.models import (
     InvoiceNinjaConfig,
     JobsConfig,
     MetricsConfig,
+    PasswordVerificationConfig,
     PaymentGatewaysConfig,
     PaypalConfig,
     RedisConfig,
     SiteWebAppConfig,
     SmtpConfig,
+    UserLogConfig,
+    UserLogRetentionPolicyConfig,
     StripeConfig,
     WebAppsConfig,
 )
@@ -65,6 +68,10 @@ def test_parse_config():
                 metrics=MetricsConfig(
                     enabled=True,
                 ),
+                password_verification=PasswordVerificationConfig(
+                    max_concurrency=2,
+                    queue_timeout_in_ms=500,
+                ),
                 payment_gateways=PaymentGatewaysConfig(
                     paypal=PaypalConfig(
                         enabled=True,
@@ -91,6 +98,20 @@ def test_parse_config():
                     password='smtp-password',
                     suppress_send=True,
                 ),
+                user_log=UserLogConfig(
+                    retention_policies=[
+                        UserLogRetentionPolicyConfig(
+                            event_type='user-logged-in-to-site',
+                            max_age_in_days=90,
+                            archive=False,
+                        ),
+                        UserLogRetentionPolicyConfig(
+                            event_type='user-badge-awarded',
+                            max_age_in_days=730,
+                            archive=True,
+                        ),
+                    ],
+                ),
             ),
             WebAppsConfig(
                 admin=AdminWebAppConfig(
@@ -154,6 +175,10 @@ def test_parse_config():
     [metrics]
     enabled = true
 
+    [password_verification]
+    max_concurrency = 2
+    queue_timeout_in_ms = 500
+
     [payment_gateways.paypal]
     enabled = true
     client_id = "paypal-client-id"
@@ -177,6 +202,15 @@ def test_parse_config():
     username = "smtp-user"
     password = "smtp-password"
     suppress_send = true
+
+    [[user_log.retention_policies]]
+    event_type = "user-logged-in-to-site"
+    max_age_in_days = 90
+
+    [[user_log.retention_policies]]
+    event_type = "user-badge-awarded"
+    max_age_in_days = 730
+    archive = true
     """
 
     assert parse_config(toml) == expected
@@ -211,6 +245,10 @@ def test_parse_config_defaults():
                 metrics=MetricsConfig(
                     enabled=False,
                 ),
+                password_verification=PasswordVerificationConfig(
+                    max_concurrency=4,
+                    queue_timeout_in_ms=2000,
+                ),
                 payment_gateways=PaymentGatewaysConfig(
                     paypal=None,
                     stripe=None,
@@ -227,6 +265,9 @@ def test_parse_config_defaults():
                     password='',
                     suppress_send=False,
                 ),
+                user_log=UserLogConfig(
+                    retention_policies=[],
+                ),
             ),
             WebAppsConfig(
                 admin=AdminWebAppConfig(
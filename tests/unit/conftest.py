@@ -20,9 +20,11 @@ from byceps.config.models import (
     DevelopmentConfig,
     JobsConfig,
     MetricsConfig,
+    PasswordVerificationConfig,
     PaymentGatewaysConfig,
     RedisConfig,
     SmtpConfig,
+    UserLogConfig,
 )
 from byceps.services.brand.models import Brand, BrandID
 from byceps.services.party.models import Party, PartyID
@@ -69,6 +71,10 @@ def make_byceps_config():
             metrics=MetricsConfig(
                 enabled=False,
             ),
+            password_verification=PasswordVerificationConfig(
+                max_concurrency=4,
+                queue_timeout_in_ms=2000,
+            ),
             payment_gateways=PaymentGatewaysConfig(
                 paypal=None,
                 stripe=None,
@@ -85,6 +91,9 @@ def make_byceps_config():
                 password=None,
                 suppress_send=True,
             ),
+            user_log=UserLogConfig(
+                retention_policies=[],
+            ),
         )
 
     return _wrapper
@@ -0,0 +1,75 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime
+
+from moneyed import EUR, Money
+
+from byceps.services.shop.cart.models import Cart
+from byceps.services.shop.order import order_domain_service
+from byceps.services.shop.order.models.number import OrderNumber
+from byceps.services.shop.order.models.order import (
+    LineItemProcessingState,
+    Orderer,
+    OrderState,
+    PaymentState,
+)
+from byceps.services.shop.shop.models import ShopID
+from byceps.services.shop.storefront.models import StorefrontID
+
+from tests.helpers import generate_token
+
+
+SHOP_ID = ShopID(generate_token())
+STOREFRONT_ID = StorefrontID(generate_token())
+ORDER_NUMBER = OrderNumber('ORDER-00042')
+
+
+def test_build_placed_order(orderer: Orderer, make_product):
+    product1 = make_product(price=Money('49.95', EUR))
+    product2 = make_product(price=Money('6.20', EUR))
+
+    cart = Cart(EUR)
+    cart.add_item(product1, 2)
+    cart.add_item(product2, 1)
+
+    incoming_order, _ = order_domain_service.place_order(
+        datetime.utcnow(), SHOP_ID, STOREFRONT_ID, orderer, cart
+    ).unwrap()
+
+    order = order_domain_service.build_placed_order(
+        incoming_order, ORDER_NUMBER
+    )
+
+    assert order.id == incoming_order.id
+    assert order.created_at == incoming_order.created_at
+    assert order.shop_id == SHOP_ID
+    assert order.storefront_id == STOREFRONT_ID
+    assert order.order_number == ORDER_NUMBER
+    assert order.placed_by == orderer.user
+    assert order.first_name == orderer.first_name
+    assert order.last_name == orderer.last_name
+    assert order.address.city == orderer.city
+    assert order.total_amount == Money('106.10', EUR)
+    assert order.payment_method is None
+    assert order.payment_state == PaymentState.open
+    assert order.state == OrderState.open
+    assert order.is_open
+    assert not order.is_canceled
+    assert not order.is_paid
+    assert not order.is_invoiced
+    assert not order.is_overdue
+    assert not order.is_processed
+
+    assert [li.product_id for li in order.line_items] == sorted(
+        [product1.id, product2.id]
+    )
+    for line_item in order.line_items:
+        assert line_item.order_number == ORDER_NUMBER
+        assert line_item.processing_result == {}
+        assert line_item.processed_at is None
+        assert (
+            line_item.processing_state == LineItemProcessingState.not_applicable
+        )
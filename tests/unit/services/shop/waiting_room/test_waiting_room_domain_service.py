@@ -0,0 +1,97 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from byceps.services.shop.storefront.models import StorefrontID
+from byceps.services.shop.waiting_room import waiting_room_domain_service
+from byceps.services.shop.waiting_room.models import QueueEntry
+
+from tests.helpers import generate_uuid
+
+
+OPENED_AT = datetime(2026, 3, 1, 12, 0, 0)
+
+
+@pytest.fixture(scope='module')
+def waiting_room():
+    return waiting_room_domain_service.open_waiting_room(
+        StorefrontID('tickets'), 10, OPENED_AT
+    )
+
+
+@pytest.mark.parametrize(
+    ('elapsed', 'expected'),
+    [
+        (timedelta(seconds=-1), 0),
+        (timedelta(0), 0),
+        (timedelta(milliseconds=250), 2),
+        (timedelta(seconds=3), 30),
+    ],
+)
+def test_count_admitted(waiting_room, elapsed: timedelta, expected: int):
+    now = OPENED_AT + elapsed
+
+    assert waiting_room_domain_service.count_admitted(waiting_room, now) == (
+        expected
+    )
+
+
+@pytest.mark.parametrize(
+    ('position', 'expected_admitted', 'expected_ahead_count'),
+    [
+        (1, True, 0),
+        (20, True, 0),
+        (21, False, 0),
+        (25, False, 4),
+    ],
+)
+def test_get_queue_status(
+    waiting_room,
+    position: int,
+    expected_admitted: bool,
+    expected_ahead_count: int,
+):
+    entry = QueueEntry(
+        waiting_room_id=waiting_room.id,
+        storefront_id=waiting_room.storefront_id,
+        user_id=generate_uuid(),
+        position=position,
+    )
+    now = OPENED_AT + timedelta(seconds=2)  # 20 admitted
+
+    actual = waiting_room_domain_service.get_queue_status(
+        waiting_room, entry, now
+    )
+
+    assert actual.admitted == expected_admitted
+    assert actual.ahead_count == expected_ahead_count
+
+
+def test_change_admission_rate_keeps_admitted_count(waiting_room):
+    now = OPENED_AT + timedelta(seconds=2)  # 20 admitted
+
+    actual = waiting_room_domain_service.change_admission_rate(
+        waiting_room, 5, now
+    )
+
+    assert actual.id == waiting_room.id
+    assert actual.admission_rate_per_second == 5
+    assert waiting_room_domain_service.count_admitted(actual, now) == 20
+    assert (
+        waiting_room_domain_service.count_admitted(
+            actual, now + timedelta(seconds=1)
+        )
+        == 25
+    )
+
+
+def test_open_waiting_room_rejects_invalid_admission_rate():
+    with pytest.raises(ValueError):
+        waiting_room_domain_service.open_waiting_room(
+            StorefrontID('tickets'), 0, OPENED_AT
+        )
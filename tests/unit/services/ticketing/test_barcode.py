@@ -0,0 +1,39 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.ticketing import barcode_service
+
+
+def test_render_svg():
+    expected = """
+<svg xmlns="http://www.w3.org/2000/svg" width="46" height="100" viewBox="0 0 46 100">
+  <rect width="46" height="100" fill="white"/>
+  <rect x="0" width="2" height="100"/>
+  <rect x="3" width="1" height="100"/>
+  <rect x="6" width="1" height="100"/>
+  <rect x="11" width="1" height="100"/>
+  <rect x="13" width="1" height="100"/>
+  <rect x="17" width="2" height="100"/>
+  <rect x="22" width="1" height="100"/>
+  <rect x="26" width="1" height="100"/>
+  <rect x="28" width="2" height="100"/>
+  <rect x="33" width="2" height="100"/>
+  <rect x="38" width="3" height="100"/>
+  <rect x="42" width="1" height="100"/>
+  <rect x="44" width="2" height="100"/>
+</svg>
+""".strip()
+
+    assert barcode_service.render_svg('A', thickness=1) == expected
+
+
+def test_render_svg_is_cached():
+    barcode_service.render_svg.cache_clear()
+
+    svg1 = barcode_service.render_svg('ZWXLN')
+    svg2 = barcode_service.render_svg('ZWXLN')
+
+    assert svg2 is svg1
+    assert barcode_service.render_svg.cache_info().hits == 1
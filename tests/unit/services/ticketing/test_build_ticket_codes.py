@@ -0,0 +1,46 @@
+"""
+:Copyright: 2014-2026 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.ticketing import ticket_code_service
+
+
+KEY = b'0123456789abcdef'
+OTHER_KEY = b'fedcba9876543210'
+
+
+def test_build_ticket_codes_are_unique_and_wellformed():
+    codes = ticket_code_service.build_ticket_codes(KEY, 0, 10_000).unwrap()
+
+    assert len(codes) == 10_000
+    assert len(set(codes)) == 10_000
+    assert all(ticket_code_service.is_ticket_code_wellformed(c) for c in codes)
+
+
+def test_build_ticket_codes_for_consecutive_ranges_do_not_overlap():
+    codes1 = ticket_code_service.build_ticket_codes(KEY, 0, 500).unwrap()
+    codes2 = ticket_code_service.build_ticket_codes(KEY, 500, 500).unwrap()
+
+    assert set(codes1).isdisjoint(codes2)
+
+
+def test_build_ticket_codes_depends_on_key():
+    codes = ticket_code_service.build_ticket_codes(KEY, 0, 20).unwrap()
+
+    assert ticket_code_service.build_ticket_codes(KEY, 0, 20).unwrap() == codes
+    assert (
+        ticket_code_service.build_ticket_codes(OTHER_KEY, 0, 20).unwrap()
+        != codes
+    )
+
+
+def test_build_ticket_codes_beyond_code_space_fails():
+    code_space_size = 21**5
+
+    assert ticket_code_service.build_ticket_codes(
+        KEY, code_space_size - 1, 1
+    ).is_ok()
+    assert ticket_code_service.build_ticket_codes(
+        KEY, code_space_size - 1, 2
+    ).is_err()